@@ -9,10 +9,18 @@ export type FetchUXConfigParams = {
     signal?: AbortSignal;
 };
 
-export async function fetchUXConfig(
+export type FetchUXConfigResult =
+    | { notModified: true; etag: string | null }
+    | { notModified: false; data: UXConfigResponse; etag: string | null };
+
+/**
+ * Conditional variant of fetchUXConfig: sends If-None-Match when an ETag is
+ * known and reports a 304 as `notModified` instead of re-downloading the payload.
+ */
+export async function fetchUXConfigIfChanged(
     module: string,
-    params: FetchUXConfigParams,
-): Promise<UXConfigResponse> {
+    params: FetchUXConfigParams & { etag?: string | null },
+): Promise<FetchUXConfigResult> {
     const trimmed = (module ?? "").trim();
     if (!trimmed) {
         throw new Error("module is required");
@@ -24,17 +32,26 @@ export async function fetchUXConfig(
 
     const url = new URL(`/ux/${encodeURIComponent(trimmed)}`, params.apiUrl);
 
+    const headers: Record<string, string> = {
+        Accept: "application/json",
+        "X-Org-Id": params.orgId,
+        "X-User-Id": params.userId,
+    };
+    if (params.etag) headers["If-None-Match"] = params.etag;
+
     const res = await fetch(url.toString(), {
         method: "GET",
-        headers: {
-            Accept: "application/json",
-            "X-Org-Id": params.orgId,
-            "X-User-Id": params.userId,
-        },
+        headers,
         cache: "no-store",
         signal: params.signal,
     });
 
+    const etag = res.headers.get("ETag");
+
+    if (res.status === 304) {
+        return { notModified: true, etag: etag ?? params.etag ?? null };
+    }
+
     if (!res.ok) {
         const body = await res.text().catch(() => "");
         throw new Error(
@@ -49,5 +66,17 @@ export async function fetchUXConfig(
         throw new Error("Invalid UX config response shape");
     }
 
-    return data as UXConfigResponse;
+    return { notModified: false, data: data as UXConfigResponse, etag };
+}
+
+export async function fetchUXConfig(
+    module: string,
+    params: FetchUXConfigParams,
+): Promise<UXConfigResponse> {
+    const result = await fetchUXConfigIfChanged(module, params);
+    if (result.notModified) {
+        // Unreachable without an ETag; keep the contract explicit.
+        throw new Error("Unexpected 304 for unconditional UX config fetch");
+    }
+    return result.data;
 }
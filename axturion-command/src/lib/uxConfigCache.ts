@@ -1,4 +1,4 @@
-import { fetchUXConfig } from "@/lib/api";
+import { fetchUXConfigIfChanged } from "@/lib/api";
 
 export type UXLayout = "default" | "compact" | "dense";
 export type UXTheme = "dark" | "light" | "defense";
@@ -20,6 +20,8 @@ type CacheKey = string;
 
 type CacheEntry = {
     value: UXConfigResponse | null;
+    // Server ETag for `value`; used to revalidate stale entries cheaply (304).
+    etag: string | null;
     expiresAt: number;
     inFlight: Promise<UXConfigResponse> | null;
 };
@@ -129,6 +131,7 @@ export async function getUXConfigWithCache(
     const key = makeKey(orgId, userId, normalized);
     const entry: CacheEntry = cache.get(key) ?? {
         value: null,
+        etag: null,
         expiresAt: 0,
         inFlight: null,
     };
@@ -144,13 +147,28 @@ export async function getUXConfigWithCache(
         }
     }
 
-    const promise = fetchUXConfig(normalized, {
+    const promise = fetchUXConfigIfChanged(normalized, {
         apiUrl,
         orgId,
         userId,
+        etag: entry.value !== null ? entry.etag : null,
     })
-        .then((result) => {
-            const raw: unknown = result;
+        .then((fetched) => {
+            if (fetched.notModified && entry.value !== null) {
+                const revalidated: CacheEntry = {
+                    value: entry.value,
+                    etag: fetched.etag,
+                    expiresAt: nowMs() + ttlMs,
+                    inFlight: null,
+                };
+                cache.set(key, revalidated);
+                return entry.value;
+            }
+            if (fetched.notModified) {
+                throw new Error("Unexpected 304 for uncached UX config");
+            }
+
+            const raw: unknown = fetched.data;
             const rawModule = isRecord(raw) ? raw["module"] : undefined;
             const rawConfig = isRecord(raw) ? raw["config"] : undefined;
 
@@ -174,6 +192,7 @@ export async function getUXConfigWithCache(
 
             const next: CacheEntry = {
                 value: normalizedResponse,
+                etag: fetched.etag,
                 expiresAt: nowMs() + ttlMs,
                 inFlight: null,
             };
@@ -20,6 +20,11 @@ from app.domain.audit.models import AuditLog
 from app.domain.job.models import Job
 from app.domain.candidate.models import Candidate
 from app.domain.organization.models import Organization
+from app.domain.reporting.models import (
+    ReportingWatermark,
+    StageOccupancySnapshot,
+    StageTransitionFact,
+)
 
 # Alembic Config object (alembic.ini)
 config = context.config
@@ -0,0 +1,71 @@
+"""add stage transition fact table and reporting watermark
+
+Revision ID: a1d6e4f8c2b9
+Revises: f9c6d1e5a7b3
+Create Date: 2026-03-18
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "a1d6e4f8c2b9"
+down_revision = "f9c6d1e5a7b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "stage_transition_fact",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("organization_id", sa.UUID(), nullable=False),
+        sa.Column("workflow_id", sa.UUID(), nullable=False),
+        sa.Column("application_id", sa.UUID(), nullable=False),
+        sa.Column("from_stage", sa.String(), nullable=True),
+        sa.Column("to_stage", sa.String(), nullable=False),
+        sa.Column("occurred_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("audit_seq", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organization.id"]),
+        sa.ForeignKeyConstraint(["workflow_id"], ["workflow.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "organization_id",
+            "audit_seq",
+            name="uq_stage_transition_fact_org_seq",
+        ),
+    )
+    op.create_index(
+        "ix_stage_transition_fact_org_workflow_occurred",
+        "stage_transition_fact",
+        ["organization_id", "workflow_id", "occurred_at"],
+    )
+
+    # Facts are backfilled lazily: the first report per org folds its audit
+    # history in from seq 0.
+    op.create_table(
+        "reporting_watermark",
+        sa.Column("organization_id", sa.UUID(), nullable=False),
+        sa.Column("name", sa.String(), nullable=False),
+        sa.Column("last_seq", sa.Integer(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            server_default=sa.func.now(),
+        ),
+        sa.ForeignKeyConstraint(["organization_id"], ["organization.id"]),
+        sa.PrimaryKeyConstraint("organization_id", "name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("reporting_watermark")
+    op.drop_index(
+        "ix_stage_transition_fact_org_workflow_occurred",
+        table_name="stage_transition_fact",
+    )
+    op.drop_table("stage_transition_fact")
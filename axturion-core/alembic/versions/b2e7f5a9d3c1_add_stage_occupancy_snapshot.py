@@ -0,0 +1,48 @@
+"""add stage occupancy snapshot and watermark last_day
+
+Revision ID: b2e7f5a9d3c1
+Revises: a1d6e4f8c2b9
+Create Date: 2026-03-19
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b2e7f5a9d3c1"
+down_revision = "a1d6e4f8c2b9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("reporting_watermark", sa.Column("last_day", sa.Date(), nullable=True))
+
+    # The unique constraint's index also serves (org, workflow, day) range reads.
+    op.create_table(
+        "stage_occupancy_snapshot",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("organization_id", sa.UUID(), nullable=False),
+        sa.Column("workflow_id", sa.UUID(), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("stage", sa.String(), nullable=False),
+        sa.Column("count", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organization.id"]),
+        sa.ForeignKeyConstraint(["workflow_id"], ["workflow.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "organization_id",
+            "workflow_id",
+            "day",
+            "stage",
+            name="uq_stage_occupancy_snapshot_org_workflow_day_stage",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("stage_occupancy_snapshot")
+    op.drop_column("reporting_watermark", "last_day")
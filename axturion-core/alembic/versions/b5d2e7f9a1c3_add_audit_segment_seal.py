@@ -0,0 +1,51 @@
+"""add audit segment seal
+
+Revision ID: b5d2e7f9a1c3
+Revises: a4c9d1e2f3b4
+Create Date: 2026-03-09
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "b5d2e7f9a1c3"
+down_revision = "a4c9d1e2f3b4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_segment_seal",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("organization_id", sa.UUID(), nullable=False),
+        sa.Column("first_seq", sa.Integer(), nullable=False),
+        sa.Column("last_seq", sa.Integer(), nullable=False),
+        sa.Column("row_count", sa.Integer(), nullable=False),
+        sa.Column("first_prev_hash", sa.String(length=64), nullable=True),
+        sa.Column("last_hash", sa.String(length=64), nullable=False),
+        sa.Column("archive_path", sa.String(), nullable=False),
+        sa.Column("archive_sha256", sa.String(length=64), nullable=False),
+        sa.Column("seal", sa.String(length=64), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            server_default=sa.func.now(),
+        ),
+        sa.ForeignKeyConstraint(["organization_id"], ["organization.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "organization_id",
+            "last_seq",
+            name="uq_audit_segment_seal_org_last_seq",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("audit_segment_seal")
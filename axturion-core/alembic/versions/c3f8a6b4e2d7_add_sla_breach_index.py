@@ -0,0 +1,39 @@
+"""add sla breach index and watermark last_at
+
+Revision ID: c3f8a6b4e2d7
+Revises: b2e7f5a9d3c1
+Create Date: 2026-03-23
+
+The breach scan reads open applications by `stage_entered_at`. A partial
+index over non-closed rows keeps that a single range scan; an index with
+`status` in the middle would have to visit every status separately.
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c3f8a6b4e2d7"
+down_revision = "b2e7f5a9d3c1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "reporting_watermark",
+        sa.Column("last_at", sa.DateTime(timezone=True), nullable=True),
+    )
+    op.create_index(
+        "ix_application_org_open_stage_entered",
+        "application",
+        ["organization_id", "stage_entered_at"],
+        postgresql_where=sa.text("status <> 'closed'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_application_org_open_stage_entered", table_name="application")
+    op.drop_column("reporting_watermark", "last_at")
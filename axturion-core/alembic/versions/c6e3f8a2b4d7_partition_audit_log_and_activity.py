@@ -0,0 +1,240 @@
+"""partition audit_log and activity by month
+
+Revision ID: c6e3f8a2b4d7
+Revises: b5d2e7f9a1c3
+Create Date: 2026-03-10
+
+Converts the append-only `audit_log` and `activity` tables into declarative
+range-partitioned tables on `created_at` (one partition per month plus a
+default partition). Future partitions are created at startup by
+`app.core.partitions.ensure_future_partitions`.
+
+Postgres requires the partition key in every unique constraint, so:
+- primary keys become (id, created_at);
+- `uq_audit_org_seq` on audit_log becomes (organization_id, seq,
+  created_at). Per-organization seq uniqueness is still guaranteed by
+  `append_audit_log`, which serializes writers on the organization row, and
+  gaps/duplicates are detected by chain verification.
+"""
+
+from __future__ import annotations
+
+from datetime import date
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "c6e3f8a2b4d7"
+down_revision = "b5d2e7f9a1c3"
+branch_labels = None
+depends_on = None
+
+
+MONTHS_AHEAD = 3
+
+_AUDIT_COLUMNS = (
+    "id, organization_id, actor_id, entity_type, entity_id, action, payload, "
+    "created_at, prev_hash, hash, seq"
+)
+_ACTIVITY_COLUMNS = (
+    "id, organization_id, entity_type, entity_id, type, message, payload, created_at"
+)
+
+
+def _add_months(value: date, months: int) -> date:
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _create_monthly_partitions(table: str, source: str) -> None:
+    bind = op.get_bind()
+    first = bind.execute(
+        sa.text(f"SELECT date_trunc('month', min(created_at)) FROM {source}")
+    ).scalar()
+    current = bind.execute(sa.text("SELECT date_trunc('month', now())")).scalar()
+
+    start = date(current.year, current.month, 1)
+    if first is not None:
+        start = min(start, date(first.year, first.month, 1))
+    end = _add_months(date(current.year, current.month, 1), MONTHS_AHEAD)
+
+    month = start
+    while month <= end:
+        upper = _add_months(month, 1)
+        op.execute(
+            f'CREATE TABLE "{table}_y{month.year:04d}m{month.month:02d}" '
+            f"PARTITION OF {table} "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') "
+            f"TO ('{upper.isoformat()} 00:00:00+00')"
+        )
+        month = upper
+
+    op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+
+def upgrade() -> None:
+    # --- audit_log ---
+    op.execute("ALTER TABLE audit_log RENAME TO audit_log_unpartitioned")
+    op.execute(
+        "ALTER TABLE audit_log_unpartitioned "
+        "DROP CONSTRAINT fk_audit_log_organization"
+    )
+    op.execute("ALTER TABLE audit_log_unpartitioned DROP CONSTRAINT uq_audit_org_seq")
+    op.execute("DROP INDEX ix_audit_org_seq")
+    op.execute(
+        "ALTER INDEX audit_log_pkey RENAME TO audit_log_unpartitioned_pkey"
+    )
+
+    op.execute(
+        """
+        CREATE TABLE audit_log (
+            id UUID NOT NULL,
+            organization_id UUID NOT NULL,
+            actor_id VARCHAR,
+            entity_type VARCHAR,
+            entity_id VARCHAR,
+            action VARCHAR,
+            payload TEXT,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            prev_hash VARCHAR(64),
+            hash VARCHAR(64) NOT NULL,
+            seq INTEGER NOT NULL,
+            CONSTRAINT audit_log_pkey PRIMARY KEY (id, created_at),
+            CONSTRAINT uq_audit_org_seq UNIQUE (organization_id, seq, created_at),
+            CONSTRAINT fk_audit_log_organization
+                FOREIGN KEY (organization_id) REFERENCES organization (id)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.create_index(
+        "ix_audit_org_seq", "audit_log", ["organization_id", "seq"], unique=False
+    )
+    op.create_index(
+        "ix_audit_org_created_at",
+        "audit_log",
+        ["organization_id", "created_at"],
+        unique=False,
+    )
+    _create_monthly_partitions("audit_log", "audit_log_unpartitioned")
+
+    op.execute(
+        f"INSERT INTO audit_log ({_AUDIT_COLUMNS}) "
+        f"SELECT {_AUDIT_COLUMNS.replace('created_at', 'coalesce(created_at, now())')} "
+        "FROM audit_log_unpartitioned"
+    )
+    op.execute("DROP TABLE audit_log_unpartitioned")
+
+    # --- activity ---
+    op.execute("ALTER TABLE activity RENAME TO activity_unpartitioned")
+    op.execute(
+        "ALTER TABLE activity_unpartitioned DROP CONSTRAINT fk_activity_organization"
+    )
+    op.execute("ALTER INDEX activity_pkey RENAME TO activity_unpartitioned_pkey")
+
+    op.execute(
+        """
+        CREATE TABLE activity (
+            id UUID NOT NULL,
+            organization_id UUID NOT NULL,
+            entity_type VARCHAR NOT NULL,
+            entity_id VARCHAR NOT NULL,
+            type VARCHAR NOT NULL,
+            message TEXT,
+            payload JSON,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            CONSTRAINT activity_pkey PRIMARY KEY (id, created_at),
+            CONSTRAINT fk_activity_organization
+                FOREIGN KEY (organization_id) REFERENCES organization (id)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    op.create_index(
+        "ix_activity_org_created_at",
+        "activity",
+        ["organization_id", "created_at"],
+        unique=False,
+    )
+    _create_monthly_partitions("activity", "activity_unpartitioned")
+
+    op.execute(
+        f"INSERT INTO activity ({_ACTIVITY_COLUMNS}) "
+        f"SELECT {_ACTIVITY_COLUMNS.replace('created_at', 'coalesce(created_at, now())')} "
+        "FROM activity_unpartitioned"
+    )
+    op.execute("DROP TABLE activity_unpartitioned")
+
+
+def downgrade() -> None:
+    # --- activity ---
+    op.execute("ALTER TABLE activity RENAME TO activity_partitioned")
+    op.execute(
+        "ALTER TABLE activity_partitioned DROP CONSTRAINT fk_activity_organization"
+    )
+    op.execute("ALTER INDEX activity_pkey RENAME TO activity_partitioned_pkey")
+    op.execute("DROP INDEX ix_activity_org_created_at")
+
+    op.execute(
+        """
+        CREATE TABLE activity (
+            id UUID NOT NULL,
+            organization_id UUID NOT NULL,
+            entity_type VARCHAR NOT NULL,
+            entity_id VARCHAR NOT NULL,
+            type VARCHAR NOT NULL,
+            message TEXT,
+            payload JSON,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            CONSTRAINT activity_pkey PRIMARY KEY (id),
+            CONSTRAINT fk_activity_organization
+                FOREIGN KEY (organization_id) REFERENCES organization (id)
+        )
+        """
+    )
+    op.execute(
+        f"INSERT INTO activity ({_ACTIVITY_COLUMNS}) "
+        f"SELECT {_ACTIVITY_COLUMNS} FROM activity_partitioned"
+    )
+    op.execute("DROP TABLE activity_partitioned")
+
+    # --- audit_log ---
+    op.execute("ALTER TABLE audit_log RENAME TO audit_log_partitioned")
+    op.execute(
+        "ALTER TABLE audit_log_partitioned DROP CONSTRAINT fk_audit_log_organization"
+    )
+    op.execute("ALTER INDEX audit_log_pkey RENAME TO audit_log_partitioned_pkey")
+    op.execute("DROP INDEX ix_audit_org_seq")
+    op.execute("DROP INDEX ix_audit_org_created_at")
+
+    op.execute(
+        """
+        CREATE TABLE audit_log (
+            id UUID NOT NULL,
+            organization_id UUID NOT NULL,
+            actor_id VARCHAR,
+            entity_type VARCHAR,
+            entity_id VARCHAR,
+            action VARCHAR,
+            payload TEXT,
+            created_at TIMESTAMP WITH TIME ZONE DEFAULT now(),
+            prev_hash VARCHAR(64),
+            hash VARCHAR(64) NOT NULL,
+            seq INTEGER NOT NULL,
+            CONSTRAINT audit_log_pkey PRIMARY KEY (id),
+            CONSTRAINT fk_audit_log_organization
+                FOREIGN KEY (organization_id) REFERENCES organization (id)
+        )
+        """
+    )
+    op.execute(
+        f"INSERT INTO audit_log ({_AUDIT_COLUMNS}) "
+        f"SELECT {_AUDIT_COLUMNS} FROM audit_log_partitioned"
+    )
+    op.execute("DROP TABLE audit_log_partitioned")
+
+    op.create_unique_constraint(
+        "uq_audit_org_seq", "audit_log", ["organization_id", "seq"]
+    )
+    op.create_index(
+        "ix_audit_org_seq", "audit_log", ["organization_id", "seq"], unique=False
+    )
@@ -0,0 +1,98 @@
+"""add approval queue read model and counters
+
+Revision ID: d4a9b7c5f3e8
+Revises: c3f8a6b4e2d7
+Create Date: 2026-03-26
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d4a9b7c5f3e8"
+down_revision = "c3f8a6b4e2d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "approval_queue_item",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("organization_id", sa.UUID(), nullable=False),
+        sa.Column("application_id", sa.UUID(), nullable=False),
+        sa.Column("workflow_id", sa.UUID(), nullable=False),
+        sa.Column("from_stage", sa.String(), nullable=False),
+        sa.Column("target_stage", sa.String(), nullable=False),
+        sa.Column("initiated_by_user_id", sa.UUID(), nullable=False),
+        sa.Column("initiated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organization.id"]),
+        sa.ForeignKeyConstraint(["application_id"], ["application.id"]),
+        sa.ForeignKeyConstraint(["workflow_id"], ["workflow.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_approval_queue_item_org_initiated",
+        "approval_queue_item",
+        ["organization_id", "initiated_at", "id"],
+    )
+    op.create_index(
+        "ix_approval_queue_item_org_workflow_initiated",
+        "approval_queue_item",
+        ["organization_id", "workflow_id", "initiated_at", "id"],
+    )
+
+    op.create_table(
+        "approval_queue_counter",
+        sa.Column("organization_id", sa.UUID(), nullable=False),
+        sa.Column("pending_count", sa.BigInteger(), nullable=False),
+        sa.Column("initiated_epoch_sum", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+            nullable=True,
+        ),
+        sa.ForeignKeyConstraint(["organization_id"], ["organization.id"]),
+        sa.PrimaryKeyConstraint("organization_id"),
+    )
+
+    # Backfill from approvals pending at upgrade time.
+    op.execute(
+        """
+        INSERT INTO approval_queue_item (
+            id, organization_id, application_id, workflow_id, from_stage,
+            target_stage, initiated_by_user_id, initiated_at
+        )
+        SELECT p.id, p.organization_id, p.application_id, a.workflow_id, a.stage,
+               p.target_stage, p.initiated_by_user_id, p.initiated_at
+        FROM pending_stage_transition p
+        JOIN application a ON a.id = p.application_id
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO approval_queue_counter (
+            organization_id, pending_count, initiated_epoch_sum
+        )
+        SELECT organization_id, count(*),
+               sum(floor(extract(epoch FROM initiated_at)))::bigint
+        FROM approval_queue_item
+        GROUP BY organization_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("approval_queue_counter")
+    op.drop_index(
+        "ix_approval_queue_item_org_workflow_initiated",
+        table_name="approval_queue_item",
+    )
+    op.drop_index(
+        "ix_approval_queue_item_org_initiated", table_name="approval_queue_item"
+    )
+    op.drop_table("approval_queue_item")
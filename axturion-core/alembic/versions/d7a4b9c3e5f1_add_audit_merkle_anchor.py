@@ -0,0 +1,47 @@
+"""add audit merkle anchor
+
+Revision ID: d7a4b9c3e5f1
+Revises: c6e3f8a2b4d7
+Create Date: 2026-03-11
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "d7a4b9c3e5f1"
+down_revision = "c6e3f8a2b4d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "audit_merkle_anchor",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("organization_id", sa.UUID(), nullable=False),
+        sa.Column("first_seq", sa.Integer(), nullable=False),
+        sa.Column("last_seq", sa.Integer(), nullable=False),
+        sa.Column("leaf_count", sa.Integer(), nullable=False),
+        sa.Column("root", sa.String(length=64), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            nullable=True,
+            server_default=sa.func.now(),
+        ),
+        sa.ForeignKeyConstraint(["organization_id"], ["organization.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "organization_id",
+            "first_seq",
+            name="uq_audit_merkle_anchor_org_first_seq",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("audit_merkle_anchor")
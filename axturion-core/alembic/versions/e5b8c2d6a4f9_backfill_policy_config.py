@@ -0,0 +1,42 @@
+"""backfill default policy_config rows
+
+Policy rows are now created when an organization is provisioned instead of
+on first read, so organizations created before that need their row.
+
+Revision ID: e5b8c2d6a4f9
+Revises: d4a9b7c5f3e8
+Create Date: 2026-03-27
+
+"""
+
+from __future__ import annotations
+
+from alembic import op
+
+
+revision = "e5b8c2d6a4f9"
+down_revision = "d4a9b7c5f3e8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute(
+        """
+        INSERT INTO policy_config (
+            organization_id, require_4eyes_on_hire, require_4eyes_on_ux_rollback,
+            stage_aging_sla_days, default_language, created_at, updated_at
+        )
+        SELECT o.id, false, false, 7, 'en',
+               timezone('utc', now()), timezone('utc', now())
+        FROM organization o
+        WHERE NOT EXISTS (
+            SELECT 1 FROM policy_config p WHERE p.organization_id = o.id
+        )
+        """
+    )
+
+
+def downgrade() -> None:
+    # Backfilled rows are indistinguishable from stored defaults; keep them.
+    pass
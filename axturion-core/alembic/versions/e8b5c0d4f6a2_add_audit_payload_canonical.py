@@ -0,0 +1,83 @@
+"""add audit payload canonical flag
+
+Revision ID: e8b5c0d4f6a2
+Revises: d7a4b9c3e5f1
+Create Date: 2026-03-12
+
+"""
+
+from __future__ import annotations
+
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "e8b5c0d4f6a2"
+down_revision = "d7a4b9c3e5f1"
+branch_labels = None
+depends_on = None
+
+
+BATCH_SIZE = 5000
+
+
+def _is_canonical(payload_text: str | None) -> bool:
+    # Frozen copy of app.core.audit_hashing.is_canonical_payload_text.
+    if payload_text is None:
+        return True
+    try:
+        value = json.loads(payload_text)
+    except Exception:
+        return False
+    canonical = json.dumps(
+        value,
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return canonical == payload_text
+
+
+def upgrade() -> None:
+    op.add_column(
+        "audit_log",
+        sa.Column(
+            "payload_canonical",
+            sa.Boolean(),
+            nullable=False,
+            server_default=sa.text("false"),
+        ),
+    )
+
+    # Backfill: flag rows whose stored payload is already canonical. Payload
+    # text is never rewritten, so existing hashes are untouched.
+    bind = op.get_bind()
+    last_id = None
+    while True:
+        query = "SELECT id, payload FROM audit_log"
+        params: dict = {"limit": BATCH_SIZE}
+        if last_id is not None:
+            query += " WHERE id > :last_id"
+            params["last_id"] = last_id
+        query += " ORDER BY id LIMIT :limit"
+        rows = bind.execute(sa.text(query), params).fetchall()
+        if not rows:
+            break
+
+        canonical_ids = [row.id for row in rows if _is_canonical(row.payload)]
+        if canonical_ids:
+            bind.execute(
+                sa.text(
+                    "UPDATE audit_log SET payload_canonical = true "
+                    "WHERE id = ANY(:ids)"
+                ),
+                {"ids": canonical_ids},
+            )
+        last_id = rows[-1].id
+
+
+def downgrade() -> None:
+    op.drop_column("audit_log", "payload_canonical")
@@ -0,0 +1,163 @@
+"""add ux_config_version
+
+Revision ID: f9c6d1e5a7b3
+Revises: e8b5c0d4f6a2
+Create Date: 2026-03-13
+
+"""
+
+from __future__ import annotations
+
+import json
+import uuid
+from typing import Any
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+revision = "f9c6d1e5a7b3"
+down_revision = "e8b5c0d4f6a2"
+branch_labels = None
+depends_on = None
+
+
+# Frozen copies of the snapshot/diff rules in app.api.routes.ux at the time
+# of this migration.
+_ALLOWED_LAYOUTS = {"default", "compact", "dense"}
+_ALLOWED_THEMES = {"dark", "light", "defense"}
+
+
+def _snapshot(raw: Any) -> dict[str, Any]:
+    if not isinstance(raw, dict):
+        return {}
+    snapshot: dict[str, Any] = {}
+    if raw.get("layout") in _ALLOWED_LAYOUTS:
+        snapshot["layout"] = raw["layout"]
+    if raw.get("theme") in _ALLOWED_THEMES:
+        snapshot["theme"] = raw["theme"]
+    flags = raw.get("flags")
+    if isinstance(flags, dict):
+        normalized = {
+            k: v for k, v in flags.items() if isinstance(k, str) and isinstance(v, bool)
+        }
+        if normalized:
+            snapshot["flags"] = normalized
+    return snapshot
+
+
+def _diff(prev: dict[str, Any] | None, curr: dict[str, Any]) -> dict[str, Any] | None:
+    if prev is None:
+        return None
+    diff: dict[str, Any] = {}
+    for field in ("layout", "theme"):
+        if prev.get(field) != curr.get(field):
+            diff[field] = {"from": prev.get(field), "to": curr.get(field)}
+
+    prev_flags = prev.get("flags") or {}
+    curr_flags = curr.get("flags") or {}
+    added = sorted(set(curr_flags) - set(prev_flags))
+    removed = sorted(set(prev_flags) - set(curr_flags))
+    changed = [
+        {"key": k, "from": prev_flags[k], "to": curr_flags[k]}
+        for k in sorted(set(prev_flags) & set(curr_flags))
+        if prev_flags[k] != curr_flags[k]
+    ]
+    if added:
+        diff["flags_added"] = added
+    if removed:
+        diff["flags_removed"] = removed
+    if changed:
+        diff["flags_changed"] = changed
+    return diff or None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "ux_config_version",
+        sa.Column("id", sa.UUID(), nullable=False),
+        sa.Column("organization_id", sa.UUID(), nullable=False),
+        sa.Column("module", sa.String(), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.Column("audit_seq", sa.Integer(), nullable=False),
+        sa.Column("audit_log_id", sa.UUID(), nullable=False),
+        sa.Column("actor_id", sa.String(), nullable=True),
+        sa.Column("snapshot_json", postgresql.JSONB(), nullable=False),
+        sa.Column("diff_json", postgresql.JSONB(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.ForeignKeyConstraint(["organization_id"], ["organization.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "organization_id",
+            "module",
+            "version",
+            name="uq_ux_config_version_org_module_version",
+        ),
+    )
+
+    # Backfill from the hot audit history (one pass, in seq order per org).
+    bind = op.get_bind()
+    rows = bind.execute(
+        sa.text(
+            "SELECT id, organization_id, entity_id, actor_id, payload, "
+            "created_at, seq FROM audit_log "
+            "WHERE entity_type = 'ux_config' AND action = 'ux_config_updated' "
+            "ORDER BY organization_id, seq"
+        )
+    ).fetchall()
+
+    table = sa.table(
+        "ux_config_version",
+        sa.column("id", sa.UUID()),
+        sa.column("organization_id", sa.UUID()),
+        sa.column("module", sa.String()),
+        sa.column("version", sa.Integer()),
+        sa.column("audit_seq", sa.Integer()),
+        sa.column("audit_log_id", sa.UUID()),
+        sa.column("actor_id", sa.String()),
+        sa.column("snapshot_json", postgresql.JSONB()),
+        sa.column("diff_json", postgresql.JSONB()),
+        sa.column("created_at", sa.DateTime(timezone=True)),
+    )
+
+    latest: dict[tuple[str, str], tuple[int, dict[str, Any]]] = {}
+    batch: list[dict[str, Any]] = []
+    for row in rows:
+        module = str(row.entity_id).split(":", 1)[-1]
+        try:
+            payload = json.loads(row.payload) if row.payload else {}
+        except ValueError:
+            payload = {}
+        if not isinstance(payload, dict):
+            payload = {}
+
+        key = (str(row.organization_id), module)
+        prev_version, prev_snapshot = latest.get(key, (0, None))
+        snapshot = _snapshot(payload.get("config"))
+        batch.append(
+            {
+                "id": uuid.uuid4(),
+                "organization_id": row.organization_id,
+                "module": module,
+                "version": prev_version + 1,
+                "audit_seq": int(row.seq),
+                "audit_log_id": row.id,
+                "actor_id": row.actor_id,
+                "snapshot_json": snapshot,
+                "diff_json": _diff(prev_snapshot, snapshot),
+                "created_at": row.created_at,
+            }
+        )
+        latest[key] = (prev_version + 1, snapshot)
+
+        if len(batch) >= 1000:
+            op.bulk_insert(table, batch)
+            batch = []
+
+    if batch:
+        op.bulk_insert(table, batch)
+
+
+def downgrade() -> None:
+    op.drop_table("ux_config_version")
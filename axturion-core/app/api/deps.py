@@ -1,10 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 from uuid import UUID
 
-from fastapi import Depends, Header, HTTPException
+from fastapi import Depends, Header, HTTPException, Request, Response
 from sqlalchemy.orm import Session
 
 from app.core.log_context import correlation_id_var
@@ -12,6 +13,7 @@ from app.core.db import get_db
 from app.core.request_context import RequestContext
 from app.core.roles import resolve_scopes_from_role
 from app.domain.identity.models import OrganizationMembership, User
+from app.services.audit_service import latest_audit_seq
 
 
 logger = logging.getLogger(__name__)
@@ -102,3 +104,84 @@ def require_scope(required_scope: str):
             raise HTTPException(status_code=403, detail="Forbidden")
 
     return _require_scope
+
+
+def _opaque_tag(etag: str) -> str:
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+
+    # If-None-Match uses weak comparison.
+    opaque = _opaque_tag(etag)
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or _opaque_tag(candidate) == opaque:
+            return True
+    return False
+
+
+def audit_etag(resource: str):
+    """Conditional GET keyed on the organization's audit watermark.
+
+    The ETag is derived from (organization, caller, resource, request URL,
+    latest audit seq). A matching If-None-Match is answered with 304 before
+    the handler runs. The ETag is weak: CompressionMiddleware serves identity,
+    gzip and br bodies of the same representation under it. Only use this for responses that change exclusively
+    through audited mutations; reports relative to "now" must not use it.
+    """
+
+    def _audit_etag(
+        request: Request,
+        response: Response,
+        ctx: RequestContext = Depends(get_request_context),
+        db: Session = Depends(get_db),
+    ) -> str:
+        seq = latest_audit_seq(db, ctx)
+
+        query = "&".join(
+            f"{key}={value}" for key, value in sorted(request.query_params.multi_items())
+        )
+        basis = "|".join(
+            [
+                str(ctx.organization_id),
+                str(ctx.actor_id),
+                str(ctx.role or ""),
+                ",".join(sorted(ctx.scopes)),
+                resource,
+                request.url.path,
+                query,
+                str(seq),
+            ]
+        )
+        etag = 'W/"' + hashlib.sha256(basis.encode("utf-8")).hexdigest()[:32] + '"'
+
+        headers = {
+            "ETag": etag,
+            "Cache-Control": "private, no-cache",
+            "Vary": "X-Org-Id, X-User-Id",
+        }
+
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers=headers)
+
+        response.headers.update(headers)
+        return etag
+
+    return _audit_etag
+
+
+def drop_audit_etag(response: Response) -> None:
+    """Withdraw the `audit_etag` validator from a response.
+
+    For handlers whose body can lag behind the audit watermark (e.g. reports
+    over derived facts that were not synced): a client must not be able to
+    revalidate such a body into a 304 for the current watermark.
+    """
+
+    for header in ("ETag", "Vary"):
+        if header in response.headers:
+            del response.headers[header]
+    response.headers["Cache-Control"] = "no-store"
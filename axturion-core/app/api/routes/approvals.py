@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+from typing import Literal
+from uuid import UUID
+
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
@@ -25,18 +28,35 @@ router = APIRouter(prefix="/approvals", tags=["approvals"])
         "Lists pending stage transition approvals for the caller's organization.\n\n"
         "Authorization: Requires reporting read scope.\n"
         "Organization boundary: Only returns approvals within the current organization.\n"
-        "Pagination: Supports limit/offset."
+        "Ordering: `sort=newest` (default) or `sort=oldest` (longest waiting first); optional `workflow_id` filter.\n"
+        "Pagination: Supports limit/offset, or keyset paging by passing the last item's `pending_id` as `after`."
     ),
     response_model=list[PendingApprovalItem],
 )
 def list_pending(
     limit: int = 50,
     offset: int = 0,
+    sort: Literal["newest", "oldest"] = "newest",
+    workflow_id: UUID | None = None,
+    after: UUID | None = None,
     _: None = Depends(require_scope(REPORTING_READ)),
     ctx: RequestContext = Depends(get_request_context),
     db: Session = Depends(get_db),
 ):
-    items = list_pending_approvals(db, ctx, limit=limit, offset=offset)
+    try:
+        items = list_pending_approvals(
+            db,
+            ctx,
+            limit=limit,
+            offset=offset,
+            sort=sort,
+            workflow_id=workflow_id,
+            after_id=after,
+        )
+    except PendingApprovalNotFoundError as exc:
+        raise HTTPException(
+            status_code=404, detail="Pending approval not found"
+        ) from exc
     return [PendingApprovalItem(**item) for item in items]
 
 
@@ -1,14 +1,24 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_request_context, require_scope
-from app.api.schemas.audit import AuditVerifyResponse
+from app.api.schemas.audit import (
+    AuditAnchorRunResponse,
+    AuditInclusionProofResponse,
+    AuditVerifyResponse,
+)
 from app.core.db import get_db
 from app.core.request_context import RequestContext
-from app.core.scopes import AUDIT_READ
-from app.services.audit_service import verify_audit_chain
+from app.core.scopes import AUDIT_READ, WORKFLOW_WRITE
+from app.services.audit_service import (
+    ArchivedSegmentError,
+    AuditProofError,
+    anchor_completed_ranges,
+    build_inclusion_proof,
+    verify_audit_chain,
+)
 
 
 router = APIRouter(prefix="/audit", tags=["audit"])
@@ -27,3 +37,54 @@ def verify(
     _: None = Depends(require_scope(AUDIT_READ)),
 ):
     return verify_audit_chain(db, ctx, limit=limit)
+
+
+@router.get(
+    "/proof/{seq}",
+    response_model=AuditInclusionProofResponse,
+    summary="Merkle inclusion proof for an audit entry",
+    description="""
+Returns a Merkle inclusion proof for the audit entry with the given `seq`.
+
+Leaves are SHA-256(0x00 || entry hash), interior nodes SHA-256(0x01 || left || right);
+an odd node is carried up unchanged. Fold `proof` from `leaf_hash` to obtain the anchor `root`.
+`canonical` and `prev_hash` allow recomputing the entry hash itself.
+Entries in a seq range that is not yet complete, or not yet anchored by the anchoring job, return 409.
+""",
+)
+def proof(
+    seq: int,
+    db: Session = Depends(get_db),
+    ctx: RequestContext = Depends(get_request_context),
+    _: None = Depends(require_scope(AUDIT_READ)),
+):
+    try:
+        return build_inclusion_proof(db, ctx, seq)
+    except AuditProofError as exc:
+        if exc.reason == "not_found":
+            raise HTTPException(status_code=404, detail="Audit entry not found")
+        raise HTTPException(status_code=409, detail=exc.reason)
+    except ArchivedSegmentError as exc:
+        raise HTTPException(status_code=409, detail=exc.reason)
+
+
+@router.post(
+    "/anchors",
+    response_model=AuditAnchorRunResponse,
+    summary="Anchor completed audit seq ranges",
+    description="""
+Periodic job: stores Merkle roots for completed audit seq ranges, scanning forward from the last anchor.
+Each range is chain-verified first; a range that fails verification stops the run and is reported.
+Safe to re-run; anchored ranges are skipped.
+""",
+)
+def run_anchoring(
+    max_ranges: int = Query(default=16, ge=1, le=1000),
+    db: Session = Depends(get_db),
+    ctx: RequestContext = Depends(get_request_context),
+    _: None = Depends(require_scope(WORKFLOW_WRITE)),
+):
+    try:
+        return anchor_completed_ranges(db, ctx, max_ranges=max_ranges)
+    except ArchivedSegmentError as exc:
+        raise HTTPException(status_code=409, detail=exc.reason)
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import logging
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+
+from app.api.deps import audit_etag, get_request_context
+from app.api.schemas.bootstrap import BootstrapResponse
+from app.api.schemas.governance import PolicyConfigSchema
+from app.api.schemas.identity import IdentityMeResponse
+from app.api.schemas.ux import UXModuleConfigSchema
+from app.api.schemas.workflows import WorkflowListItem
+from app.core.db import get_db
+from app.core.language import resolve_language
+from app.core.log_context import correlation_id_var
+from app.core.request_context import RequestContext
+from app.core.scopes import UX_READ, WORKFLOW_READ
+from app.domain.identity.models import User
+from app.services.policy_service import get_policy
+from app.services.ux_service import get_ux_configs, normalize_ux_config
+from app.services.workflow_query_service import list_workflows
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter(prefix="/bootstrap", tags=["identity"])
+
+
+MAX_BOOTSTRAP_MODULES = 50
+
+
+def _parse_modules(modules: str | None) -> list[str]:
+    names: list[str] = []
+    for part in (modules or "").split(","):
+        name = part.strip()
+        if name and name not in names:
+            names.append(name)
+    if len(names) > MAX_BOOTSTRAP_MODULES:
+        raise HTTPException(
+            status_code=422,
+            detail=f"at most {MAX_BOOTSTRAP_MODULES} modules can be requested",
+        )
+    return names
+
+
+@router.get(
+    "",
+    summary="Bootstrap the frontend session",
+    description="""
+Returns everything the Command frontend needs on startup in one response:
+identity (with effective language), governance policy, the workflow list and
+the UX config of each requested module (`modules=applications,jobs`).
+
+Scope: Policy and workflows require workflow read scope, UX configs require
+UX read scope; sections the caller cannot read are returned as null.
+Caching: One ETag over the organization's audit watermark, like `/me`.
+""",
+    response_model=BootstrapResponse,
+    response_model_exclude_unset=True,
+)
+def get_bootstrap(
+    modules: str | None = None,
+    _etag: str = Depends(audit_etag("bootstrap")),
+    ctx: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    module_names = _parse_modules(modules)
+
+    user_id = UUID(str(ctx.actor_id))
+    user = db.query(User).filter(User.id == user_id).one()
+
+    # Read once; feeds both the effective language and the policy section.
+    policy = get_policy(db, ctx)
+
+    correlation_id = correlation_id_var.get("-")
+    identity = IdentityMeResponse(
+        organization_id=ctx.organization_id,
+        user_id=user_id,
+        role=str(ctx.role or ""),
+        scopes=sorted(ctx.scopes),
+        language=user.language,
+        default_language=policy.default_language,
+        effective_language=resolve_language(
+            org_default=policy.default_language,
+            user_override=user.language,
+        ),
+        correlation_id=correlation_id,
+        ux={},
+        features={},
+    )
+
+    policy_section: PolicyConfigSchema | None = None
+    workflows: list[WorkflowListItem] | None = None
+    if WORKFLOW_READ in ctx.scopes:
+        policy_section = PolicyConfigSchema(
+            organization_id=str(policy.organization_id),
+            require_4eyes_on_hire=bool(policy.require_4eyes_on_hire),
+            require_4eyes_on_ux_rollback=bool(policy.require_4eyes_on_ux_rollback),
+            stage_aging_sla_days=int(policy.stage_aging_sla_days),
+            default_language=str(policy.default_language),
+            candidate_retention_days=policy.candidate_retention_days,
+            audit_retention_days=policy.audit_retention_days,
+            created_at=policy.created_at,
+            updated_at=policy.updated_at,
+        )
+        workflows = [
+            WorkflowListItem.model_validate(item) for item in list_workflows(db, ctx)
+        ]
+
+    ux: dict[str, UXModuleConfigSchema] | None = None
+    if UX_READ in ctx.scopes:
+        # One query for all requested modules.
+        stored = get_ux_configs(db, ctx, module_names)
+        ux = {
+            name: UXModuleConfigSchema.model_validate(
+                normalize_ux_config(stored[name].config) if name in stored else {}
+            )
+            for name in module_names
+        }
+
+    logger.info(
+        "bootstrap_read",
+        extra={
+            "action": "bootstrap_read",
+            "organization_id": str(ctx.organization_id),
+            "actor_id": str(user_id),
+            "correlation_id": correlation_id,
+            "modules": len(module_names),
+        },
+    )
+
+    return BootstrapResponse(
+        identity=identity,
+        policy=policy_section,
+        workflows=workflows,
+        ux=ux,
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from fastapi.responses import Response
 from sqlalchemy.orm import Session
 
@@ -8,7 +8,10 @@ from app.api.deps import get_request_context, require_scope
 from app.core.db import get_db
 from app.core.request_context import RequestContext
 from app.core.scopes import COMPLIANCE_EXPORT
-from app.services.compliance_service import generate_compliance_bundle
+from app.services.compliance_service import (
+    ComplianceExportError,
+    generate_compliance_bundle,
+)
 
 
 router = APIRouter(prefix="/compliance", tags=["compliance"])
@@ -24,7 +27,12 @@ def export_bundle(
     ctx: RequestContext = Depends(get_request_context),
     _: None = Depends(require_scope(COMPLIANCE_EXPORT)),
 ):
-    bundle = generate_compliance_bundle(db, ctx)
+    try:
+        bundle = generate_compliance_bundle(db, ctx)
+    except ComplianceExportError as exc:
+        raise HTTPException(
+            status_code=409, detail=f"audit archive unreadable: {exc.reason}"
+        )
 
     filename = f"compliance_export_{ctx.organization_id}.zip"
     return Response(
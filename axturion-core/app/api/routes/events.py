@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+from fastapi import APIRouter, Depends, Header, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.api.deps import get_request_context, require_scope
+from app.core.db import get_db
+from app.core.event_bus import BusEvent, event_bus
+from app.core.request_context import RequestContext
+from app.core.scopes import AUDIT_READ
+from app.services.event_stream_service import (
+    parse_last_event_id,
+    replay_audit_events,
+)
+
+
+router = APIRouter(prefix="/events", tags=["events"])
+
+
+HEARTBEAT_SECONDS = 15.0
+
+
+def _format_sse(bus_event: BusEvent) -> str:
+    lines = []
+    # Only audit events carry an id: it is the resume cursor (audit seq).
+    if bus_event.seq is not None:
+        lines.append(f"id: {bus_event.seq}")
+    lines.append(f"event: {bus_event.kind}")
+    lines.append(
+        "data: "
+        + json.dumps(bus_event.data, ensure_ascii=False, separators=(",", ":"), default=str)
+    )
+    return "\n".join(lines) + "\n\n"
+
+
+def _format_resync(reason: str) -> str:
+    return f"event: resync\ndata: {json.dumps({'reason': reason})}\n\n"
+
+
+@router.get(
+    "/stream",
+    summary="Stream organization events (SSE)",
+    description="""
+Server-Sent Events stream of committed activity and audit events for the caller's organization.
+
+Authorization: Requires audit read scope.
+Organization boundary: Only events of the current organization are delivered.
+Filtering: Optionally restrict the stream to one entity (entity_type / entity_id).
+Resume: Audit events carry their audit `seq` as event id; reconnecting with Last-Event-ID replays missed audit events.
+Backpressure: Slow consumers receive a `resync` event and are disconnected; clients should refetch list endpoints.
+""",
+)
+async def stream_events(
+    request: Request,
+    entity_type: str | None = None,
+    entity_id: str | None = None,
+    last_event_id: str | None = Header(default=None, alias="Last-Event-ID"),
+    _: None = Depends(require_scope(AUDIT_READ)),
+    ctx: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    # Subscribe before replaying so nothing committed in between is lost.
+    sub = event_bus.subscribe(
+        str(ctx.organization_id),
+        entity_type=entity_type,
+        entity_id=entity_id,
+    )
+
+    replay: list[BusEvent] = []
+    replay_truncated = False
+    after_seq = parse_last_event_id(last_event_id)
+    if after_seq is not None:
+        try:
+            replay, replay_truncated = await run_in_threadpool(
+                replay_audit_events,
+                db,
+                ctx,
+                after_seq=after_seq,
+                entity_type=entity_type,
+                entity_id=entity_id,
+            )
+        except BaseException:
+            event_bus.unsubscribe(sub)
+            raise
+
+    async def event_source():
+        last_seq = after_seq or 0
+        try:
+            yield "retry: 3000\n\n"
+
+            for bus_event in replay:
+                last_seq = max(last_seq, int(bus_event.seq or 0))
+                yield _format_sse(bus_event)
+
+            if replay_truncated:
+                yield _format_resync("replay_truncated")
+                return
+
+            while True:
+                try:
+                    bus_event = await asyncio.wait_for(
+                        sub.queue.get(), timeout=HEARTBEAT_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    if sub.overflowed:
+                        yield _format_resync("overflow")
+                        return
+                    if await request.is_disconnected():
+                        return
+                    yield ": keepalive\n\n"
+                    continue
+
+                if bus_event.seq is not None:
+                    # Already delivered through the replay.
+                    if bus_event.seq <= last_seq:
+                        continue
+                    last_seq = bus_event.seq
+
+                yield _format_sse(bus_event)
+
+                if sub.overflowed and sub.queue.empty():
+                    yield _format_resync("overflow")
+                    return
+        finally:
+            event_bus.unsubscribe(sub)
+
+    return StreamingResponse(
+        event_source(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -2,23 +2,32 @@ from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_request_context, require_scope
+from app.api.deps import audit_etag, get_request_context, require_scope
 from app.core.db import get_db
+from app.core.partitions import DEFAULT_MONTHS_AHEAD, ensure_future_partitions
 from app.core.request_context import RequestContext
 from app.core.scopes import WORKFLOW_READ, WORKFLOW_WRITE
 from app.api.schemas.governance import (
+    PartitionMaintenanceSchema,
     PolicyConfigSchema,
     PolicyConfigWriteSchema,
+    RetentionExecuteRequestSchema,
+    RetentionExecutionSchema,
     RetentionPreviewSchema,
 )
+from app.audit.archive import ArchiveConfigurationError
 from app.domain.audit.models import AuditLog
 from app.domain.candidate.models import Candidate
 from app.services.policy_service import get_policy, update_policy
-from app.services.retention_service import get_retention_config
+from app.services.retention_service import (
+    RetentionIntegrityError,
+    execute_retention,
+    get_retention_config,
+)
 
 
 router = APIRouter(prefix="/governance", tags=["governance"])
@@ -36,6 +45,7 @@ def _now_utc() -> datetime:
 )
 def fetch_policy(
     _: None = Depends(require_scope(WORKFLOW_READ)),
+    _etag: str = Depends(audit_etag("policy")),
     ctx: RequestContext = Depends(get_request_context),
     db: Session = Depends(get_db),
 ):
@@ -127,3 +137,63 @@ def preview_retention(
         candidates_eligible_for_deletion=candidates_eligible,
         audit_entries_eligible_for_deletion=audit_eligible,
     )
+
+
+@router.post(
+    "/retention/execute",
+    response_model=RetentionExecutionSchema,
+    summary="Execute retention policy",
+    description="""
+Applies the organization's retention policy.
+
+Candidates: eligible candidates are anonymized (default) or deleted in bounded chunks.
+Audit: expired audit entries are moved to compressed archive segments, each anchored by a signed segment seal;
+chain verification continues from the sealed boundary.
+Throttling: `max_rows_per_second` caps throughput so the purge never starves regular traffic.
+Dry run: `dry_run=true` (default) only reports what would be processed.
+""",
+)
+def execute_retention_policy(
+    payload: RetentionExecuteRequestSchema,
+    _: None = Depends(require_scope(WORKFLOW_WRITE)),
+    ctx: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    try:
+        return execute_retention(
+            db,
+            ctx,
+            dry_run=payload.dry_run,
+            candidate_mode=payload.candidate_mode,
+            chunk_size=payload.chunk_size,
+            max_rows_per_second=payload.max_rows_per_second,
+        )
+    except RetentionIntegrityError as exc:
+        raise HTTPException(
+            status_code=409, detail=f"audit chain verification failed: {exc.reason}"
+        )
+    except ArchiveConfigurationError as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+
+
+@router.post(
+    "/partitions/maintain",
+    response_model=PartitionMaintenanceSchema,
+    summary="Maintain audit/activity partitions",
+    description="""
+Creates the monthly `audit_log` and `activity` partitions from the current month up to `months_ahead`
+months ahead (Postgres only; a no-op elsewhere). Rows that already landed in the default partition for
+a month being created are moved into it.
+
+Intended to run periodically (e.g. daily) so partitions never depend on an application restart.
+""",
+)
+def maintain_partitions(
+    months_ahead: int = Query(default=DEFAULT_MONTHS_AHEAD, ge=0, le=24),
+    _: None = Depends(require_scope(WORKFLOW_WRITE)),
+    db: Session = Depends(get_db),
+):
+    return PartitionMaintenanceSchema(
+        months_ahead=months_ahead,
+        partitions=ensure_future_partitions(db, months_ahead=months_ahead),
+    )
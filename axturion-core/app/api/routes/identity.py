@@ -6,7 +6,7 @@ from uuid import UUID
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_request_context
+from app.api.deps import audit_etag, get_request_context
 from app.api.schemas.identity import IdentityMeResponse
 from app.core.db import get_db
 from app.core.language import resolve_language
@@ -31,6 +31,7 @@ Includes effective language resolved from user override + org policy default.
     response_model=IdentityMeResponse,
 )
 def get_me(
+    _etag: str = Depends(audit_etag("identity")),
     ctx: RequestContext = Depends(get_request_context),
     db: Session = Depends(get_db),
 ):
@@ -1,11 +1,18 @@
+from contextlib import contextmanager
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from uuid import UUID
 from app.core.db import get_db
-from app.api.deps import get_request_context, require_scope
-from app.core.scopes import REPORTING_READ
+from app.api.deps import (
+    audit_etag,
+    drop_audit_etag,
+    get_request_context,
+    require_scope,
+)
+from app.core.scopes import REPORTING_READ, WORKFLOW_WRITE
 from app.core.request_context import RequestContext
 from app.api.schemas.approvals import ApprovalsSummaryResponse
 from app.services.approvals_service import approval_summary
@@ -20,7 +27,18 @@ from app.services.lifecycle_reporting_service import (
     time_to_close_stats,
     WorkflowNotFoundError as LifecycleWorkflowNotFoundError,
 )
+from app.reporting.guardrails import ReportingLimitError, reporting_guard
 from app.reporting.window import ReportingWindow
+from app.services.funnel_reporting_service import (
+    get_workflow_funnel,
+    get_workflow_throughput,
+)
+from app.services.occupancy_service import (
+    get_stage_occupancy_series,
+    snapshot_stage_occupancy,
+)
+from app.services.org_reporting_service import iter_org_lifecycle_report
+from app.services.sla_service import emit_new_sla_breaches, list_sla_breaches
 from app.services.stage_duration_breakdown_service import (
     list_stage_duration_breakdown,
 )
@@ -28,17 +46,42 @@ from app.api.schemas.reporting import (
     WorkflowStageSummaryResponse,
     WorkflowStageDurationResponse,
 )
+from app.api.schemas.reporting_funnel import (
+    OccupancySnapshotRequest,
+    OccupancySnapshotResponse,
+    WorkflowFunnelResponse,
+    WorkflowOccupancyResponse,
+    WorkflowThroughputResponse,
+)
 from app.api.schemas.reporting_lifecycle import (
+    OrgLifecycleReportResponse,
     StageAgingItem,
     StageDurationBreakdownItem,
     StageDurationSummaryItem,
     TimeToCloseResult,
     TimeToCloseStatsResponse,
+    WorkflowLifecycleSection,
 )
+from app.api.schemas.reporting_sla import SlaBreachListResponse, SlaBreachScanResponse
 
 router = APIRouter(prefix="/reporting", tags=["reporting"])
 
 
+@contextmanager
+def _report_guard(db: Session, ctx: RequestContext):
+    """Heavy report guardrails (timeout, row budget, per-org concurrency),
+    mapped to 413/503 responses."""
+
+    try:
+        with reporting_guard(db, ctx):
+            yield
+    except ReportingLimitError as exc:
+        headers = (
+            {"Retry-After": str(exc.retry_after)} if exc.retry_after is not None else None
+        )
+        raise HTTPException(status_code=exc.status_code, detail=str(exc), headers=headers)
+
+
 @router.get(
     "/workflows/{workflow_id}/stage-summary",
     summary="Stage distribution for a workflow",
@@ -54,6 +97,7 @@ router = APIRouter(prefix="/reporting", tags=["reporting"])
 def stage_summary(
     workflow_id: str,
     _: None = Depends(require_scope(REPORTING_READ)),
+    _etag: str = Depends(audit_etag("reporting_stage_summary")),
     ctx: RequestContext = Depends(get_request_context),
     db: Session = Depends(get_db),
 ):
@@ -87,6 +131,137 @@ def stage_duration(
         raise HTTPException(status_code=404, detail="Workflow not found")
 
 
+@router.get(
+    "/workflows/{workflow_id}/funnel",
+    summary="Stage-to-stage funnel conversion",
+    description=(
+        "For each workflow stage, counts applications that entered the stage within the window and how many of them "
+        "moved on to a later stage (still within the window); the remainder is reported as drop-off.\n\n"
+        "Source: stage transition facts derived incrementally from the audit log (creation, stage changes, approved transitions).\n"
+        "Window semantics: only entries inside `from`/`to` form the cohort; earlier entries are not counted.\n"
+        "Scope: Strictly workflow-scoped and org-scoped."
+    ),
+    response_model=WorkflowFunnelResponse,
+)
+def workflow_funnel(
+    workflow_id: UUID,
+    response: Response,
+    from_: datetime | None = Query(default=None, alias="from"),
+    to: datetime | None = None,
+    _: None = Depends(require_scope(REPORTING_READ)),
+    _etag: str = Depends(audit_etag("reporting_funnel")),
+    ctx: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    try:
+        window = ReportingWindow(from_datetime=from_, to_datetime=to)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    try:
+        with _report_guard(db, ctx):
+            report = get_workflow_funnel(db, ctx, workflow_id, window=window)
+    except WorkflowNotFoundError:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+
+    # Facts behind the audit log must not be revalidated under its ETag.
+    if not report.pop("facts_current"):
+        drop_audit_etag(response)
+    return report
+
+
+@router.get(
+    "/workflows/{workflow_id}/throughput",
+    summary="Weekly stage throughput",
+    description=(
+        "Counts stage entries per ISO week (Monday, UTC) for a workflow: new applications started, stage transitions, "
+        "and entries per stage. Weeks without activity inside the window are returned with zero counts.\n\n"
+        "Source: stage transition facts derived incrementally from the audit log.\n"
+        "Scope: Strictly workflow-scoped and org-scoped."
+    ),
+    response_model=WorkflowThroughputResponse,
+)
+def workflow_throughput(
+    workflow_id: UUID,
+    response: Response,
+    from_: datetime | None = Query(default=None, alias="from"),
+    to: datetime | None = None,
+    _: None = Depends(require_scope(REPORTING_READ)),
+    _etag: str = Depends(audit_etag("reporting_throughput")),
+    ctx: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    try:
+        window = ReportingWindow(from_datetime=from_, to_datetime=to)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    try:
+        with _report_guard(db, ctx):
+            report = get_workflow_throughput(db, ctx, workflow_id, window=window)
+    except WorkflowNotFoundError:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+
+    # Facts behind the audit log must not be revalidated under its ETag.
+    if not report.pop("facts_current"):
+        drop_audit_etag(response)
+    return report
+
+
+@router.get(
+    "/workflows/{workflow_id}/occupancy",
+    summary="Daily stage occupancy time series",
+    description=(
+        "Returns, for each day in the window, how many applications were in each stage of the workflow at the end "
+        "of that day (UTC), read from daily occupancy snapshots.\n\n"
+        "Window semantics: `from`/`to` are reduced to UTC dates; only days already snapshotted are returned.\n"
+        "Scope: Strictly workflow-scoped and org-scoped."
+    ),
+    response_model=WorkflowOccupancyResponse,
+)
+def workflow_occupancy(
+    workflow_id: UUID,
+    from_: datetime | None = Query(default=None, alias="from"),
+    to: datetime | None = None,
+    _: None = Depends(require_scope(REPORTING_READ)),
+    ctx: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    try:
+        window = ReportingWindow(from_datetime=from_, to_datetime=to)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    try:
+        return get_stage_occupancy_series(db, ctx, workflow_id, window=window)
+    except WorkflowNotFoundError:
+        raise HTTPException(status_code=404, detail="Workflow not found")
+
+
+@router.post(
+    "/occupancy/snapshots",
+    summary="Write daily stage occupancy snapshots",
+    description=(
+        "Daily job: writes end-of-day stage occupancy for every completed day since the last run, up to `through` "
+        "(default: yesterday, UTC). Each day is derived from the previous snapshot plus that day's stage transitions. "
+        "Safe to re-run; days already written are skipped."
+    ),
+    response_model=OccupancySnapshotResponse,
+)
+def run_occupancy_snapshots(
+    payload: OccupancySnapshotRequest | None = None,
+    _: None = Depends(require_scope(WORKFLOW_WRITE)),
+    ctx: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    try:
+        return snapshot_stage_occupancy(
+            db, ctx, through=payload.through if payload else None
+        )
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+
 @router.get(
     "/approvals/summary",
     summary="Pending approvals summary",
@@ -130,6 +305,50 @@ def reporting_stage_aging(
     )
 
 
+@router.get(
+    "/sla-breaches",
+    summary="Open applications in breach of the stage aging SLA",
+    description=(
+        "Lists open applications that have been in their current stage longer than the organization's "
+        "`stage_aging_sla_days`, longest overdue first, with the exact total for pagination. "
+        "`breach_started_at` is the stage entry time plus the SLA.\n\n"
+        "Organization boundary: strictly org-scoped."
+    ),
+    response_model=SlaBreachListResponse,
+)
+def reporting_sla_breaches(
+    workflow_id: UUID | None = None,
+    limit: int = 50,
+    offset: int = 0,
+    _: None = Depends(require_scope(REPORTING_READ)),
+    ctx: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    return list_sla_breaches(
+        db, ctx, workflow_id=workflow_id, limit=limit, offset=offset
+    )
+
+
+@router.post(
+    "/sla-breaches/scan",
+    summary="Emit alerts for new SLA breaches",
+    description=(
+        "Periodic job: records an `sla_breached` activity and fires the `application.sla_breached` automation "
+        "event for every open application whose breach started since the previous scan. The first scan alerts all "
+        "current breaches. Each run reads only the newly breached range, in chunks of `batch_size` that each "
+        "commit and advance the scan watermark."
+    ),
+    response_model=SlaBreachScanResponse,
+)
+def run_sla_breach_scan(
+    batch_size: int = Query(default=500, ge=1, le=5000),
+    _: None = Depends(require_scope(WORKFLOW_WRITE)),
+    ctx: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    return emit_new_sla_breaches(db, ctx, batch_size=batch_size)
+
+
 @router.get(
     "/stage-duration-summary",
     summary="Stage duration summary for closed applications",
@@ -143,11 +362,13 @@ def reporting_stage_aging(
 def reporting_stage_duration_summary(
     workflow_id: UUID,
     _: None = Depends(require_scope(REPORTING_READ)),
+    _etag: str = Depends(audit_etag("reporting_stage_duration_summary")),
     ctx: RequestContext = Depends(get_request_context),
     db: Session = Depends(get_db),
 ):
     try:
-        return stage_duration_summary(db, ctx, workflow_id=workflow_id)
+        with _report_guard(db, ctx):
+            return stage_duration_summary(db, ctx, workflow_id=workflow_id)
     except LifecycleWorkflowNotFoundError:
         raise HTTPException(status_code=404, detail="Workflow not found")
 
@@ -165,10 +386,12 @@ def reporting_time_to_close(
     workflow_id: UUID | None = None,
     result: TimeToCloseResult | None = None,
     _: None = Depends(require_scope(REPORTING_READ)),
+    _etag: str = Depends(audit_etag("reporting_time_to_close")),
     ctx: RequestContext = Depends(get_request_context),
     db: Session = Depends(get_db),
 ):
-    return time_to_close_stats(db, ctx, workflow_id=workflow_id, result=result)
+    with _report_guard(db, ctx):
+        return time_to_close_stats(db, ctx, workflow_id=workflow_id, result=result)
 
 
 @router.get(
@@ -195,4 +418,46 @@ def reporting_stage_duration_breakdown(
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc))
 
-    return list_stage_duration_breakdown(db, ctx, workflow_id=workflow_id, window=window)
+    with _report_guard(db, ctx):
+        return list_stage_duration_breakdown(
+            db, ctx, workflow_id=workflow_id, window=window
+        )
+
+
+@router.get(
+    "/org/lifecycle",
+    summary="Organization-wide lifecycle report",
+    description=(
+        "Computes stage summary, current-stage duration, closed-application stage durations, "
+        "stage duration breakdown and time-to-close for every workflow of the organization in one pass. "
+        "Window semantics: `from`/`to` clip the stage duration breakdown only, as on the per-workflow endpoint. "
+        "With `stream=true` the response is NDJSON, one workflow section per line. "
+        "Organization boundary: strictly org-scoped."
+    ),
+    response_model=OrgLifecycleReportResponse,
+)
+def reporting_org_lifecycle(
+    from_: datetime | None = Query(default=None, alias="from"),
+    to: datetime | None = None,
+    stream: bool = False,
+    _: None = Depends(require_scope(REPORTING_READ)),
+    ctx: RequestContext = Depends(get_request_context),
+    db: Session = Depends(get_db),
+):
+    try:
+        window = ReportingWindow(from_datetime=from_, to_datetime=to)
+        window.validate()
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
+
+    # Computed while the request session is open; only serialization streams.
+    with _report_guard(db, ctx):
+        sections = list(iter_org_lifecycle_report(db, ctx, window=window))
+    if not stream:
+        return {"workflows": sections}
+
+    def ndjson():
+        for section in sections:
+            yield WorkflowLifecycleSection.model_validate(section).model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 from typing import Any
 from uuid import UUID
 
@@ -9,12 +8,20 @@ from fastapi import Response
 from sqlalchemy.orm import Session
 
 from app.core.db import get_db
-from app.api.deps import get_request_context, require_scope
+from app.api.deps import audit_etag, get_request_context, require_scope
 from app.core.request_context import RequestContext
-from app.domain.audit.models import AuditLog
 from app.domain.ux.models import PendingUXRollback
 from app.services.policy_service import get_policy
-from app.services.ux_service import get_ux_config, upsert_ux_config
+from app.services.ux_service import (
+    get_ux_config,
+    get_ux_config_version,
+    latest_ux_config_version,
+    list_ux_config_version_page,
+    normalize_ux_config,
+    record_ux_config_version,
+    snapshot_ux_config,
+    upsert_ux_config,
+)
 from app.core.scopes import UX_READ, UX_WRITE
 from app.api.schemas.ux import (
     UXConfigResponse,
@@ -32,84 +39,23 @@ from app.services.audit_service import append_audit_log
 router = APIRouter(prefix="/ux", tags=["ux"])
 
 
-_ALLOWED_LAYOUTS: set[str] = {"default", "compact", "dense"}
-_ALLOWED_THEMES: set[str] = {"dark", "light", "defense"}
-
-
-def _normalize_flags(value: Any) -> dict[str, bool] | None:
-    if not isinstance(value, dict):
-        return None
-
-    normalized: dict[str, bool] = {}
-    for key, flag_value in value.items():
-        if isinstance(key, str) and isinstance(flag_value, bool):
-            normalized[key] = flag_value
-
-    return normalized or None
-
-
-def _normalize_config(raw: Any) -> dict[str, Any]:
-    # Preserve unknown keys, but harden known ones.
-    if not isinstance(raw, dict):
-        return {}
-
-    config: dict[str, Any] = dict(raw)
-
-    layout = config.get("layout")
-    if isinstance(layout, str) and layout in _ALLOWED_LAYOUTS:
-        config["layout"] = layout
-    else:
-        config.pop("layout", None)
-
-    theme = config.get("theme")
-    if isinstance(theme, str) and theme in _ALLOWED_THEMES:
-        config["theme"] = theme
-    else:
-        config.pop("theme", None)
-
-    flags = _normalize_flags(config.get("flags"))
-    if flags is not None:
-        config["flags"] = flags
-    else:
-        config.pop("flags", None)
-
-    return config
-
-
-def _snapshot_config(raw: Any) -> dict[str, Any]:
-    """Strict snapshot config for versioning/rollback.
-
-    Returns only allowed keys and values. Unknown keys are dropped.
-    """
-
-    if not isinstance(raw, dict):
-        return {}
-
-    snapshot: dict[str, Any] = {}
-
-    layout = raw.get("layout")
-    if isinstance(layout, str) and layout in _ALLOWED_LAYOUTS:
-        snapshot["layout"] = layout
-
-    theme = raw.get("theme")
-    if isinstance(theme, str) and theme in _ALLOWED_THEMES:
-        snapshot["theme"] = theme
-
-    flags = _normalize_flags(raw.get("flags"))
-    if flags is not None:
-        snapshot["flags"] = flags
-
-    return snapshot
-
-
-def _audit_payload_to_dict(payload_text: str | None) -> dict[str, Any]:
-    if not payload_text:
-        return {}
-    try:
-        parsed = json.loads(payload_text)
-    except Exception:
-        return {}
-    return parsed if isinstance(parsed, dict) else {}
+def _record_version(
+    db: Session, ctx: RequestContext, module: str, audit_log, raw_config: Any
+) -> None:
+    previous = latest_ux_config_version(db, ctx, module)
+    snapshot = snapshot_ux_config(raw_config)
+    diff = _compute_diff(
+        previous.snapshot_json if previous is not None else None, snapshot
+    )
+    record_ux_config_version(
+        db,
+        ctx,
+        module,
+        audit_log=audit_log,
+        snapshot=snapshot,
+        diff=diff.model_dump(by_alias=True, exclude_unset=True) if diff else None,
+        previous=previous,
+    )
 
 
 def _compute_diff(
@@ -189,6 +135,7 @@ def _compute_diff(
 def fetch_ux_config(
     module: str,
     _: None = Depends(require_scope(UX_READ)),
+    _etag: str = Depends(audit_etag("ux_config")),
     ctx: RequestContext = Depends(get_request_context),
     db: Session = Depends(get_db),
 ):
@@ -196,7 +143,7 @@ def fetch_ux_config(
     if record is None:
         return UXConfigResponse(module=module.strip(), config=UXModuleConfigSchema())
 
-    normalized_config = _normalize_config(record.config)
+    normalized_config = normalize_ux_config(record.config)
     return UXConfigResponse(
         module=record.module,
         config=UXModuleConfigSchema.model_validate(normalized_config),
@@ -213,6 +160,7 @@ def list_ux_config_versions(
     limit: int = 50,
     offset: int = 0,
     _: None = Depends(require_scope(UX_READ)),
+    _etag: str = Depends(audit_etag("ux_config_versions")),
     ctx: RequestContext = Depends(get_request_context),
     db: Session = Depends(get_db),
 ):
@@ -221,57 +169,34 @@ def list_ux_config_versions(
         raise HTTPException(status_code=422, detail="module is required")
 
     current = get_ux_config(db, ctx, normalized_module)
-    current_snapshot = _snapshot_config(current.config) if current is not None else None
+    current_snapshot = snapshot_ux_config(current.config) if current is not None else None
 
-    entity_id = f"{ctx.organization_id}:{normalized_module}"
     limit = max(1, min(int(limit), 500))
     offset = max(0, int(offset))
 
-    base_query = (
-        db.query(AuditLog)
-        .filter(
-            AuditLog.organization_id == ctx.organization_id,
-            AuditLog.entity_type == "ux_config",
-            AuditLog.action == "ux_config_updated",
-            AuditLog.entity_id == entity_id,
-        )
-        .order_by(AuditLog.seq.asc())
+    versions = list_ux_config_version_page(
+        db, ctx, normalized_module, offset=offset, limit=limit
     )
 
-    rows = base_query.offset(offset).limit(limit).all()
-    if not rows:
-        return []
-
     items: list[UXConfigVersionItem] = []
-    prev_snapshot: dict[str, Any] | None = None
-    if offset > 0:
-        prev_row = base_query.offset(offset - 1).limit(1).first()
-        if prev_row is not None:
-            prev_payload = _audit_payload_to_dict(prev_row.payload)
-            prev_snapshot = _snapshot_config(prev_payload.get("config"))
-
-    for idx, row in enumerate(rows, start=offset + 1):
-        payload = _audit_payload_to_dict(row.payload)
-        raw_config = payload.get("config")
-        snapshot = _snapshot_config(raw_config)
-
-        is_active = current_snapshot is not None and snapshot == current_snapshot
-        diff = _compute_diff(prev_snapshot, snapshot)
-
+    for row in versions:
+        snapshot = row.snapshot_json or {}
         items.append(
             UXConfigVersionItem(
-                version=idx,
-                audit_log_id=str(row.id),
+                version=int(row.version),
+                audit_log_id=str(row.audit_log_id),
                 created_at=row.created_at,
                 actor_id=str(row.actor_id or ""),
                 config=UXModuleConfigSchema.model_validate(snapshot),
-                is_active=is_active,
-                diff=diff,
+                is_active=current_snapshot is not None and snapshot == current_snapshot,
+                diff=(
+                    UXConfigDiff.model_validate(row.diff_json)
+                    if row.diff_json
+                    else None
+                ),
             )
         )
 
-        prev_snapshot = snapshot
-
     return items
 
 
@@ -291,7 +216,7 @@ def update_ux_config(
     config_to_store = payload.model_dump(exclude_none=True, exclude_unset=True)
     record = upsert_ux_config(db, ctx, module, config_to_store, commit=False)
 
-    append_audit_log(
+    log = append_audit_log(
         db,
         ctx,
         entity_type="ux_config",
@@ -299,10 +224,11 @@ def update_ux_config(
         action="ux_config_updated",
         payload={"module": record.module, "config": config_to_store},
     )
+    _record_version(db, ctx, record.module, log, config_to_store)
 
     db.commit()
     db.refresh(record)
-    normalized_config = _normalize_config(record.config)
+    normalized_config = normalize_ux_config(record.config)
     return UXConfigResponse(
         module=record.module,
         config=UXModuleConfigSchema.model_validate(normalized_config),
@@ -325,7 +251,7 @@ def put_ux_config(
     config_to_store = payload.model_dump(exclude_none=True, exclude_unset=True)
     record = upsert_ux_config(db, ctx, module, config_to_store, commit=False)
 
-    append_audit_log(
+    log = append_audit_log(
         db,
         ctx,
         entity_type="ux_config",
@@ -333,11 +259,12 @@ def put_ux_config(
         action="ux_config_updated",
         payload={"module": record.module, "config": config_to_store},
     )
+    _record_version(db, ctx, record.module, log, config_to_store)
 
     db.commit()
     db.refresh(record)
 
-    normalized_config = _normalize_config(record.config)
+    normalized_config = normalize_ux_config(record.config)
     return UXConfigResponse(
         module=record.module,
         config=UXModuleConfigSchema.model_validate(normalized_config),
@@ -385,20 +312,10 @@ def rollback_ux_config(
 
         if pending is None:
             # Validate version exists before creating a pending approval.
-            existing_version_row = (
-                db.query(AuditLog.id)
-                .filter(
-                    AuditLog.organization_id == ctx.organization_id,
-                    AuditLog.entity_type == "ux_config",
-                    AuditLog.action == "ux_config_updated",
-                    AuditLog.entity_id == entity_id,
-                )
-                .order_by(AuditLog.seq.asc())
-                .offset(int(body.version) - 1)
-                .limit(1)
-                .first()
+            existing_version = get_ux_config_version(
+                db, ctx, normalized_module, int(body.version)
             )
-            if existing_version_row is None:
+            if existing_version is None:
                 raise HTTPException(
                     status_code=404, detail="UX config version not found"
                 )
@@ -457,25 +374,12 @@ def rollback_ux_config(
 
         # Continue below to perform the actual rollback and write the canonical rollback audit.
 
-    row = (
-        db.query(AuditLog)
-        .filter(
-            AuditLog.organization_id == ctx.organization_id,
-            AuditLog.entity_type == "ux_config",
-            AuditLog.action == "ux_config_updated",
-            AuditLog.entity_id == entity_id,
-        )
-        .order_by(AuditLog.seq.asc())
-        .offset(int(body.version) - 1)
-        .limit(1)
-        .first()
-    )
+    version = get_ux_config_version(db, ctx, normalized_module, int(body.version))
 
-    if row is None:
+    if version is None:
         raise HTTPException(status_code=404, detail="UX config version not found")
 
-    payload = _audit_payload_to_dict(row.payload)
-    snapshot = _snapshot_config(payload.get("config"))
+    snapshot = dict(version.snapshot_json or {})
 
     record = upsert_ux_config(db, ctx, normalized_module, snapshot, commit=False)
 
@@ -494,7 +398,7 @@ def rollback_ux_config(
     db.commit()
     db.refresh(record)
 
-    normalized_config = _normalize_config(record.config)
+    normalized_config = normalize_ux_config(record.config)
     return UXConfigResponse(
         module=record.module,
         config=UXModuleConfigSchema.model_validate(normalized_config),
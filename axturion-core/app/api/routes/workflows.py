@@ -1,7 +1,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_request_context, require_scope
+from app.api.deps import audit_etag, get_request_context, require_scope
 from app.api.schemas.workflows import WorkflowListItem
 from app.core.scopes import WORKFLOW_READ
 from app.core.request_context import RequestContext
@@ -29,6 +29,7 @@ Performance: No stages/transitions are joined or returned.
 )
 def list_workflows_endpoint(
     _: None = Depends(require_scope(WORKFLOW_READ)),
+    _etag: str = Depends(audit_etag("workflows")),
     ctx: RequestContext = Depends(get_request_context),
     db: Session = Depends(get_db),
 ):
@@ -50,6 +51,7 @@ Errors: Returns not-found when the workflow identifier is unknown.
 )
 def get_workflow(
     workflow_id: str,
+    _etag: str = Depends(audit_etag("workflow")),
     ctx: RequestContext = Depends(get_request_context),
     db: Session = Depends(get_db),
 ):
@@ -15,6 +15,7 @@ class PendingApprovalItem(BaseModel):
 
     workflow_id: UUID | None = None
     current_stage: str | None = None
+    pending_id: UUID | None = None
 
     model_config = ConfigDict(from_attributes=True)
 
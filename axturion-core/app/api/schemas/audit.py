@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from datetime import datetime
+from typing import Literal
 from uuid import UUID
 
 from pydantic import BaseModel, ConfigDict
@@ -7,7 +9,9 @@ from pydantic import BaseModel, ConfigDict
 
 class AuditVerifyError(BaseModel):
     seq: int
-    audit_log_id: UUID
+    # The failing row, or the segment seal when archived history is broken.
+    audit_log_id: UUID | None = None
+    segment_seal_id: UUID | None = None
     reason: str
 
     model_config = ConfigDict(from_attributes=True)
@@ -21,3 +25,34 @@ class AuditVerifyResponse(BaseModel):
     error: AuditVerifyError | None = None
 
     model_config = ConfigDict(from_attributes=True)
+
+
+class AuditMerkleAnchorSchema(BaseModel):
+    first_seq: int
+    last_seq: int
+    leaf_count: int
+    root: str
+    created_at: datetime | None = None
+
+
+class AuditAnchorRunResponse(BaseModel):
+    anchored: int
+    anchored_through_seq: int
+    failed_first_seq: int | None = None
+    failed_last_seq: int | None = None
+
+
+class AuditProofStep(BaseModel):
+    position: Literal["left", "right"]
+    hash: str
+
+
+class AuditInclusionProofResponse(BaseModel):
+    seq: int
+    audit_log_id: UUID
+    prev_hash: str | None = None
+    hash: str
+    canonical: str
+    leaf_hash: str
+    anchor: AuditMerkleAnchorSchema
+    proof: list[AuditProofStep]
@@ -0,0 +1,16 @@
+from __future__ import annotations
+
+from pydantic import BaseModel
+
+from app.api.schemas.governance import PolicyConfigSchema
+from app.api.schemas.identity import IdentityMeResponse
+from app.api.schemas.ux import UXModuleConfigSchema
+from app.api.schemas.workflows import WorkflowListItem
+
+
+class BootstrapResponse(BaseModel):
+    identity: IdentityMeResponse
+    # Sections the caller has no read scope for are returned as null.
+    policy: PolicyConfigSchema | None = None
+    workflows: list[WorkflowListItem] | None = None
+    ux: dict[str, UXModuleConfigSchema] | None = None
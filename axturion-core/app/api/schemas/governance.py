@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -15,8 +16,9 @@ class PolicyConfigSchema(BaseModel):
     default_language: Language = DEFAULT_LANGUAGE
     candidate_retention_days: int | None = Field(default=None, ge=1)
     audit_retention_days: int | None = Field(default=None, ge=1)
-    created_at: datetime
-    updated_at: datetime
+    # None until the organization's policy has been stored.
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
 
 
 class PolicyConfigWriteSchema(BaseModel):
@@ -35,3 +37,31 @@ class RetentionPreviewSchema(BaseModel):
     audit_retention_days: int | None
     candidates_eligible_for_deletion: int
     audit_entries_eligible_for_deletion: int
+
+
+class RetentionExecuteRequestSchema(BaseModel):
+    model_config = ConfigDict(extra="forbid")
+
+    dry_run: bool = True
+    candidate_mode: Literal["anonymize", "delete"] = "anonymize"
+    chunk_size: int = Field(default=500, ge=1, le=5000)
+    max_rows_per_second: int | None = Field(default=None, ge=1)
+
+
+class PartitionMaintenanceSchema(BaseModel):
+    months_ahead: int
+    partitions: list[str]
+
+
+class RetentionExecutionSchema(BaseModel):
+    dry_run: bool
+    candidate_mode: Literal["anonymize", "delete"]
+    candidate_retention_days: int | None
+    audit_retention_days: int | None
+    candidates_eligible: int
+    candidates_processed: int
+    audit_entries_eligible: int
+    audit_entries_archived: int
+    audit_segments_written: int
+    archived_through_seq: int
+    elapsed_seconds: float
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class FunnelStageItem(BaseModel):
+    stage: str
+    entered: int
+    advanced: int
+    dropped: int
+    conversion_rate: float
+
+
+class WorkflowFunnelResponse(BaseModel):
+    workflow_id: str
+    workflow_name: str
+    stages: list[FunnelStageItem]
+
+
+class ThroughputStageCount(BaseModel):
+    stage: str
+    entered: int
+
+
+class ThroughputWeek(BaseModel):
+    week_start: date
+    started: int
+    transitions: int
+    stages: list[ThroughputStageCount]
+
+
+class WorkflowThroughputResponse(BaseModel):
+    workflow_id: str
+    workflow_name: str
+    weeks: list[ThroughputWeek]
+
+
+class OccupancyStageCount(BaseModel):
+    stage: str
+    count: int
+
+
+class OccupancyDay(BaseModel):
+    day: date
+    stages: list[OccupancyStageCount]
+
+
+class WorkflowOccupancyResponse(BaseModel):
+    workflow_id: str
+    workflow_name: str
+    days: list[OccupancyDay]
+
+
+class OccupancySnapshotRequest(BaseModel):
+    through: date | None = None
+
+
+class OccupancySnapshotResponse(BaseModel):
+    days_written: int
+    through: date | None
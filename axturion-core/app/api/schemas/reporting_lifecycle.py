@@ -5,6 +5,8 @@ from uuid import UUID
 
 from pydantic import BaseModel
 
+from app.api.schemas.reporting import StageDurationItem, StageSummaryItem
+
 
 class StageAgingItem(BaseModel):
     application_id: UUID
@@ -38,3 +40,17 @@ class TimeToCloseStatsResponse(BaseModel):
 
 
 TimeToCloseResult = Literal["hired", "rejected"]
+
+
+class WorkflowLifecycleSection(BaseModel):
+    workflow_id: UUID
+    workflow_name: str
+    stage_summary: list[StageSummaryItem]
+    stage_duration: list[StageDurationItem]
+    stage_duration_summary: list[StageDurationSummaryItem]
+    stage_duration_breakdown: list[StageDurationBreakdownItem]
+    time_to_close: TimeToCloseStatsResponse
+
+
+class OrgLifecycleReportResponse(BaseModel):
+    workflows: list[WorkflowLifecycleSection]
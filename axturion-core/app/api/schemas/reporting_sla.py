@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class SlaBreachItem(BaseModel):
+    application_id: UUID
+    workflow_id: UUID
+    stage: str
+    stage_entered_at: datetime
+    breach_started_at: datetime
+    overdue_seconds: int
+
+
+class SlaBreachListResponse(BaseModel):
+    sla_days: int
+    as_of: datetime
+    total: int
+    limit: int
+    offset: int
+    items: list[SlaBreachItem]
+
+
+class SlaBreachScanResponse(BaseModel):
+    emitted: int
+    as_of: datetime
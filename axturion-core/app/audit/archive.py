@@ -0,0 +1,456 @@
+"""Cold storage for audit history.
+
+Archived audit rows are written to compressed, seekable segment files. Each
+segment is anchored by a seal: an HMAC over the segment boundary (first/last
+seq, the chain hash entering and leaving the segment) and the file digest.
+The hot chain continues from the last sealed hash.
+
+Segment file layout::
+
+    MAGIC
+    block 0 .. block N-1   compressed JSON lines, one record per audit row
+    index                  JSON: codec + per-block seq range, offset, digest,
+                           boundary hashes
+    trailer                index offset (u64 LE), index length (u64 LE),
+                           index MAC (32 bytes), MAGIC
+
+Each record holds the row's canonical bytes (`canonical_audit_payload`), so
+the chain can be recomputed from the archive alone. `ArchiveReader`
+memory-maps the file, parses only the index and decompresses just the
+block(s) needed for a single row or a seq range.
+
+The index MAC is an HMAC with the seal key, so opening a segment checks the
+index against its seal without hashing the whole file; every block read is
+then checked against the block's indexed digest and boundary hashes.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import hmac
+import json
+import mmap
+import os
+import struct
+import uuid
+import zlib
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Iterator
+
+from app.core.audit_hashing import canonical_audit_payload, compute_hash
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - zstandard is optional
+    zstandard = None
+
+
+DEFAULT_ARCHIVE_DIR = "var/audit-archive"
+DEFAULT_BLOCK_ROWS = 256
+
+MAGIC = b"AXAUDIT1"
+_TRAILER = struct.Struct("<QQ32s8s")
+
+# Verifies test fixtures outside prod. Nothing is sealed with it: retention
+# refuses to archive without AUDIT_SEAL_KEY (see `require_seal_key`).
+_DEV_SEAL_KEY = "axturion-dev-audit-seal-key"
+
+
+class ArchiveConfigurationError(Exception):
+    pass
+
+
+class ArchiveFormatError(Exception):
+    pass
+
+
+def archive_dir() -> Path:
+    return Path(os.getenv("AUDIT_ARCHIVE_DIR", DEFAULT_ARCHIVE_DIR))
+
+
+def default_codec() -> str:
+    return "zstd" if zstandard is not None else "zlib"
+
+
+def _compress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise ArchiveConfigurationError("zstandard is not installed")
+        return zstandard.ZstdCompressor(level=9).compress(data)
+    if codec == "zlib":
+        return zlib.compress(data, 9)
+    raise ArchiveFormatError(f"unsupported codec: {codec}")
+
+
+def _decompress(codec: str, data: bytes) -> bytes:
+    if codec == "zstd":
+        if zstandard is None:
+            raise ArchiveConfigurationError("zstandard is not installed")
+        return zstandard.ZstdDecompressor().decompress(data)
+    if codec == "zlib":
+        return zlib.decompress(data)
+    raise ArchiveFormatError(f"unsupported codec: {codec}")
+
+
+def require_seal_key() -> None:
+    """Raise ArchiveConfigurationError unless AUDIT_SEAL_KEY is configured."""
+
+    if not os.getenv("AUDIT_SEAL_KEY"):
+        raise ArchiveConfigurationError(
+            "AUDIT_SEAL_KEY is required to archive audit data"
+        )
+
+
+def _seal_key() -> bytes:
+    key = os.getenv("AUDIT_SEAL_KEY")
+    if not key:
+        if os.getenv("ENV", "dev").lower() == "prod":
+            raise ArchiveConfigurationError("AUDIT_SEAL_KEY is required in prod")
+        key = _DEV_SEAL_KEY
+    return key.encode("utf-8")
+
+
+@dataclass(frozen=True, slots=True)
+class SegmentBoundary:
+    organization_id: str
+    first_seq: int
+    last_seq: int
+    row_count: int
+    first_prev_hash: str | None
+    last_hash: str
+    archive_sha256: str
+
+
+def boundary_from_seal(seal) -> SegmentBoundary:
+    return SegmentBoundary(
+        organization_id=str(seal.organization_id),
+        first_seq=int(seal.first_seq),
+        last_seq=int(seal.last_seq),
+        row_count=int(seal.row_count),
+        first_prev_hash=seal.first_prev_hash,
+        last_hash=str(seal.last_hash),
+        archive_sha256=str(seal.archive_sha256),
+    )
+
+
+def compute_segment_seal(boundary: SegmentBoundary) -> str:
+    message = "|".join(
+        [
+            boundary.organization_id,
+            str(int(boundary.first_seq)),
+            str(int(boundary.last_seq)),
+            str(int(boundary.row_count)),
+            boundary.first_prev_hash or "",
+            boundary.last_hash,
+            boundary.archive_sha256,
+        ]
+    ).encode("utf-8")
+    return hmac.new(_seal_key(), message, hashlib.sha256).hexdigest()
+
+
+def verify_segment_seal(boundary: SegmentBoundary, seal: str) -> bool:
+    return hmac.compare_digest(compute_segment_seal(boundary), str(seal))
+
+
+def _index_mac(index: bytes) -> bytes:
+    return hmac.new(_seal_key(), b"audit-index\x00" + index, hashlib.sha256).digest()
+
+
+@dataclass(frozen=True, slots=True)
+class BlockInfo:
+    first_seq: int
+    last_seq: int
+    offset: int
+    length: int
+    first_prev_hash: str | None
+    first_hash: str
+    last_hash: str
+    # SHA-256 of the compressed block.
+    sha256: str
+
+
+@dataclass(slots=True)
+class ArchivedAuditRow:
+    """Audit row restored from an archive segment (duck-types `AuditLog`)."""
+
+    id: uuid.UUID
+    organization_id: str
+    actor_id: str | None
+    entity_type: str | None
+    entity_id: str | None
+    action: str | None
+    payload: Any
+    created_at: datetime | None
+    seq: int
+    prev_hash: str | None
+    hash: str
+
+    @classmethod
+    def from_record(cls, record: dict) -> "ArchivedAuditRow":
+        body = json.loads(record["canonical"])
+        created_at = body.get("created_at") or None
+        return cls(
+            id=uuid.UUID(record["id"]),
+            organization_id=body["organization_id"],
+            actor_id=body.get("actor_id") or None,
+            entity_type=body.get("entity_type") or None,
+            entity_id=body.get("entity_id") or None,
+            action=body.get("action") or None,
+            payload=record.get("payload"),
+            created_at=datetime.fromisoformat(created_at) if created_at else None,
+            seq=int(record["seq"]),
+            prev_hash=record["prev_hash"],
+            hash=record["hash"],
+        )
+
+
+def _segment_path(root: Path, organization_id: str, first_seq: int, last_seq: int) -> Path:
+    return root / organization_id / f"audit-{first_seq:012d}-{last_seq:012d}.axa"
+
+
+def _record(row) -> dict:
+    return {
+        "id": str(row.id),
+        "seq": int(row.seq),
+        "prev_hash": row.prev_hash,
+        "hash": str(row.hash),
+        "payload": row.payload,
+        "canonical": canonical_audit_payload(row).decode("utf-8"),
+    }
+
+
+def write_segment(
+    rows: list,
+    *,
+    root: Path | None = None,
+    block_rows: int = DEFAULT_BLOCK_ROWS,
+    codec: str | None = None,
+) -> tuple[Path, SegmentBoundary]:
+    """Write a contiguous, seq-ordered run of audit rows to a segment file."""
+
+    if not rows:
+        raise ValueError("cannot archive an empty segment")
+
+    codec = codec or default_codec()
+    organization_id = str(rows[0].organization_id)
+    first, last = rows[0], rows[-1]
+    path = _segment_path(
+        root or archive_dir(), organization_id, int(first.seq), int(last.seq)
+    )
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    blocks: list[dict] = []
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as fh:
+        fh.write(MAGIC)
+        offset = len(MAGIC)
+
+        for start in range(0, len(rows), max(1, int(block_rows))):
+            chunk = rows[start : start + block_rows]
+            raw = b"".join(
+                json.dumps(_record(row), separators=(",", ":"), default=str).encode(
+                    "utf-8"
+                )
+                + b"\n"
+                for row in chunk
+            )
+            data = _compress(codec, raw)
+            fh.write(data)
+            blocks.append(
+                {
+                    "first_seq": int(chunk[0].seq),
+                    "last_seq": int(chunk[-1].seq),
+                    "offset": offset,
+                    "length": len(data),
+                    "sha256": hashlib.sha256(data).hexdigest(),
+                    "first_prev_hash": chunk[0].prev_hash,
+                    "first_hash": str(chunk[0].hash),
+                    "last_hash": str(chunk[-1].hash),
+                }
+            )
+            offset += len(data)
+
+        index = json.dumps(
+            {
+                "version": 1,
+                "codec": codec,
+                "organization_id": organization_id,
+                "blocks": blocks,
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        fh.write(index)
+        fh.write(_TRAILER.pack(offset, len(index), _index_mac(index), MAGIC))
+    os.replace(tmp_path, path)
+
+    boundary = SegmentBoundary(
+        organization_id=organization_id,
+        first_seq=int(first.seq),
+        last_seq=int(last.seq),
+        row_count=len(rows),
+        first_prev_hash=first.prev_hash,
+        last_hash=str(last.hash),
+        archive_sha256=file_sha256(path),
+    )
+    return path, boundary
+
+
+def file_sha256(path: Path) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1 << 20), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+class ArchiveReader:
+    """Random access to a segment file via mmap and the footer index."""
+
+    def __init__(self, path: Path | str):
+        self.path = Path(path)
+        self._fh = open(self.path, "rb")
+        try:
+            self._map = mmap.mmap(self._fh.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:  # empty file
+            self._fh.close()
+            raise ArchiveFormatError("empty archive segment") from exc
+
+        try:
+            self._load_index()
+        except Exception:
+            self.close()
+            raise
+
+    def _load_index(self) -> None:
+        size = len(self._map)
+        if size < len(MAGIC) + _TRAILER.size or self._map[: len(MAGIC)] != MAGIC:
+            raise ArchiveFormatError("not an audit archive segment")
+
+        index_offset, index_length, index_mac, magic = _TRAILER.unpack_from(
+            self._map, size - _TRAILER.size
+        )
+        if magic != MAGIC or index_offset + index_length > size - _TRAILER.size:
+            raise ArchiveFormatError("corrupt archive trailer")
+
+        self._index_bytes = bytes(self._map[index_offset : index_offset + index_length])
+        self.index_mac: bytes = index_mac
+        index = json.loads(self._index_bytes)
+        self.codec: str = index["codec"]
+        self.organization_id: str = index["organization_id"]
+        self.blocks: list[BlockInfo] = [BlockInfo(**b) for b in index["blocks"]]
+        self._first_seqs = [b.first_seq for b in self.blocks]
+
+    def __enter__(self) -> "ArchiveReader":
+        return self
+
+    def __exit__(self, *_exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._map.close()
+        self._fh.close()
+
+    @property
+    def first_seq(self) -> int:
+        return self.blocks[0].first_seq
+
+    @property
+    def last_seq(self) -> int:
+        return self.blocks[-1].last_seq
+
+    def verify_index(self, boundary: SegmentBoundary) -> bool:
+        """Check the index MAC and that the index matches the sealed boundary."""
+
+        if not hmac.compare_digest(_index_mac(self._index_bytes), self.index_mac):
+            return False
+        if not self.blocks or self.organization_id != boundary.organization_id:
+            return False
+        expected_seq = boundary.first_seq
+        prev_hash = boundary.first_prev_hash
+        for block in self.blocks:
+            if block.first_seq != expected_seq:
+                return False
+            if (block.first_prev_hash or None) != (prev_hash or None):
+                return False
+            expected_seq = block.last_seq + 1
+            prev_hash = block.last_hash
+        return expected_seq - 1 == boundary.last_seq and prev_hash == boundary.last_hash
+
+    def _block_records(self, block: BlockInfo) -> list[dict]:
+        raw = self._map[block.offset : block.offset + block.length]
+        if hashlib.sha256(raw).hexdigest() != block.sha256:
+            raise ArchiveFormatError(f"block {block.first_seq} digest mismatch")
+        data = _decompress(self.codec, raw)
+        records = [json.loads(line) for line in data.splitlines() if line]
+        if (
+            len(records) != block.last_seq - block.first_seq + 1
+            or (records[0]["prev_hash"] or None) != (block.first_prev_hash or None)
+            or records[0]["hash"] != block.first_hash
+            or records[-1]["hash"] != block.last_hash
+        ):
+            raise ArchiveFormatError(f"block {block.first_seq} does not match the index")
+        return records
+
+    def _block_index(self, seq: int) -> int | None:
+        i = bisect.bisect_right(self._first_seqs, int(seq)) - 1
+        if i < 0 or seq > self.blocks[i].last_seq:
+            return None
+        return i
+
+    def get(self, seq: int) -> dict | None:
+        """Return the archived record for `seq` (decompresses one block)."""
+
+        i = self._block_index(seq)
+        if i is None:
+            return None
+        block = self.blocks[i]
+        return self._block_records(block)[int(seq) - block.first_seq]
+
+    def iter_range(self, first_seq: int, last_seq: int) -> Iterator[dict]:
+        """Yield records with first_seq <= seq <= last_seq in seq order."""
+
+        first_seq = max(int(first_seq), self.first_seq)
+        i = self._block_index(first_seq)
+        if i is None:
+            return
+        for block in self.blocks[i:]:
+            if block.first_seq > last_seq:
+                return
+            for record in self._block_records(block):
+                seq = int(record["seq"])
+                if seq < first_seq:
+                    continue
+                if seq > last_seq:
+                    return
+                yield record
+
+    def iter_rows(self, first_seq: int, last_seq: int) -> Iterator[ArchivedAuditRow]:
+        for record in self.iter_range(first_seq, last_seq):
+            yield ArchivedAuditRow.from_record(record)
+
+
+def verify_segment_file(path: Path, boundary: SegmentBoundary) -> bool:
+    """Recompute the hash chain stored in a segment file against its seal."""
+
+    if file_sha256(path) != boundary.archive_sha256:
+        return False
+
+    prev_hash = boundary.first_prev_hash
+    expected_seq = boundary.first_seq
+    with ArchiveReader(path) as reader:
+        for record in reader.iter_range(boundary.first_seq, boundary.last_seq):
+            if int(record["seq"]) != expected_seq:
+                return False
+            if (record["prev_hash"] or None) != (prev_hash or None):
+                return False
+            expected_hash = compute_hash(
+                prev_hash, record["canonical"].encode("utf-8")
+            )
+            if record["hash"] != expected_hash:
+                return False
+            prev_hash = expected_hash
+            expected_seq += 1
+    return expected_seq - 1 == boundary.last_seq and prev_hash == boundary.last_hash
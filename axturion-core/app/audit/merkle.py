@@ -0,0 +1,65 @@
+"""Merkle trees over audit chain hashes.
+
+Leaves are the audit rows' chain hashes (which already commit to the
+canonical payload and the previous hash). Leaf and interior nodes use
+distinct prefixes (0x00 / 0x01) so a leaf can never be passed off as an
+interior node. An odd node at the end of a level is carried up unchanged.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Literal, Sequence
+
+
+Side = Literal["left", "right"]
+
+
+def leaf_hash(entry_hash: str) -> bytes:
+    return hashlib.sha256(b"\x00" + entry_hash.encode("ascii")).digest()
+
+
+def node_hash(left: bytes, right: bytes) -> bytes:
+    return hashlib.sha256(b"\x01" + left + right).digest()
+
+
+def _next_level(level: Sequence[bytes]) -> list[bytes]:
+    paired = [node_hash(level[i], level[i + 1]) for i in range(0, len(level) - 1, 2)]
+    if len(level) % 2:
+        paired.append(level[-1])
+    return paired
+
+
+def merkle_root(leaves: Sequence[bytes]) -> bytes:
+    if not leaves:
+        raise ValueError("cannot compute the root of an empty tree")
+    level = list(leaves)
+    while len(level) > 1:
+        level = _next_level(level)
+    return level[0]
+
+
+def inclusion_proof(leaves: Sequence[bytes], index: int) -> list[tuple[Side, bytes]]:
+    """Return sibling hashes from leaf `index` up to the root."""
+
+    if not 0 <= index < len(leaves):
+        raise IndexError(index)
+
+    proof: list[tuple[Side, bytes]] = []
+    level = list(leaves)
+    while len(level) > 1:
+        sibling = index ^ 1
+        if sibling < len(level):
+            proof.append(("left" if sibling < index else "right", level[sibling]))
+        index //= 2
+        level = _next_level(level)
+    return proof
+
+
+def verify_inclusion(
+    leaf: bytes, proof: Sequence[tuple[Side, bytes]], root: bytes
+) -> bool:
+    node = leaf
+    for side, sibling in proof:
+        node = node_hash(sibling, node) if side == "left" else node_hash(node, sibling)
+    return node == root
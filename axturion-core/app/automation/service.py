@@ -1,7 +1,7 @@
 import json
 from uuid import UUID
 from sqlalchemy.orm import Session
-from app.domain.automation.models import AutomationRule, Activity
+from app.domain.automation.models import AutomationRule
 from app.services.activity_service import create_activity
 
 
@@ -47,13 +47,13 @@ def handle_event(db: Session, event_type: str, payload: dict):
         elif rule.action_type == "send_email":
             # later: echte mail service; nu alleen loggen/activities
             data = json.loads(rule.action_payload or "{}")
-            act = Activity(  # log email as activity for now
+            act = create_activity(  # log email as activity for now
+                db=db,
                 organization_id=organization_id,
                 entity_type=payload.get("entity_type", "application"),
                 entity_id=str(payload.get("entity_id")),
-                type="email",
+                activity_type="email",
                 message=f"FAKE EMAIL: {data}",
             )
-            db.add(act)
 
             # No commit here: keep automation effects in the caller's transaction.
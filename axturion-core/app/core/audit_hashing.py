@@ -3,9 +3,24 @@ from __future__ import annotations
 import hashlib
 import json
 from datetime import datetime, timezone
+from json.encoder import encode_basestring
 from typing import Any
 
 
+# Column order expected by `canonical_audit_values` (e.g. for Core selects).
+AUDIT_CANONICAL_COLUMNS = (
+    "organization_id",
+    "actor_id",
+    "entity_type",
+    "entity_id",
+    "action",
+    "payload",
+    "created_at",
+    "seq",
+    "payload_canonical",
+)
+
+
 def _coerce_dt(dt: datetime) -> datetime:
     if dt.tzinfo is None:
         return dt.replace(tzinfo=timezone.utc)
@@ -22,44 +37,108 @@ def _canonical_json(value: Any) -> str:
     )
 
 
+def _payload_value(payload_raw: Any) -> Any:
+    if payload_raw is None:
+        return None
+    if isinstance(payload_raw, (dict, list, int, float, bool)):
+        return payload_raw
+    payload_str = str(payload_raw)
+    try:
+        return json.loads(payload_str)
+    except Exception:
+        return payload_str
+
+
+def serialize_payload(payload: Any) -> tuple[str | None, bool]:
+    """Serialize an audit payload for storage.
+
+    Returns (text, payload_canonical). Structured payloads are stored in
+    canonical form so hashing can embed the text without re-serializing it;
+    string payloads are stored verbatim and flagged only if already canonical.
+    """
+
+    if payload is None:
+        return None, True
+    if isinstance(payload, str):
+        return payload, is_canonical_payload_text(payload)
+    # Round-trip first so non-str dict keys and `default=str` values hash
+    # exactly as the parsed stored text would.
+    text = _canonical_json(json.loads(json.dumps(payload, default=str)))
+    return text, True
+
+
+def is_canonical_payload_text(payload_text: str) -> bool:
+    try:
+        value = json.loads(payload_text)
+    except Exception:
+        return False
+    return _canonical_json(value) == payload_text
+
+
+def canonical_audit_values(
+    organization_id: Any,
+    actor_id: Any,
+    entity_type: Any,
+    entity_id: Any,
+    action: Any,
+    payload: Any,
+    created_at: datetime | None,
+    seq: Any,
+    payload_canonical: bool | None = False,
+) -> bytes:
+    """Canonical bytes from plain column values (see AUDIT_CANONICAL_COLUMNS).
+
+    Byte-identical to the generic canonicalization. When `payload_canonical`
+    is set the stored payload text is embedded as-is instead of being parsed
+    and re-serialized.
+    """
+
+    if payload_canonical and (payload is None or isinstance(payload, str)):
+        payload_json = "null" if payload is None else payload
+    else:
+        payload_json = _canonical_json(_payload_value(payload))
+
+    created_at_iso = "" if created_at is None else _coerce_dt(created_at).isoformat()
+
+    # Keys in sorted order, compact separators: same output as _canonical_json.
+    return (
+        '{"action":'
+        + encode_basestring(str(action or ""))
+        + ',"actor_id":'
+        + encode_basestring(str(actor_id or ""))
+        + ',"created_at":'
+        + encode_basestring(created_at_iso)
+        + ',"entity_id":'
+        + encode_basestring(str(entity_id or ""))
+        + ',"entity_type":'
+        + encode_basestring(str(entity_type or ""))
+        + ',"organization_id":'
+        + encode_basestring(str(organization_id))
+        + ',"payload":'
+        + payload_json
+        + ',"seq":'
+        + str(int(seq or 0))
+        + "}"
+    ).encode("utf-8")
+
+
 def canonical_audit_payload(audit_log_row) -> bytes:
     """Return deterministic bytes for hashing an audit log.
 
     Includes only stable, semantic fields. `payload` is canonicalized JSON.
     """
 
-    payload_raw = getattr(audit_log_row, "payload", None)
-    payload_value: Any
-
-    if payload_raw is None:
-        payload_value = None
-    elif isinstance(payload_raw, (dict, list, int, float, bool)):
-        payload_value = payload_raw
-    else:
-        payload_str = str(payload_raw)
-        try:
-            payload_value = json.loads(payload_str)
-        except Exception:
-            payload_value = payload_str
-
-    created_at = getattr(audit_log_row, "created_at", None)
-    if created_at is None:
-        created_at_iso = ""
-    else:
-        created_at_iso = _coerce_dt(created_at).isoformat()
-
-    body = {
-        "organization_id": str(getattr(audit_log_row, "organization_id", "")),
-        "actor_id": str(getattr(audit_log_row, "actor_id", "") or ""),
-        "entity_type": str(getattr(audit_log_row, "entity_type", "") or ""),
-        "entity_id": str(getattr(audit_log_row, "entity_id", "") or ""),
-        "action": str(getattr(audit_log_row, "action", "") or ""),
-        "payload": payload_value,
-        "created_at": created_at_iso,
-        "seq": int(getattr(audit_log_row, "seq", 0) or 0),
-    }
-
-    return _canonical_json(body).encode("utf-8")
+    return canonical_audit_values(
+        getattr(audit_log_row, "organization_id", ""),
+        getattr(audit_log_row, "actor_id", ""),
+        getattr(audit_log_row, "entity_type", ""),
+        getattr(audit_log_row, "entity_id", ""),
+        getattr(audit_log_row, "action", ""),
+        getattr(audit_log_row, "payload", None),
+        getattr(audit_log_row, "created_at", None),
+        getattr(audit_log_row, "seq", 0),
+        getattr(audit_log_row, "payload_canonical", False),
+    )
 
 
 def compute_hash(prev_hash: str | None, canonical_bytes: bytes) -> str:
@@ -0,0 +1,162 @@
+"""Response compression (brotli/gzip) for large, fully-buffered responses.
+
+Only single-message responses are compressed. Streaming responses (SSE,
+chunked bodies) and already-compressed media types are passed through
+untouched so they are never buffered by this layer.
+"""
+
+from __future__ import annotations
+
+import gzip
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional
+    brotli = None
+
+
+DEFAULT_MINIMUM_SIZE = 1024
+
+DEFAULT_EXCLUDED_MEDIA_TYPES: frozenset[str] = frozenset(
+    {
+        "text/event-stream",
+        "application/zip",
+        "application/gzip",
+        "application/x-gzip",
+    }
+)
+
+
+def _parse_accept_encoding(value: str) -> dict[str, float]:
+    accepted: dict[str, float] = {}
+    for part in value.split(","):
+        token, _, params = part.strip().partition(";")
+        token = token.strip().lower()
+        if not token:
+            continue
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[token] = q
+    return accepted
+
+
+def negotiate_encoding(accept_encoding: str | None) -> str | None:
+    """Pick the best supported content-coding ("br" or "gzip"), if any."""
+
+    if not accept_encoding:
+        return None
+
+    accepted = _parse_accept_encoding(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+
+    candidates: list[tuple[float, int, str]] = []
+    if brotli is not None:
+        candidates.append((accepted.get("br", wildcard), 1, "br"))
+    candidates.append((accepted.get("gzip", wildcard), 0, "gzip"))
+
+    q, _preference, encoding = max(candidates)
+    return encoding if q > 0.0 else None
+
+
+class CompressionMiddleware:
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        excluded_media_types: frozenset[str] = DEFAULT_EXCLUDED_MEDIA_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = int(minimum_size)
+        self.gzip_level = int(gzip_level)
+        self.brotli_quality = int(brotli_quality)
+        self.excluded_media_types = excluded_media_types
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressionResponder(self, encoding, send)
+        await self.app(scope, receive, responder.send)
+
+    def compress(self, encoding: str, body: bytes) -> bytes:
+        if encoding == "br":
+            return brotli.compress(body, quality=self.brotli_quality)
+        return gzip.compress(body, compresslevel=self.gzip_level, mtime=0)
+
+    def is_compressible(self, headers: Headers, body: bytes) -> bool:
+        if "content-encoding" in headers:
+            return False
+        media_type = headers.get("content-type", "").split(";", 1)[0].strip().lower()
+        if media_type in self.excluded_media_types:
+            return False
+        return len(body) >= self.minimum_size
+
+
+class _CompressionResponder:
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self._send = send
+        self.start_message: Message | None = None
+        self.passthrough = False
+
+    async def send(self, message: Message) -> None:
+        if self.passthrough:
+            await self._send(message)
+            return
+
+        message_type = message["type"]
+
+        if message_type == "http.response.start":
+            # Hold the start message until the first body chunk tells us
+            # whether this is a buffered or a streaming response.
+            self.start_message = message
+            return
+
+        if message_type != "http.response.body" or self.start_message is None:
+            await self._flush_passthrough(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+        headers = MutableHeaders(raw=self.start_message["headers"])
+
+        if more_body or not self.middleware.is_compressible(headers, body):
+            await self._flush_passthrough(message)
+            return
+
+        compressed = self.middleware.compress(self.encoding, body)
+        if len(compressed) >= len(body):
+            await self._flush_passthrough(message)
+            return
+
+        headers["Content-Encoding"] = self.encoding
+        headers["Content-Length"] = str(len(compressed))
+        headers.add_vary_header("Accept-Encoding")
+
+        self.passthrough = True
+        await self._send(self.start_message)
+        await self._send({"type": "http.response.body", "body": compressed})
+
+    async def _flush_passthrough(self, message: Message) -> None:
+        self.passthrough = True
+        if self.start_message is not None:
+            await self._send(self.start_message)
+        await self._send(message)
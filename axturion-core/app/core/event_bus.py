@@ -0,0 +1,161 @@
+"""In-process fan-out bus for committed domain events.
+
+Services queue events on the SQLAlchemy session (`publish_on_commit`); they
+are delivered to subscribers only after the transaction commits and are
+dropped on rollback. Each subscriber owns a bounded asyncio queue. A
+subscriber that cannot keep up is marked as overflowed instead of blocking
+publishers; the consumer is expected to resync (e.g. via Last-Event-ID).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+
+logger = logging.getLogger(__name__)
+
+
+_PENDING_EVENTS_KEY = "pending_bus_events"
+
+DEFAULT_QUEUE_SIZE = 256
+
+
+@dataclass(frozen=True, slots=True)
+class BusEvent:
+    organization_id: str
+    kind: str
+    entity_type: str
+    entity_id: str
+    data: dict[str, Any] = field(default_factory=dict)
+    # Audit sequence number; only set for audit events.
+    seq: int | None = None
+
+
+class Subscription:
+    def __init__(
+        self,
+        *,
+        organization_id: str,
+        entity_type: str | None,
+        entity_id: str | None,
+        maxsize: int,
+        loop: asyncio.AbstractEventLoop,
+    ):
+        self.organization_id = organization_id
+        self.entity_type = entity_type
+        self.entity_id = entity_id
+        self.loop = loop
+        self.queue: asyncio.Queue[BusEvent] = asyncio.Queue(maxsize=maxsize)
+        self.overflowed = False
+
+    def matches(self, bus_event: BusEvent) -> bool:
+        if bus_event.organization_id != self.organization_id:
+            return False
+        if self.entity_type is not None and bus_event.entity_type != self.entity_type:
+            return False
+        if self.entity_id is not None and bus_event.entity_id != self.entity_id:
+            return False
+        return True
+
+    def _offer(self, bus_event: BusEvent) -> None:
+        # Runs on the subscriber's event loop.
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(bus_event)
+        except asyncio.QueueFull:
+            self.overflowed = True
+
+
+class EventBus:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscriptions: list[Subscription] = []
+
+    def subscribe(
+        self,
+        organization_id: str,
+        *,
+        entity_type: str | None = None,
+        entity_id: str | None = None,
+        maxsize: int = DEFAULT_QUEUE_SIZE,
+    ) -> Subscription:
+        """Register a subscriber; must be called from a running event loop."""
+
+        sub = Subscription(
+            organization_id=str(organization_id),
+            entity_type=entity_type,
+            entity_id=entity_id,
+            maxsize=maxsize,
+            loop=asyncio.get_running_loop(),
+        )
+        with self._lock:
+            self._subscriptions.append(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            try:
+                self._subscriptions.remove(sub)
+            except ValueError:
+                pass
+
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscriptions)
+
+    def publish(self, bus_event: BusEvent) -> None:
+        """Deliver an event to all matching subscribers (thread-safe)."""
+
+        with self._lock:
+            targets = [s for s in self._subscriptions if s.matches(bus_event)]
+
+        for sub in targets:
+            try:
+                sub.loop.call_soon_threadsafe(sub._offer, bus_event)
+            except RuntimeError:
+                # Subscriber loop is closed; it will be cleaned up by its owner.
+                self.unsubscribe(sub)
+
+
+event_bus = EventBus()
+
+
+def publish_on_commit(db: Session, bus_event: BusEvent) -> None:
+    """Queue an event for delivery once the session's transaction commits."""
+
+    db.info.setdefault(_PENDING_EVENTS_KEY, []).append(bus_event)
+
+
+@event.listens_for(Session, "after_commit")
+def _publish_pending_events(session: Session) -> None:
+    pending = session.info.pop(_PENDING_EVENTS_KEY, None)
+    if not pending:
+        return
+
+    for bus_event in pending:
+        try:
+            event_bus.publish(bus_event)
+        except Exception:
+            logger.exception(
+                "event_publish_failed",
+                extra={
+                    "action": "event_publish_failed",
+                    "organization_id": bus_event.organization_id,
+                    "kind": bus_event.kind,
+                },
+            )
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_events(session: Session, previous_transaction) -> None:
+    if previous_transaction.nested:
+        return
+    session.info.pop(_PENDING_EVENTS_KEY, None)
@@ -0,0 +1,254 @@
+"""Cross-process cache invalidation bus.
+
+Caches register a handler per cache name with `invalidation_bus.subscribe`.
+Writers call `invalidate_on_commit(db, cache, organization_id, key)`; the
+invalidation is delivered only if the transaction commits:
+
+- in this process, to local handlers right after the commit;
+- on Postgres, to every other worker/replica via `pg_notify` issued inside
+  the committing transaction (so NOTIFY is atomic with the write) and
+  received by `InvalidationListener`, a daemon thread holding a dedicated
+  `LISTEN` connection.
+
+On SQLite (tests) or without a listener, only in-process delivery happens.
+When the listener reconnects after losing its connection it may have
+missed notifications, so it delivers a full reset (`cache == "*"`) to
+every handler.
+
+Handlers run on the committing thread or the listener thread and must be
+thread-safe and fast (drop entries; never query the database).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+import uuid
+from dataclasses import dataclass
+from typing import Callable
+
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+
+logger = logging.getLogger(__name__)
+
+
+CHANNEL = "axturion_cache_invalidation"
+ALL_CACHES = "*"
+
+_PENDING_INVALIDATIONS_KEY = "pending_cache_invalidations"
+
+# Identifies this process so it can skip its own NOTIFY echoes.
+_ORIGIN = uuid.uuid4().hex
+
+
+@dataclass(frozen=True, slots=True)
+class Invalidation:
+    cache: str
+    # None: every organization; key None: every entry of the organization.
+    organization_id: str | None = None
+    key: str | None = None
+
+    def to_payload(self) -> str:
+        return json.dumps(
+            {
+                "origin": _ORIGIN,
+                "cache": self.cache,
+                "organization_id": self.organization_id,
+                "key": self.key,
+            },
+            separators=(",", ":"),
+        )
+
+    @classmethod
+    def from_payload(cls, payload: str) -> tuple[str | None, "Invalidation"]:
+        data = json.loads(payload)
+        return data.get("origin"), cls(
+            cache=str(data["cache"]),
+            organization_id=data.get("organization_id"),
+            key=data.get("key"),
+        )
+
+
+Handler = Callable[[Invalidation], None]
+
+
+class InvalidationBus:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._handlers: dict[str, list[Handler]] = {}
+
+    def subscribe(self, cache: str, handler: Handler) -> Callable[[], None]:
+        """Register `handler` for `cache`; returns an unsubscribe callable.
+
+        Handlers also receive full resets (`cache == ALL_CACHES`).
+        """
+
+        with self._lock:
+            self._handlers.setdefault(cache, []).append(handler)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                handlers = self._handlers.get(cache, [])
+                if handler in handlers:
+                    handlers.remove(handler)
+
+        return unsubscribe
+
+    def deliver(self, invalidation: Invalidation) -> None:
+        """Run the local handlers for an invalidation."""
+
+        with self._lock:
+            if invalidation.cache == ALL_CACHES:
+                targets = [h for handlers in self._handlers.values() for h in handlers]
+            else:
+                targets = list(self._handlers.get(invalidation.cache, ()))
+
+        for handler in targets:
+            try:
+                handler(invalidation)
+            except Exception:
+                logger.exception(
+                    "cache_invalidation_failed",
+                    extra={
+                        "action": "cache_invalidation_failed",
+                        "cache": invalidation.cache,
+                    },
+                )
+
+
+invalidation_bus = InvalidationBus()
+
+
+def invalidate_on_commit(
+    db: Session,
+    cache: str,
+    organization_id=None,
+    key: str | None = None,
+) -> None:
+    """Queue a cache invalidation for delivery once the transaction commits."""
+
+    invalidation = Invalidation(
+        cache=cache,
+        organization_id=str(organization_id) if organization_id is not None else None,
+        key=key,
+    )
+    pending = db.info.setdefault(_PENDING_INVALIDATIONS_KEY, [])
+    if invalidation not in pending:
+        pending.append(invalidation)
+
+
+@event.listens_for(Session, "before_commit")
+def _notify_pending_invalidations(session: Session) -> None:
+    pending = session.info.get(_PENDING_INVALIDATIONS_KEY)
+    if not pending or session.get_bind().dialect.name != "postgresql":
+        return
+
+    connection = session.connection()
+    for invalidation in pending:
+        connection.execute(
+            text("SELECT pg_notify(:channel, :payload)"),
+            {"channel": CHANNEL, "payload": invalidation.to_payload()},
+        )
+
+
+@event.listens_for(Session, "after_commit")
+def _deliver_pending_invalidations(session: Session) -> None:
+    pending = session.info.pop(_PENDING_INVALIDATIONS_KEY, None)
+    for invalidation in pending or ():
+        invalidation_bus.deliver(invalidation)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_invalidations(session: Session, previous_transaction) -> None:
+    if previous_transaction.nested:
+        return
+    session.info.pop(_PENDING_INVALIDATIONS_KEY, None)
+
+
+class InvalidationListener:
+    """Receives invalidations from other processes over Postgres LISTEN."""
+
+    def __init__(
+        self,
+        database_url: str,
+        *,
+        bus: InvalidationBus = invalidation_bus,
+        poll_seconds: float = 1.0,
+        max_backoff_seconds: float = 30.0,
+    ) -> None:
+        self._conninfo = (
+            make_url(database_url)
+            .set(drivername="postgresql")
+            .render_as_string(hide_password=False)
+        )
+        self._bus = bus
+        self._poll_seconds = poll_seconds
+        self._max_backoff_seconds = max_backoff_seconds
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="cache-invalidation-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        import psycopg
+
+        backoff = 1.0
+        connected_before = False
+        while not self._stop.is_set():
+            try:
+                with psycopg.connect(self._conninfo, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {CHANNEL}")
+                    if connected_before:
+                        # Notifications sent while disconnected are lost.
+                        self._bus.deliver(Invalidation(cache=ALL_CACHES))
+                    connected_before = True
+                    backoff = 1.0
+                    while not self._stop.is_set():
+                        for notify in conn.notifies(timeout=self._poll_seconds):
+                            self._handle(notify.payload)
+            except Exception:
+                logger.exception(
+                    "cache_invalidation_listener_error",
+                    extra={"action": "cache_invalidation_listener_error"},
+                )
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, self._max_backoff_seconds)
+
+    def _handle(self, payload: str) -> None:
+        try:
+            origin, invalidation = Invalidation.from_payload(payload)
+        except (ValueError, KeyError, TypeError):
+            logger.warning(
+                "cache_invalidation_payload_invalid",
+                extra={"action": "cache_invalidation_payload_invalid"},
+            )
+            return
+        if origin == _ORIGIN:
+            return
+        self._bus.deliver(invalidation)
+
+
+def start_invalidation_listener(database_url: str) -> InvalidationListener | None:
+    """Start the LISTEN thread for Postgres URLs; None for other databases."""
+
+    if make_url(database_url).get_backend_name() != "postgresql":
+        return None
+    listener = InvalidationListener(database_url)
+    listener.start()
+    return listener
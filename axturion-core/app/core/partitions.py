@@ -0,0 +1,184 @@
+"""Monthly range partitions for append-only tables (Postgres only).
+
+`audit_log` and `activity` are partitioned by `created_at` (see migration
+c6e3f8a2b4d7). Writers are unaware of partitioning; rows outside any monthly
+partition land in the `<table>_default` partition. This module keeps monthly
+partitions created ahead of time so the default partition stays empty.
+
+`ensure_future_partitions` runs at startup and as a periodic job
+(POST /governance/partitions/maintain). When the default partition already
+holds rows for a month being created (the job did not run in time), it is
+detached, the month's rows are moved into the new partition and the default
+partition is re-attached, all in one transaction.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import date, datetime, timezone
+
+from sqlalchemy import text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+
+
+logger = logging.getLogger(__name__)
+
+
+PARTITIONED_TABLES = ("audit_log", "activity")
+DEFAULT_MONTHS_AHEAD = 3
+# pg_advisory_xact_lock key serializing maintenance runs across workers.
+_MAINTENANCE_LOCK_KEY = 0x61785F70617274  # "ax_part"
+
+
+def month_start(value: datetime | date) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(value: date, months: int) -> date:
+    index = value.year * 12 + (value.month - 1) + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_y{month.year:04d}m{month.month:02d}"
+
+
+def _month_bounds(month: date) -> tuple[str, str]:
+    start = month_start(month)
+    end = add_months(start, 1)
+    return f"{start.isoformat()} 00:00:00+00", f"{end.isoformat()} 00:00:00+00"
+
+
+def partition_ddl(table: str, month: date) -> str:
+    # Identifiers and bounds are generated from trusted constants/dates only.
+    lower, upper = _month_bounds(month)
+    return (
+        f'CREATE TABLE IF NOT EXISTS "{partition_name(table, month_start(month))}" '
+        f'PARTITION OF "{table}" '
+        f"FOR VALUES FROM ('{lower}') TO ('{upper}')"
+    )
+
+
+def default_partition_name(table: str) -> str:
+    return f"{table}_default"
+
+
+def _month_filter(month: date) -> str:
+    lower, upper = _month_bounds(month)
+    return f"created_at >= '{lower}' AND created_at < '{upper}'"
+
+
+def _default_has_rows(db: Session, table: str, month: date) -> bool:
+    row = db.execute(
+        text(
+            f'SELECT 1 FROM "{default_partition_name(table)}" '
+            f"WHERE {_month_filter(month)} LIMIT 1"
+        )
+    ).first()
+    return row is not None
+
+
+def _partition_exists(db: Session, name: str) -> bool:
+    row = db.execute(
+        text(
+            "SELECT 1 FROM pg_class "
+            "WHERE relname = :name AND pg_table_is_visible(oid)"
+        ),
+        {"name": name},
+    ).first()
+    return row is not None
+
+
+def _create_partition(db: Session, table: str, month: date) -> None:
+    """Create one monthly partition, moving matching rows out of the default."""
+
+    if not _default_has_rows(db, table, month):
+        db.execute(text(partition_ddl(table, month)))
+        return
+
+    bounds = _month_filter(month)
+    default = default_partition_name(table)
+    db.execute(text(f'ALTER TABLE "{table}" DETACH PARTITION "{default}"'))
+    db.execute(text(partition_ddl(table, month)))
+    db.execute(
+        text(f'INSERT INTO "{table}" SELECT * FROM "{default}" WHERE {bounds}')
+    )
+    db.execute(text(f'DELETE FROM "{default}" WHERE {bounds}'))
+    db.execute(text(f'ALTER TABLE "{table}" ATTACH PARTITION "{default}" DEFAULT'))
+    logger.info(
+        "partition_rows_moved_from_default",
+        extra={
+            "action": "partition_rows_moved_from_default",
+            "table": table,
+            "partition": partition_name(table, month),
+        },
+    )
+
+
+def _is_partitioned(db: Session, table: str) -> bool:
+    row = db.execute(
+        text(
+            "SELECT 1 FROM pg_partitioned_table p "
+            "JOIN pg_class c ON c.oid = p.partrelid "
+            "WHERE c.relname = :table AND pg_table_is_visible(c.oid)"
+        ),
+        {"table": table},
+    ).first()
+    return row is not None
+
+
+def ensure_future_partitions(
+    db: Session,
+    *,
+    months_ahead: int = DEFAULT_MONTHS_AHEAD,
+    now: datetime | None = None,
+) -> list[str]:
+    """Create missing monthly partitions from the current month onwards.
+
+    No-op on non-Postgres databases and for tables that are not partitioned.
+    Returns the names of partitions that were checked/created.
+    """
+
+    if db.get_bind().dialect.name != "postgresql":
+        return []
+
+    # Concurrent runs (startup of several workers, the periodic job) queue up
+    # here instead of racing on DETACH/CREATE.
+    db.execute(
+        text("SELECT pg_advisory_xact_lock(:key)"), {"key": _MAINTENANCE_LOCK_KEY}
+    )
+
+    current = month_start(now or datetime.now(timezone.utc))
+    ensured: list[str] = []
+
+    for table in PARTITIONED_TABLES:
+        if not _is_partitioned(db, table):
+            continue
+
+        for offset in range(int(months_ahead) + 1):
+            month = add_months(current, offset)
+            name = partition_name(table, month)
+            if _partition_exists(db, name):
+                ensured.append(name)
+                continue
+            try:
+                with db.begin_nested():
+                    _create_partition(db, table, month)
+            except DBAPIError:
+                # Traffic keeps flowing into the default partition; the next
+                # run retries.
+                logger.warning(
+                    "partition_create_failed",
+                    extra={
+                        "action": "partition_create_failed",
+                        "table": table,
+                        "partition": name,
+                    },
+                    exc_info=True,
+                )
+                continue
+            ensured.append(name)
+
+    db.commit()
+    return ensured
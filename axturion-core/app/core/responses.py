@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi import responses
+
+
+class ORJSONResponse(responses.ORJSONResponse):
+    """Default API response class: FastAPI's orjson response with our options.
+
+    `option` is the orjson flag set passed to `orjson.dumps`; subclass and
+    override it rather than re-implementing rendering.
+    """
+
+    option = orjson.OPT_NON_STR_KEYS
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=self.option)
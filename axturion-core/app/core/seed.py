@@ -6,6 +6,7 @@ from app.domain.automation.models import AutomationRule
 from app.domain.identity.models import OrganizationMembership, User
 from app.domain.organization.models import Organization
 from app.domain.workflow.models import Workflow, WorkflowStage, WorkflowTransition
+from app.services.policy_service import provision_policy
 
 
 def seed_identity(db: Session) -> None:
@@ -16,6 +17,10 @@ def seed_identity(db: Session) -> None:
         db.commit()
         db.refresh(org)
 
+    # Provision the org's default policy (idempotent).
+    provision_policy(db, org.id)
+    db.commit()
+
     # Seed user (idempotent).
     seed_email = "seed@local"
     user = db.query(User).filter(User.email == seed_email).first()
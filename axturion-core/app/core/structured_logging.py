@@ -1,14 +1,23 @@
 from __future__ import annotations
 
+import atexit
 import json
 import logging
+import logging.handlers
 import os
+import queue
+import random
 import re
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 
 from app.core.log_context import actor_id_var, correlation_id_var, organization_id_var
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is a declared dependency
+    orjson = None
+
 
 _RESERVED = {
     "name",
@@ -59,6 +68,13 @@ class SensitiveRedactionFilter(logging.Filter):
 
     _redacted = "***REDACTED***"
 
+    # Matches: key=VALUE or key: VALUE (with optional quotes), for any key.
+    _pattern = re.compile(
+        r"(?i)(\b(?:"
+        + "|".join(re.escape(key) for key in sorted(_sensitive_keys))
+        + r")\b\s*[:=]\s*)(\"[^\"]*\"|'[^']*'|[^\s,;]+)"
+    )
+
     def filter(self, record: logging.LogRecord) -> bool:  # noqa: A003
         # Redact sensitive extras
         for key in list(record.__dict__.keys()):
@@ -75,14 +91,52 @@ class SensitiveRedactionFilter(logging.Filter):
         return True
 
     def _redact_message(self, message: str) -> str:
-        redacted = message
-        for key in self._sensitive_keys:
-            # Matches: key=VALUE or key: VALUE (with optional quotes)
-            pattern = re.compile(
-                rf"(?i)(\b{re.escape(key)}\b\s*[:=]\s*)(\"[^\"]*\"|'[^']*'|[^\s,;]+)"
-            )
-            redacted = pattern.sub(rf"\1{self._redacted}", redacted)
-        return redacted
+        return self._pattern.sub(rf"\1{self._redacted}", message)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of high-volume INFO/DEBUG events.
+
+    Rates are keyed by the record's `action` extra (falling back to the raw
+    message), e.g. {"role_resolved": 0.01}. Warnings and errors are never
+    sampled out.
+    """
+
+    def __init__(
+        self,
+        rates: dict[str, float],
+        *,
+        rand: Callable[[], float] = random.random,
+    ) -> None:
+        super().__init__()
+        self.rates = rates
+        self._rand = rand
+
+    def filter(self, record: logging.LogRecord) -> bool:  # noqa: A003
+        if not self.rates or record.levelno >= logging.WARNING:
+            return True
+        key = getattr(record, "action", None) or record.msg
+        rate = self.rates.get(key) if isinstance(key, str) else None
+        if rate is None or rate >= 1.0:
+            return True
+        return self._rand() < rate
+
+
+def parse_sample_rates(value: str | None) -> dict[str, float]:
+    """Parse LOG_SAMPLE_RATES, e.g. "role_resolved=0.01,activity_created=0.5"."""
+
+    rates: dict[str, float] = {}
+    for part in (value or "").split(","):
+        key, sep, raw = part.partition("=")
+        key = key.strip()
+        if not key or not sep:
+            continue
+        try:
+            rate = float(raw)
+        except ValueError:
+            continue
+        rates[key] = min(1.0, max(0.0, rate))
+    return rates
 
 
 class StructuredFormatter(logging.Formatter):
@@ -108,11 +162,52 @@ class StructuredFormatter(logging.Formatter):
 
         if record.exc_info:
             payload["exc_info"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            payload["exc_info"] = record.exc_text
 
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    payload, default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+            except TypeError:
+                # e.g. integers beyond 64 bit; the stdlib encoder handles them.
+                pass
         return json.dumps(payload, default=str)
 
 
+class _StructuredQueueHandler(logging.handlers.QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Runs on the calling thread: merge args and render tracebacks so the
+        # queued record is self-contained; JSON formatting and I/O happen on
+        # the listener thread.
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_listener: logging.handlers.QueueListener | None = None
+
+
+def shutdown_logging() -> None:
+    """Stop the background listener, flushing queued records."""
+
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
+
+
 def configure_logging() -> None:
+    global _listener
+
     env = os.getenv("ENV", "dev").lower()
     requested = os.getenv("LOG_LEVEL", "INFO").upper()
 
@@ -128,14 +223,35 @@ def configure_logging() -> None:
     root = logging.getLogger()
     root.setLevel(effective_levelno)
 
+    shutdown_logging()
+
+    sampling = SamplingFilter(parse_sample_rates(os.getenv("LOG_SAMPLE_RATES")))
+
     handler = logging.StreamHandler()
     handler.setLevel(effective_levelno)
-    handler.addFilter(ContextEnricherFilter())
-    handler.addFilter(SensitiveRedactionFilter())
     handler.setFormatter(StructuredFormatter())
 
     root.handlers.clear()
-    root.addHandler(handler)
+    if os.getenv("LOG_QUEUE", "true").lower() in {"0", "false", "no", "off"}:
+        handler.addFilter(sampling)
+        handler.addFilter(ContextEnricherFilter())
+        handler.addFilter(SensitiveRedactionFilter())
+        root.addHandler(handler)
+    else:
+        # Context must be captured on the request thread (contextvars);
+        # redaction, formatting and writing run on the listener thread.
+        handler.addFilter(SensitiveRedactionFilter())
+
+        queue_handler = _StructuredQueueHandler(queue.SimpleQueue())
+        queue_handler.setLevel(effective_levelno)
+        queue_handler.addFilter(sampling)
+        queue_handler.addFilter(ContextEnricherFilter())
+        root.addHandler(queue_handler)
+
+        _listener = logging.handlers.QueueListener(
+            queue_handler.queue, handler, respect_handler_level=True
+        )
+        _listener.start()
 
     # Prevent Alembic double logging
     logging.getLogger("alembic").propagate = False
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, ForeignKey, DateTime
+from sqlalchemy import Column, String, ForeignKey, DateTime, Index, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.db import Base
@@ -8,6 +8,17 @@ import uuid
 
 class Application(Base):
     __tablename__ = "application"
+    __table_args__ = (
+        # SLA breach predicate: open applications by stage entry time. Queries
+        # must render the status predicate inline for the planner to use it.
+        Index(
+            "ix_application_org_open_stage_entered",
+            "organization_id",
+            "stage_entered_at",
+            postgresql_where=text("status <> 'closed'"),
+            sqlite_where=text("status <> 'closed'"),
+        ),
+    )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
 
@@ -1,5 +1,8 @@
 import uuid
+from datetime import datetime, timezone
+
 from sqlalchemy import (
+    Boolean,
     Column,
     DateTime,
     ForeignKey,
@@ -14,11 +17,22 @@ from sqlalchemy.sql import func
 from app.core.db import Base
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class AuditLog(Base):
+    # Range-partitioned by month on created_at on Postgres (migration
+    # c6e3f8a2b4d7), so the partition key is part of the primary key. There
+    # uq_audit_org_seq also has to include created_at; append_audit_log's
+    # organization row lock keeps seq unique per org. Unpartitioned databases
+    # keep the plain (organization_id, seq) unique declared here.
+    # See app.core.partitions.
     __tablename__ = "audit_log"
     __table_args__ = (
         UniqueConstraint("organization_id", "seq", name="uq_audit_org_seq"),
         Index("ix_audit_org_seq", "organization_id", "seq"),
+        Index("ix_audit_org_created_at", "organization_id", "created_at"),
     )
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -32,8 +46,66 @@ class AuditLog(Base):
     entity_id = Column(String)
     action = Column(String)
     payload = Column(Text)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    # True when `payload` is stored exactly as its canonical JSON, so hashing
+    # can embed it without a parse/re-serialize round trip.
+    payload_canonical = Column(Boolean, nullable=False, default=False)
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=_utcnow,
+        server_default=func.now(),
+    )
 
     prev_hash = Column(String(64), nullable=True)
     hash = Column(String(64), nullable=False)
     seq = Column(Integer, nullable=False)
+
+
+class AuditSegmentSeal(Base):
+    """Anchor for an archived run of audit rows (see app.audit.archive)."""
+
+    __tablename__ = "audit_segment_seal"
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id", "last_seq", name="uq_audit_segment_seal_org_last_seq"
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organization.id"),
+        nullable=False,
+    )
+    first_seq = Column(Integer, nullable=False)
+    last_seq = Column(Integer, nullable=False)
+    row_count = Column(Integer, nullable=False)
+    first_prev_hash = Column(String(64), nullable=True)
+    last_hash = Column(String(64), nullable=False)
+    archive_path = Column(String, nullable=False)
+    archive_sha256 = Column(String(64), nullable=False)
+    seal = Column(String(64), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class AuditMerkleAnchor(Base):
+    """Merkle root over a fixed-size seq range of an org's audit chain."""
+
+    __tablename__ = "audit_merkle_anchor"
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id", "first_seq", name="uq_audit_merkle_anchor_org_first_seq"
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organization.id"),
+        nullable=False,
+    )
+    first_seq = Column(Integer, nullable=False)
+    last_seq = Column(Integer, nullable=False)
+    leaf_count = Column(Integer, nullable=False)
+    root = Column(String(64), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -1,10 +1,16 @@
 import uuid
-from sqlalchemy import JSON, Column, DateTime, String, Text, ForeignKey
+from datetime import datetime, timezone
+
+from sqlalchemy import JSON, Column, DateTime, Index, String, Text, ForeignKey
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.db import Base
 
 
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class AutomationRule(Base):
     __tablename__ = "automation_rule"
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
@@ -23,7 +29,14 @@ class AutomationRule(Base):
 
 
 class Activity(Base):
+    # Range-partitioned by month on created_at on Postgres (migration
+    # c6e3f8a2b4d7), so the primary key is (id, created_at); see
+    # app.core.partitions.
     __tablename__ = "activity"
+    __table_args__ = (
+        Index("ix_activity_org_created_at", "organization_id", "created_at"),
+    )
+
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     organization_id = Column(
         UUID(as_uuid=True),
@@ -35,4 +48,9 @@ class Activity(Base):
     type = Column(String, nullable=False)
     message = Column(Text, nullable=True)
     payload = Column(JSON, nullable=True)
-    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    created_at = Column(
+        DateTime(timezone=True),
+        primary_key=True,
+        default=_utcnow,
+        server_default=func.now(),
+    )
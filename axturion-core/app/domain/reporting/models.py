@@ -0,0 +1,108 @@
+import uuid
+
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    UniqueConstraint,
+)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+
+from app.core.db import Base
+
+
+class StageTransitionFact(Base):
+    """One application entering a stage, derived from the audit log.
+
+    `from_stage` is null for the initial stage on application creation.
+    Rows are appended incrementally by `stage_fact_service`; `audit_seq`
+    points at the source audit entry.
+    """
+
+    __tablename__ = "stage_transition_fact"
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id", "audit_seq", name="uq_stage_transition_fact_org_seq"
+        ),
+        Index(
+            "ix_stage_transition_fact_org_workflow_occurred",
+            "organization_id",
+            "workflow_id",
+            "occurred_at",
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organization.id"),
+        nullable=False,
+    )
+    workflow_id = Column(UUID(as_uuid=True), ForeignKey("workflow.id"), nullable=False)
+    # No FK: facts outlive application retention.
+    application_id = Column(UUID(as_uuid=True), nullable=False)
+    from_stage = Column(String, nullable=True)
+    to_stage = Column(String, nullable=False)
+    occurred_at = Column(DateTime(timezone=True), nullable=False)
+    audit_seq = Column(Integer, nullable=False)
+
+
+class ReportingWatermark(Base):
+    """Progress of a derived reporting table, per org.
+
+    `last_seq` is the last audit seq folded in; `last_day` the last UTC day
+    written by daily jobs; `last_at` the end of the last scanned time range
+    for time-based feeds.
+    """
+
+    __tablename__ = "reporting_watermark"
+
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organization.id"),
+        primary_key=True,
+    )
+    name = Column(String, primary_key=True)
+    last_seq = Column(Integer, nullable=False, default=0)
+    last_day = Column(Date, nullable=True)
+    last_at = Column(DateTime(timezone=True), nullable=True)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
+
+
+class StageOccupancySnapshot(Base):
+    """Applications in a workflow stage at the end of a UTC day.
+
+    Written daily by `occupancy_service`; stages with zero applications are
+    not stored.
+    """
+
+    __tablename__ = "stage_occupancy_snapshot"
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id",
+            "workflow_id",
+            "day",
+            "stage",
+            name="uq_stage_occupancy_snapshot_org_workflow_day_stage",
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organization.id"),
+        nullable=False,
+    )
+    workflow_id = Column(UUID(as_uuid=True), ForeignKey("workflow.id"), nullable=False)
+    day = Column(Date, nullable=False)
+    stage = Column(String, nullable=False)
+    count = Column(Integer, nullable=False)
@@ -82,3 +82,43 @@ class PendingUXRollback(Base):
     created_at = Column(
         DateTime(timezone=True), nullable=False, server_default=func.now()
     )
+
+
+class UXConfigVersion(Base):
+    """Versioned snapshot of a module's UX config, written on each update.
+
+    `version` N is the module's Nth `ux_config_updated` audit entry; the
+    snapshot and the diff against version N-1 are stored pre-computed.
+    """
+
+    __tablename__ = "ux_config_version"
+
+    __table_args__ = (
+        UniqueConstraint(
+            "organization_id",
+            "module",
+            "version",
+            name="uq_ux_config_version_org_module_version",
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organization.id"),
+        nullable=False,
+    )
+
+    module = Column(String, nullable=False)
+    version = Column(Integer, nullable=False)
+
+    # Source audit entry (no FK: audit_log is partitioned on Postgres).
+    audit_seq = Column(Integer, nullable=False)
+    audit_log_id = Column(UUID(as_uuid=True), nullable=False)
+    actor_id = Column(String, nullable=True)
+
+    snapshot_json = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=False)
+    diff_json = Column(JSON().with_variant(JSONB(), "postgresql"), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), nullable=False)
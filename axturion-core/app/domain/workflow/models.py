@@ -1,5 +1,14 @@
 import uuid
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Integer, String
+from sqlalchemy import (
+    BigInteger,
+    Boolean,
+    Column,
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.sql import func
 from app.core.db import Base
@@ -73,3 +82,66 @@ class PendingStageTransition(Base):
 
     approved_by_user_id = Column(UUID(as_uuid=True), nullable=True)
     approved_at = Column(DateTime(timezone=True), nullable=True)
+
+
+class ApprovalQueueItem(Base):
+    """Read model of one pending approval for the approver dashboard.
+
+    Written and deleted together with its `PendingStageTransition` (same id)
+    by `approvals_service`; `from_stage` is the application's stage when
+    the approval was requested.
+    """
+
+    __tablename__ = "approval_queue_item"
+    __table_args__ = (
+        Index(
+            "ix_approval_queue_item_org_initiated",
+            "organization_id",
+            "initiated_at",
+            "id",
+        ),
+        Index(
+            "ix_approval_queue_item_org_workflow_initiated",
+            "organization_id",
+            "workflow_id",
+            "initiated_at",
+            "id",
+        ),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True)
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organization.id"),
+        nullable=False,
+    )
+    application_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("application.id"),
+        nullable=False,
+    )
+    workflow_id = Column(UUID(as_uuid=True), ForeignKey("workflow.id"), nullable=False)
+    from_stage = Column(String, nullable=False)
+    target_stage = Column(String, nullable=False)
+    initiated_by_user_id = Column(UUID(as_uuid=True), nullable=False)
+    initiated_at = Column(DateTime(timezone=True), nullable=False)
+
+
+class ApprovalQueueCounter(Base):
+    """Per-org pending approval count and sum of initiation times (Unix
+    seconds), so the queue's size and average age need no scan."""
+
+    __tablename__ = "approval_queue_counter"
+
+    organization_id = Column(
+        UUID(as_uuid=True),
+        ForeignKey("organization.id"),
+        primary_key=True,
+    )
+    pending_count = Column(BigInteger, nullable=False, default=0)
+    initiated_epoch_sum = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
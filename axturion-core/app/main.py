@@ -7,7 +7,11 @@ from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
 
 import app.core.db as core_db
+from app.core.compression import DEFAULT_MINIMUM_SIZE, CompressionMiddleware
 from app.core.config import get_settings
+from app.core.invalidation import start_invalidation_listener
+from app.core.responses import ORJSONResponse
+from app.core.partitions import ensure_future_partitions
 from app.core.log_context import actor_id_var, correlation_id_var, organization_id_var
 from app.core.startup_verification import verify_startup
 from app.core.seed import seed_automation
@@ -18,9 +22,11 @@ from app.api.routes import (
     activity,
     audit,
     approvals,
+    bootstrap,
     candidates,
     compliance,
     dev_seed,
+    events,
     governance,
     identity,
     jobs,
@@ -49,6 +55,11 @@ from app.domain.audit.models import AuditLog
 from app.domain.automation.models import AutomationRule, Activity
 from app.domain.ux.models import UXConfig, PendingUXRollback
 from app.domain.governance.models import PolicyConfig
+from app.domain.reporting.models import (
+    ReportingWatermark,
+    StageOccupancySnapshot,
+    StageTransitionFact,
+)
 from app.core.logging_config import configure_logging
 
 import logging
@@ -71,12 +82,20 @@ async def lifespan(app: FastAPI):
     verify_startup(core_db.engine, settings)
 
     with core_db.SessionLocal() as db:
+        # Postgres only: keep monthly audit_log/activity partitions ahead.
+        ensure_future_partitions(db)
         seed_identity(db)
         seed_workflow(db)
         seed_automation(db)
 
+    # Postgres only: receive cache invalidations committed by other workers.
+    invalidation_listener = start_invalidation_listener(settings.database_url)
+
     yield
 
+    if invalidation_listener is not None:
+        invalidation_listener.stop()
+
 
 app = FastAPI(
     title="AXTURION API",
@@ -94,9 +113,22 @@ All operations are strictly workflow-scoped.
 Designed for on-premise, modular, and extensible deployments.
 """,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 
+if os.getenv("RESPONSE_COMPRESSION", "true").lower() not in {"0", "false", "no", "off"}:
+    # Registered first so it sits innermost, directly around the routes: it sees
+    # complete single-message bodies there, while streaming responses (SSE)
+    # are passed through untouched.
+    app.add_middleware(
+        CompressionMiddleware,
+        minimum_size=int(
+            os.getenv("RESPONSE_COMPRESSION_MIN_BYTES", str(DEFAULT_MINIMUM_SIZE))
+        ),
+    )
+
+
 env_name = os.getenv("ENV", "dev").lower()
 if env_name != "prod":
     # Dev/test convenience: allow Command (localhost:3000) to call Core (localhost:8000)
@@ -108,6 +140,7 @@ if env_name != "prod":
         allow_credentials=False,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=["ETag", "X-Correlation-Id"],
     )
 
 
@@ -154,9 +187,11 @@ app.include_router(ux.router)
 app.include_router(governance.router)
 app.include_router(applications.router, prefix="/applications")
 app.include_router(activity.router, prefix="/activity")
+app.include_router(events.router)
 app.include_router(candidates.router, prefix="/candidates")
 app.include_router(jobs.router, prefix="/jobs")
 app.include_router(identity.router)
+app.include_router(bootstrap.router)
 app.include_router(workflows.router, prefix="/workflows")
 app.include_router(workflow_queries.router, prefix="/workflow-queries")
 app.include_router(workflow_editor.router, prefix="/workflow-editor")
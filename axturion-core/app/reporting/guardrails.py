@@ -0,0 +1,211 @@
+"""Cost guardrails for heavy reporting queries.
+
+`reporting_guard` wraps one report computation and applies:
+
+- a per-transaction Postgres `statement_timeout` (re-applied with
+  `SET LOCAL` whenever the session begins a new transaction, since some
+  reports commit mid-way);
+- a row budget: services charge the rows they load through
+  `fetch_budgeted` / `metered`, and the report is aborted once the request
+  has read more than the budget;
+- a per-org limit on concurrently running heavy reports, so one tenant
+  cannot occupy every worker and connection. The limit is enforced per
+  process.
+
+Limits come from the environment (`REPORTING_STATEMENT_TIMEOUT_MS`,
+`REPORTING_ROW_BUDGET`, `REPORTING_MAX_CONCURRENT_PER_ORG`); 0 disables a
+limit. Outside a guard, budget helpers are no-ops.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, Iterator, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Query, Session
+
+from app.core.request_context import RequestContext
+
+
+T = TypeVar("T")
+
+DEFAULT_STATEMENT_TIMEOUT_MS = 15_000
+DEFAULT_ROW_BUDGET = 500_000
+DEFAULT_MAX_CONCURRENT_PER_ORG = 2
+
+# Postgres SQLSTATE for query_canceled (raised by statement_timeout).
+_QUERY_CANCELED = "57014"
+
+
+class ReportingLimitError(Exception):
+    status_code = 503
+    retry_after: int | None = None
+
+
+class RowBudgetExceededError(ReportingLimitError):
+    status_code = 413
+
+
+class ReportTimeoutError(ReportingLimitError):
+    status_code = 503
+
+
+class ReportBusyError(ReportingLimitError):
+    status_code = 503
+    retry_after = 5
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(0, int(os.getenv(name, str(default))))
+    except ValueError:
+        return default
+
+
+def statement_timeout_ms() -> int:
+    return _env_int("REPORTING_STATEMENT_TIMEOUT_MS", DEFAULT_STATEMENT_TIMEOUT_MS)
+
+
+def row_budget() -> int:
+    return _env_int("REPORTING_ROW_BUDGET", DEFAULT_ROW_BUDGET)
+
+
+def max_concurrent_per_org() -> int:
+    return _env_int("REPORTING_MAX_CONCURRENT_PER_ORG", DEFAULT_MAX_CONCURRENT_PER_ORG)
+
+
+class RowBudget:
+    __slots__ = ("limit", "used")
+
+    def __init__(self, limit: int):
+        self.limit = int(limit)
+        self.used = 0
+
+    @property
+    def remaining(self) -> int:
+        return max(0, self.limit - self.used)
+
+    def charge(self, rows: int = 1) -> None:
+        self.used += int(rows)
+        if self.used > self.limit:
+            raise RowBudgetExceededError(
+                f"Report exceeds the row budget of {self.limit} rows; "
+                "narrow the workflow or time window"
+            )
+
+
+_current_budget: ContextVar[RowBudget | None] = ContextVar(
+    "reporting_row_budget", default=None
+)
+
+
+def fetch_budgeted(query: Query) -> list:
+    """`query.all()`, reading at most one row past the remaining budget."""
+
+    budget = _current_budget.get()
+    if budget is None:
+        return query.all()
+    rows = query.limit(budget.remaining + 1).all()
+    budget.charge(len(rows))
+    return rows
+
+
+def metered(rows: Iterable[T]) -> Iterator[T]:
+    """Charge each row of a (streamed) result against the budget."""
+
+    budget = _current_budget.get()
+    if budget is None:
+        yield from rows
+        return
+    for row in rows:
+        budget.charge()
+        yield row
+
+
+class OrgConcurrencyLimiter:
+    """Non-blocking per-org slot counter for heavy reports."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._running: dict[str, int] = {}
+
+    @contextmanager
+    def slot(self, organization_id, limit: int) -> Iterator[None]:
+        key = str(organization_id)
+        with self._lock:
+            running = self._running.get(key, 0)
+            if limit and running >= limit:
+                raise ReportBusyError(
+                    "Too many reports running for this organization; retry shortly"
+                )
+            self._running[key] = running + 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                remaining = self._running[key] - 1
+                if remaining:
+                    self._running[key] = remaining
+                else:
+                    del self._running[key]
+
+
+report_limiter = OrgConcurrencyLimiter()
+
+
+def _is_statement_timeout(exc: OperationalError) -> bool:
+    orig = exc.orig
+    code = getattr(orig, "sqlstate", None) or getattr(orig, "pgcode", None)
+    return code == _QUERY_CANCELED
+
+
+@contextmanager
+def statement_timeout(db: Session, timeout_ms: int) -> Iterator[None]:
+    """Apply `SET LOCAL statement_timeout` to every transaction the session
+    runs inside the block. No-op on other databases or when 0."""
+
+    if not timeout_ms or db.get_bind().dialect.name != "postgresql":
+        yield
+        return
+
+    sql = f"SET LOCAL statement_timeout = {int(timeout_ms)}"
+
+    def _apply(_session, _transaction, connection) -> None:
+        connection.exec_driver_sql(sql)
+
+    if db.in_transaction():
+        db.connection().exec_driver_sql(sql)
+    event.listen(db, "after_begin", _apply)
+    try:
+        yield
+    finally:
+        event.remove(db, "after_begin", _apply)
+
+
+@contextmanager
+def reporting_guard(db: Session, ctx: RequestContext) -> Iterator[RowBudget | None]:
+    """Run a heavy report under the per-org concurrency limit, the
+    statement timeout and the row budget."""
+
+    limit = row_budget()
+    budget = RowBudget(limit) if limit else None
+    with report_limiter.slot(ctx.organization_id, max_concurrent_per_org()):
+        token = _current_budget.set(budget)
+        try:
+            with statement_timeout(db, statement_timeout_ms()):
+                yield budget
+        except OperationalError as exc:
+            if not _is_statement_timeout(exc):
+                raise
+            db.rollback()
+            raise ReportTimeoutError(
+                "Report exceeded the statement timeout; "
+                "narrow the workflow or time window"
+            ) from exc
+        finally:
+            _current_budget.reset(token)
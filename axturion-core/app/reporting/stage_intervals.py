@@ -0,0 +1,237 @@
+"""Columnar stage-interval breakdown (NumPy).
+
+Vectorized equivalent of `stage_duration_breakdown_service.app_stage_intervals`
+followed by `breakdown_items`: events are held as parallel arrays (app index,
+timestamp in microseconds, seq, from/to stage codes), sorted once with
+`lexsort`, clipped to each application's [start, end) bounds with masks, and
+differenced against the previous in-range event of the same application.
+Per-stage median and nearest-rank p90 are taken from one grouped sort.
+
+Results are identical to the reference implementation, including integer
+truncation of seconds and the stage-at-window-start rules.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterable
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - numpy is optional
+    np = None
+
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_US = timedelta(microseconds=1)
+_US_PER_SECOND = 1_000_000
+_NO_STAGE = -1
+_NO_CLOSE = 2**63 - 1
+
+
+def _to_us(dt: datetime) -> int:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _US
+
+
+def _us_array(values: list[datetime]) -> "np.ndarray":
+    try:
+        return np.array([(dt - _EPOCH) // _US for dt in values], dtype=np.int64)
+    except TypeError:
+        # Naive datetimes are taken as UTC.
+        return np.array([_to_us(dt) for dt in values], dtype=np.int64)
+
+
+class TransitionColumns:
+    """Applications and transition events as parallel int64 arrays.
+
+    Stage codes index `names`, which is sorted, so ordering by code orders
+    stages by name. Apps without `created_at` and events of unknown apps
+    are dropped.
+    """
+
+    __slots__ = (
+        "names",
+        "created",
+        "closed",
+        "current",
+        "ev_app",
+        "ev_ts",
+        "ev_seq",
+        "ev_from",
+        "ev_to",
+    )
+
+    @classmethod
+    def from_rows(
+        cls,
+        apps: Iterable[tuple[Any, str, datetime | None, datetime | None]],
+        events: Iterable[tuple[Any, datetime, int, str | None, str]],
+    ) -> "TransitionColumns":
+        if np is None:
+            raise RuntimeError("numpy is required for TransitionColumns")
+
+        apps = [row for row in apps if row[2] is not None]
+        events = list(events)
+
+        # One comprehension per column; zip(*rows) is much slower at this size.
+        current = [row[1] for row in apps]
+        ev_from_names = [e[3] for e in events]
+        ev_to_names = [e[4] for e in events]
+        names = sorted({*current, *ev_to_names, *(s for s in ev_from_names if s)})
+        codes = {name: i for i, name in enumerate(names)}
+        app_index = {row[0]: i for i, row in enumerate(apps)}
+
+        cols = cls()
+        cols.names = names
+        cols.created = _us_array([row[2] for row in apps])
+        cols.closed = np.array(
+            [_NO_CLOSE if row[3] is None else _to_us(row[3]) for row in apps],
+            dtype=np.int64,
+        )
+        cols.current = np.array([codes[s] for s in current], dtype=np.int64)
+
+        ev_app = np.array([app_index.get(e[0], -1) for e in events], dtype=np.int64)
+        known = ev_app >= 0
+        cols.ev_app = ev_app[known]
+        cols.ev_ts = _us_array([e[1] for e in events])[known]
+        cols.ev_seq = np.array([e[2] for e in events], dtype=np.int64)[known]
+        cols.ev_from = np.array(
+            [codes[s] if s else _NO_STAGE for s in ev_from_names], dtype=np.int64
+        )[known]
+        cols.ev_to = np.array([codes[s] for s in ev_to_names], dtype=np.int64)[known]
+        return cols
+
+
+def breakdown_columnar(
+    apps: Iterable[tuple[Any, str, datetime | None, datetime | None]],
+    events: Iterable[tuple[Any, datetime, int, str | None, str]],
+    *,
+    window_from: datetime | None,
+    window_to: datetime | None,
+    now: datetime,
+) -> list[dict[str, Any]]:
+    """Stage duration breakdown from (app_id, stage, created_at, closed_at)
+    rows and (app_id, at, seq, from_stage, to_stage) transition events.
+
+    Events must already be limited to at <= window_to. Requires NumPy.
+    """
+
+    return breakdown_from_columns(
+        TransitionColumns.from_rows(apps, events),
+        window_from=window_from,
+        window_to=window_to,
+        now=now,
+    )
+
+
+def breakdown_from_columns(
+    cols: TransitionColumns,
+    *,
+    window_from: datetime | None,
+    window_to: datetime | None,
+    now: datetime,
+) -> list[dict[str, Any]]:
+    """Breakdown over prebuilt columns (see `breakdown_columnar`)."""
+
+    n_apps = cols.created.size
+    if n_apps == 0:
+        return []
+    names = cols.names
+    created = cols.created
+    closed = cols.closed
+    stage_at_start = cols.current.copy()
+
+    # Per-app [start, end) bounds.
+    start = created
+    if window_from is not None:
+        start = np.maximum(start, _to_us(window_from))
+    end_bound = _to_us(window_to) if window_to is not None else _to_us(now)
+    end = np.minimum(closed, end_bound)
+    valid = end > start
+
+    order = np.lexsort((cols.ev_seq, cols.ev_ts, cols.ev_app))
+    ev_app = cols.ev_app[order]
+    ev_ts = cols.ev_ts[order]
+    ev_from = cols.ev_from[order]
+    ev_to = cols.ev_to[order]
+
+    # Stage active at `start`: the last earlier event's target, else the
+    # first event's source, else the application's current stage.
+    before = ev_ts < start[ev_app]
+    n_before = np.bincount(ev_app[before], minlength=n_apps)
+    first = np.searchsorted(ev_app, np.arange(n_apps), side="left")
+    has_events = np.bincount(ev_app, minlength=n_apps) > 0
+
+    has_before = n_before > 0
+    stage_at_start[has_before] = ev_to[(first + n_before - 1)[has_before]]
+
+    use_first_from = ~has_before & has_events
+    first_from = np.full(n_apps, _NO_STAGE, dtype=np.int64)
+    first_from[use_first_from] = ev_from[first[use_first_from]]
+    take_from = first_from != _NO_STAGE
+    stage_at_start[take_from] = first_from[take_from]
+
+    # Events inside each app's bounds, still grouped by app in time order.
+    in_range = valid[ev_app] & ~before & (ev_ts <= end[ev_app])
+    sel_app = ev_app[in_range]
+    sel_ts = ev_ts[in_range]
+    sel_to = ev_to[in_range]
+
+    n_sel = sel_app.size
+    is_first = np.ones(n_sel, dtype=bool)
+    is_last = np.ones(n_sel, dtype=bool)
+    if n_sel > 1:
+        boundary = sel_app[1:] != sel_app[:-1]
+        is_first[1:] = boundary
+        is_last[:-1] = boundary
+
+    cursor = np.empty(n_sel, dtype=np.int64)
+    active = np.empty(n_sel, dtype=np.int64)
+    if n_sel:
+        cursor[1:] = sel_ts[:-1]
+        active[1:] = sel_to[:-1]
+        cursor[is_first] = start[sel_app[is_first]]
+        active[is_first] = stage_at_start[sel_app[is_first]]
+    step_seconds = (sel_ts - cursor) // _US_PER_SECOND
+
+    final_cursor = start.copy()
+    final_active = stage_at_start.copy()
+    final_cursor[sel_app[is_last]] = sel_ts[is_last]
+    final_active[sel_app[is_last]] = sel_to[is_last]
+    final_seconds = np.where(valid, (end - final_cursor) // _US_PER_SECOND, 0)
+
+    stages = np.concatenate([active, final_active])
+    seconds = np.concatenate([step_seconds, final_seconds])
+    keep = seconds > 0
+    stages = stages[keep]
+    seconds = seconds[keep]
+    if seconds.size == 0:
+        return []
+
+    # Grouped stats: sort by (stage, seconds) and slice each stage's run.
+    order = np.lexsort((seconds, stages))
+    stages = stages[order]
+    seconds = seconds[order]
+
+    group_starts = np.flatnonzero(np.r_[True, stages[1:] != stages[:-1]])
+    counts = np.diff(np.r_[group_starts, stages.size])
+
+    mid = group_starts + counts // 2
+    odd = counts % 2 == 1
+    medians = np.where(
+        odd, seconds[mid], (seconds[mid - (~odd)] + seconds[mid]) // 2
+    )
+    k = np.ceil(0.90 * counts).astype(np.int64)
+    p90 = seconds[group_starts + np.clip(k - 1, 0, counts - 1)]
+
+    return [
+        {
+            "stage": names[stages[s]],
+            "count": int(n),
+            "median_seconds": int(m),
+            "p90_seconds": int(p),
+        }
+        for s, n, m, p in zip(group_starts, counts, medians, p90)
+    ]
@@ -4,13 +4,21 @@ ActivityService
 This service manages creation and retrieval of timeline activities.
 Activities are immutable records used to show what happened to an entity
 (application, candidate, job) over time.
+
+Activities are written through a deferred, per-session writer: rows are
+collected for the current unit of work and inserted in a single batch when
+the session commits. Primary keys and timestamps are generated client-side
+so callers can use the returned object (e.g. `activity.id`) immediately.
 """
 
-import json
+import uuid
+from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 from uuid import UUID
 
+from sqlalchemy import event, insert
 from sqlalchemy.orm import Session
+from app.core.event_bus import BusEvent, publish_on_commit
 from app.domain.automation.models import Activity
 
 import logging
@@ -18,6 +26,58 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+_PENDING_ACTIVITIES_KEY = "pending_activities"
+_PENDING_MARKS_KEY = "pending_activity_marks"
+
+
+def _now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _pending_activities(db: Session) -> list[dict[str, Any]]:
+    return db.info.setdefault(_PENDING_ACTIVITIES_KEY, [])
+
+
+@event.listens_for(Session, "before_commit")
+def _write_pending_activities(session: Session) -> None:
+    rows = session.info.pop(_PENDING_ACTIVITIES_KEY, None)
+    if not rows:
+        return
+
+    # One executemany INSERT for the whole unit of work; all column values
+    # (including id and created_at) are already populated client-side.
+    session.execute(insert(Activity), rows)
+
+
+@event.listens_for(Session, "after_transaction_create")
+def _mark_pending_activities(session: Session, transaction) -> None:
+    # Remember how many activities were queued when a savepoint began, so
+    # rolling it back discards only the ones queued inside it.
+    if transaction.nested:
+        marks = session.info.setdefault(_PENDING_MARKS_KEY, {})
+        marks[transaction] = len(session.info.get(_PENDING_ACTIVITIES_KEY, ()))
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _forget_pending_marks(session: Session, transaction) -> None:
+    # Fires before after_soft_rollback, so savepoint marks are only dropped
+    # once the outermost transaction ends.
+    if not transaction.nested and transaction.parent is None:
+        session.info.pop(_PENDING_MARKS_KEY, None)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_activities(session: Session, previous_transaction) -> None:
+    if not previous_transaction.nested:
+        session.info.pop(_PENDING_ACTIVITIES_KEY, None)
+        return
+
+    mark = session.info.get(_PENDING_MARKS_KEY, {}).pop(previous_transaction, None)
+    pending = session.info.get(_PENDING_ACTIVITIES_KEY)
+    if mark is not None and pending is not None:
+        del pending[mark:]
+
+
 def create_activity(
     db: Session,
     organization_id: UUID,
@@ -35,19 +95,24 @@ def create_activity(
     - manual recruiter actions
     - system events (emails, stage changes)
 
-    Activities are immutable and append-only.
+    Activities are immutable and append-only. The row is queued on the
+    session and inserted together with all other activities of the same
+    unit of work on commit; a rollback discards it (a savepoint rollback
+    only discards activities queued inside the savepoint).
     """
     if message is None:
         message = ""
 
-    activity = Activity(
-        organization_id=organization_id,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        type=activity_type,
-        message=message,
-        payload=payload,
-    )
+    values = {
+        "id": uuid.uuid4(),
+        "organization_id": organization_id,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "type": activity_type,
+        "message": message,
+        "payload": payload,
+        "created_at": _now_utc(),
+    }
 
     logger.info(
         "activity_created",
@@ -59,7 +124,24 @@ def create_activity(
             "activity_type": activity_type,
         },
     )
-    db.add(activity)
-    db.flush()
-    db.refresh(activity)
-    return activity
+    _pending_activities(db).append(values)
+
+    publish_on_commit(
+        db,
+        BusEvent(
+            organization_id=str(organization_id),
+            kind="activity",
+            entity_type=entity_type,
+            entity_id=str(entity_id),
+            data={
+                "id": str(values["id"]),
+                "entity_type": entity_type,
+                "entity_id": str(entity_id),
+                "type": activity_type,
+                "message": message,
+                "payload": payload,
+                "created_at": values["created_at"].isoformat(),
+            },
+        ),
+    )
+    return Activity(**values)
@@ -5,13 +5,17 @@ from datetime import datetime, timezone
 from uuid import UUID
 
 import sqlalchemy as sa
-from sqlalchemy import func
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.core.log_context import correlation_id_var
 from app.core.request_context import RequestContext
 from app.domain.application.models import Application
-from app.domain.workflow.models import PendingStageTransition
+from app.domain.workflow.models import (
+    ApprovalQueueCounter,
+    ApprovalQueueItem,
+    PendingStageTransition,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -37,46 +41,160 @@ def _coerce_dt(dt: datetime) -> datetime:
     return dt
 
 
+def _epoch_seconds(dt: datetime) -> int:
+    return int(_coerce_dt(dt).timestamp())
+
+
+def _bump_counter(db: Session, organization_id, delta: int, epoch: int) -> None:
+    counter_update = (
+        sa.update(ApprovalQueueCounter)
+        .where(ApprovalQueueCounter.organization_id == organization_id)
+        .values(
+            pending_count=ApprovalQueueCounter.pending_count + delta,
+            initiated_epoch_sum=ApprovalQueueCounter.initiated_epoch_sum
+            + delta * epoch,
+        )
+        .execution_options(synchronize_session=False)
+    )
+    if db.execute(counter_update).rowcount:
+        return
+
+    try:
+        with db.begin_nested():
+            db.add(
+                ApprovalQueueCounter(
+                    organization_id=organization_id,
+                    pending_count=delta,
+                    initiated_epoch_sum=delta * epoch,
+                )
+            )
+    except IntegrityError:
+        # Created concurrently; apply the delta to the winner's row.
+        db.execute(counter_update)
+
+
+def enqueue_pending_approval(
+    db: Session,
+    pending: PendingStageTransition,
+    *,
+    workflow_id,
+    from_stage: str,
+) -> None:
+    """Add a new pending approval to the read model. Call after the pending
+    row is flushed and refreshed (`initiated_at` is server-generated);
+    commits with the caller."""
+
+    db.add(
+        ApprovalQueueItem(
+            id=pending.id,
+            organization_id=pending.organization_id,
+            application_id=pending.application_id,
+            workflow_id=workflow_id,
+            from_stage=from_stage,
+            target_stage=pending.target_stage,
+            initiated_by_user_id=pending.initiated_by_user_id,
+            initiated_at=pending.initiated_at,
+        )
+    )
+    _bump_counter(db, pending.organization_id, 1, _epoch_seconds(pending.initiated_at))
+
+
+def dequeue_pending_approval(db: Session, pending: PendingStageTransition) -> None:
+    """Remove a resolved pending approval from the read model."""
+
+    db.query(ApprovalQueueItem).filter(ApprovalQueueItem.id == pending.id).delete(
+        synchronize_session=False
+    )
+    _bump_counter(
+        db, pending.organization_id, -1, _epoch_seconds(pending.initiated_at)
+    )
+
+
+APPROVAL_SORTS = ("newest", "oldest")
+
+
 def list_pending_approvals(
     db: Session,
     ctx: RequestContext,
     limit: int = 50,
     offset: int = 0,
+    *,
+    sort: str = "newest",
+    workflow_id: UUID | None = None,
+    after_id=None,
 ):
+    """Page of the approval queue, newest or oldest (longest waiting) first.
+
+    Reads `approval_queue_item` through its (org[, workflow], initiated_at,
+    id) indexes. Pass the last item's `pending_id` as `after_id` for keyset
+    pagination, which stays O(page) however deep the backlog is.
+    """
+
+    if sort not in APPROVAL_SORTS:
+        raise ValueError(f"sort must be one of: {', '.join(APPROVAL_SORTS)}")
     limit = max(1, min(int(limit), 200))
     offset = max(0, int(offset))
 
     now = datetime.now(timezone.utc)
 
-    rows = (
-        db.query(
-            PendingStageTransition,
-            Application.workflow_id,
-            Application.stage,
+    q = db.query(ApprovalQueueItem).filter(
+        ApprovalQueueItem.organization_id == ctx.organization_id
+    )
+    if workflow_id is not None:
+        q = q.filter(ApprovalQueueItem.workflow_id == workflow_id)
+
+    key = sa.tuple_(ApprovalQueueItem.initiated_at, ApprovalQueueItem.id)
+    if after_id is not None:
+        anchor = (
+            db.query(ApprovalQueueItem.initiated_at, ApprovalQueueItem.id)
+            .filter(
+                ApprovalQueueItem.organization_id == ctx.organization_id,
+                ApprovalQueueItem.id == _coerce_uuid(after_id),
+            )
+            .one_or_none()
         )
-        .join(Application, Application.id == PendingStageTransition.application_id)
-        .filter(
-            PendingStageTransition.organization_id == ctx.organization_id,
-            Application.organization_id == ctx.organization_id,
+        if anchor is None:
+            raise PendingApprovalNotFoundError()
+        bound = sa.tuple_(
+            sa.literal(anchor[0], ApprovalQueueItem.initiated_at.type),
+            sa.literal(anchor[1], ApprovalQueueItem.id.type),
+        )
+        q = q.filter(key < bound if sort == "newest" else key > bound)
+
+    if sort == "newest":
+        q = q.order_by(
+            ApprovalQueueItem.initiated_at.desc(), ApprovalQueueItem.id.desc()
+        )
+    else:
+        q = q.order_by(ApprovalQueueItem.initiated_at.asc(), ApprovalQueueItem.id.asc())
+
+    rows = q.offset(offset).limit(limit).all()
+
+    # The application may have moved on since the request; show its stage now.
+    current_stage_by_app: dict = {}
+    if rows:
+        current_stage_by_app = dict(
+            db.query(Application.id, Application.stage).filter(
+                Application.organization_id == ctx.organization_id,
+                Application.id.in_({row.application_id for row in rows}),
+            )
         )
-        .order_by(PendingStageTransition.initiated_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .all()
-    )
 
     items: list[dict] = []
-    for pending, workflow_id, current_stage in rows:
-        initiated_at = _coerce_dt(pending.initiated_at)
+    for row in rows:
+        initiated_at = _coerce_dt(row.initiated_at)
         age_seconds = int(max(0.0, (now - initiated_at).total_seconds()))
 
         items.append(
             {
-                "application_id": pending.application_id,
-                "workflow_id": workflow_id,
-                "current_stage": current_stage,
-                "target_stage": pending.target_stage,
-                "initiated_by_user_id": pending.initiated_by_user_id,
+                "pending_id": row.id,
+                "application_id": row.application_id,
+                "workflow_id": row.workflow_id,
+                "current_stage": current_stage_by_app.get(
+                    row.application_id, row.from_stage
+                ),
+                "target_stage": row.target_stage,
+                "initiated_by_user_id": row.initiated_by_user_id,
                 "initiated_at": initiated_at,
                 "age_seconds": age_seconds,
             }
@@ -141,84 +259,41 @@ def get_pending_for_application(
 
 
 def approval_summary(db: Session, ctx: RequestContext):
+    """Queue size and ages from `approval_queue_counter` plus one index
+    probe for the oldest item; independent of the backlog size."""
+
     now = datetime.now(timezone.utc)
 
-    total, oldest_initiated_at = (
+    counter = (
         db.query(
-            func.count(PendingStageTransition.id),
-            func.min(PendingStageTransition.initiated_at),
+            ApprovalQueueCounter.pending_count,
+            ApprovalQueueCounter.initiated_epoch_sum,
         )
-        .filter(PendingStageTransition.organization_id == ctx.organization_id)
-        .one()
+        .filter(ApprovalQueueCounter.organization_id == ctx.organization_id)
+        .one_or_none()
     )
-    total = int(total or 0)
+    total = int(counter[0]) if counter is not None else 0
 
     if total <= 0:
+        total = 0
         avg_age = 0.0
         oldest = 0
     else:
-        oldest_dt = _coerce_dt(oldest_initiated_at)
-        oldest = int(max(0.0, (now - oldest_dt).total_seconds()))
-
-        dialect = db.get_bind().dialect.name
-
-        avg_seconds: float | None = None
-        try:
-            if dialect == "sqlite":
-                # SQLite: use julianday math to compute epoch deltas.
-                now_naive = now.replace(tzinfo=None)
-                avg_expr = func.avg(
-                    (
-                        func.julianday(now_naive)
-                        - func.julianday(PendingStageTransition.initiated_at)
-                    )
-                    * 86400.0
-                )
-                avg_seconds = (
-                    db.query(avg_expr)
-                    .filter(
-                        PendingStageTransition.organization_id == ctx.organization_id
-                    )
-                    .scalar()
-                )
-            else:
-                # Postgres (and most others): extract seconds from an interval.
-                avg_expr = func.avg(
-                    func.extract(
-                        "epoch",
-                        sa.bindparam("now", now) - PendingStageTransition.initiated_at,
-                    )
-                )
-                avg_seconds = (
-                    db.query(avg_expr)
-                    .filter(
-                        PendingStageTransition.organization_id == ctx.organization_id
-                    )
-                    .params(now=now)
-                    .scalar()
-                )
-        except Exception:
-            avg_seconds = None
-
-        if avg_seconds is None:
-            # Fallback: bounded iteration (no .all()) for dialects lacking support.
-            MAX_FALLBACK_ROWS = 10_000
-            if total <= MAX_FALLBACK_ROWS:
-                total_seconds = 0.0
-                for (initiated_at,) in (
-                    db.query(PendingStageTransition.initiated_at)
-                    .filter(
-                        PendingStageTransition.organization_id == ctx.organization_id
-                    )
-                    .yield_per(1000)
-                ):
-                    initiated_at = _coerce_dt(initiated_at)
-                    total_seconds += max(0.0, (now - initiated_at).total_seconds())
-                avg_seconds = total_seconds / float(total)
-            else:
-                avg_seconds = 0.0
-
-        avg_age = float(max(0.0, avg_seconds))
+        avg_initiated = int(counter[1]) / float(total)
+        avg_age = float(max(0.0, now.timestamp() - avg_initiated))
+
+        oldest_initiated_at = (
+            db.query(ApprovalQueueItem.initiated_at)
+            .filter(ApprovalQueueItem.organization_id == ctx.organization_id)
+            .order_by(ApprovalQueueItem.initiated_at.asc())
+            .limit(1)
+            .scalar()
+        )
+        oldest = (
+            int(max(0.0, (now - _coerce_dt(oldest_initiated_at)).total_seconds()))
+            if oldest_initiated_at is not None
+            else 0
+        )
 
     logger.info(
         "pending_approvals_summarized",
@@ -0,0 +1,155 @@
+"""Lightweight, streaming reads of audit_log rows.
+
+Read paths that scan audit history (chain verification, compliance export,
+UX version listings, lifecycle reports) only need a handful of columns and
+never modify rows. Loading `AuditLog` ORM instances for them pays for
+identity-map tracking and per-instance state on every row; the helpers here
+issue Core `select()` statements instead and stream results in batches.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Iterable, Iterator
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.core.request_context import RequestContext
+from app.domain.audit.models import AuditLog
+
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+class AuditRecord:
+    """Read-only audit row (duck-types `AuditLog` for hashing and exports)."""
+
+    __slots__ = (
+        "id",
+        "organization_id",
+        "actor_id",
+        "entity_type",
+        "entity_id",
+        "action",
+        "payload",
+        "payload_canonical",
+        "created_at",
+        "seq",
+        "prev_hash",
+        "hash",
+    )
+
+    def __init__(
+        self,
+        id,
+        organization_id,
+        actor_id,
+        entity_type,
+        entity_id,
+        action,
+        payload,
+        payload_canonical,
+        created_at,
+        seq,
+        prev_hash,
+        hash,
+    ):
+        self.id = id
+        self.organization_id = organization_id
+        self.actor_id = actor_id
+        self.entity_type = entity_type
+        self.entity_id = entity_id
+        self.action = action
+        self.payload = payload
+        self.payload_canonical = payload_canonical
+        self.created_at = created_at
+        self.seq = seq
+        self.prev_hash = prev_hash
+        self.hash = hash
+
+    def __repr__(self) -> str:
+        return f"AuditRecord(seq={self.seq!r}, action={self.action!r})"
+
+
+# Column order matches AuditRecord.__init__.
+AUDIT_RECORD_COLUMNS = tuple(
+    getattr(AuditLog, name) for name in AuditRecord.__slots__
+)
+
+
+def stream_rows(
+    db: Session, stmt: Select, *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> Iterator[Any]:
+    """Execute a Core select and yield plain row tuples in batches.
+
+    On Postgres this uses a server-side cursor, so the full result is never
+    held in memory. Do not issue other queries on the same session while
+    the iterator is being consumed.
+    """
+
+    result = db.execute(
+        stmt.execution_options(stream_results=True, yield_per=int(batch_size))
+    )
+    try:
+        yield from result
+    finally:
+        result.close()
+
+
+def audit_records_select(
+    ctx: RequestContext,
+    *,
+    start_seq: int | None = None,
+    end_seq: int | None = None,
+    entity_type: str | None = None,
+    entity_id: str | None = None,
+    actions: Iterable[str] | None = None,
+) -> Select:
+    """Select full audit records for the org, ordered by seq."""
+
+    stmt = select(*AUDIT_RECORD_COLUMNS).where(
+        AuditLog.organization_id == ctx.organization_id
+    )
+    if start_seq is not None:
+        stmt = stmt.where(AuditLog.seq >= int(start_seq))
+    if end_seq is not None:
+        stmt = stmt.where(AuditLog.seq <= int(end_seq))
+    if entity_type is not None:
+        stmt = stmt.where(AuditLog.entity_type == entity_type)
+    if entity_id is not None:
+        stmt = stmt.where(AuditLog.entity_id == entity_id)
+    if actions is not None:
+        stmt = stmt.where(AuditLog.action.in_(list(actions)))
+    return stmt.order_by(AuditLog.seq.asc())
+
+
+def iter_audit_records(
+    db: Session,
+    ctx: RequestContext,
+    *,
+    start_seq: int | None = None,
+    end_seq: int | None = None,
+    entity_type: str | None = None,
+    entity_id: str | None = None,
+    actions: Iterable[str] | None = None,
+    offset: int | None = None,
+    limit: int | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Iterator[AuditRecord]:
+    """Yield `AuditRecord`s for the org in seq order."""
+
+    stmt = audit_records_select(
+        ctx,
+        start_seq=start_seq,
+        end_seq=end_seq,
+        entity_type=entity_type,
+        entity_id=entity_id,
+        actions=actions,
+    )
+    if offset:
+        stmt = stmt.offset(int(offset))
+    if limit is not None:
+        stmt = stmt.limit(int(limit))
+
+    for row in stream_rows(db, stmt, batch_size=batch_size):
+        yield AuditRecord(*row)
@@ -1,28 +1,45 @@
 from __future__ import annotations
 
-import json
+import logging
 import os
 from datetime import datetime, timezone
-from typing import Any
+from pathlib import Path
+from typing import Any, Iterator
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.core.audit_hashing import canonical_audit_payload, compute_hash
+from app.audit.archive import (
+    ArchivedAuditRow,
+    ArchiveFormatError,
+    ArchiveReader,
+    boundary_from_seal,
+    file_sha256,
+    verify_segment_seal,
+)
+from app.audit.merkle import inclusion_proof, leaf_hash, merkle_root
+from app.core.audit_hashing import (
+    canonical_audit_payload,
+    compute_hash,
+    serialize_payload,
+)
+from app.core.event_bus import BusEvent, publish_on_commit
 from app.core.request_context import RequestContext
-from app.domain.audit.models import AuditLog
+from app.domain.audit.models import AuditLog, AuditMerkleAnchor, AuditSegmentSeal
 from app.domain.organization.models import Organization
+from app.services.audit_row_reader import AuditRecord, iter_audit_records
 
 
-def _now_utc() -> datetime:
-    return datetime.now(timezone.utc)
+logger = logging.getLogger(__name__)
+
 
+# Rows per Merkle anchor; a range [k*N+1, (k+1)*N] is anchored by the
+# anchoring job (`anchor_completed_ranges`) once complete.
+ANCHOR_RANGE_SIZE = 1024
 
-def _payload_to_text(payload: Any) -> str | None:
-    if payload is None:
-        return None
-    if isinstance(payload, str):
-        return payload
-    return json.dumps(payload, default=str)
+
+def _now_utc() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 def append_audit_log(
@@ -67,13 +84,16 @@ def append_audit_log(
     else:
         effective_created_at = effective_created_at.astimezone(timezone.utc)
 
+    payload_text, payload_canonical = serialize_payload(payload)
+
     log = AuditLog(
         organization_id=ctx.organization_id,
         actor_id=str(ctx.actor_id) if ctx.actor_id else None,
         entity_type=entity_type,
         entity_id=str(entity_id),
         action=action,
-        payload=_payload_to_text(payload),
+        payload=payload_text,
+        payload_canonical=payload_canonical,
         created_at=effective_created_at,
         seq=next_seq,
         prev_hash=prev_hash,
@@ -87,9 +107,47 @@ def append_audit_log(
     # Ensure subsequent audit appends in the same transaction see this row,
     # so sequence numbers remain unique.
     db.flush()
+
+    publish_on_commit(db, audit_bus_event(log))
     return log
 
 
+def audit_bus_event(log: AuditLog) -> BusEvent:
+    """Build the stream event for an audit row.
+
+    Only metadata is exposed; the payload stays behind the audit endpoints.
+    """
+
+    created_at = log.created_at
+    return BusEvent(
+        organization_id=str(log.organization_id),
+        kind="audit",
+        entity_type=str(log.entity_type or ""),
+        entity_id=str(log.entity_id or ""),
+        seq=int(log.seq),
+        data={
+            "seq": int(log.seq),
+            "action": log.action,
+            "entity_type": log.entity_type,
+            "entity_id": log.entity_id,
+            "actor_id": log.actor_id,
+            "created_at": created_at.isoformat() if created_at else None,
+        },
+    )
+
+
+def latest_audit_seq(db: Session, ctx: RequestContext) -> int:
+    """Return the organization's audit watermark (0 when no audit exists)."""
+
+    row = (
+        db.query(AuditLog.seq)
+        .filter(AuditLog.organization_id == ctx.organization_id)
+        .order_by(AuditLog.seq.desc())
+        .first()
+    )
+    return 0 if not row else int(row[0])
+
+
 class AuditVerificationError(Exception):
     def __init__(self, *, seq: int, audit_log_id: str, reason: str):
         super().__init__(reason)
@@ -98,17 +156,264 @@ class AuditVerificationError(Exception):
         self.reason = reason
 
 
+def archived_through_seq(db: Session, ctx: RequestContext) -> int:
+    """Return the last archived (sealed) audit seq, or 0 if nothing is archived."""
+
+    row = (
+        db.query(AuditSegmentSeal.last_seq)
+        .filter(AuditSegmentSeal.organization_id == ctx.organization_id)
+        .order_by(AuditSegmentSeal.last_seq.desc())
+        .first()
+    )
+    return 0 if not row else int(row[0])
+
+
+class ArchivedSegmentError(Exception):
+    """An archive segment failed its seal or digest check."""
+
+    def __init__(self, seal: AuditSegmentSeal, reason: str):
+        super().__init__(reason)
+        self.seal = seal
+        self.reason = reason
+
+    def as_verification_error(self) -> dict[str, Any]:
+        return {
+            "seq": int(self.seal.first_seq),
+            "segment_seal_id": str(self.seal.id),
+            "reason": self.reason,
+        }
+
+
+def _open_sealed_segment(
+    seal: AuditSegmentSeal, *, full_digest: bool = False
+) -> ArchiveReader:
+    """Open a sealed segment after checking it against its seal.
+
+    By default only the seal-signed index is checked; blocks are checked
+    against their indexed digests as they are read. `full_digest` hashes the
+    whole file instead.
+    """
+
+    boundary = boundary_from_seal(seal)
+    if not verify_segment_seal(boundary, seal.seal):
+        raise ArchivedSegmentError(seal, "segment_seal_invalid")
+
+    path = Path(seal.archive_path)
+    if not path.is_file():
+        raise ArchivedSegmentError(seal, "archive_missing")
+    try:
+        reader = ArchiveReader(path)
+    except (ArchiveFormatError, ValueError) as exc:
+        raise ArchivedSegmentError(seal, "archive_corrupt") from exc
+
+    if full_digest:
+        if file_sha256(path) != boundary.archive_sha256:
+            reader.close()
+            raise ArchivedSegmentError(seal, "archive_digest_mismatch")
+    elif not reader.verify_index(boundary):
+        reader.close()
+        raise ArchivedSegmentError(seal, "archive_index_invalid")
+    return reader
+
+
+def iter_archived_audit_rows(
+    db: Session,
+    ctx: RequestContext,
+    first_seq: int,
+    last_seq: int,
+    *,
+    full_digest: bool = False,
+) -> Iterator[ArchivedAuditRow]:
+    """Yield archived audit rows in [first_seq, last_seq] from sealed segments.
+
+    Raises ArchivedSegmentError when a segment's seal, index or a block read
+    from it does not match. `full_digest` also checks each segment's
+    whole-file digest (see `_open_sealed_segment`).
+    """
+
+    seals = (
+        db.query(AuditSegmentSeal)
+        .filter(
+            AuditSegmentSeal.organization_id == ctx.organization_id,
+            AuditSegmentSeal.last_seq >= first_seq,
+            AuditSegmentSeal.first_seq <= last_seq,
+        )
+        .order_by(AuditSegmentSeal.first_seq.asc())
+        .all()
+    )
+    for seal in seals:
+        with _open_sealed_segment(seal, full_digest=full_digest) as reader:
+            try:
+                yield from reader.iter_rows(
+                    max(first_seq, int(seal.first_seq)),
+                    min(last_seq, int(seal.last_seq)),
+                )
+            except ArchiveFormatError as exc:
+                raise ArchivedSegmentError(seal, "archive_block_corrupt") from exc
+
+
+def iter_audit_chain_rows(
+    db: Session,
+    ctx: RequestContext,
+    *,
+    start_seq: int,
+    end_seq: int | None = None,
+    full_digest: bool = False,
+) -> Iterator[AuditRecord | ArchivedAuditRow]:
+    """Yield audit rows from `start_seq` (through `end_seq`) in seq order.
+
+    Archived rows are read transparently from sealed segments; the rest is
+    streamed from the hot table (see `stream_rows`), so callers can consume
+    long ranges without holding them in memory. `full_digest` is passed to
+    `iter_archived_audit_rows`.
+    """
+
+    boundary_seq = archived_through_seq(db, ctx)
+
+    if start_seq <= boundary_seq:
+        archived_end = boundary_seq if end_seq is None else min(end_seq, boundary_seq)
+        yield from iter_archived_audit_rows(
+            db, ctx, start_seq, archived_end, full_digest=full_digest
+        )
+
+    yield from iter_audit_records(
+        db, ctx, start_seq=max(start_seq, boundary_seq + 1), end_seq=end_seq
+    )
+
+
+def _chain_seed(
+    db: Session, ctx: RequestContext, start_seq: int
+) -> tuple[str | None, dict[str, Any] | None]:
+    """Return the hash preceding `start_seq` (hot row, seal or archive)."""
+
+    if start_seq <= 1:
+        return None, None
+
+    prev_seq = start_seq - 1
+    prev_row = (
+        db.query(AuditLog.hash)
+        .filter(
+            AuditLog.organization_id == ctx.organization_id,
+            AuditLog.seq == prev_seq,
+        )
+        .first()
+    )
+    if prev_row:
+        return str(prev_row[0]), None
+
+    seal = (
+        db.query(AuditSegmentSeal)
+        .filter(
+            AuditSegmentSeal.organization_id == ctx.organization_id,
+            AuditSegmentSeal.first_seq <= prev_seq,
+            AuditSegmentSeal.last_seq >= prev_seq,
+        )
+        .first()
+    )
+    if seal is None:
+        return None, None
+
+    if int(seal.last_seq) == prev_seq:
+        # The seal itself carries the boundary hash; no need to open the file.
+        if not verify_segment_seal(boundary_from_seal(seal), seal.seal):
+            return None, ArchivedSegmentError(
+                seal, "segment_seal_invalid"
+            ).as_verification_error()
+        return str(seal.last_hash), None
+
+    try:
+        archived = list(iter_archived_audit_rows(db, ctx, prev_seq, prev_seq))
+    except ArchivedSegmentError as exc:
+        return None, exc.as_verification_error()
+    return (str(archived[0].hash) if archived else None), None
+
+
+class AuditChainVerifier:
+    """Incremental chain verification over rows fed in seq order.
+
+    Once a row fails, later rows are ignored; `result()` reports the first
+    failure in the shape returned by `verify_audit_chain`.
+    """
+
+    def __init__(self, start_seq: int, prev_hash: str | None):
+        self.start_seq = start_seq
+        self._prev_hash = prev_hash
+        self._expected_seq = start_seq
+        self.checked = 0
+        self.error: dict[str, Any] | None = None
+
+    def fail(self, error: dict[str, Any]) -> None:
+        if self.error is None:
+            self.error = error
+
+    def feed(self, row) -> bool:
+        """Check the next row; False once the chain is broken."""
+
+        if self.error is not None:
+            return False
+
+        if int(row.seq) != self._expected_seq:
+            reason = "non_contiguous_sequence"
+        elif (row.prev_hash or None) != (self._prev_hash or None):
+            reason = "prev_hash_mismatch"
+        elif str(row.hash) != compute_hash(
+            self._prev_hash, canonical_audit_payload(row)
+        ):
+            reason = "hash_mismatch"
+        else:
+            self._prev_hash = str(row.hash)
+            self._expected_seq += 1
+            self.checked += 1
+            return True
+
+        self.error = {
+            "seq": int(row.seq),
+            "audit_log_id": str(row.id),
+            "reason": reason,
+        }
+        return False
+
+    def result(self) -> dict[str, Any]:
+        if self.error is not None:
+            return {
+                "ok": False,
+                "checked": self.checked,
+                "first_seq": self.start_seq,
+                "last_seq": self._expected_seq - 1 if self.checked else None,
+                "error": self.error,
+            }
+        return {
+            "ok": True,
+            "checked": self.checked,
+            "first_seq": self.start_seq if self.checked else None,
+            "last_seq": self._expected_seq - 1 if self.checked else None,
+            "error": None,
+        }
+
+
+def audit_chain_verifier(
+    db: Session, ctx: RequestContext, start_seq: int
+) -> AuditChainVerifier:
+    """A verifier seeded with the hash preceding `start_seq`."""
+
+    prev_hash, seed_error = _chain_seed(db, ctx, start_seq)
+    verifier = AuditChainVerifier(start_seq, prev_hash)
+    if seed_error is not None:
+        verifier.fail(seed_error)
+    return verifier
+
+
 def verify_audit_chain(
     db: Session,
     ctx: RequestContext,
     *,
     limit: int | None = 1000,
-    rows: list[AuditLog] | None = None,
+    rows: list[AuditLog | AuditRecord | ArchivedAuditRow] | None = None,
 ) -> dict[str, Any]:
     """Verify audit chain integrity for the current organization.
 
     If limit is set, verifies the latest `limit` rows (plus the immediately
-    preceding row to seed the chain).
+    preceding row to seed the chain). Rows are streamed, not loaded at once.
     """
 
     limit_value: int | None
@@ -122,89 +427,17 @@ def verify_audit_chain(
     if rows is not None:
         rows_list = list(rows)
         if not rows_list:
-            return {
-                "ok": True,
-                "checked": 0,
-                "first_seq": None,
-                "last_seq": None,
-                "error": None,
-            }
+            return AuditChainVerifier(0, None).result()
 
         rows_list.sort(key=lambda r: int(r.seq))
         if limit_value is not None and len(rows_list) > limit_value:
             rows_list = rows_list[-limit_value:]
 
-        start_seq = int(rows_list[0].seq)
-
-        prev_hash: str | None = None
-        if start_seq > 1:
-            prev_row = (
-                db.query(AuditLog.hash)
-                .filter(
-                    AuditLog.organization_id == ctx.organization_id,
-                    AuditLog.seq == (start_seq - 1),
-                )
-                .first()
-            )
-            prev_hash = None if not prev_row else str(prev_row[0])
-
-        expected_seq = start_seq
-        checked = 0
-
+        verifier = audit_chain_verifier(db, ctx, int(rows_list[0].seq))
         for row in rows_list:
-            if int(row.seq) != expected_seq:
-                return {
-                    "ok": False,
-                    "checked": checked,
-                    "first_seq": start_seq,
-                    "last_seq": expected_seq - 1 if checked else None,
-                    "error": {
-                        "seq": int(row.seq),
-                        "audit_log_id": str(row.id),
-                        "reason": "non_contiguous_sequence",
-                    },
-                }
-
-            if (row.prev_hash or None) != (prev_hash or None):
-                return {
-                    "ok": False,
-                    "checked": checked,
-                    "first_seq": start_seq,
-                    "last_seq": expected_seq - 1 if checked else None,
-                    "error": {
-                        "seq": int(row.seq),
-                        "audit_log_id": str(row.id),
-                        "reason": "prev_hash_mismatch",
-                    },
-                }
-
-            canonical = canonical_audit_payload(row)
-            expected_hash = compute_hash(prev_hash, canonical)
-
-            if str(row.hash) != expected_hash:
-                return {
-                    "ok": False,
-                    "checked": checked,
-                    "first_seq": start_seq,
-                    "last_seq": expected_seq - 1 if checked else None,
-                    "error": {
-                        "seq": int(row.seq),
-                        "audit_log_id": str(row.id),
-                        "reason": "hash_mismatch",
-                    },
-                }
-
-            prev_hash = str(row.hash)
-            expected_seq += 1
-            checked += 1
-
-        return {
-            "ok": True,
-            "checked": checked,
-            "first_seq": start_seq,
-            "last_seq": int(rows_list[-1].seq) if rows_list else None,
-            "error": None,
-        }
+            if not verifier.feed(row):
+                break
+        return verifier.result()
 
     max_seq_row = (
         db.query(AuditLog.seq)
@@ -213,13 +446,7 @@ def verify_audit_chain(
         .first()
     )
     if not max_seq_row:
-        return {
-            "ok": True,
-            "checked": 0,
-            "first_seq": None,
-            "last_seq": None,
-            "error": None,
-        }
+        return AuditChainVerifier(0, None).result()
 
     max_seq = int(max_seq_row[0])
     # At this point limit_value is always an int (unlimited is only allowed
@@ -227,82 +454,153 @@ def verify_audit_chain(
     assert limit_value is not None
     start_seq = max(1, max_seq - limit_value + 1)
 
-    prev_hash: str | None = None
-    if start_seq > 1:
-        prev_row = (
-            db.query(AuditLog.hash)
-            .filter(
-                AuditLog.organization_id == ctx.organization_id,
-                AuditLog.seq == (start_seq - 1),
+    verifier = audit_chain_verifier(db, ctx, start_seq)
+    if verifier.error is None:
+        # Rows before the archive boundary are read from sealed segments,
+        # each checked against its whole-file digest.
+        chain = iter_audit_chain_rows(db, ctx, start_seq=start_seq, full_digest=True)
+        try:
+            for row in chain:
+                if not verifier.feed(row):
+                    break
+        except ArchivedSegmentError as exc:
+            verifier.fail(exc.as_verification_error())
+        finally:
+            chain.close()
+    return verifier.result()
+
+
+class AuditProofError(Exception):
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def anchor_range_bounds(seq: int) -> tuple[int, int]:
+    first = ((int(seq) - 1) // ANCHOR_RANGE_SIZE) * ANCHOR_RANGE_SIZE + 1
+    return first, first + ANCHOR_RANGE_SIZE - 1
+
+
+def anchor_completed_ranges(
+    db: Session, ctx: RequestContext, *, max_ranges: int = 16
+) -> dict[str, Any]:
+    """Periodic job: store Merkle roots for completed seq ranges. Commits.
+
+    Scans forward from the org's last anchor, anchoring at most
+    `max_ranges` ranges per run. Each range is chain-verified first; a range
+    that fails verification stops the run and is reported (later ranges
+    cannot be anchored past a broken chain), so it is retried only by the
+    next run of this job.
+    """
+
+    # Serialize concurrent runs for the org (same lock as audit appends).
+    db.query(Organization.id).filter(
+        Organization.id == ctx.organization_id
+    ).with_for_update().one_or_none()
+
+    last_anchored = (
+        db.query(func.max(AuditMerkleAnchor.last_seq))
+        .filter(AuditMerkleAnchor.organization_id == ctx.organization_id)
+        .scalar()
+    )
+    first_seq = int(last_anchored or 0) + 1
+    completed_through = (
+        latest_audit_seq(db, ctx) // ANCHOR_RANGE_SIZE
+    ) * ANCHOR_RANGE_SIZE
+
+    anchored = 0
+    failed_range: tuple[int, int] | None = None
+    while anchored < max_ranges and first_seq + ANCHOR_RANGE_SIZE - 1 <= completed_through:
+        last_seq = first_seq + ANCHOR_RANGE_SIZE - 1
+        rows = list(
+            iter_audit_chain_rows(db, ctx, start_seq=first_seq, end_seq=last_seq)
+        )
+        verification = verify_audit_chain(db, ctx, limit=None, rows=rows)
+        if len(rows) != ANCHOR_RANGE_SIZE or not verification["ok"]:
+            logger.warning(
+                "audit_anchor_failed",
+                extra={
+                    "action": "audit_anchor_failed",
+                    "organization_id": str(ctx.organization_id),
+                    "first_seq": first_seq,
+                    "last_seq": last_seq,
+                },
+            )
+            failed_range = (first_seq, last_seq)
+            break
+
+        db.add(
+            AuditMerkleAnchor(
+                organization_id=ctx.organization_id,
+                first_seq=first_seq,
+                last_seq=last_seq,
+                leaf_count=len(rows),
+                root=merkle_root([leaf_hash(str(r.hash)) for r in rows]).hex(),
             )
-            .first()
         )
-        prev_hash = None if not prev_row else str(prev_row[0])
+        anchored += 1
+        first_seq = last_seq + 1
 
-    rows = (
-        db.query(AuditLog)
-        .filter(
-            AuditLog.organization_id == ctx.organization_id,
-            AuditLog.seq >= start_seq,
-        )
-        .order_by(AuditLog.seq.asc())
-        .all()
-    )
+    db.commit()
+    return {
+        "anchored": anchored,
+        "anchored_through_seq": first_seq - 1,
+        "failed_first_seq": failed_range[0] if failed_range else None,
+        "failed_last_seq": failed_range[1] if failed_range else None,
+    }
 
-    expected_seq = start_seq
-    checked = 0
 
-    for row in rows:
-        if int(row.seq) != expected_seq:
-            return {
-                "ok": False,
-                "checked": checked,
-                "first_seq": start_seq,
-                "last_seq": expected_seq - 1 if checked else None,
-                "error": {
-                    "seq": int(row.seq),
-                    "audit_log_id": str(row.id),
-                    "reason": "non_contiguous_sequence",
-                },
-            }
+def build_inclusion_proof(db: Session, ctx: RequestContext, seq: int) -> dict[str, Any]:
+    """Return a Merkle inclusion proof for the audit row `seq`. Read-only.
 
-        if (row.prev_hash or None) != (prev_hash or None):
-            return {
-                "ok": False,
-                "checked": checked,
-                "first_seq": start_seq,
-                "last_seq": expected_seq - 1 if checked else None,
-                "error": {
-                    "seq": int(row.seq),
-                    "audit_log_id": str(row.id),
-                    "reason": "prev_hash_mismatch",
-                },
-            }
+    Raises AuditProofError with reason not_found, not_anchored (the row's
+    range is still open or not anchored yet) or anchor_mismatch.
+    """
 
-        canonical = canonical_audit_payload(row)
-        expected_hash = compute_hash(prev_hash, canonical)
+    seq = int(seq)
+    max_seq = latest_audit_seq(db, ctx)
+    if seq < 1 or seq > max_seq:
+        raise AuditProofError("not_found")
 
-        if str(row.hash) != expected_hash:
-            return {
-                "ok": False,
-                "checked": checked,
-                "first_seq": start_seq,
-                "last_seq": expected_seq - 1 if checked else None,
-                "error": {
-                    "seq": int(row.seq),
-                    "audit_log_id": str(row.id),
-                    "reason": "hash_mismatch",
-                },
-            }
+    first_seq, last_seq = anchor_range_bounds(seq)
+    if last_seq > max_seq:
+        raise AuditProofError("not_anchored")
+
+    anchor = (
+        db.query(AuditMerkleAnchor)
+        .filter(
+            AuditMerkleAnchor.organization_id == ctx.organization_id,
+            AuditMerkleAnchor.first_seq == first_seq,
+        )
+        .one_or_none()
+    )
+    if anchor is None:
+        # Completed, but the anchoring job has not reached it yet.
+        raise AuditProofError("not_anchored")
 
-        prev_hash = str(row.hash)
-        expected_seq += 1
-        checked += 1
+    rows = list(iter_audit_chain_rows(db, ctx, start_seq=first_seq, end_seq=last_seq))
+    leaves = [leaf_hash(str(r.hash)) for r in rows]
+    if len(rows) != int(anchor.leaf_count) or merkle_root(leaves).hex() != anchor.root:
+        raise AuditProofError("anchor_mismatch")
 
+    index = seq - first_seq
+    row = rows[index]
     return {
-        "ok": True,
-        "checked": checked,
-        "first_seq": start_seq,
-        "last_seq": int(rows[-1].seq) if rows else None,
-        "error": None,
+        "seq": seq,
+        "audit_log_id": str(row.id),
+        "prev_hash": row.prev_hash,
+        "hash": str(row.hash),
+        "canonical": canonical_audit_payload(row).decode("utf-8"),
+        "leaf_hash": leaves[index].hex(),
+        "anchor": {
+            "first_seq": int(anchor.first_seq),
+            "last_seq": int(anchor.last_seq),
+            "leaf_count": int(anchor.leaf_count),
+            "root": anchor.root,
+            "created_at": anchor.created_at,
+        },
+        "proof": [
+            {"position": side, "hash": sibling.hex()}
+            for side, sibling in inclusion_proof(leaves, index)
+        ],
     }
@@ -6,32 +6,71 @@ from datetime import datetime
 from io import BytesIO
 from typing import Any
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.core.request_context import RequestContext
 from app.domain.application.models import Application
-from app.domain.audit.models import AuditLog
+from app.domain.audit.models import AuditLog, AuditSegmentSeal
 from app.domain.candidate.models import Candidate
 from app.domain.job.models import Job
 from app.services.approvals_service import list_pending_approvals
-from app.services.audit_service import verify_audit_chain
+from app.services.audit_service import (
+    ArchivedSegmentError,
+    audit_chain_verifier,
+    iter_audit_chain_rows,
+)
 
 
 MAX_AUDIT_ENTRIES = 200_000
 
 
+class ComplianceExportError(Exception):
+    """Archived audit history could not be read back for the export."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
 def _json_default(value: Any):
     if isinstance(value, datetime):
         return value.isoformat()
     return str(value)
 
 
+def _audit_entry_json(r) -> bytes:
+    entry = {
+        "id": str(r.id),
+        "organization_id": str(r.organization_id),
+        "seq": int(r.seq),
+        "prev_hash": r.prev_hash,
+        "hash": r.hash,
+        "actor_id": r.actor_id,
+        "entity_type": r.entity_type,
+        "entity_id": r.entity_id,
+        "action": r.action,
+        "payload": r.payload,
+        "created_at": r.created_at.isoformat() if r.created_at else None,
+    }
+    return json.dumps(
+        entry, ensure_ascii=False, separators=(",", ":"), default=_json_default
+    ).encode("utf-8")
+
+
 def generate_compliance_bundle(db: Session, ctx: RequestContext) -> bytes:
-    total_count = (
+    hot_count = (
         db.query(AuditLog.id)
         .filter(AuditLog.organization_id == ctx.organization_id)
         .count()
     )
+    archived_count = int(
+        db.query(func.coalesce(func.sum(AuditSegmentSeal.row_count), 0))
+        .filter(AuditSegmentSeal.organization_id == ctx.organization_id)
+        .scalar()
+        or 0
+    )
+    total_count = int(hot_count) + archived_count
 
     max_seq_row = (
         db.query(AuditLog.seq)
@@ -47,25 +86,6 @@ def generate_compliance_bundle(db: Session, ctx: RequestContext) -> bytes:
     else:
         start_seq = 1
 
-    audit_query = (
-        db.query(AuditLog)
-        .filter(
-            AuditLog.organization_id == ctx.organization_id,
-            AuditLog.seq >= start_seq,
-        )
-        .order_by(AuditLog.seq.asc())
-        .yield_per(1000)
-    )
-    audit_rows = list(audit_query)
-
-    verification = verify_audit_chain(db, ctx, limit=None, rows=audit_rows)
-    verification = {
-        **verification,
-        "export_truncated": bool(export_truncated),
-        "exported_count": int(len(audit_rows)),
-        "total_count": int(total_count),
-    }
-
     pending_approvals = list_pending_approvals(db, ctx, limit=200, offset=0)
 
     total_jobs = (
@@ -99,34 +119,36 @@ def generate_compliance_bundle(db: Session, ctx: RequestContext) -> bytes:
         "closed_applications": int(closed_applications),
     }
 
-    audit_chain = [
-        {
-            "id": str(r.id),
-            "organization_id": str(r.organization_id),
-            "seq": int(r.seq),
-            "prev_hash": r.prev_hash,
-            "hash": r.hash,
-            "actor_id": r.actor_id,
-            "entity_type": r.entity_type,
-            "entity_id": r.entity_id,
-            "action": r.action,
-            "payload": r.payload,
-            "created_at": r.created_at.isoformat() if r.created_at else None,
-        }
-        for r in audit_rows
-    ]
-
     buf = BytesIO()
     with zipfile.ZipFile(buf, mode="w", compression=zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr(
-            "audit_chain.json",
-            json.dumps(
-                audit_chain,
-                ensure_ascii=False,
-                separators=(",", ":"),
-                default=_json_default,
-            ),
-        )
+        # The chain is streamed into the archive and verified in the same
+        # pass; no other queries may run on the session meanwhile.
+        verifier = audit_chain_verifier(db, ctx, start_seq)
+        exported_count = 0
+        # Archived history is read back from sealed segments transparently.
+        chain = iter_audit_chain_rows(db, ctx, start_seq=start_seq, full_digest=True)
+        try:
+            with zf.open("audit_chain.json", mode="w") as out:
+                out.write(b"[")
+                for r in chain:
+                    if exported_count:
+                        out.write(b",")
+                    out.write(_audit_entry_json(r))
+                    verifier.feed(r)
+                    exported_count += 1
+                out.write(b"]")
+        except ArchivedSegmentError as exc:
+            raise ComplianceExportError(exc.reason) from exc
+        finally:
+            chain.close()
+
+        verification = {
+            **verifier.result(),
+            "export_truncated": bool(export_truncated),
+            "exported_count": int(exported_count),
+            "archived_count": int(archived_count),
+            "total_count": int(total_count),
+        }
         zf.writestr(
             "audit_verification.json",
             json.dumps(
@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+from sqlalchemy.orm import Session
+
+from app.core.event_bus import BusEvent
+from app.core.request_context import RequestContext
+from app.domain.audit.models import AuditLog
+from app.services.audit_service import audit_bus_event
+
+
+MAX_REPLAY_EVENTS = 1000
+
+
+def parse_last_event_id(value: str | None) -> int | None:
+    """Parse an SSE Last-Event-ID header (audit `seq`); invalid ids are ignored."""
+
+    if value is None:
+        return None
+    try:
+        seq = int(str(value).strip())
+    except (TypeError, ValueError):
+        return None
+    return seq if seq >= 0 else None
+
+
+def replay_audit_events(
+    db: Session,
+    ctx: RequestContext,
+    *,
+    after_seq: int,
+    entity_type: str | None = None,
+    entity_id: str | None = None,
+    limit: int = MAX_REPLAY_EVENTS,
+) -> tuple[list[BusEvent], bool]:
+    """Return audit events committed after `after_seq` for a reconnecting stream.
+
+    The second element is True when more than `limit` events are missing; the
+    client must then resync from the list endpoints instead.
+    """
+
+    limit = max(1, min(int(limit), MAX_REPLAY_EVENTS))
+
+    q = db.query(AuditLog).filter(
+        AuditLog.organization_id == ctx.organization_id,
+        AuditLog.seq > int(after_seq),
+    )
+    if entity_type is not None:
+        q = q.filter(AuditLog.entity_type == entity_type)
+    if entity_id is not None:
+        q = q.filter(AuditLog.entity_id == entity_id)
+
+    rows = q.order_by(AuditLog.seq.asc()).limit(limit + 1).all()
+
+    truncated = len(rows) > limit
+    return [audit_bus_event(row) for row in rows[:limit]], truncated
@@ -0,0 +1,249 @@
+"""Funnel conversion and weekly throughput per workflow.
+
+Both reports read `stage_transition_fact` (see `stage_fact_service`), which
+is brought up to date with the audit log before each query unless another
+request is already syncing it. Reports carry `facts_current`, False when
+they were built from facts behind the audit log. A report is a
+single indexed range scan of the workflow's facts in the window plus one
+pass in Python.
+
+Funnel semantics: for each stage, `entered` counts applications that entered
+the stage inside the window; `advanced` counts those that later (still
+inside the window) moved on to a stage further down the workflow. Entries
+before the window are not part of the cohort.
+"""
+
+from __future__ import annotations
+
+from datetime import date, datetime, timedelta, timezone
+from itertools import groupby
+from typing import Any, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.request_context import RequestContext
+from app.domain.reporting.models import StageTransitionFact
+from app.domain.workflow.models import Workflow, WorkflowStage
+from app.reporting.guardrails import metered
+from app.reporting.window import ReportingWindow
+from app.services.reporting_service import WorkflowNotFoundError
+from app.services.stage_fact_service import (
+    stage_facts_current,
+    sync_stage_transition_facts,
+)
+
+
+# (application_id, from_stage, to_stage, occurred_at)
+Fact = tuple[UUID, Optional[str], str, datetime]
+
+
+def _coerce_dt(dt: datetime | None) -> datetime | None:
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _week_start(dt: datetime) -> date:
+    day = dt.date()
+    return day - timedelta(days=day.weekday())
+
+
+def _load_workflow(
+    db: Session, ctx: RequestContext, workflow_id
+) -> tuple[UUID, str, list[str]]:
+    workflow = (
+        db.query(Workflow)
+        .filter(
+            Workflow.id == workflow_id,
+            Workflow.organization_id == ctx.organization_id,
+        )
+        .first()
+    )
+    if not workflow:
+        raise WorkflowNotFoundError()
+
+    stage_names = [
+        name
+        for (name,) in db.query(WorkflowStage.name)
+        .filter(
+            WorkflowStage.organization_id == ctx.organization_id,
+            WorkflowStage.workflow_id == workflow.id,
+        )
+        .order_by(
+            WorkflowStage.order.is_(None),
+            WorkflowStage.order,
+            WorkflowStage.name,
+        )
+    ]
+    return workflow.id, workflow.name, stage_names
+
+
+def _window_facts(
+    db: Session, ctx: RequestContext, workflow_id, window: ReportingWindow
+) -> tuple[list[Fact], bool]:
+    """The workflow's facts in the window, and whether they were current."""
+
+    # Bring facts up to date without queueing behind a concurrent sync, then
+    # release the watermark lock before reading. When the facts are current
+    # or another request holds the lock, nothing is written or committed.
+    if sync_stage_transition_facts(db, ctx, wait=False) is not None:
+        db.commit()
+        current = True
+    else:
+        # Checked before reading: the read sees at least these facts.
+        current = stage_facts_current(db, ctx)
+
+    stmt = select(
+        StageTransitionFact.application_id,
+        StageTransitionFact.from_stage,
+        StageTransitionFact.to_stage,
+        StageTransitionFact.occurred_at,
+    ).where(
+        StageTransitionFact.organization_id == ctx.organization_id,
+        StageTransitionFact.workflow_id == workflow_id,
+    )
+    if window.from_datetime is not None:
+        stmt = stmt.where(StageTransitionFact.occurred_at >= window.from_datetime)
+    if window.to_datetime is not None:
+        stmt = stmt.where(StageTransitionFact.occurred_at <= window.to_datetime)
+    stmt = stmt.order_by(
+        StageTransitionFact.application_id.asc(),
+        StageTransitionFact.occurred_at.asc(),
+        StageTransitionFact.audit_seq.asc(),
+    )
+    facts = [
+        (application_id, from_stage, to_stage, _coerce_dt(occurred_at))
+        for application_id, from_stage, to_stage, occurred_at in metered(
+            db.execute(stmt)
+        )
+    ]
+    return facts, current
+
+
+def funnel_items(stage_names: list[str], facts: Iterable[Fact]) -> list[dict[str, Any]]:
+    """Per-stage entered/advanced counts from facts ordered by application."""
+
+    rank = {name: i for i, name in enumerate(stage_names)}
+    entered = dict.fromkeys(stage_names, 0)
+    advanced = dict.fromkeys(stage_names, 0)
+
+    for _app_id, app_facts in groupby(facts, key=lambda f: f[0]):
+        app_entered: set[str] = set()
+        app_advanced: set[str] = set()
+        for _, from_stage, to_stage, _occurred_at in app_facts:
+            if (
+                from_stage in app_entered
+                and to_stage in rank
+                and rank[to_stage] > rank[from_stage]
+            ):
+                app_advanced.add(from_stage)
+            if to_stage in rank:
+                app_entered.add(to_stage)
+        for stage in app_entered:
+            entered[stage] += 1
+        for stage in app_advanced:
+            advanced[stage] += 1
+
+    items: list[dict[str, Any]] = []
+    for stage in stage_names:
+        n_entered = entered[stage]
+        n_advanced = advanced[stage]
+        items.append(
+            {
+                "stage": stage,
+                "entered": n_entered,
+                "advanced": n_advanced,
+                "dropped": n_entered - n_advanced,
+                "conversion_rate": (
+                    round(n_advanced / n_entered, 4) if n_entered else 0.0
+                ),
+            }
+        )
+    return items
+
+
+def throughput_weeks(
+    stage_names: list[str],
+    facts: Iterable[Fact],
+    *,
+    window_from: datetime | None = None,
+    window_to: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """Weekly (Monday-based, UTC) stage entries, including empty weeks."""
+
+    by_week: dict[date, dict[str, int]] = {}
+    started: dict[date, int] = {}
+    for _, from_stage, to_stage, occurred_at in facts:
+        week = _week_start(occurred_at)
+        counts = by_week.setdefault(week, {})
+        counts[to_stage] = counts.get(to_stage, 0) + 1
+        if from_stage is None:
+            started[week] = started.get(week, 0) + 1
+
+    bounds = list(by_week)
+    if window_from is not None:
+        bounds.append(_week_start(_coerce_dt(window_from)))
+    if window_to is not None:
+        bounds.append(_week_start(_coerce_dt(window_to)))
+    if not bounds:
+        return []
+
+    known = set(stage_names)
+    extra = sorted({s for counts in by_week.values() for s in counts} - known)
+    ordered = stage_names + extra
+
+    weeks: list[dict[str, Any]] = []
+    week = min(bounds)
+    last = max(bounds)
+    while week <= last:
+        counts = by_week.get(week, {})
+        weeks.append(
+            {
+                "week_start": week,
+                "started": started.get(week, 0),
+                "transitions": sum(counts.values()) - started.get(week, 0),
+                "stages": [
+                    {"stage": stage, "entered": counts.get(stage, 0)}
+                    for stage in ordered
+                ],
+            }
+        )
+        week += timedelta(days=7)
+    return weeks
+
+
+def get_workflow_funnel(
+    db: Session, ctx: RequestContext, workflow_id, *, window: ReportingWindow
+) -> dict[str, Any]:
+    window.validate()
+    wf_id, wf_name, stage_names = _load_workflow(db, ctx, workflow_id)
+    facts, current = _window_facts(db, ctx, wf_id, window)
+    return {
+        "workflow_id": str(wf_id),
+        "workflow_name": wf_name,
+        "stages": funnel_items(stage_names, facts),
+        "facts_current": current,
+    }
+
+
+def get_workflow_throughput(
+    db: Session, ctx: RequestContext, workflow_id, *, window: ReportingWindow
+) -> dict[str, Any]:
+    window.validate()
+    wf_id, wf_name, stage_names = _load_workflow(db, ctx, workflow_id)
+    facts, current = _window_facts(db, ctx, wf_id, window)
+    return {
+        "workflow_id": str(wf_id),
+        "workflow_name": wf_name,
+        "weeks": throughput_weeks(
+            stage_names,
+            facts,
+            window_from=window.from_datetime,
+            window_to=window.to_datetime,
+        ),
+        "facts_current": current,
+    }
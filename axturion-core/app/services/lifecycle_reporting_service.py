@@ -4,17 +4,19 @@ import json
 import math
 from datetime import datetime, timezone
 from statistics import median
-from typing import Any
+from typing import Any, Iterable, Iterator
 from uuid import UUID
 
-from sqlalchemy import String, cast, func
+from sqlalchemy import String, cast, func, select
 from sqlalchemy.orm import Session
 
 from app.core.request_context import RequestContext
 from app.domain.application.models import Application
 from app.domain.audit.models import AuditLog
 from app.domain.workflow.models import Workflow
+from app.reporting.guardrails import fetch_budgeted, metered
 from app.reporting.window import ReportingWindow
+from app.services.audit_row_reader import stream_rows
 
 
 class WorkflowNotFoundError(Exception):
@@ -196,14 +198,12 @@ def stage_duration_summary(
     if not workflow:
         raise WorkflowNotFoundError()
 
-    apps = (
-        db.query(Application.id, Application.closed_at)
-        .filter(
+    apps = fetch_budgeted(
+        db.query(Application.id, Application.closed_at).filter(
             Application.organization_id == ctx.organization_id,
             Application.workflow_id == workflow_id,
             Application.status == "closed",
         )
-        .all()
     )
     if not apps:
         return []
@@ -220,15 +220,15 @@ def stage_duration_summary(
     if not app_ids:
         return []
 
-    rows = (
-        db.query(
+    audit_stmt = (
+        select(
             AuditLog.entity_id,
             AuditLog.action,
             AuditLog.payload,
             AuditLog.created_at,
             AuditLog.seq,
         )
-        .filter(
+        .where(
             AuditLog.organization_id == ctx.organization_id,
             AuditLog.entity_type == "application",
             AuditLog.action.in_(_STAGE_CHANGE_ACTIONS),
@@ -237,8 +237,8 @@ def stage_duration_summary(
         .order_by(
             AuditLog.entity_id.asc(), AuditLog.created_at.asc(), AuditLog.seq.asc()
         )
-        .all()
     )
+    rows = metered(stream_rows(db, audit_stmt))
 
     durations_by_stage: dict[str, list[float]] = {}
 
@@ -246,26 +246,11 @@ def stage_duration_summary(
     events: list[tuple[datetime, str, str]] = []
 
     def flush_events(app_id: str, events_to_flush: list[tuple[datetime, str, str]]):
-        if not events_to_flush:
-            return
         closed_at = closed_at_by_id.get(app_id)
         if closed_at is None:
             return
-
-        # Only contiguous durations between stage changes.
-        for i in range(len(events_to_flush) - 1):
-            start_at, _from_stage, to_stage = events_to_flush[i]
-            end_at, _n_from, _n_to = events_to_flush[i + 1]
-            duration = (end_at - start_at).total_seconds()
-            if duration <= 0:
-                continue
-            durations_by_stage.setdefault(to_stage, []).append(float(duration))
-
-        # Final stage: end at closed_at.
-        last_at, _from_stage, last_to = events_to_flush[-1]
-        final_duration = (closed_at - last_at).total_seconds()
-        if final_duration > 0:
-            durations_by_stage.setdefault(last_to, []).append(float(final_duration))
+        for stage, duration in closed_stage_durations(events_to_flush, closed_at):
+            durations_by_stage.setdefault(stage, []).append(duration)
 
     for entity_id, action, payload, created_at, _seq in rows:
         app_id = str(entity_id)
@@ -290,6 +275,40 @@ def stage_duration_summary(
     if current_app_id is not None:
         flush_events(current_app_id, events)
 
+    return duration_summary_items(durations_by_stage)
+
+
+def closed_stage_durations(
+    events: list[tuple[datetime, str, str]], closed_at: datetime
+) -> Iterator[tuple[str, float]]:
+    """(stage, seconds) spent per stage by a closed application.
+
+    `events` are its (at, from_stage, to_stage) stage changes in order; the
+    last stage ends at `closed_at`.
+    """
+
+    if not events:
+        return
+
+    # Only contiguous durations between stage changes.
+    for i in range(len(events) - 1):
+        start_at, _from_stage, to_stage = events[i]
+        end_at, _n_from, _n_to = events[i + 1]
+        duration = (end_at - start_at).total_seconds()
+        if duration <= 0:
+            continue
+        yield to_stage, float(duration)
+
+    # Final stage: end at closed_at.
+    last_at, _from_stage, last_to = events[-1]
+    final_duration = (closed_at - last_at).total_seconds()
+    if final_duration > 0:
+        yield last_to, float(final_duration)
+
+
+def duration_summary_items(
+    durations_by_stage: dict[str, list[float]],
+) -> list[dict[str, Any]]:
     items: list[dict[str, Any]] = []
     for stage, durations in sorted(durations_by_stage.items(), key=lambda kv: kv[0]):
         if not durations:
@@ -339,16 +358,27 @@ def time_to_close_stats(
     if result is not None:
         q = q.filter(Application.result == str(result))
 
-    durations: list[float] = []
-    for created_at, closed_at in q.all():
-        created = _coerce_dt(created_at)
-        closed = _coerce_dt(closed_at)
-        if created is None or closed is None:
-            continue
-        seconds = (closed - created).total_seconds()
-        if seconds < 0:
-            continue
-        durations.append(float(seconds))
+    return time_to_close_summary(
+        time_to_close_seconds(created_at, closed_at)
+        for created_at, closed_at in fetch_budgeted(q)
+    )
+
+
+def time_to_close_seconds(
+    created_at: datetime | None, closed_at: datetime | None
+) -> float | None:
+    created = _coerce_dt(created_at)
+    closed = _coerce_dt(closed_at)
+    if created is None or closed is None:
+        return None
+    seconds = (closed - created).total_seconds()
+    if seconds < 0:
+        return None
+    return float(seconds)
+
+
+def time_to_close_summary(seconds: Iterable[float | None]) -> dict[str, Any]:
+    durations = [float(s) for s in seconds if s is not None]
 
     if not durations:
         return {
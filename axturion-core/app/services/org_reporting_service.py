@@ -0,0 +1,221 @@
+"""Organization-wide lifecycle reporting in one pass.
+
+Computes, for every workflow of the organization, the same figures as the
+per-workflow reporting endpoints (stage summary, current-stage duration,
+closed-application stage durations, windowed stage duration breakdown and
+time-to-close) from one scan of workflows, stages, applications and stage
+transition audit rows, grouped by workflow in memory.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime, timezone
+from itertools import groupby
+from typing import Any, Iterator
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.request_context import RequestContext
+from app.domain.application.models import Application
+from app.domain.audit.models import AuditLog
+from app.domain.workflow.models import Workflow, WorkflowStage
+from app.reporting.guardrails import fetch_budgeted, metered
+from app.reporting.window import ReportingWindow
+from app.services.audit_row_reader import stream_rows
+from app.services.lifecycle_reporting_service import (
+    _STAGE_CHANGE_ACTIONS,
+    _parse_stage_change,
+    closed_stage_durations,
+    duration_summary_items,
+    time_to_close_seconds,
+    time_to_close_summary,
+)
+from app.services.reporting_service import stage_duration_items
+from app.services.stage_duration_breakdown_service import (
+    _parse_transition_payload,
+    app_stage_intervals,
+    breakdown_items,
+)
+
+
+def _coerce_dt(dt: datetime | None) -> datetime | None:
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+class _WorkflowAccumulator:
+    __slots__ = (
+        "workflow_id",
+        "workflow_name",
+        "stage_names",
+        "stage_counts",
+        "stage_entries",
+        "time_to_close",
+        "closed_durations",
+        "breakdown_durations",
+    )
+
+    def __init__(self, workflow_id, workflow_name: str):
+        self.workflow_id = workflow_id
+        self.workflow_name = workflow_name
+        self.stage_names: list[str] = []
+        self.stage_counts: Counter[str] = Counter()
+        self.stage_entries: list[tuple[str, datetime | None]] = []
+        self.time_to_close: list[float | None] = []
+        self.closed_durations: dict[str, list[float]] = {}
+        self.breakdown_durations: dict[str, list[int]] = {}
+
+    def section(self, now: datetime) -> dict[str, Any]:
+        return {
+            "workflow_id": str(self.workflow_id),
+            "workflow_name": self.workflow_name,
+            "stage_summary": [
+                {"stage": name, "count": self.stage_counts.get(name, 0)}
+                for name in self.stage_names
+            ],
+            "stage_duration": stage_duration_items(
+                self.stage_names, self.stage_entries, now
+            ),
+            "stage_duration_summary": duration_summary_items(self.closed_durations),
+            "stage_duration_breakdown": breakdown_items(self.breakdown_durations),
+            "time_to_close": time_to_close_summary(self.time_to_close),
+        }
+
+
+def iter_org_lifecycle_report(
+    db: Session,
+    ctx: RequestContext,
+    *,
+    window: ReportingWindow,
+    now: datetime | None = None,
+) -> Iterator[dict[str, Any]]:
+    """Yield one lifecycle section per workflow (ordered by name).
+
+    The stage duration breakdown is clipped to `window`; the other figures
+    cover all time, as on the per-workflow endpoints.
+    """
+
+    window.validate()
+    window_from = _coerce_dt(window.from_datetime)
+    window_to = _coerce_dt(window.to_datetime)
+    now = _coerce_dt(now) or datetime.now(timezone.utc)
+
+    workflows: dict[str, _WorkflowAccumulator] = {}
+    for workflow_id, name in (
+        db.query(Workflow.id, Workflow.name)
+        .filter(Workflow.organization_id == ctx.organization_id)
+        .order_by(Workflow.name.asc(), Workflow.id.asc())
+    ):
+        workflows[str(workflow_id)] = _WorkflowAccumulator(workflow_id, name)
+    if not workflows:
+        return
+
+    for workflow_id, stage_name in (
+        db.query(WorkflowStage.workflow_id, WorkflowStage.name)
+        .filter(WorkflowStage.organization_id == ctx.organization_id)
+        .order_by(WorkflowStage.workflow_id.asc(), WorkflowStage.order.asc())
+    ):
+        acc = workflows.get(str(workflow_id))
+        if acc is not None:
+            acc.stage_names.append(stage_name)
+
+    # app id -> (accumulator, stage, status, created_at, closed_at)
+    apps: dict[str, tuple[_WorkflowAccumulator, str, str, Any, Any]] = {}
+    for app_id, workflow_id, stage, status, created_at, closed_at, entered_at in fetch_budgeted(
+        db.query(
+            Application.id,
+            Application.workflow_id,
+            Application.stage,
+            Application.status,
+            Application.created_at,
+            Application.closed_at,
+            Application.stage_entered_at,
+        ).filter(Application.organization_id == ctx.organization_id)
+    ):
+        acc = workflows.get(str(workflow_id))
+        if acc is None:
+            continue
+
+        acc.stage_counts[stage] += 1
+        acc.stage_entries.append((stage, entered_at))
+        closed = _coerce_dt(closed_at)
+        if status == "closed":
+            acc.time_to_close.append(time_to_close_seconds(created_at, closed_at))
+        apps[str(app_id)] = (acc, str(stage), status, _coerce_dt(created_at), closed)
+
+    def add_intervals(app_id: str, breakdown_events: list) -> None:
+        acc, stage, _status, created, closed = apps[app_id]
+        for interval_stage, duration in app_stage_intervals(
+            breakdown_events,
+            current_stage=stage,
+            created_at=created,
+            closed_at=closed,
+            window_from=window_from,
+            window_to=window_to,
+            now=now,
+        ):
+            acc.breakdown_durations.setdefault(interval_stage, []).append(duration)
+
+    audit_stmt = (
+        select(
+            AuditLog.entity_id,
+            AuditLog.action,
+            AuditLog.payload,
+            AuditLog.created_at,
+            AuditLog.seq,
+        )
+        .where(
+            AuditLog.organization_id == ctx.organization_id,
+            AuditLog.entity_type == "application",
+            AuditLog.action.in_(_STAGE_CHANGE_ACTIONS),
+        )
+        .order_by(
+            AuditLog.entity_id.asc(), AuditLog.created_at.asc(), AuditLog.seq.asc()
+        )
+    )
+    rows = metered(stream_rows(db, audit_stmt))
+
+    seen: set[str] = set()
+    for entity_id, app_rows in groupby(rows, key=lambda r: str(r[0])):
+        if entity_id not in apps:
+            continue
+        seen.add(entity_id)
+        acc, _stage, status, _created, closed = apps[entity_id]
+
+        closed_events: list[tuple[datetime, str, str]] = []
+        breakdown_events: list[tuple[datetime, int, str | None, str]] = []
+        for _entity_id, action, payload, created_at, seq in app_rows:
+            ts = _coerce_dt(created_at)
+            if ts is None:
+                continue
+
+            if window_to is None or ts <= window_to:
+                parsed = _parse_transition_payload(
+                    action=str(action) if action is not None else None,
+                    payload_text=payload,
+                )
+                if parsed is not None:
+                    breakdown_events.append(
+                        (ts, int(seq) if seq is not None else 0, parsed[0], parsed[1])
+                    )
+
+            if status == "closed" and closed is not None:
+                change = _parse_stage_change(str(action), payload)
+                if change is not None:
+                    closed_events.append((ts, change[0], change[1]))
+
+        if closed is not None:
+            for stage, duration in closed_stage_durations(closed_events, closed):
+                acc.closed_durations.setdefault(stage, []).append(duration)
+        add_intervals(entity_id, breakdown_events)
+
+    for app_id in apps.keys() - seen:
+        add_intervals(app_id, [])
+
+    for acc in workflows.values():
+        yield acc.section(now)
@@ -1,28 +1,177 @@
+"""Organization policy with a per-process read cache.
+
+`get_policy` serves an immutable `PolicySnapshot` from an in-memory cache
+keyed by organization and never writes: an organization without a
+`policy_config` row reads as the defaults. Rows are created when an
+organization is provisioned (`provision_policy`) or on the first
+`update_policy`.
+
+Every committed insert/update/delete of a `PolicyConfig` row publishes a
+`policy` invalidation (see `app.core.invalidation`), so other workers drop
+their entry; `update_policy` also writes the new snapshot through to this
+process's cache.
+"""
+
 from __future__ import annotations
 
+import threading
+from dataclasses import dataclass
+from datetime import datetime
 from typing import Any
 
-from sqlalchemy.orm import Session
+from sqlalchemy import event
+from sqlalchemy.orm import Session, object_session
 
+from app.core.invalidation import (
+    ALL_CACHES,
+    Invalidation,
+    invalidate_on_commit,
+    invalidation_bus,
+)
 from app.core.request_context import RequestContext
 from app.domain.governance.models import PolicyConfig
 from app.services.audit_service import append_audit_log
 
 
-def get_policy(db: Session, ctx: RequestContext) -> PolicyConfig:
-    policy = (
-        db.query(PolicyConfig)
-        .filter(PolicyConfig.organization_id == ctx.organization_id)
-        .one_or_none()
+POLICY_CACHE = "policy"
+
+# Column defaults of PolicyConfig, for organizations without a row.
+DEFAULT_POLICY: dict[str, Any] = {
+    "require_4eyes_on_hire": False,
+    "require_4eyes_on_ux_rollback": False,
+    "stage_aging_sla_days": 7,
+    "default_language": "en",
+    "candidate_retention_days": None,
+    "audit_retention_days": None,
+}
+
+
+@dataclass(frozen=True, slots=True)
+class PolicySnapshot:
+    organization_id: Any
+    require_4eyes_on_hire: bool
+    require_4eyes_on_ux_rollback: bool
+    stage_aging_sla_days: int
+    default_language: str
+    candidate_retention_days: int | None
+    audit_retention_days: int | None
+    # None when the organization has no stored policy yet.
+    created_at: datetime | None = None
+    updated_at: datetime | None = None
+
+    @classmethod
+    def from_row(cls, policy: PolicyConfig) -> "PolicySnapshot":
+        return cls(
+            organization_id=policy.organization_id,
+            require_4eyes_on_hire=bool(policy.require_4eyes_on_hire),
+            require_4eyes_on_ux_rollback=bool(policy.require_4eyes_on_ux_rollback),
+            stage_aging_sla_days=int(policy.stage_aging_sla_days),
+            default_language=str(policy.default_language),
+            candidate_retention_days=policy.candidate_retention_days,
+            audit_retention_days=policy.audit_retention_days,
+            created_at=policy.created_at,
+            updated_at=policy.updated_at,
+        )
+
+    @classmethod
+    def defaults(cls, organization_id) -> "PolicySnapshot":
+        return cls(organization_id=organization_id, **DEFAULT_POLICY)
+
+
+class _PolicyCache:
+    """Thread-safe org -> snapshot map.
+
+    A read that raced with an invalidation must not re-insert what it read,
+    so fills carry the generation observed before the database read.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._entries: dict[str, PolicySnapshot] = {}
+        self._generation = 0
+
+    def get(self, organization_id) -> tuple[PolicySnapshot | None, int]:
+        with self._lock:
+            return self._entries.get(str(organization_id)), self._generation
+
+    def fill(self, snapshot: PolicySnapshot, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation:
+                self._entries[str(snapshot.organization_id)] = snapshot
+
+    def put(self, snapshot: PolicySnapshot) -> None:
+        with self._lock:
+            self._generation += 1
+            self._entries[str(snapshot.organization_id)] = snapshot
+
+    def invalidate(self, invalidation: Invalidation) -> None:
+        with self._lock:
+            self._generation += 1
+            if invalidation.cache == ALL_CACHES or invalidation.organization_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(invalidation.organization_id, None)
+
+
+_cache = _PolicyCache()
+invalidation_bus.subscribe(POLICY_CACHE, _cache.invalidate)
+
+
+def invalidate_policy_cache(organization_id=None) -> None:
+    """Drop cached policy for one organization (or all) in this process."""
+
+    _cache.invalidate(
+        Invalidation(
+            cache=POLICY_CACHE,
+            organization_id=str(organization_id) if organization_id is not None else None,
+        )
     )
 
-    if policy is not None:
-        return policy
 
-    policy = PolicyConfig(organization_id=ctx.organization_id)
-    db.add(policy)
-    db.commit()
-    db.refresh(policy)
+@event.listens_for(PolicyConfig, "after_insert")
+@event.listens_for(PolicyConfig, "after_update")
+@event.listens_for(PolicyConfig, "after_delete")
+def _invalidate_on_policy_write(_mapper, _connection, policy: PolicyConfig) -> None:
+    session = object_session(policy)
+    if session is not None:
+        invalidate_on_commit(session, POLICY_CACHE, policy.organization_id)
+
+
+def _load_policy_row(
+    db: Session, organization_id, *, for_update: bool = False
+) -> PolicyConfig | None:
+    q = db.query(PolicyConfig).filter(PolicyConfig.organization_id == organization_id)
+    if for_update:
+        q = q.with_for_update()
+    return q.one_or_none()
+
+
+def get_policy(db: Session, ctx: RequestContext) -> PolicySnapshot:
+    cached, generation = _cache.get(ctx.organization_id)
+    if cached is not None:
+        return cached
+
+    policy = _load_policy_row(db, ctx.organization_id)
+    snapshot = (
+        PolicySnapshot.from_row(policy)
+        if policy is not None
+        else PolicySnapshot.defaults(ctx.organization_id)
+    )
+    _cache.fill(snapshot, generation)
+    return snapshot
+
+
+def provision_policy(db: Session, organization_id) -> PolicyConfig:
+    """Create the organization's default policy row if missing (idempotent).
+
+    Part of organization provisioning; does not commit.
+    """
+
+    policy = _load_policy_row(db, organization_id)
+    if policy is None:
+        policy = PolicyConfig(organization_id=organization_id)
+        db.add(policy)
+        db.flush()
     return policy
 
 
@@ -55,7 +204,9 @@ def update_policy(
     *,
     commit: bool = True,
 ) -> PolicyConfig:
-    policy = get_policy(db, ctx)
+    policy = _load_policy_row(db, ctx.organization_id, for_update=True)
+    if policy is None:
+        policy = provision_policy(db, ctx.organization_id)
 
     if "require_4eyes_on_hire" in payload:
         policy.require_4eyes_on_hire = payload["require_4eyes_on_hire"]
@@ -85,5 +236,7 @@ def update_policy(
     if commit:
         db.commit()
         db.refresh(policy)
+        # Write-through; other workers drop their entry via the invalidation.
+        _cache.put(PolicySnapshot.from_row(policy))
 
     return policy
@@ -11,9 +11,10 @@ Requirements:
 """
 
 from datetime import datetime, timezone
+from typing import Iterable
 
 from sqlalchemy.orm import Session
-from sqlalchemy import func
+from sqlalchemy import and_, func
 from app.core.request_context import RequestContext
 from app.domain.workflow.models import Workflow, WorkflowStage
 from app.domain.application.models import Application
@@ -69,52 +70,118 @@ def get_stage_summary(db: Session, ctx: RequestContext, workflow_id):
     }
 
 
+# julianday() of the Unix epoch; SQLite has no EXTRACT(EPOCH ...).
+_JULIAN_DAY_UNIX_EPOCH = 2440587.5
+
+
+def _epoch_seconds(db: Session, column):
+    """SQL expression for a timestamp column as Unix epoch seconds."""
+
+    if db.get_bind().dialect.name == "sqlite":
+        return (func.julianday(column) - _JULIAN_DAY_UNIX_EPOCH) * 86400.0
+    return func.extract("epoch", column)
+
+
 def get_stage_duration_summary(
     db: Session,
     ctx: RequestContext,
     workflow_id,
     now: datetime | None = None,
 ):
-    workflow = (
-        db.query(Workflow)
-        .filter(
-            Workflow.id == workflow_id,
-            Workflow.organization_id == ctx.organization_id,
-        )
-        .first()
-    )
-    if not workflow:
-        raise WorkflowNotFoundError()
+    """Average days in the current stage per stage, aggregated in SQL.
+
+    One statement reads the workflow left-joined with its stages (zero-count
+    stages included); a second groups the workflow's applications by stage
+    with COUNT and AVG(now - stage_entered_at). Neither returns a row per
+    application.
+    """
 
     if now is None:
-        now = datetime.utcnow()
+        now = datetime.now(timezone.utc)
 
     if now.tzinfo is None:
         now = now.replace(tzinfo=timezone.utc)
     else:
         now = now.astimezone(timezone.utc)
 
-    stages_for_workflow = (
-        db.query(WorkflowStage)
+    rows = (
+        db.query(Workflow.id, Workflow.name, WorkflowStage.name)
+        .outerjoin(
+            WorkflowStage,
+            and_(
+                WorkflowStage.workflow_id == Workflow.id,
+                WorkflowStage.organization_id == Workflow.organization_id,
+            ),
+        )
         .filter(
-            WorkflowStage.workflow_id == workflow_id,
-            WorkflowStage.organization_id == ctx.organization_id,
+            Workflow.id == workflow_id,
+            Workflow.organization_id == ctx.organization_id,
         )
         .order_by(WorkflowStage.order)
         .all()
     )
+    if not rows:
+        raise WorkflowNotFoundError()
 
-    workflow_stage_names = {stage.name for stage in stages_for_workflow}
+    wf_id, wf_name = rows[0][0], rows[0][1]
+    stage_names = [stage for _id, _name, stage in rows if stage is not None]
 
-    applications = (
-        db.query(Application)
+    now_epoch = now.timestamp()
+    aggregates = {
+        stage: (int(count), avg_seconds)
+        for stage, count, avg_seconds in db.query(
+            Application.stage,
+            func.count(Application.stage_entered_at),
+            func.avg(now_epoch - _epoch_seconds(db, Application.stage_entered_at)),
+        )
         .filter(
             Application.workflow_id == workflow_id,
             Application.organization_id == ctx.organization_id,
         )
-        .all()
+        .group_by(Application.stage)
+    }
+
+    known = set(stage_names)
+    ordered = stage_names + sorted(
+        stage for stage, (count, _) in aggregates.items() if count and stage not in known
     )
 
+    stages = []
+    for stage in ordered:
+        count, avg_seconds = aggregates.get(stage, (0, None))
+        stages.append(
+            {
+                "stage": stage,
+                "average_days": (
+                    round(float(avg_seconds) / 86400, 2)
+                    if count and avg_seconds is not None
+                    else 0.0
+                ),
+                "count": count,
+            }
+        )
+
+    return {
+        "workflow_id": str(wf_id),
+        "workflow_name": wf_name,
+        "stages": stages,
+    }
+
+
+def stage_duration_items(
+    stage_names: list[str],
+    entries: Iterable[tuple[str, datetime | None]],
+    now: datetime,
+) -> list[dict]:
+    """Average days in the current stage per stage.
+
+    `stage_names` are the workflow's stages in order; `entries` are
+    (stage, stage_entered_at) pairs for its applications. Stages that only
+    occur on applications are appended in name order.
+    """
+
+    workflow_stage_names = set(stage_names)
+
     stage_data: dict[str, dict[str, float | int]] = {}
 
     for stage_name in workflow_stage_names:
@@ -123,11 +190,10 @@ def get_stage_duration_summary(
             "count": 0,
         }
 
-    for app in applications:
-        if not app.stage_entered_at:
+    for stage, entered_at in entries:
+        if not entered_at:
             continue
 
-        entered_at = app.stage_entered_at
         if entered_at.tzinfo is None:
             entered_at = entered_at.replace(tzinfo=timezone.utc)
         else:
@@ -135,19 +201,19 @@ def get_stage_duration_summary(
 
         duration = (now - entered_at).total_seconds() / 86400
 
-        if app.stage not in stage_data:
-            stage_data[app.stage] = {
+        if stage not in stage_data:
+            stage_data[stage] = {
                 "total_duration": 0.0,
                 "count": 0,
             }
 
-        stage_data[app.stage]["total_duration"] += duration
-        stage_data[app.stage]["count"] += 1
+        stage_data[stage]["total_duration"] += duration
+        stage_data[stage]["count"] += 1
 
     stages = []
 
-    for stage in stages_for_workflow:
-        data = stage_data[stage.name]
+    for stage_name in stage_names:
+        data = stage_data[stage_name]
         if data["count"]:
             avg = data["total_duration"] / data["count"]
             average_days = round(avg, 2)
@@ -156,7 +222,7 @@ def get_stage_duration_summary(
 
         stages.append(
             {
-                "stage": stage.name,
+                "stage": stage_name,
                 "average_days": average_days,
                 "count": data["count"],
             }
@@ -184,8 +250,4 @@ def get_stage_duration_summary(
             }
         )
 
-    return {
-        "workflow_id": str(workflow.id),
-        "workflow_name": workflow.name,
-        "stages": stages,
-    }
+    return stages
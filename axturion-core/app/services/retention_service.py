@@ -1,18 +1,80 @@
 from __future__ import annotations
 
-from typing import TypedDict
+import logging
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Literal, TypedDict
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
+from app.audit.archive import (
+    archive_dir,
+    compute_segment_seal,
+    require_seal_key,
+    write_segment,
+)
 from app.core.request_context import RequestContext
+from app.domain.audit.models import AuditLog, AuditSegmentSeal
+from app.domain.candidate.models import Candidate
+from app.domain.organization.models import Organization
+from app.services.audit_service import (
+    append_audit_log,
+    archived_through_seq,
+    latest_audit_seq,
+    verify_audit_chain,
+)
 from app.services.policy_service import get_policy
 
 
+logger = logging.getLogger(__name__)
+
+
+CandidateMode = Literal["anonymize", "delete"]
+
+ANONYMIZED_NAME = "[anonymized]"
+DEFAULT_CHUNK_SIZE = 500
+MAX_CHUNK_SIZE = 5000
+
+
 class RetentionConfig(TypedDict):
     candidate_retention_days: int | None
     audit_retention_days: int | None
 
 
+class RetentionProgress(TypedDict):
+    phase: Literal["candidates", "audit"]
+    processed: int
+    total: int
+    chunks: int
+
+
+class RetentionReport(TypedDict):
+    dry_run: bool
+    candidate_mode: CandidateMode
+    candidate_retention_days: int | None
+    audit_retention_days: int | None
+    candidates_eligible: int
+    candidates_processed: int
+    audit_entries_eligible: int
+    audit_entries_archived: int
+    audit_segments_written: int
+    archived_through_seq: int
+    elapsed_seconds: float
+
+
+class RetentionIntegrityError(Exception):
+    """The audit chain failed verification; nothing was archived."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+def _now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 def get_retention_config(db: Session, ctx: RequestContext) -> RetentionConfig:
     policy = get_policy(db, ctx)
     return {
@@ -27,3 +89,267 @@ def get_retention_config(db: Session, ctx: RequestContext) -> RetentionConfig:
             else None
         ),
     }
+
+
+class _Throttle:
+    """Caps throughput at `max_rows_per_second` by sleeping between chunks."""
+
+    def __init__(
+        self,
+        max_rows_per_second: int | None,
+        *,
+        sleep: Callable[[float], None],
+        clock: Callable[[], float],
+    ) -> None:
+        self.max_rows_per_second = max_rows_per_second
+        self._sleep = sleep
+        self._clock = clock
+        self._started = clock()
+        self._rows = 0
+
+    def account(self, rows: int) -> None:
+        if not self.max_rows_per_second:
+            return
+        self._rows += rows
+        budget_seconds = self._rows / float(self.max_rows_per_second)
+        elapsed = self._clock() - self._started
+        if budget_seconds > elapsed:
+            self._sleep(budget_seconds - elapsed)
+
+
+def _eligible_candidates_query(
+    db: Session, ctx: RequestContext, cutoff: datetime, mode: CandidateMode
+):
+    query = db.query(Candidate.id).filter(
+        Candidate.organization_id == ctx.organization_id,
+        Candidate.created_at <= cutoff,
+    )
+    if mode == "anonymize":
+        # Already-anonymized rows stay in place; do not rewrite them every run.
+        query = query.filter(Candidate.name != ANONYMIZED_NAME)
+    return query
+
+
+def _audit_archive_range(
+    db: Session, ctx: RequestContext, cutoff: datetime
+) -> tuple[int, int]:
+    """Return the exclusive seq range (boundary, stop) eligible for archiving.
+
+    Only a contiguous prefix of the hot chain is archived, and the newest row
+    always stays hot so `append_audit_log` can continue the chain.
+    """
+
+    boundary = archived_through_seq(db, ctx)
+    max_seq = latest_audit_seq(db, ctx)
+
+    first_retained = (
+        db.query(func.min(AuditLog.seq))
+        .filter(
+            AuditLog.organization_id == ctx.organization_id,
+            AuditLog.seq > boundary,
+            AuditLog.created_at > cutoff,
+        )
+        .scalar()
+    )
+    stop = max_seq if first_retained is None else min(int(first_retained), max_seq)
+    return boundary, max(stop, boundary + 1)
+
+
+def execute_retention(
+    db: Session,
+    ctx: RequestContext,
+    *,
+    dry_run: bool = True,
+    candidate_mode: CandidateMode = "anonymize",
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_rows_per_second: int | None = None,
+    on_progress: Callable[[RetentionProgress], None] | None = None,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+) -> RetentionReport:
+    """Apply the organization's retention policy.
+
+    Candidates older than `candidate_retention_days` are anonymized (or
+    deleted) and audit rows older than `audit_retention_days` are moved to
+    sealed archive segments. Work is done in chunks of `chunk_size` rows,
+    each committed separately and throttled to `max_rows_per_second`.
+    With `dry_run` only the eligible counts are computed.
+
+    Raises ArchiveConfigurationError when audit retention is configured but
+    AUDIT_SEAL_KEY is not.
+    """
+
+    if candidate_mode not in ("anonymize", "delete"):
+        raise ValueError(f"unsupported candidate_mode: {candidate_mode}")
+
+    chunk_size = max(1, min(int(chunk_size), MAX_CHUNK_SIZE))
+    started = clock()
+    throttle = _Throttle(max_rows_per_second, sleep=sleep, clock=clock)
+    cfg = get_retention_config(db, ctx)
+    now = _now_utc()
+    if not dry_run and cfg["audit_retention_days"] is not None:
+        # Fail closed before touching anything: segments are never sealed
+        # with the development key.
+        require_seal_key()
+
+    def report_progress(progress: RetentionProgress) -> None:
+        logger.info(
+            "retention_progress",
+            extra={
+                "action": "retention_progress",
+                "organization_id": str(ctx.organization_id),
+                **progress,
+            },
+        )
+        if on_progress is not None:
+            on_progress(progress)
+
+    candidates_eligible = 0
+    candidates_processed = 0
+    if cfg["candidate_retention_days"] is not None:
+        cutoff = now - timedelta(days=int(cfg["candidate_retention_days"]))
+        candidates_eligible = int(
+            _eligible_candidates_query(db, ctx, cutoff, candidate_mode).count()
+        )
+
+        chunks = 0
+        while not dry_run and candidates_processed < candidates_eligible:
+            ids = [
+                row[0]
+                for row in _eligible_candidates_query(db, ctx, cutoff, candidate_mode)
+                .order_by(Candidate.created_at.asc())
+                .limit(chunk_size)
+                .all()
+            ]
+            if not ids:
+                break
+
+            target = db.query(Candidate).filter(
+                Candidate.organization_id == ctx.organization_id,
+                Candidate.id.in_(ids),
+            )
+            if candidate_mode == "delete":
+                target.delete(synchronize_session=False)
+            else:
+                target.update(
+                    {
+                        Candidate.name: ANONYMIZED_NAME,
+                        Candidate.email: None,
+                        Candidate.phone: None,
+                        Candidate.notes: None,
+                    },
+                    synchronize_session=False,
+                )
+            db.commit()
+
+            chunks += 1
+            candidates_processed += len(ids)
+            report_progress(
+                {
+                    "phase": "candidates",
+                    "processed": candidates_processed,
+                    "total": candidates_eligible,
+                    "chunks": chunks,
+                }
+            )
+            throttle.account(len(ids))
+
+    audit_eligible = 0
+    audit_archived = 0
+    segments_written = 0
+    if cfg["audit_retention_days"] is not None:
+        cutoff = now - timedelta(days=int(cfg["audit_retention_days"]))
+        boundary, stop = _audit_archive_range(db, ctx, cutoff)
+        audit_eligible = max(0, stop - boundary - 1)
+
+        root = archive_dir()
+        while not dry_run and audit_archived < audit_eligible:
+            # Serialize with audit writers and concurrent executors for this org.
+            db.query(Organization.id).filter(
+                Organization.id == ctx.organization_id
+            ).with_for_update().one()
+
+            boundary = archived_through_seq(db, ctx)
+            rows = (
+                db.query(AuditLog)
+                .filter(
+                    AuditLog.organization_id == ctx.organization_id,
+                    AuditLog.seq > boundary,
+                    AuditLog.seq < stop,
+                )
+                .order_by(AuditLog.seq.asc())
+                .limit(chunk_size)
+                .all()
+            )
+            if not rows:
+                db.rollback()
+                break
+
+            verification = verify_audit_chain(db, ctx, limit=None, rows=rows)
+            if not verification["ok"] or int(rows[0].seq) != boundary + 1:
+                db.rollback()
+                reason = (
+                    verification["error"]["reason"]
+                    if verification["error"]
+                    else "non_contiguous_sequence"
+                )
+                raise RetentionIntegrityError(reason)
+
+            path, segment = write_segment(rows, root=root)
+            db.add(
+                AuditSegmentSeal(
+                    organization_id=ctx.organization_id,
+                    first_seq=segment.first_seq,
+                    last_seq=segment.last_seq,
+                    row_count=segment.row_count,
+                    first_prev_hash=segment.first_prev_hash,
+                    last_hash=segment.last_hash,
+                    archive_path=str(path),
+                    archive_sha256=segment.archive_sha256,
+                    seal=compute_segment_seal(segment),
+                )
+            )
+            db.query(AuditLog).filter(
+                AuditLog.organization_id == ctx.organization_id,
+                AuditLog.id.in_([row.id for row in rows]),
+            ).delete(synchronize_session=False)
+            db.commit()
+
+            segments_written += 1
+            audit_archived += len(rows)
+            report_progress(
+                {
+                    "phase": "audit",
+                    "processed": audit_archived,
+                    "total": audit_eligible,
+                    "chunks": segments_written,
+                }
+            )
+            throttle.account(len(rows))
+
+    report: RetentionReport = {
+        "dry_run": bool(dry_run),
+        "candidate_mode": candidate_mode,
+        "candidate_retention_days": cfg["candidate_retention_days"],
+        "audit_retention_days": cfg["audit_retention_days"],
+        "candidates_eligible": candidates_eligible,
+        "candidates_processed": candidates_processed,
+        "audit_entries_eligible": audit_eligible,
+        "audit_entries_archived": audit_archived,
+        "audit_segments_written": segments_written,
+        "archived_through_seq": archived_through_seq(db, ctx),
+        "elapsed_seconds": round(clock() - started, 3),
+    }
+
+    if not dry_run:
+        append_audit_log(
+            db,
+            ctx,
+            entity_type="retention",
+            entity_id=str(ctx.organization_id),
+            action="retention_executed",
+            payload={k: v for k, v in report.items() if k != "elapsed_seconds"},
+        )
+        db.commit()
+
+    return report
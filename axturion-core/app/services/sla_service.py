@@ -0,0 +1,212 @@
+"""Stage aging SLA breaches.
+
+An open application is in breach once it has been in its current stage for
+longer than the org's `PolicyConfig.stage_aging_sla_days`. Its breach
+started at `stage_entered_at + sla`, so the breach set at `now` is the
+range `stage_entered_at <= now - sla` over open applications, served by
+the partial index `ix_application_org_open_stage_entered`.
+
+`emit_new_sla_breaches` turns breaches into alerts: each run only reads
+applications whose breach started since the previous run (an indexed range
+on `stage_entered_at` shifted by the SLA), records a `sla_breached` activity
+and fires the `application.sla_breached` automation event for each, in
+bounded chunks that each advance the watermark.
+Applications that left the stage before a run are not alerted, and
+lowering the SLA does not back-fill alerts for breach start times already
+passed.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy import literal_column
+from sqlalchemy.orm import Session
+
+from app.automation.service import handle_event
+from app.core.request_context import RequestContext
+from app.domain.application.models import Application
+from app.services.activity_service import create_activity
+from app.services.policy_service import get_policy
+from app.services.stage_fact_service import lock_reporting_watermark
+
+
+SLA_BREACH_WATERMARK = "sla_breach"
+DEFAULT_BATCH_SIZE = 500
+MAX_BATCH_SIZE = 5000
+
+
+def _now_utc() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _coerce_dt(dt: datetime | None) -> datetime | None:
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def stage_aging_sla_days(db: Session, ctx: RequestContext) -> int:
+    """The org's SLA in days (served from the policy cache)."""
+
+    return int(get_policy(db, ctx).stage_aging_sla_days)
+
+
+def _open_applications(db: Session, ctx: RequestContext):
+    return db.query(
+        Application.id,
+        Application.workflow_id,
+        Application.stage,
+        Application.stage_entered_at,
+    ).filter(
+        Application.organization_id == ctx.organization_id,
+        # Inline literal, not a bind parameter, so it matches the predicate
+        # of the partial index (a generic plan cannot prove a parameter).
+        Application.status != literal_column("'closed'"),
+    )
+
+
+def _breach_item(row, sla: timedelta, now: datetime) -> dict[str, Any]:
+    app_id, workflow_id, stage, stage_entered_at = row
+    entered = _coerce_dt(stage_entered_at)
+    breach_started_at = entered + sla
+    return {
+        "application_id": app_id,
+        "workflow_id": workflow_id,
+        "stage": str(stage),
+        "stage_entered_at": entered,
+        "breach_started_at": breach_started_at,
+        "overdue_seconds": int(max(0.0, (now - breach_started_at).total_seconds())),
+    }
+
+
+def list_sla_breaches(
+    db: Session,
+    ctx: RequestContext,
+    *,
+    workflow_id: UUID | None = None,
+    limit: int = 50,
+    offset: int = 0,
+) -> dict[str, Any]:
+    """Counted page of current breaches, longest overdue first."""
+
+    limit = max(1, min(int(limit), 500))
+    offset = max(0, int(offset))
+
+    now = _now_utc()
+    sla_days = stage_aging_sla_days(db, ctx)
+    sla = timedelta(days=sla_days)
+
+    q = _open_applications(db, ctx).filter(Application.stage_entered_at <= now - sla)
+    if workflow_id is not None:
+        q = q.filter(Application.workflow_id == workflow_id)
+
+    total = q.order_by(None).count()
+    rows = (
+        q.order_by(Application.stage_entered_at.asc(), Application.id.asc())
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
+    return {
+        "sla_days": sla_days,
+        "as_of": now,
+        "total": int(total),
+        "limit": limit,
+        "offset": offset,
+        "items": [_breach_item(row, sla, now) for row in rows],
+    }
+
+
+def _emit_breach_alert(
+    db: Session, ctx: RequestContext, item: dict[str, Any], sla_days: int
+) -> None:
+    payload = {
+        "workflow_id": str(item["workflow_id"]),
+        "stage": item["stage"],
+        "sla_days": sla_days,
+        "breach_started_at": item["breach_started_at"].isoformat(),
+    }
+    create_activity(
+        db=db,
+        organization_id=ctx.organization_id,
+        entity_type="application",
+        entity_id=str(item["application_id"]),
+        activity_type="sla_breached",
+        message=f"Stage '{item['stage']}' exceeded the {sla_days}-day SLA",
+        payload=payload,
+    )
+    handle_event(
+        db,
+        "application.sla_breached",
+        {
+            "organization_id": ctx.organization_id,
+            "entity_type": "application",
+            "entity_id": str(item["application_id"]),
+            **payload,
+        },
+    )
+
+
+def emit_new_sla_breaches(
+    db: Session, ctx: RequestContext, *, batch_size: int = DEFAULT_BATCH_SIZE
+) -> dict[str, Any]:
+    """Alert on breaches that started since the previous run. Commits.
+
+    Breaches are processed in `batch_size` chunks ordered by breach start;
+    each chunk is committed together with the watermark advanced to its last
+    breach start, so an interrupted run resumes where it stopped. A chunk is
+    extended to include every application sharing its last
+    `stage_entered_at`, keeping the watermark on a clean boundary.
+    The first run alerts every current breach.
+    """
+
+    batch_size = max(1, min(int(batch_size), MAX_BATCH_SIZE))
+    now = _now_utc()
+    sla_days = stage_aging_sla_days(db, ctx)
+    sla = timedelta(days=sla_days)
+    breached = _open_applications(db, ctx).filter(
+        Application.stage_entered_at <= now - sla
+    )
+    order = (Application.stage_entered_at.asc(), Application.id.asc())
+
+    emitted = 0
+    while True:
+        # Re-locked per chunk; a concurrent run continues from our watermark.
+        watermark = lock_reporting_watermark(db, ctx, SLA_BREACH_WATERMARK)
+        since = _coerce_dt(watermark.last_at)
+        if since is not None and since >= now:
+            db.commit()
+            break
+
+        q = breached
+        if since is not None:
+            q = q.filter(Application.stage_entered_at > since - sla)
+        rows = q.order_by(*order).limit(batch_size).all()
+        if len(rows) == batch_size:
+            last_id, last_entered = rows[-1][0], rows[-1][3]
+            rows += (
+                breached.filter(
+                    Application.stage_entered_at == last_entered,
+                    Application.id > last_id,
+                )
+                .order_by(*order)
+                .all()
+            )
+
+        for row in rows:
+            _emit_breach_alert(db, ctx, _breach_item(row, sla, now), sla_days)
+        emitted += len(rows)
+
+        done = len(rows) < batch_size
+        # Past the last chunk everything up to `now` has been alerted.
+        watermark.last_at = now if done else _coerce_dt(rows[-1][3]) + sla
+        db.commit()
+        if done:
+            break
+
+    return {"emitted": emitted, "as_of": now}
@@ -3,15 +3,19 @@ from __future__ import annotations
 import json
 import math
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Iterator
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.core.request_context import RequestContext
 from app.domain.application.models import Application
 from app.domain.audit.models import AuditLog
+from app.reporting import stage_intervals
+from app.reporting.guardrails import fetch_budgeted, metered
 from app.reporting.window import ReportingWindow
+from app.services.audit_row_reader import stream_rows
 
 
 def _now_utc() -> datetime:
@@ -115,7 +119,7 @@ def list_stage_duration_breakdown(
     window_from = _coerce_dt(window.from_datetime)
     window_to = _coerce_dt(window.to_datetime)
 
-    apps = (
+    apps = fetch_budgeted(
         db.query(
             Application.id,
             Application.stage,
@@ -128,7 +132,6 @@ def list_stage_duration_breakdown(
             Application.workflow_id == workflow_id,
         )
         .order_by(Application.created_at.asc(), Application.id.asc())
-        .all()
     )
 
     if not apps:
@@ -141,15 +144,15 @@ def list_stage_duration_breakdown(
 
     transition_actions = _transition_actions()
 
-    audit_q = (
-        db.query(
+    audit_stmt = (
+        select(
             AuditLog.entity_id,
             AuditLog.action,
             AuditLog.payload,
             AuditLog.created_at,
             AuditLog.seq,
         )
-        .filter(
+        .where(
             AuditLog.organization_id == ctx.organization_id,
             AuditLog.entity_type == "application",
             AuditLog.action.in_(transition_actions),
@@ -161,13 +164,12 @@ def list_stage_duration_breakdown(
     )
 
     if window_to is not None:
-        audit_q = audit_q.filter(AuditLog.created_at <= window_to)
+        audit_stmt = audit_stmt.where(AuditLog.created_at <= window_to)
 
-    audit_rows = audit_q.all()
+    audit_rows = metered(stream_rows(db, audit_stmt))
 
-    events_by_app: dict[str, list[tuple[datetime, int, str | None, str]]] = {}
+    events: list[tuple[str, datetime, int, str | None, str]] = []
     for entity_id, action, payload, created_at, seq in audit_rows:
-        app_id = str(entity_id)
         ts = _coerce_dt(created_at)
         if ts is None:
             continue
@@ -177,71 +179,150 @@ def list_stage_duration_breakdown(
             continue
         from_stage, to_stage = parsed
 
-        events_by_app.setdefault(app_id, []).append(
-            (ts, int(seq) if seq is not None else 0, from_stage, to_stage)
+        events.append(
+            (str(entity_id), ts, int(seq) if seq is not None else 0, from_stage, to_stage)
         )
 
-    now = _now_utc()
-    durations_by_stage: dict[str, list[int]] = {}
-
-    for app_id, (current_stage, created_at, closed_at) in app_by_id.items():
-        created = created_at
-        if created is None:
-            continue
+    return stage_duration_breakdown(
+        [(app_id, *values) for app_id, values in app_by_id.items()],
+        events,
+        window_from=window_from,
+        window_to=window_to,
+        now=_now_utc(),
+    )
 
-        start_time = created
-        if window_from is not None and window_from > start_time:
-            start_time = window_from
 
-        end_bound = window_to if window_to is not None else now
-        if closed_at is not None and closed_at < end_bound:
-            end_bound = closed_at
+def stage_duration_breakdown(
+    apps: list[tuple[str, str, datetime | None, datetime | None]],
+    events: list[tuple[str, datetime, int, str | None, str]],
+    *,
+    window_from: datetime | None,
+    window_to: datetime | None,
+    now: datetime,
+    vectorized: bool | None = None,
+) -> list[dict[str, Any]]:
+    """Breakdown from (app_id, stage, created_at, closed_at) rows and
+    (app_id, at, seq, from_stage, to_stage) events with at <= window_to.
+
+    Uses the NumPy implementation when available; both produce identical
+    results.
+    """
+
+    if vectorized is None:
+        vectorized = stage_intervals.np is not None
+    if vectorized:
+        return stage_intervals.breakdown_columnar(
+            apps, events, window_from=window_from, window_to=window_to, now=now
+        )
+    return breakdown_reference(
+        apps, events, window_from=window_from, window_to=window_to, now=now
+    )
 
-        if end_bound <= start_time:
-            continue
 
-        events = events_by_app.get(app_id, [])
-        events.sort(key=lambda e: (e[0], e[1]))
+def breakdown_reference(
+    apps: list[tuple[str, str, datetime | None, datetime | None]],
+    events: list[tuple[str, datetime, int, str | None, str]],
+    *,
+    window_from: datetime | None,
+    window_to: datetime | None,
+    now: datetime,
+) -> list[dict[str, Any]]:
+    """Pure-Python breakdown, one application at a time."""
 
-        # Determine active stage at start_time.
-        stage_at_start: str | None = None
+    events_by_app: dict[str, list[tuple[datetime, int, str | None, str]]] = {}
+    for app_id, ts, seq, from_stage, to_stage in events:
+        events_by_app.setdefault(app_id, []).append((ts, seq, from_stage, to_stage))
 
-        last_before = None
-        for e in events:
-            if e[0] < start_time:
-                last_before = e
-            else:
-                break
-        if last_before is not None:
-            stage_at_start = last_before[3]
+    durations_by_stage: dict[str, list[int]] = {}
+    for app_id, current_stage, created_at, closed_at in apps:
+        for stage, duration in app_stage_intervals(
+            events_by_app.get(app_id, []),
+            current_stage=current_stage,
+            created_at=created_at,
+            closed_at=closed_at,
+            window_from=window_from,
+            window_to=window_to,
+            now=now,
+        ):
+            durations_by_stage.setdefault(stage, []).append(duration)
+
+    return breakdown_items(durations_by_stage)
+
+
+def app_stage_intervals(
+    events: list[tuple[datetime, int, str | None, str]],
+    *,
+    current_stage: str,
+    created_at: datetime | None,
+    closed_at: datetime | None,
+    window_from: datetime | None,
+    window_to: datetime | None,
+    now: datetime,
+) -> Iterator[tuple[str, int]]:
+    """(stage, seconds) intervals of one application, clipped to the window.
+
+    `events` are (at, seq, from_stage, to_stage) transitions with
+    at <= window_to; they are sorted in place.
+    """
+
+    created = created_at
+    if created is None:
+        return
+
+    start_time = created
+    if window_from is not None and window_from > start_time:
+        start_time = window_from
+
+    end_bound = window_to if window_to is not None else now
+    if closed_at is not None and closed_at < end_bound:
+        end_bound = closed_at
+
+    if end_bound <= start_time:
+        return
+
+    events.sort(key=lambda e: (e[0], e[1]))
+
+    # Determine active stage at start_time.
+    stage_at_start: str | None = None
+
+    last_before = None
+    for e in events:
+        if e[0] < start_time:
+            last_before = e
         else:
-            first_event = events[0] if events else None
-            if first_event is not None and first_event[2]:
-                stage_at_start = first_event[2]
-
-        if not stage_at_start:
-            stage_at_start = current_stage
-
-        cursor = start_time
-        active_stage = stage_at_start
+            break
+    if last_before is not None:
+        stage_at_start = last_before[3]
+    else:
+        first_event = events[0] if events else None
+        if first_event is not None and first_event[2]:
+            stage_at_start = first_event[2]
+
+    if not stage_at_start:
+        stage_at_start = current_stage
+
+    cursor = start_time
+    active_stage = stage_at_start
+
+    for ts, _seq, _from_stage, to_stage in events:
+        if ts < start_time:
+            continue
+        if ts > end_bound:
+            break
 
-        for ts, _seq, _from_stage, to_stage in events:
-            if ts < start_time:
-                continue
-            if ts > end_bound:
-                break
+        duration = int(max(0.0, (ts - cursor).total_seconds()))
+        if duration > 0:
+            yield active_stage, duration
 
-            duration = int(max(0.0, (ts - cursor).total_seconds()))
-            if duration > 0:
-                durations_by_stage.setdefault(active_stage, []).append(duration)
+        active_stage = to_stage
+        cursor = ts
 
-            active_stage = to_stage
-            cursor = ts
+    final_duration = int(max(0.0, (end_bound - cursor).total_seconds()))
+    if final_duration > 0:
+        yield active_stage, final_duration
 
-        final_duration = int(max(0.0, (end_bound - cursor).total_seconds()))
-        if final_duration > 0:
-            durations_by_stage.setdefault(active_stage, []).append(final_duration)
 
+def breakdown_items(durations_by_stage: dict[str, list[int]]) -> list[dict[str, Any]]:
     items: list[dict[str, Any]] = []
     for stage, durations in sorted(durations_by_stage.items(), key=lambda kv: kv[0]):
         if not durations:
@@ -0,0 +1,204 @@
+"""Incremental stage transition facts derived from the audit log.
+
+`stage_transition_fact` holds one row per application entering a stage
+(creation into the initial stage, stage changes, approved 4-eyes
+transitions). Facts are appended by folding audit entries above the org's
+`reporting_watermark` in seq order, so each audit row is parsed once and
+reports query the narrow fact table instead of re-reading audit history.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from uuid import UUID
+
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.request_context import RequestContext
+from app.domain.application.models import Application
+from app.domain.audit.models import AuditLog
+from app.domain.reporting.models import ReportingWatermark, StageTransitionFact
+from app.services.audit_service import latest_audit_seq
+from app.services.stage_duration_breakdown_service import _parse_transition_payload
+
+
+STAGE_FACT_WATERMARK = "stage_transition_fact"
+SYNC_BATCH_SIZE = 1000
+
+_FACT_ACTIONS: tuple[str, ...] = (
+    "application_created",
+    "stage_changed",
+    "stage_transition_approved",
+)
+
+
+def _coerce_dt(dt: datetime | None) -> datetime | None:
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
+
+
+def _parse_fact(action: str, payload_text: str | None) -> tuple[str | None, str] | None:
+    if action != "application_created":
+        return _parse_transition_payload(action=action, payload_text=payload_text)
+    try:
+        payload = json.loads(payload_text or "")
+    except Exception:
+        return None
+    initial_stage = payload.get("initial_stage") if isinstance(payload, dict) else None
+    if not isinstance(initial_stage, str) or not initial_stage.strip():
+        return None
+    return (None, initial_stage.strip())
+
+
+def _watermark_query(db: Session, ctx: RequestContext, name: str):
+    return db.query(ReportingWatermark).filter(
+        ReportingWatermark.organization_id == ctx.organization_id,
+        ReportingWatermark.name == name,
+    )
+
+
+def lock_reporting_watermark(
+    db: Session, ctx: RequestContext, name: str, *, skip_locked: bool = False
+) -> ReportingWatermark | None:
+    """Get-or-create the org's watermark row `name` and lock it (FOR UPDATE).
+
+    With `skip_locked`, returns None instead of waiting when another
+    transaction holds the lock.
+    """
+
+    def _locked() -> ReportingWatermark | None:
+        return (
+            _watermark_query(db, ctx, name)
+            .with_for_update(skip_locked=skip_locked)
+            .first()
+        )
+
+    watermark = _locked()
+    if watermark is not None:
+        return watermark
+    if skip_locked and _watermark_query(db, ctx, name).first() is not None:
+        return None
+
+    try:
+        with db.begin_nested():
+            db.add(
+                ReportingWatermark(
+                    organization_id=ctx.organization_id, name=name, last_seq=0
+                )
+            )
+    except IntegrityError:
+        # Created concurrently; fall through and lock the winner's row.
+        pass
+    return _locked()
+
+
+def stage_facts_current(db: Session, ctx: RequestContext) -> bool:
+    """True when the facts cover every audit entry of the org."""
+
+    watermark = _watermark_query(db, ctx, STAGE_FACT_WATERMARK).first()
+    return watermark is not None and int(watermark.last_seq or 0) >= latest_audit_seq(
+        db, ctx
+    )
+
+
+def sync_stage_transition_facts(
+    db: Session,
+    ctx: RequestContext,
+    *,
+    batch_size: int = SYNC_BATCH_SIZE,
+    wait: bool = True,
+) -> int | None:
+    """Fold new audit entries into `stage_transition_fact`.
+
+    Holds the org's watermark row lock until the caller commits, so
+    concurrent syncs serialize instead of inserting duplicates. Returns the
+    number of facts added. Does not commit.
+
+    With `wait=False` (report reads), returns None without locking or
+    writing when the facts are already current or another transaction is
+    syncing; the caller then serves the facts materialized so far.
+    """
+
+    target_seq = latest_audit_seq(db, ctx)
+    if not wait:
+        current = _watermark_query(db, ctx, STAGE_FACT_WATERMARK).first()
+        if current is not None and int(current.last_seq or 0) >= target_seq:
+            return None
+
+    watermark = lock_reporting_watermark(
+        db, ctx, STAGE_FACT_WATERMARK, skip_locked=not wait
+    )
+    if watermark is None:
+        return None
+    last_seq = int(watermark.last_seq or 0)
+    added = 0
+
+    while last_seq < target_seq:
+        rows = db.execute(
+            select(
+                AuditLog.seq,
+                AuditLog.entity_id,
+                AuditLog.action,
+                AuditLog.payload,
+                AuditLog.created_at,
+            )
+            .where(
+                AuditLog.organization_id == ctx.organization_id,
+                AuditLog.seq > last_seq,
+                AuditLog.seq <= target_seq,
+                AuditLog.entity_type == "application",
+                AuditLog.action.in_(_FACT_ACTIONS),
+            )
+            .order_by(AuditLog.seq.asc())
+            .limit(int(batch_size))
+        ).all()
+        if len(rows) < batch_size:
+            last_seq = target_seq
+        elif rows:
+            last_seq = int(rows[-1][0])
+
+        parsed: list[tuple[int, UUID, str | None, str, datetime]] = []
+        for seq, entity_id, action, payload, created_at in rows:
+            change = _parse_fact(str(action), payload)
+            occurred_at = _coerce_dt(created_at)
+            if change is None or occurred_at is None:
+                continue
+            try:
+                application_id = UUID(str(entity_id))
+            except ValueError:
+                continue
+            parsed.append((int(seq), application_id, change[0], change[1], occurred_at))
+
+        if parsed:
+            workflow_by_app = dict(
+                db.query(Application.id, Application.workflow_id).filter(
+                    Application.organization_id == ctx.organization_id,
+                    Application.id.in_(list({item[1] for item in parsed})),
+                )
+            )
+            facts = [
+                {
+                    "organization_id": ctx.organization_id,
+                    "workflow_id": workflow_by_app[application_id],
+                    "application_id": application_id,
+                    "from_stage": from_stage,
+                    "to_stage": to_stage,
+                    "occurred_at": occurred_at,
+                    "audit_seq": seq,
+                }
+                for seq, application_id, from_stage, to_stage, occurred_at in parsed
+                if application_id in workflow_by_app
+            ]
+            if facts:
+                db.execute(insert(StageTransitionFact), facts)
+                added += len(facts)
+
+    watermark.last_seq = last_seq
+    db.flush()
+    return added
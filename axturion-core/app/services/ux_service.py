@@ -2,10 +2,81 @@ from typing import Any
 
 from sqlalchemy.orm import Session
 
-from app.domain.ux.models import UXConfig
+from app.domain.audit.models import AuditLog
+from app.domain.ux.models import UXConfig, UXConfigVersion
 from app.core.request_context import RequestContext
 
 
+_ALLOWED_LAYOUTS: set[str] = {"default", "compact", "dense"}
+_ALLOWED_THEMES: set[str] = {"dark", "light", "defense"}
+
+
+def _normalize_flags(value: Any) -> dict[str, bool] | None:
+    if not isinstance(value, dict):
+        return None
+
+    normalized: dict[str, bool] = {}
+    for key, flag_value in value.items():
+        if isinstance(key, str) and isinstance(flag_value, bool):
+            normalized[key] = flag_value
+
+    return normalized or None
+
+
+def normalize_ux_config(raw: Any) -> dict[str, Any]:
+    # Preserve unknown keys, but harden known ones.
+    if not isinstance(raw, dict):
+        return {}
+
+    config: dict[str, Any] = dict(raw)
+
+    layout = config.get("layout")
+    if isinstance(layout, str) and layout in _ALLOWED_LAYOUTS:
+        config["layout"] = layout
+    else:
+        config.pop("layout", None)
+
+    theme = config.get("theme")
+    if isinstance(theme, str) and theme in _ALLOWED_THEMES:
+        config["theme"] = theme
+    else:
+        config.pop("theme", None)
+
+    flags = _normalize_flags(config.get("flags"))
+    if flags is not None:
+        config["flags"] = flags
+    else:
+        config.pop("flags", None)
+
+    return config
+
+
+def snapshot_ux_config(raw: Any) -> dict[str, Any]:
+    """Strict snapshot config for versioning/rollback.
+
+    Returns only allowed keys and values. Unknown keys are dropped.
+    """
+
+    if not isinstance(raw, dict):
+        return {}
+
+    snapshot: dict[str, Any] = {}
+
+    layout = raw.get("layout")
+    if isinstance(layout, str) and layout in _ALLOWED_LAYOUTS:
+        snapshot["layout"] = layout
+
+    theme = raw.get("theme")
+    if isinstance(theme, str) and theme in _ALLOWED_THEMES:
+        snapshot["theme"] = theme
+
+    flags = _normalize_flags(raw.get("flags"))
+    if flags is not None:
+        snapshot["flags"] = flags
+
+    return snapshot
+
+
 def get_ux_config(db: Session, ctx: RequestContext, module: str) -> UXConfig | None:
     module = (module or "").strip()
     if not module:
@@ -22,6 +93,28 @@ def get_ux_config(db: Session, ctx: RequestContext, module: str) -> UXConfig | N
     )
 
 
+def get_ux_configs(
+    db: Session, ctx: RequestContext, modules: list[str]
+) -> dict[str, UXConfig]:
+    """Return stored configs for `modules` (missing modules are omitted)."""
+
+    names = sorted({(m or "").strip() for m in modules} - {""})
+    if not names:
+        return {}
+
+    rows = (
+        db.query(UXConfig)
+        .filter(
+            UXConfig.organization_id == ctx.organization_id,
+            UXConfig.module.in_(names),
+        )
+        .order_by(UXConfig.updated_at.asc())
+        .all()
+    )
+    # Newest row wins, matching get_ux_config.
+    return {row.module: row for row in rows}
+
+
 def upsert_ux_config(
     db: Session,
     ctx: RequestContext,
@@ -67,3 +160,79 @@ def upsert_ux_config(
         db.flush()
     db.refresh(new_config)
     return new_config
+
+
+def latest_ux_config_version(
+    db: Session, ctx: RequestContext, module: str
+) -> UXConfigVersion | None:
+    return (
+        db.query(UXConfigVersion)
+        .filter(
+            UXConfigVersion.organization_id == ctx.organization_id,
+            UXConfigVersion.module == module,
+        )
+        .order_by(UXConfigVersion.version.desc())
+        .first()
+    )
+
+
+def get_ux_config_version(
+    db: Session, ctx: RequestContext, module: str, version: int
+) -> UXConfigVersion | None:
+    return (
+        db.query(UXConfigVersion)
+        .filter(
+            UXConfigVersion.organization_id == ctx.organization_id,
+            UXConfigVersion.module == module,
+            UXConfigVersion.version == int(version),
+        )
+        .one_or_none()
+    )
+
+
+def list_ux_config_version_page(
+    db: Session, ctx: RequestContext, module: str, *, offset: int, limit: int
+) -> list[UXConfigVersion]:
+    return (
+        db.query(UXConfigVersion)
+        .filter(
+            UXConfigVersion.organization_id == ctx.organization_id,
+            UXConfigVersion.module == module,
+            UXConfigVersion.version > int(offset),
+        )
+        .order_by(UXConfigVersion.version.asc())
+        .limit(int(limit))
+        .all()
+    )
+
+
+def record_ux_config_version(
+    db: Session,
+    ctx: RequestContext,
+    module: str,
+    *,
+    audit_log: AuditLog,
+    snapshot: dict[str, Any],
+    diff: dict[str, Any] | None,
+    previous: UXConfigVersion | None,
+) -> UXConfigVersion:
+    """Store the next version for `module`.
+
+    Call after appending the `ux_config_updated` audit entry: the audit append
+    locks the organization row, which serializes version numbering.
+    """
+
+    version = UXConfigVersion(
+        organization_id=ctx.organization_id,
+        module=module,
+        version=1 if previous is None else int(previous.version) + 1,
+        audit_seq=int(audit_log.seq),
+        audit_log_id=audit_log.id,
+        actor_id=audit_log.actor_id,
+        snapshot_json=snapshot,
+        diff_json=diff,
+        created_at=audit_log.created_at,
+    )
+    db.add(version)
+    db.flush()
+    return version
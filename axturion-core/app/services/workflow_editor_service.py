@@ -18,6 +18,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy import func
 
 from app.core.request_context import RequestContext
+from app.services.audit_service import append_audit_log
 
 
 from app.domain.workflow.models import (
@@ -210,6 +211,16 @@ def add_workflow_transition(
     )
 
     db.add(transition)
+
+    append_audit_log(
+        db,
+        ctx,
+        entity_type="workflow",
+        entity_id=str(workflow_uuid),
+        action="workflow_transition_added",
+        payload={"from_stage": from_stage, "to_stage": to_stage},
+    )
+
     db.commit()
     db.refresh(transition)
 
@@ -260,6 +271,16 @@ def remove_workflow_transition(
             "to_stage": to_stage,
         },
     )
+
+    append_audit_log(
+        db,
+        ctx,
+        entity_type="workflow",
+        entity_id=str(workflow_uuid),
+        action="workflow_transition_removed",
+        payload={"from_stage": from_stage, "to_stage": to_stage},
+    )
+
     db.commit()
 
     return None
@@ -356,6 +377,15 @@ def remove_workflow_stage(
     for index, remaining in enumerate(remaining_stages, start=1):
         remaining.order = index
 
+    append_audit_log(
+        db,
+        ctx,
+        entity_type="workflow",
+        entity_id=str(workflow_uuid),
+        action="workflow_stage_removed",
+        payload={"stage": stage_name},
+    )
+
     db.commit()
 
     return None
@@ -431,6 +461,16 @@ def add_workflow_stage(
     )
 
     db.add(stage)
+
+    append_audit_log(
+        db,
+        ctx,
+        entity_type="workflow",
+        entity_id=str(workflow_uuid),
+        action="workflow_stage_added",
+        payload={"stage": name, "order": order},
+    )
+
     db.commit()
     db.refresh(stage)
 
@@ -9,6 +9,10 @@ from app.domain.application.models import Application
 from app.domain.workflow.models import PendingStageTransition, WorkflowTransition
 from app.services.activity_service import create_activity
 from app.services.application_service import ApplicationAlreadyClosedError
+from app.services.approvals_service import (
+    dequeue_pending_approval,
+    enqueue_pending_approval,
+)
 from app.services.audit_service import append_audit_log
 
 import logging
@@ -139,6 +143,9 @@ def move_application_stage(
             db.add(pending)
             db.flush()
             db.refresh(pending)
+            enqueue_pending_approval(
+                db, pending, workflow_id=workflow_id, from_stage=current_stage
+            )
 
             payload_with_pending = {**payload, "pending_id": str(pending.id)}
 
@@ -236,6 +243,7 @@ def move_application_stage(
             payload=payload_with_pending,
         )
 
+        dequeue_pending_approval(db, pending)
         db.delete(pending)
         db.commit()
         db.refresh(app)
@@ -0,0 +1,147 @@
+"""Audit canonicalization benchmark: hashes/sec for verify and export.
+
+Compares the previous canonicalizer (parse the stored payload text, rebuild a
+dict and `json.dumps(sort_keys=True)` per row) against the current one, which
+builds the canonical bytes directly and embeds payloads flagged
+`payload_canonical` verbatim.
+
+- verify: ORM-shaped rows through `canonical_audit_payload`
+- export: plain Core-select tuples through `canonical_audit_values`
+
+Run from axturion-core:
+
+    python -m benchmarks.audit_canonicalization [--rows 20000] [--repeat 5]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.core.audit_hashing import (
+    AUDIT_CANONICAL_COLUMNS,
+    _canonical_json,
+    _coerce_dt,
+    canonical_audit_payload,
+    canonical_audit_values,
+    compute_hash,
+    serialize_payload,
+)
+
+
+_BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _legacy_canonical(row) -> bytes:
+    payload_raw = row.payload
+    if payload_raw is None:
+        payload_value = None
+    else:
+        try:
+            payload_value = json.loads(str(payload_raw))
+        except Exception:
+            payload_value = str(payload_raw)
+
+    body = {
+        "organization_id": str(row.organization_id),
+        "actor_id": str(row.actor_id or ""),
+        "entity_type": str(row.entity_type or ""),
+        "entity_id": str(row.entity_id or ""),
+        "action": str(row.action or ""),
+        "payload": payload_value,
+        "created_at": _coerce_dt(row.created_at).isoformat() if row.created_at else "",
+        "seq": int(row.seq or 0),
+    }
+    return _canonical_json(body).encode("utf-8")
+
+
+def audit_rows(rows: int) -> list[SimpleNamespace]:
+    organization_id = uuid.UUID(int=1)
+    result = []
+    for i in range(rows):
+        payload, canonical = serialize_payload(
+            {
+                "from_stage": "screening",
+                "to_stage": "interview",
+                "application_id": str(uuid.UUID(int=i)),
+                "reason": f"Moved after panel review #{i}",
+                "scores": [i % 5, (i * 3) % 5, (i * 7) % 5],
+            }
+        )
+        result.append(
+            SimpleNamespace(
+                organization_id=organization_id,
+                actor_id=str(uuid.UUID(int=7)),
+                entity_type="application",
+                entity_id=str(uuid.UUID(int=i % 97)),
+                action="stage_changed",
+                payload=payload,
+                payload_canonical=canonical,
+                created_at=_BASE_TIME + timedelta(seconds=i),
+                seq=i + 1,
+            )
+        )
+    return result
+
+
+def _hash_chain(rows, canonicalize) -> str | None:
+    prev_hash = None
+    for row in rows:
+        prev_hash = compute_hash(prev_hash, canonicalize(row))
+    return prev_hash
+
+
+def _rate(rows: list, canonicalize, repeat: int) -> tuple[float, str | None]:
+    best = float("inf")
+    head = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        head = _hash_chain(rows, canonicalize)
+        best = min(best, time.perf_counter() - start)
+    return len(rows) / best, head
+
+
+def run(rows: int, repeat: int) -> list[dict]:
+    orm_rows = audit_rows(rows)
+    tuples = [tuple(getattr(r, c) for c in AUDIT_CANONICAL_COLUMNS) for r in orm_rows]
+
+    legacy_rate, legacy_head = _rate(orm_rows, _legacy_canonical, repeat)
+    verify_rate, verify_head = _rate(orm_rows, canonical_audit_payload, repeat)
+    export_rate, export_head = _rate(
+        tuples, lambda values: canonical_audit_values(*values), repeat
+    )
+    if not legacy_head == verify_head == export_head:
+        raise AssertionError("canonicalizers disagree on the chain head")
+
+    return [
+        {"path": "legacy", "rows": rows, "hashes_per_sec": legacy_rate},
+        {"path": "verify (orm rows)", "rows": rows, "hashes_per_sec": verify_rate},
+        {"path": "export (core tuples)", "rows": rows, "hashes_per_sec": export_rate},
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    results = run(args.rows, args.repeat)
+    baseline = results[0]["hashes_per_sec"]
+
+    header = f"{'path':<24}{'rows':>8}{'hashes/s':>12}{'speedup':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['path']:<24}{r['rows']:>8}{r['hashes_per_sec']:>12.0f}"
+            f"{r['hashes_per_sec'] / baseline:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,70 @@
+"""pytest-benchmark fixtures for the service hot-path benchmarks.
+
+Not part of the default test run (`testpaths = ["tests"]`). Run from
+axturion-core:
+
+    python -m pytest benchmarks [--benchmark-autosave]
+
+Environment:
+
+- BENCH_DATABASE_URL: defaults to in-memory SQLite; point it at a
+  throwaway local Postgres database to benchmark the production dialect
+- BENCH_ORGS / BENCH_WORKFLOWS / BENCH_APPLICATIONS: dataset size (orgs,
+  workflows per org, applications per workflow)
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+from sqlalchemy.orm import Session
+
+from benchmarks.dataset import (
+    DEFAULT_DATABASE_URL,
+    Tenant,
+    create_bench_engine,
+    generate_tenants,
+)
+
+
+pytest.importorskip("pytest_benchmark")
+
+
+def _env_int(name: str, default: int) -> int:
+    return int(os.getenv(name, str(default)))
+
+
+@pytest.fixture(scope="session")
+def bench_engine():
+    engine = create_bench_engine(os.getenv("BENCH_DATABASE_URL", DEFAULT_DATABASE_URL))
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def tenants(bench_engine) -> list[Tenant]:
+    with Session(bench_engine) as db:
+        return generate_tenants(
+            db,
+            orgs=_env_int("BENCH_ORGS", 2),
+            workflows=_env_int("BENCH_WORKFLOWS", 2),
+            applications=_env_int("BENCH_APPLICATIONS", 500),
+        )
+
+
+@pytest.fixture(scope="session")
+def tenant(tenants) -> Tenant:
+    """The tenant under measurement; the others only add table volume."""
+
+    return tenants[0]
+
+
+@pytest.fixture
+def db(bench_engine):
+    session = Session(bench_engine)
+    try:
+        yield session
+    finally:
+        session.rollback()
+        session.close()
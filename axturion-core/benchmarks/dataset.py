@@ -0,0 +1,228 @@
+"""Deterministic synthetic large-tenant dataset for service benchmarks.
+
+Creates N orgs x M workflows x K applications. Each workflow has a linear
+stage chain (with a 4-eyes transition into `offer`); applications get the
+backdated stage-change histories and audit chain of the dev seed endpoint
+(`seed_lifecycle_applications`), and a share of the open `interview`
+applications gets a pending approval.
+
+For a given size and seed the generated content is identical from run to
+run; row ids are random UUIDs.
+
+Run from axturion-core to (re)fill a database without benchmarking:
+
+    python -m benchmarks.dataset [--database-url sqlite:///bench.db] \\
+        [--orgs 2] [--workflows 2] [--applications 500]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+from app.core.db import Base
+from app.core.request_context import RequestContext
+from app.domain.application.models import Application
+from app.domain.organization.models import Organization
+from app.domain.workflow.models import Workflow, WorkflowStage, WorkflowTransition
+
+# Register every table on Base.metadata for create_all().
+from app.domain.audit.models import AuditLog  # noqa: F401
+from app.domain.automation.models import Activity, AutomationRule  # noqa: F401
+from app.domain.candidate.models import Candidate  # noqa: F401
+from app.domain.governance.models import PolicyConfig  # noqa: F401
+from app.domain.identity.models import OrganizationMembership, User  # noqa: F401
+from app.domain.job.models import Job  # noqa: F401
+from app.domain.reporting.models import ReportingWatermark  # noqa: F401
+from app.domain.ux.models import UXConfig  # noqa: F401
+from app.services.dev_seed_service import seed_lifecycle_applications
+from app.services.policy_service import provision_policy
+from app.workflow.service import StageTransitionPendingError, move_application_stage
+
+
+DEFAULT_DATABASE_URL = "sqlite://"
+
+STAGES = ["applied", "screening", "interview", "offer", "hired"]
+APPROVAL_FROM_STAGE = "interview"
+APPROVAL_TO_STAGE = "offer"
+
+# Fixed clock so histories (and every report over them) are reproducible.
+NOW = datetime(2026, 3, 1, 12, 0, tzinfo=timezone.utc)
+
+CLOSED_SHARE = 0.3
+PENDING_SHARE = 0.5
+
+
+@dataclass
+class Tenant:
+    ctx: RequestContext
+    workflow_ids: list[uuid.UUID] = field(default_factory=list)
+    application_ids: list[str] = field(default_factory=list)
+    pending: int = 0
+
+
+def create_bench_engine(database_url: str = DEFAULT_DATABASE_URL) -> Engine:
+    """Engine with the schema created (`create_all`; existing tables are kept).
+
+    Point Postgres runs at a throwaway database: generated tenants are
+    never deleted.
+    """
+
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        engine = create_engine(
+            url,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+    else:
+        engine = create_engine(url)
+    Base.metadata.create_all(bind=engine)
+    return engine
+
+
+def _tenant_ctx(organization_id: uuid.UUID, rng: random.Random) -> RequestContext:
+    return RequestContext(
+        organization_id=organization_id,
+        actor_id=str(uuid.UUID(int=rng.getrandbits(128))),
+        role="hr_admin",
+        scopes=set(),
+    )
+
+
+def _create_workflow(db: Session, ctx: RequestContext, name: str) -> Workflow:
+    workflow = Workflow(name=name, organization_id=ctx.organization_id)
+    db.add(workflow)
+    db.flush()
+    for order, stage in enumerate(STAGES):
+        db.add(
+            WorkflowStage(
+                organization_id=ctx.organization_id,
+                workflow_id=workflow.id,
+                name=stage,
+                order=order,
+            )
+        )
+    for from_stage, to_stage in zip(STAGES, STAGES[1:]):
+        db.add(
+            WorkflowTransition(
+                organization_id=ctx.organization_id,
+                workflow_id=workflow.id,
+                from_stage=from_stage,
+                to_stage=to_stage,
+                requires_approval=(
+                    from_stage == APPROVAL_FROM_STAGE and to_stage == APPROVAL_TO_STAGE
+                ),
+            )
+        )
+    db.flush()
+    return workflow
+
+
+def generate_tenants(
+    db: Session,
+    *,
+    orgs: int,
+    workflows: int,
+    applications: int,
+    seed: int = 20260301,
+) -> list[Tenant]:
+    """Create `orgs` tenants with `workflows` workflows of `applications`
+    applications each. Commits."""
+
+    rng = random.Random(seed)
+    tenants: list[Tenant] = []
+    closed_count = int(applications * CLOSED_SHARE)
+    open_count = applications - closed_count
+
+    for org_index in range(orgs):
+        org = Organization(name=f"bench-org-{org_index}")
+        db.add(org)
+        db.flush()
+        provision_policy(db, org.id)
+        tenant = Tenant(ctx=_tenant_ctx(org.id, rng))
+
+        for wf_index in range(workflows):
+            workflow = _create_workflow(db, tenant.ctx, f"Bench workflow {wf_index}")
+            tenant.workflow_ids.append(workflow.id)
+            tenant.application_ids.extend(
+                seed_lifecycle_applications(
+                    db,
+                    tenant.ctx,
+                    workflow_id=workflow.id,
+                    stage_names=STAGES,
+                    open_count=open_count,
+                    closed_count=closed_count,
+                    rng=rng,
+                    now=NOW,
+                )
+            )
+        db.commit()
+
+        tenant.pending = _request_approvals(db, tenant, rng)
+        tenants.append(tenant)
+    return tenants
+
+
+def _request_approvals(db: Session, tenant: Tenant, rng: random.Random) -> int:
+    candidates = [
+        app_id
+        for (app_id,) in db.query(Application.id)
+        .filter(
+            Application.organization_id == tenant.ctx.organization_id,
+            Application.status == "open",
+            Application.stage == APPROVAL_FROM_STAGE,
+        )
+        .order_by(Application.created_at.asc(), Application.id.asc())
+    ]
+    pending = 0
+    for app_id in candidates:
+        if rng.random() >= PENDING_SHARE:
+            continue
+        try:
+            move_application_stage(db, tenant.ctx, app_id, APPROVAL_TO_STAGE)
+        except StageTransitionPendingError:
+            pending += 1
+    return pending
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", default=DEFAULT_DATABASE_URL)
+    parser.add_argument("--orgs", type=int, default=2)
+    parser.add_argument("--workflows", type=int, default=2)
+    parser.add_argument("--applications", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=20260301)
+    args = parser.parse_args()
+
+    engine = create_bench_engine(args.database_url)
+    start = time.perf_counter()
+    with Session(engine) as db:
+        tenants = generate_tenants(
+            db,
+            orgs=args.orgs,
+            workflows=args.workflows,
+            applications=args.applications,
+            seed=args.seed,
+        )
+    seconds = time.perf_counter() - start
+
+    for tenant in tenants:
+        print(
+            f"org {tenant.ctx.organization_id}: {len(tenant.workflow_ids)} workflows, "
+            f"{len(tenant.application_ids)} applications, {tenant.pending} pending"
+        )
+    print(f"generated in {seconds:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
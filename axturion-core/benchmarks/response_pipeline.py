@@ -0,0 +1,149 @@
+"""Response pipeline benchmark: JSON encoding time and bytes on the wire.
+
+Compares the previous pipeline (stdlib `json` via Starlette's JSONResponse,
+uncompressed) against the current one (orjson + gzip/brotli) for synthetic
+payloads shaped like the heaviest list endpoints:
+
+- GET /activity/activities (timeline items with payloads)
+- GET /ux/{module}/versions (config snapshots with diffs)
+- GET /reporting/stage-aging (one row per open application)
+
+Run from axturion-core:
+
+    python -m benchmarks.response_pipeline [--rows 2000] [--repeat 20]
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from app.api.schemas.activity import ActivityResponse
+from app.api.schemas.reporting_lifecycle import StageAgingItem
+from app.api.schemas.ux import UXConfigVersionItem
+from app.core.compression import CompressionMiddleware, brotli
+from app.core.responses import ORJSONResponse
+
+
+_BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def activity_payload(rows: int) -> list[dict]:
+    items = [
+        ActivityResponse(
+            id=uuid.UUID(int=i),
+            entity_type="application",
+            entity_id=str(uuid.UUID(int=i % 97)),
+            type="stage_changed" if i % 3 else "note",
+            message=f"Moved from screening to interview ({i})",
+            payload={"from_stage": "screening", "to_stage": "interview", "n": i},
+            created_at=_BASE_TIME + timedelta(minutes=i),
+        )
+        for i in range(rows)
+    ]
+    return jsonable_encoder(items)
+
+
+def ux_versions_payload(rows: int) -> list[dict]:
+    items = [
+        UXConfigVersionItem(
+            version=i + 1,
+            audit_log_id=str(uuid.UUID(int=i)),
+            created_at=_BASE_TIME + timedelta(hours=i),
+            actor_id=str(uuid.UUID(int=7)),
+            config={
+                "layout": "compact" if i % 2 else "default",
+                "theme": "dark",
+                "flags": {f"flag_{k}": bool((i + k) % 2) for k in range(8)},
+            },
+            is_active=i == rows - 1,
+        )
+        for i in range(rows)
+    ]
+    return jsonable_encoder(items)
+
+
+def stage_aging_payload(rows: int) -> list[dict]:
+    stages = ["applied", "screening", "interview", "offer", "hired"]
+    items = [
+        StageAgingItem(
+            application_id=uuid.UUID(int=i),
+            workflow_id=uuid.UUID(int=i % 5),
+            current_stage=stages[i % len(stages)],
+            age_seconds=3600 * (i % 240),
+        )
+        for i in range(rows)
+    ]
+    return jsonable_encoder(items)
+
+
+PAYLOADS = {
+    "activity_timeline": activity_payload,
+    "ux_config_versions": ux_versions_payload,
+    "stage_aging": stage_aging_payload,
+}
+
+
+def _time_render(response_class, content, repeat: int) -> tuple[float, bytes]:
+    body = b""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        body = response_class(content).body
+    return (time.perf_counter() - start) / repeat, body
+
+
+def run(rows: int, repeat: int) -> list[dict]:
+    compressor = CompressionMiddleware(app=None)
+    results = []
+
+    for name, factory in PAYLOADS.items():
+        content = factory(rows)
+
+        stdlib_seconds, stdlib_body = _time_render(JSONResponse, content, repeat)
+        orjson_seconds, orjson_body = _time_render(ORJSONResponse, content, repeat)
+
+        results.append(
+            {
+                "payload": name,
+                "rows": rows,
+                "stdlib_ms": stdlib_seconds * 1000,
+                "orjson_ms": orjson_seconds * 1000,
+                "raw_bytes": len(stdlib_body),
+                "gzip_bytes": len(compressor.compress("gzip", orjson_body)),
+                "br_bytes": (
+                    len(compressor.compress("br", orjson_body)) if brotli else None
+                ),
+            }
+        )
+
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    header = (
+        f"{'payload':<26}{'rows':>7}{'stdlib ms':>11}{'orjson ms':>11}"
+        f"{'raw B':>10}{'gzip B':>10}{'br B':>10}"
+    )
+    print(header)
+    print("-" * len(header))
+    for r in run(args.rows, args.repeat):
+        br_bytes = "-" if r["br_bytes"] is None else r["br_bytes"]
+        print(
+            f"{r['payload']:<26}{r['rows']:>7}{r['stdlib_ms']:>11.2f}"
+            f"{r['orjson_ms']:>11.2f}{r['raw_bytes']:>10}{r['gzip_bytes']:>10}"
+            f"{br_bytes:>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
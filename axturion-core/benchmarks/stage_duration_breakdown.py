@@ -0,0 +1,119 @@
+"""Stage duration breakdown benchmark: pure Python vs NumPy columnar.
+
+Times the in-memory part of `list_stage_duration_breakdown` (everything after
+the audit rows are parsed) for a synthetic workflow: per-app interval walks
+via `app_stage_intervals` + `breakdown_items` against the vectorized
+`breakdown_columnar`. All paths must return identical results.
+
+- python: reference implementation from parsed row tuples
+- numpy: columnar implementation from the same tuples (includes converting
+  datetimes and stage names into int64 columns)
+- numpy kernel: `breakdown_from_columns` alone, with columns prebuilt
+
+Run from axturion-core:
+
+    python -m benchmarks.stage_duration_breakdown [--apps 100000] [--repeat 3]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+from app.reporting.stage_intervals import TransitionColumns, breakdown_from_columns
+from app.services.stage_duration_breakdown_service import stage_duration_breakdown
+
+
+_BASE_TIME = datetime(2026, 1, 1, tzinfo=timezone.utc)
+_STAGES = ["applied", "screening", "interview", "assessment", "offer", "hired"]
+
+
+def dataset(apps: int, seed: int = 7):
+    rng = random.Random(seed)
+    app_rows = []
+    events = []
+    seq = 0
+    for i in range(apps):
+        app_id = f"app-{i}"
+        created = _BASE_TIME + timedelta(minutes=rng.randint(0, 60 * 24 * 180))
+        at = created
+        stage = _STAGES[0]
+        for to_stage in _STAGES[1 : 1 + rng.randint(0, 5)]:
+            at += timedelta(minutes=rng.randint(30, 60 * 24 * 14))
+            seq += 1
+            events.append((app_id, at, seq, stage, to_stage))
+            stage = to_stage
+        closed = at + timedelta(days=1) if rng.random() < 0.3 else None
+        app_rows.append((app_id, stage, created, closed))
+    rng.shuffle(events)
+    return app_rows, events
+
+
+def _best(fn, repeat: int) -> tuple[float, list]:
+    best = float("inf")
+    result: list = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def run(apps: int, repeat: int) -> list[dict]:
+    app_rows, events = dataset(apps)
+    kwargs = dict(
+        window_from=_BASE_TIME + timedelta(days=30),
+        window_to=_BASE_TIME + timedelta(days=150),
+        now=_BASE_TIME + timedelta(days=200),
+    )
+    events = [e for e in events if e[1] <= kwargs["window_to"]]
+
+    results = []
+    outputs = []
+    for path, vectorized in (("python", False), ("numpy", True)):
+        seconds, output = _best(
+            lambda: stage_duration_breakdown(
+                app_rows, events, vectorized=vectorized, **kwargs
+            ),
+            repeat,
+        )
+        outputs.append(output)
+        results.append(
+            {"path": path, "apps": apps, "events": len(events), "seconds": seconds}
+        )
+
+    columns = TransitionColumns.from_rows(app_rows, events)
+    seconds, output = _best(lambda: breakdown_from_columns(columns, **kwargs), repeat)
+    outputs.append(output)
+    results.append(
+        {"path": "numpy kernel", "apps": apps, "events": len(events), "seconds": seconds}
+    )
+
+    if not outputs[0] == outputs[1] == outputs[2]:
+        raise AssertionError("implementations disagree")
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--apps", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    results = run(args.apps, args.repeat)
+    baseline = results[0]["seconds"]
+
+    header = f"{'path':<14}{'apps':>10}{'events':>10}{'ms':>10}{'speedup':>10}"
+    print(header)
+    print("-" * len(header))
+    for r in results:
+        print(
+            f"{r['path']:<14}{r['apps']:>10}{r['events']:>10}"
+            f"{r['seconds'] * 1000:>10.1f}{baseline / r['seconds']:>9.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
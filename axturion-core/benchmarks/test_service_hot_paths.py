@@ -0,0 +1,173 @@
+"""Service hot-path benchmarks over the synthetic tenant dataset.
+
+Read paths are timed as-is; write paths (`append_audit_log`,
+`move_application_stage`) run a bounded number of rounds, each committing,
+so repeated runs grow the dataset only slightly.
+"""
+
+from __future__ import annotations
+
+import uuid
+from datetime import timedelta
+
+import pytest
+
+from app.core.request_context import RequestContext
+from app.domain.application.models import Application
+from app.reporting.window import ReportingWindow
+from app.services.approvals_service import approval_summary, list_pending_approvals
+from app.services.audit_service import append_audit_log, verify_audit_chain
+from app.services.compliance_service import generate_compliance_bundle
+from app.services.funnel_reporting_service import (
+    get_workflow_funnel,
+    get_workflow_throughput,
+)
+from app.services.lifecycle_reporting_service import (
+    list_stage_aging,
+    stage_duration_summary,
+    time_to_close_stats,
+)
+from app.services.occupancy_service import (
+    get_stage_occupancy_series,
+    snapshot_stage_occupancy,
+)
+from app.services.org_reporting_service import iter_org_lifecycle_report
+from app.services.reporting_service import get_stage_duration_summary, get_stage_summary
+from app.services.sla_service import list_sla_breaches
+from app.services.stage_duration_breakdown_service import list_stage_duration_breakdown
+from app.services.stage_fact_service import sync_stage_transition_facts
+from app.workflow.service import move_application_stage
+from benchmarks.dataset import NOW, STAGES
+
+
+WRITE_ROUNDS = 200
+
+WINDOW = ReportingWindow(from_datetime=NOW - timedelta(days=60), to_datetime=NOW)
+
+
+def test_append_audit_log(benchmark, db, tenant):
+    def append():
+        append_audit_log(
+            db,
+            tenant.ctx,
+            entity_type="application",
+            entity_id=tenant.application_ids[0],
+            action="note_added",
+            payload={"note": "benchmark"},
+        )
+        db.commit()
+
+    benchmark.pedantic(append, rounds=WRITE_ROUNDS, warmup_rounds=5)
+
+
+def test_move_application_stage(benchmark, db, tenant):
+    workflow_id = tenant.workflow_ids[0]
+
+    def new_application():
+        app = Application(
+            organization_id=tenant.ctx.organization_id,
+            workflow_id=workflow_id,
+            stage=STAGES[0],
+        )
+        db.add(app)
+        db.commit()
+        return (db, tenant.ctx, app.id, STAGES[1]), {}
+
+    benchmark.pedantic(move_application_stage, setup=new_application, rounds=WRITE_ROUNDS)
+
+
+def test_verify_audit_chain(benchmark, db, tenant):
+    result = benchmark(verify_audit_chain, db, tenant.ctx, limit=1000)
+    assert result["ok"] is True
+
+
+def test_compliance_export(benchmark, db, tenant):
+    bundle = benchmark(generate_compliance_bundle, db, tenant.ctx)
+    assert bundle
+
+
+def _workflow(tenant):
+    return tenant.workflow_ids[0]
+
+
+REPORTS = {
+    "stage_summary": lambda db, t: get_stage_summary(db, t.ctx, _workflow(t)),
+    "current_stage_duration_summary": lambda db, t: get_stage_duration_summary(
+        db, t.ctx, _workflow(t)
+    ),
+    "stage_duration_summary": lambda db, t: stage_duration_summary(
+        db, t.ctx, workflow_id=_workflow(t)
+    ),
+    "time_to_close": lambda db, t: time_to_close_stats(
+        db, t.ctx, workflow_id=_workflow(t)
+    ),
+    "stage_aging": lambda db, t: list_stage_aging(
+        db, t.ctx, workflow_id=_workflow(t), window=WINDOW
+    ),
+    "stage_duration_breakdown": lambda db, t: list_stage_duration_breakdown(
+        db, t.ctx, workflow_id=_workflow(t), window=WINDOW
+    ),
+    "funnel": lambda db, t: get_workflow_funnel(db, t.ctx, _workflow(t), window=WINDOW),
+    "throughput": lambda db, t: get_workflow_throughput(
+        db, t.ctx, _workflow(t), window=WINDOW
+    ),
+    "org_lifecycle": lambda db, t: list(
+        iter_org_lifecycle_report(db, t.ctx, window=WINDOW, now=NOW)
+    ),
+    "sla_breaches": lambda db, t: list_sla_breaches(db, t.ctx),
+    "stage_occupancy_series": lambda db, t: get_stage_occupancy_series(
+        db, t.ctx, _workflow(t), window=WINDOW
+    ),
+    "stage_fact_sync": lambda db, t: sync_stage_transition_facts(db, t.ctx),
+}
+
+
+@pytest.mark.parametrize("report", sorted(REPORTS))
+def test_reporting(benchmark, db, tenant, report):
+    if report == "stage_occupancy_series":
+        snapshot_stage_occupancy(db, tenant.ctx)
+    benchmark(REPORTS[report], db, tenant)
+
+
+@pytest.mark.parametrize("sort", ["newest", "oldest"])
+def test_list_pending_approvals(benchmark, db, tenant, sort):
+    items = benchmark(list_pending_approvals, db, tenant.ctx, limit=50, sort=sort)
+    assert len(items) == min(50, tenant.pending)
+
+
+def test_list_pending_approvals_keyset_page(benchmark, db, tenant):
+    first = list_pending_approvals(db, tenant.ctx, limit=10, sort="oldest")
+    benchmark(
+        list_pending_approvals,
+        db,
+        tenant.ctx,
+        limit=10,
+        sort="oldest",
+        after_id=first[-1]["pending_id"],
+    )
+
+
+def test_approval_summary(benchmark, db, tenant):
+    summary = benchmark(approval_summary, db, tenant.ctx)
+    assert summary["total_pending"] == tenant.pending
+
+
+def test_approval_by_second_user(benchmark, db, tenant):
+    """Approve pending transitions (the 4-eyes write path)."""
+
+    approver = RequestContext(
+        organization_id=tenant.ctx.organization_id,
+        actor_id=str(uuid.UUID(int=1)),
+        role="hr_admin",
+        scopes=set(),
+    )
+    pending = list_pending_approvals(db, tenant.ctx, limit=tenant.pending, sort="oldest")
+    queue = iter(pending)
+
+    def next_pending():
+        item = next(queue)
+        return (db, approver, item["application_id"], item["target_stage"]), {}
+
+    benchmark.pedantic(
+        move_application_stage, setup=next_pending, rounds=max(1, len(pending) // 2)
+    )
@@ -0,0 +1,83 @@
+from app.domain.automation.models import Activity
+from app.services.activity_service import create_activity
+
+
+def test_create_activity_returns_id_without_writing(db, org):
+    activity = create_activity(
+        db,
+        organization_id=org.id,
+        entity_type="application",
+        entity_id="app-1",
+        activity_type="note",
+        payload={"k": "v"},
+    )
+
+    assert activity.id is not None
+    assert activity.created_at is not None
+    assert activity.message == ""
+
+    # Nothing is written until the unit of work commits.
+    assert db.query(Activity).count() == 0
+
+
+def test_activities_are_written_in_one_batch_on_commit(db, org):
+    created = [
+        create_activity(
+            db,
+            organization_id=org.id,
+            entity_type="application",
+            entity_id="app-1",
+            activity_type="note",
+            message=f"m{i}",
+        )
+        for i in range(3)
+    ]
+
+    db.commit()
+
+    rows = db.query(Activity).order_by(Activity.message.asc()).all()
+    assert [r.id for r in rows] == [a.id for a in created]
+    assert [r.message for r in rows] == ["m0", "m1", "m2"]
+
+
+def test_rollback_discards_pending_activities(db, org):
+    create_activity(
+        db,
+        organization_id=org.id,
+        entity_type="application",
+        entity_id="app-1",
+        activity_type="note",
+    )
+
+    db.rollback()
+    db.commit()
+
+    assert db.query(Activity).count() == 0
+
+
+def test_savepoint_rollback_discards_only_its_activities(db, org):
+    def note(message):
+        create_activity(
+            db,
+            organization_id=org.id,
+            entity_type="application",
+            entity_id="app-1",
+            activity_type="note",
+            message=message,
+        )
+
+    note("outer")
+    try:
+        with db.begin_nested():
+            note("inner")
+            raise RuntimeError("boom")
+    except RuntimeError:
+        pass
+
+    with db.begin_nested():
+        note("kept")
+
+    db.commit()
+
+    rows = db.query(Activity).order_by(Activity.message.asc()).all()
+    assert [r.message for r in rows] == ["kept", "outer"]
@@ -0,0 +1,55 @@
+import random
+from datetime import datetime, timezone
+
+from app.domain.application.models import Application
+from app.domain.audit.models import AuditLog
+from app.domain.workflow.models import Workflow
+from app.services.dev_seed_service import seed_lifecycle_applications
+
+
+STAGES = ["applied", "screening", "interview", "offer", "hired"]
+NOW = datetime(2026, 3, 1, tzinfo=timezone.utc)
+
+
+def _seed(db, org, ctx):
+    workflow = Workflow(name="Hiring", organization_id=org.id)
+    db.add(workflow)
+    db.flush()
+    seed_lifecycle_applications(
+        db,
+        ctx,
+        workflow_id=workflow.id,
+        stage_names=STAGES,
+        open_count=20,
+        closed_count=10,
+        rng=random.Random(7),
+        now=NOW,
+    )
+    db.commit()
+    apps = (
+        db.query(Application)
+        .filter(Application.workflow_id == workflow.id)
+        .order_by(Application.created_at, Application.stage)
+        .all()
+    )
+    history = [
+        (row.payload, row.created_at)
+        for row in db.query(AuditLog)
+        .filter(AuditLog.organization_id == org.id, AuditLog.seq.isnot(None))
+        .order_by(AuditLog.seq)
+    ]
+    return apps, history
+
+
+def test_seed_lifecycle_applications_is_deterministic(db, org, ctx):
+    first_apps, first_history = _seed(db, org, ctx)
+    second_apps, second_history = _seed(db, org, ctx)
+
+    assert len(first_apps) == 30
+    assert [(a.stage, a.status, a.created_at, a.stage_entered_at) for a in first_apps] == [
+        (a.stage, a.status, a.created_at, a.stage_entered_at) for a in second_apps
+    ]
+    assert [p for p, _ in second_history[len(first_history) :]] == [
+        p for p, _ in first_history
+    ]
+    assert all(a.stage == "hired" for a in first_apps if a.status == "closed")
@@ -0,0 +1,150 @@
+import struct
+import uuid
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.audit import archive
+from app.audit.archive import (
+    ArchiveFormatError,
+    ArchiveReader,
+    ArchivedAuditRow,
+    verify_segment_file,
+    write_segment,
+)
+from app.core.audit_hashing import canonical_audit_payload, compute_hash
+from app.domain.audit.models import AuditLog
+
+
+def _chain(organization_id, count: int) -> list[AuditLog]:
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    prev = None
+    rows = []
+    for seq in range(1, count + 1):
+        row = AuditLog(
+            id=uuid.uuid4(),
+            organization_id=organization_id,
+            actor_id="actor-1" if seq % 2 else None,
+            entity_type="job",
+            entity_id=str(seq),
+            action="updated",
+            payload='{"n": %d}' % seq if seq % 3 else "not json",
+            created_at=base + timedelta(minutes=seq),
+            seq=seq,
+            prev_hash=prev,
+            hash="",
+        )
+        row.hash = compute_hash(prev, canonical_audit_payload(row))
+        prev = row.hash
+        rows.append(row)
+    return rows
+
+
+@pytest.mark.parametrize(
+    "codec",
+    [
+        "zlib",
+        pytest.param(
+            "zstd",
+            marks=pytest.mark.skipif(
+                archive.zstandard is None, reason="zstandard not installed"
+            ),
+        ),
+    ],
+)
+def test_segment_round_trip_with_random_access(tmp_path, codec):
+    org_id = uuid.uuid4()
+    rows = _chain(org_id, 50)
+
+    path, boundary = write_segment(rows, root=tmp_path, block_rows=8, codec=codec)
+    assert (boundary.first_seq, boundary.last_seq, boundary.row_count) == (1, 50, 50)
+    assert boundary.last_hash == rows[-1].hash
+
+    with ArchiveReader(path) as reader:
+        assert reader.codec == codec
+        assert len(reader.blocks) == 7
+        assert reader.blocks[1].first_prev_hash == rows[7].hash
+        assert reader.blocks[1].last_hash == rows[15].hash
+
+        assert reader.get(17)["hash"] == rows[16].hash
+        assert reader.get(0) is None
+        assert reader.get(51) is None
+
+        assert [r["seq"] for r in reader.iter_range(15, 18)] == [15, 16, 17, 18]
+
+        restored = list(reader.iter_rows(1, 50))
+
+    # Restored rows canonicalize to the exact bytes that were hashed.
+    assert all(isinstance(r, ArchivedAuditRow) for r in restored)
+    for original, copy in zip(rows, restored):
+        assert canonical_audit_payload(copy) == canonical_audit_payload(original)
+        assert copy.payload == original.payload
+
+    assert verify_segment_file(path, boundary)
+
+
+def test_tampered_segment_fails_verification(tmp_path):
+    rows = _chain(uuid.uuid4(), 10)
+    path, boundary = write_segment(rows, root=tmp_path, codec="zlib")
+
+    data = bytearray(path.read_bytes())
+    data[len(archive.MAGIC) + 4] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    assert verify_segment_file(path, boundary) is False
+
+
+def test_reader_rejects_foreign_files(tmp_path):
+    bogus = tmp_path / "bogus.axa"
+    bogus.write_bytes(
+        b"not an archive" + struct.pack("<QQ32s8s", 0, 0, b"", b"xxxxxxxx")
+    )
+
+    with pytest.raises(ArchiveFormatError):
+        ArchiveReader(bogus)
+
+
+def test_index_is_verified_against_the_seal_boundary(tmp_path):
+    rows = _chain(uuid.uuid4(), 20)
+    path, boundary = write_segment(rows, root=tmp_path, block_rows=8, codec="zlib")
+
+    with ArchiveReader(path) as reader:
+        assert reader.verify_index(boundary)
+        assert not reader.verify_index(replace(boundary, last_seq=21))
+        assert not reader.verify_index(replace(boundary, last_hash="0" * 64))
+        assert not reader.verify_index(
+            replace(boundary, organization_id=str(uuid.uuid4()))
+        )
+
+
+def test_index_mac_rejects_rewritten_index(tmp_path):
+    rows = _chain(uuid.uuid4(), 20)
+    path, boundary = write_segment(rows, root=tmp_path, block_rows=8, codec="zlib")
+
+    data = path.read_bytes()
+    data = data.replace(b'"version":1', b'"version":2')
+    path.write_bytes(data)
+
+    with ArchiveReader(path) as reader:
+        assert not reader.verify_index(boundary)
+
+
+def test_tampered_block_is_detected_on_read_only(tmp_path):
+    rows = _chain(uuid.uuid4(), 20)
+    path, boundary = write_segment(rows, root=tmp_path, block_rows=8, codec="zlib")
+
+    with ArchiveReader(path) as reader:
+        second = reader.blocks[1]
+    data = bytearray(path.read_bytes())
+    data[second.offset + 2] ^= 0xFF
+    path.write_bytes(bytes(data))
+
+    with ArchiveReader(path) as reader:
+        # The index is intact; only reads touching the block fail.
+        assert reader.verify_index(boundary)
+        assert reader.get(3)["hash"] == rows[2].hash
+        with pytest.raises(ArchiveFormatError):
+            reader.get(10)
+        with pytest.raises(ArchiveFormatError):
+            list(reader.iter_range(7, 9))
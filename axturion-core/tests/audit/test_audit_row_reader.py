@@ -0,0 +1,78 @@
+import pytest
+from sqlalchemy.exc import IntegrityError
+
+from app.core.audit_hashing import canonical_audit_payload
+from app.domain.audit.models import AuditLog
+from app.services.audit_row_reader import AuditRecord, iter_audit_records
+from app.services.audit_service import append_audit_log, iter_audit_chain_rows
+
+
+def _seed(db, ctx, n=5):
+    for i in range(n):
+        append_audit_log(
+            db,
+            ctx,
+            entity_type="ux_config" if i % 2 else "job",
+            entity_id=str(i % 2),
+            action="ux_config_updated" if i % 2 else "job_created",
+            payload={"i": i},
+        )
+    db.commit()
+
+
+def test_records_match_orm_rows(db, ctx):
+    _seed(db, ctx)
+
+    orm_rows = db.query(AuditLog).order_by(AuditLog.seq).all()
+    records = list(iter_audit_records(db, ctx))
+
+    assert all(isinstance(r, AuditRecord) for r in records)
+    assert [r.seq for r in records] == [r.seq for r in orm_rows]
+    for record, row in zip(records, orm_rows):
+        assert record.id == row.id
+        assert record.hash == row.hash
+        assert canonical_audit_payload(record) == canonical_audit_payload(row)
+
+
+def test_filters_and_paging(db, ctx):
+    _seed(db, ctx, n=7)
+
+    ux = list(
+        iter_audit_records(
+            db, ctx, entity_type="ux_config", actions=("ux_config_updated",)
+        )
+    )
+    assert [r.seq for r in ux] == [2, 4, 6]
+
+    page = list(iter_audit_records(db, ctx, start_seq=2, offset=1, limit=2))
+    assert [r.seq for r in page] == [3, 4]
+
+    assert [r.seq for r in iter_audit_records(db, ctx, end_seq=2)] == [1, 2]
+
+
+def test_chain_rows_are_lightweight_records(db, ctx):
+    _seed(db, ctx, n=3)
+
+    rows = iter_audit_chain_rows(db, ctx, start_seq=1)
+    # Streamed, not materialized.
+    assert not isinstance(rows, list)
+    assert [type(r) for r in rows] == [AuditRecord] * 3
+
+
+def test_seq_stays_unique_per_org(db, ctx):
+    _seed(db, ctx, n=1)
+    row = db.query(AuditLog).one()
+    db.add(
+        AuditLog(
+            organization_id=row.organization_id,
+            entity_type="job",
+            entity_id="x",
+            action="job_created",
+            payload="{}",
+            seq=row.seq,
+            prev_hash=row.hash,
+            hash="0" * 64,
+        )
+    )
+    with pytest.raises(IntegrityError):
+        db.commit()
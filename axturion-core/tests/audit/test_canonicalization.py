@@ -0,0 +1,142 @@
+import json
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.audit_hashing import (
+    _canonical_json,
+    _coerce_dt,
+    AUDIT_CANONICAL_COLUMNS,
+    canonical_audit_payload,
+    canonical_audit_values,
+    serialize_payload,
+)
+from app.domain.audit.models import AuditLog
+from app.services.audit_service import append_audit_log, verify_audit_chain
+
+
+def legacy_canonical_audit_payload(audit_log_row) -> bytes:
+    # Frozen copy of the original implementation: the byte-level reference.
+    payload_raw = getattr(audit_log_row, "payload", None)
+
+    if payload_raw is None:
+        payload_value = None
+    elif isinstance(payload_raw, (dict, list, int, float, bool)):
+        payload_value = payload_raw
+    else:
+        payload_str = str(payload_raw)
+        try:
+            payload_value = json.loads(payload_str)
+        except Exception:
+            payload_value = payload_str
+
+    created_at = getattr(audit_log_row, "created_at", None)
+    if created_at is None:
+        created_at_iso = ""
+    else:
+        created_at_iso = _coerce_dt(created_at).isoformat()
+
+    body = {
+        "organization_id": str(getattr(audit_log_row, "organization_id", "")),
+        "actor_id": str(getattr(audit_log_row, "actor_id", "") or ""),
+        "entity_type": str(getattr(audit_log_row, "entity_type", "") or ""),
+        "entity_id": str(getattr(audit_log_row, "entity_id", "") or ""),
+        "action": str(getattr(audit_log_row, "action", "") or ""),
+        "payload": payload_value,
+        "created_at": created_at_iso,
+        "seq": int(getattr(audit_log_row, "seq", 0) or 0),
+    }
+
+    return _canonical_json(body).encode("utf-8")
+
+
+PAYLOADS = [
+    None,
+    {"b": 1, "a": [1, 2, {"z": None, "y": True}]},
+    {1: "int key", "x": 1.5},
+    {"when": datetime(2026, 1, 1, tzinfo=timezone.utc), "id": uuid.UUID(int=5)},
+    ["list", 1, 2.25, False],
+    {"unicode": "naïve café ✓", "quote": 'he said "hi"\n\t'},
+    {"float": 1e20, "neg": -0.0, "small": 1e-7},
+    "plain text, not json",
+    '{"b":2,"a":1}',
+    '{"a": 1, "b": 2}',
+    '"a json string"',
+    "1e5",
+    "",
+    42,
+    True,
+]
+
+CREATED_AT = [
+    None,
+    datetime(2026, 3, 1, 12, 30, 15, 123456),
+    datetime(2026, 3, 1, 12, 30, tzinfo=timezone(timedelta(hours=2))),
+]
+
+
+def _row(payload, created_at, **overrides):
+    text, canonical = serialize_payload(payload)
+    fields = dict(
+        organization_id=uuid.UUID(int=1),
+        actor_id="actor-ü",
+        entity_type="application",
+        entity_id=str(uuid.UUID(int=2)),
+        action="stage_changed",
+        payload=text,
+        payload_canonical=canonical,
+        created_at=created_at,
+        seq=7,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+@pytest.mark.parametrize("created_at", CREATED_AT)
+@pytest.mark.parametrize("payload", PAYLOADS)
+def test_fast_canonicalization_matches_legacy(payload, created_at):
+    row = _row(payload, created_at)
+
+    expected = legacy_canonical_audit_payload(row)
+    assert canonical_audit_payload(row) == expected
+    values = tuple(getattr(row, c) for c in AUDIT_CANONICAL_COLUMNS)
+    assert canonical_audit_values(*values) == expected
+
+    # Serializing structured payloads must hash like the previous json.dumps.
+    if payload is not None and not isinstance(payload, str):
+        previous = _row(json.dumps(payload, default=str), created_at)
+        assert legacy_canonical_audit_payload(previous) == expected
+
+
+def test_missing_fields_match_legacy():
+    row = SimpleNamespace(organization_id=None, payload={"k": "v"})
+    assert canonical_audit_payload(row) == legacy_canonical_audit_payload(row)
+
+
+def test_serialize_payload_flags_only_canonical_text():
+    assert serialize_payload({"b": 1, "a": 2}) == ('{"a":2,"b":1}', True)
+    assert serialize_payload('{"a":2,"b":1}') == ('{"a":2,"b":1}', True)
+    assert serialize_payload('{"b": 1}') == ('{"b": 1}', False)
+    assert serialize_payload("not json") == ("not json", False)
+    assert serialize_payload(None) == (None, True)
+
+
+def test_appended_rows_are_flagged_and_verify(db, ctx):
+    append_audit_log(
+        db, ctx, entity_type="job", entity_id="1", action="created",
+        payload={"title": "Engineer", "tags": ["x"]},
+    )
+    append_audit_log(
+        db, ctx, entity_type="job", entity_id="1", action="noted",
+        payload="free text",
+    )
+    db.commit()
+
+    rows = db.query(AuditLog).order_by(AuditLog.seq).all()
+    assert [r.payload_canonical for r in rows] == [True, False]
+    for row in rows:
+        assert canonical_audit_payload(row) == legacy_canonical_audit_payload(row)
+
+    assert verify_audit_chain(db, ctx)["ok"] is True
@@ -0,0 +1,40 @@
+import hashlib
+
+import pytest
+
+from app.audit.merkle import (
+    inclusion_proof,
+    leaf_hash,
+    merkle_root,
+    node_hash,
+    verify_inclusion,
+)
+
+
+def _leaves(n: int) -> list[bytes]:
+    return [leaf_hash(hashlib.sha256(str(i).encode()).hexdigest()) for i in range(n)]
+
+
+@pytest.mark.parametrize("n", [1, 2, 3, 5, 8, 13, 33])
+def test_every_leaf_proves_against_the_root(n):
+    leaves = _leaves(n)
+    root = merkle_root(leaves)
+
+    for index, leaf in enumerate(leaves):
+        proof = inclusion_proof(leaves, index)
+        assert len(proof) <= max(1, n).bit_length()
+        assert verify_inclusion(leaf, proof, root)
+
+
+def test_odd_node_is_carried_up():
+    a, b, c = _leaves(3)
+    assert merkle_root([a, b, c]) == node_hash(node_hash(a, b), c)
+
+
+def test_proof_fails_for_other_leaf_or_root():
+    leaves = _leaves(6)
+    root = merkle_root(leaves)
+    proof = inclusion_proof(leaves, 2)
+
+    assert not verify_inclusion(leaves[3], proof, root)
+    assert not verify_inclusion(leaves[2], proof, merkle_root(leaves[:5]))
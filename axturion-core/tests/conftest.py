@@ -1,3 +1,5 @@
+import os
+
 import pytest
 import uuid
 from sqlalchemy import create_engine
@@ -17,7 +19,12 @@ from app.domain.candidate.models import Candidate  # noqa: F401
 from app.domain.job.models import Job  # noqa: F401
 from app.domain.identity.models import OrganizationMembership, User  # noqa: F401
 from app.domain.governance.models import PolicyConfig  # noqa: F401
-from app.domain.ux.models import UXConfig, PendingUXRollback  # noqa: F401
+from app.domain.reporting.models import (  # noqa: F401
+    ReportingWatermark,
+    StageOccupancySnapshot,
+    StageTransitionFact,
+)
+from app.domain.ux.models import UXConfig, UXConfigVersion, PendingUXRollback  # noqa: F401
 from app.domain.workflow.models import PendingStageTransition  # noqa: F401
 from app.domain.workflow.models import (  # noqa: F401
     Workflow,
@@ -28,6 +35,9 @@ from app.domain.workflow.models import (  # noqa: F401
 
 TEST_DATABASE_URL = "sqlite:///:memory:"
 
+# Log synchronously so tests can capture output right after a log call.
+os.environ.setdefault("LOG_QUEUE", "false")
+
 
 @pytest.fixture
 def db():
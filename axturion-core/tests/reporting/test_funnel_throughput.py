@@ -0,0 +1,162 @@
+from datetime import date, datetime, timedelta, timezone
+
+from app.domain.application.models import Application
+from app.domain.reporting.models import ReportingWatermark, StageTransitionFact
+from app.domain.workflow.models import Workflow, WorkflowStage
+from app.reporting.window import ReportingWindow
+from app.services.audit_service import append_audit_log
+from app.services.funnel_reporting_service import (
+    get_workflow_funnel,
+    get_workflow_throughput,
+)
+from app.services.stage_fact_service import sync_stage_transition_facts
+
+
+# A Monday.
+T0 = datetime(2026, 3, 2, 9, 0, 0, tzinfo=timezone.utc)
+STAGES = ["applied", "screening", "interview", "offer"]
+
+
+def _workflow(db, org) -> Workflow:
+    wf = Workflow(organization_id=org.id, name="Hiring")
+    db.add(wf)
+    db.commit()
+    db.refresh(wf)
+    for order, name in enumerate(STAGES, start=1):
+        db.add(
+            WorkflowStage(
+                organization_id=org.id, workflow_id=wf.id, name=name, order=order
+            )
+        )
+    db.commit()
+    return wf
+
+
+def _create(db, ctx, wf, at: datetime) -> Application:
+    app = Application(
+        organization_id=ctx.organization_id,
+        workflow_id=wf.id,
+        stage="applied",
+        stage_entered_at=at,
+        created_at=at,
+    )
+    db.add(app)
+    db.flush()
+    append_audit_log(
+        db,
+        ctx,
+        entity_type="application",
+        entity_id=str(app.id),
+        action="application_created",
+        payload={"workflow_id": str(wf.id), "initial_stage": "applied"},
+        created_at=at,
+    )
+    db.commit()
+    return app
+
+
+def _move(db, ctx, app, from_stage: str, to_stage: str, at: datetime) -> None:
+    append_audit_log(
+        db,
+        ctx,
+        entity_type="application",
+        entity_id=str(app.id),
+        action="stage_changed",
+        payload=f"{from_stage}->{to_stage}",
+        created_at=at,
+    )
+    db.commit()
+
+
+def _seed(db, ctx, wf) -> None:
+    a = _create(db, ctx, wf, T0)
+    _move(db, ctx, a, "applied", "screening", T0 + timedelta(days=1))
+    _move(db, ctx, a, "screening", "interview", T0 + timedelta(days=8))
+
+    b = _create(db, ctx, wf, T0 + timedelta(days=2))
+    _move(db, ctx, b, "applied", "screening", T0 + timedelta(days=3))
+    # Moving back does not count as advancing.
+    _move(db, ctx, b, "screening", "applied", T0 + timedelta(days=9))
+
+    _create(db, ctx, wf, T0 + timedelta(days=10))
+
+
+def test_facts_are_folded_incrementally(db, org, ctx):
+    wf = _workflow(db, org)
+    app = _create(db, ctx, wf, T0)
+    append_audit_log(
+        db, ctx, entity_type="job", entity_id="1", action="job_created", payload={}
+    )
+    db.commit()
+
+    assert sync_stage_transition_facts(db, ctx) == 1
+    db.commit()
+    assert sync_stage_transition_facts(db, ctx) == 0
+
+    _move(db, ctx, app, "applied", "screening", T0 + timedelta(days=1))
+    assert sync_stage_transition_facts(db, ctx) == 1
+    db.commit()
+
+    # Report reads skip the lock and the write when facts are already current.
+    assert sync_stage_transition_facts(db, ctx, wait=False) is None
+    _move(db, ctx, app, "screening", "interview", T0 + timedelta(days=2))
+    assert sync_stage_transition_facts(db, ctx, wait=False) == 1
+    db.commit()
+
+    facts = (
+        db.query(StageTransitionFact.from_stage, StageTransitionFact.to_stage)
+        .order_by(StageTransitionFact.audit_seq)
+        .all()
+    )
+    assert facts == [
+        (None, "applied"),
+        ("applied", "screening"),
+        ("screening", "interview"),
+    ]
+    watermark = db.query(ReportingWatermark).one()
+    assert watermark.last_seq == 4
+
+
+def test_funnel_conversion_and_drop_off(db, org, ctx):
+    wf = _workflow(db, org)
+    _seed(db, ctx, wf)
+
+    report = get_workflow_funnel(db, ctx, wf.id, window=ReportingWindow.all_time())
+    assert report["stages"] == [
+        {"stage": "applied", "entered": 3, "advanced": 2, "dropped": 1, "conversion_rate": 0.6667},
+        {"stage": "screening", "entered": 2, "advanced": 1, "dropped": 1, "conversion_rate": 0.5},
+        {"stage": "interview", "entered": 1, "advanced": 0, "dropped": 1, "conversion_rate": 0.0},
+        {"stage": "offer", "entered": 0, "advanced": 0, "dropped": 0, "conversion_rate": 0.0},
+    ]
+
+    # Entries before the window are not part of the cohort.
+    window = ReportingWindow(
+        from_datetime=T0 + timedelta(days=2, hours=1), to_datetime=T0 + timedelta(days=30)
+    )
+    report = get_workflow_funnel(db, ctx, wf.id, window=window)
+    by_stage = {item["stage"]: item for item in report["stages"]}
+    assert by_stage["applied"]["entered"] == 2
+    assert by_stage["applied"]["advanced"] == 0
+    assert by_stage["screening"]["entered"] == 1
+    assert by_stage["screening"]["advanced"] == 0
+
+
+def test_weekly_throughput(db, org, ctx):
+    wf = _workflow(db, org)
+    _seed(db, ctx, wf)
+
+    window = ReportingWindow(from_datetime=T0, to_datetime=T0 + timedelta(days=20))
+    weeks = get_workflow_throughput(db, ctx, wf.id, window=window)["weeks"]
+
+    assert [w["week_start"] for w in weeks] == [
+        date(2026, 3, 2),
+        date(2026, 3, 9),
+        date(2026, 3, 16),
+    ]
+    assert [(w["started"], w["transitions"]) for w in weeks] == [(2, 2), (1, 2), (0, 0)]
+    assert weeks[1]["stages"] == [
+        {"stage": "applied", "entered": 2},
+        {"stage": "screening", "entered": 0},
+        {"stage": "interview", "entered": 1},
+        {"stage": "offer", "entered": 0},
+    ]
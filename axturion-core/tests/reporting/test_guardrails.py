@@ -0,0 +1,80 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.domain.application.models import Application
+from app.domain.workflow.models import Workflow
+from app.reporting.guardrails import (
+    OrgConcurrencyLimiter,
+    ReportBusyError,
+    RowBudgetExceededError,
+    fetch_budgeted,
+    metered,
+    reporting_guard,
+)
+from app.services.lifecycle_reporting_service import time_to_close_stats
+
+
+T0 = datetime(2026, 3, 2, 10, 0, 0, tzinfo=timezone.utc)
+
+
+def _closed_apps(db, org, n):
+    wf = Workflow(organization_id=org.id, name="Hiring")
+    db.add(wf)
+    db.commit()
+    for i in range(n):
+        db.add(
+            Application(
+                organization_id=org.id,
+                workflow_id=wf.id,
+                stage="hired",
+                status="closed",
+                created_at=T0,
+                closed_at=T0 + timedelta(days=i + 1),
+            )
+        )
+    db.commit()
+    return wf
+
+
+def test_row_budget_aborts_report_over_budget(db, org, ctx, monkeypatch):
+    _closed_apps(db, org, 5)
+
+    monkeypatch.setenv("REPORTING_ROW_BUDGET", "5")
+    with reporting_guard(db, ctx) as budget:
+        assert time_to_close_stats(db, ctx)["count"] == 5
+    assert budget.used == 5
+
+    monkeypatch.setenv("REPORTING_ROW_BUDGET", "4")
+    with pytest.raises(RowBudgetExceededError):
+        with reporting_guard(db, ctx):
+            time_to_close_stats(db, ctx)
+
+    # Outside a guard nothing is charged.
+    assert time_to_close_stats(db, ctx)["count"] == 5
+
+
+def test_budget_is_shared_across_queries_of_one_report(db, org, ctx, monkeypatch):
+    _closed_apps(db, org, 3)
+    monkeypatch.setenv("REPORTING_ROW_BUDGET", "4")
+
+    with pytest.raises(RowBudgetExceededError):
+        with reporting_guard(db, ctx):
+            fetch_budgeted(db.query(Application.id))
+            list(metered(range(2)))
+
+
+def test_concurrency_limiter_rejects_beyond_limit(org):
+    limiter = OrgConcurrencyLimiter()
+
+    with limiter.slot(org.id, 2):
+        with limiter.slot(org.id, 2):
+            with pytest.raises(ReportBusyError):
+                with limiter.slot(org.id, 2):
+                    pass
+            # Other orgs are not affected.
+            with limiter.slot("other-org", 2):
+                pass
+        with limiter.slot(org.id, 2):
+            pass
+    assert limiter._running == {}
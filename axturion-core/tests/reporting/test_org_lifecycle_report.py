@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from app.domain.application.models import Application
+from app.domain.workflow.models import Workflow, WorkflowStage
+from app.reporting.window import ReportingWindow
+from app.services.audit_service import append_audit_log
+from app.services.lifecycle_reporting_service import (
+    stage_duration_summary,
+    time_to_close_stats,
+)
+from app.services.org_reporting_service import iter_org_lifecycle_report
+from app.services.reporting_service import get_stage_duration_summary, get_stage_summary
+from app.services.stage_duration_breakdown_service import (
+    list_stage_duration_breakdown,
+)
+
+
+NOW = datetime(2026, 3, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _workflow(db, org, name: str, stages: list[str]) -> Workflow:
+    wf = Workflow(organization_id=org.id, name=name)
+    db.add(wf)
+    db.commit()
+    db.refresh(wf)
+    for order, stage in enumerate(stages, start=1):
+        db.add(
+            WorkflowStage(
+                organization_id=org.id, workflow_id=wf.id, name=stage, order=order
+            )
+        )
+    db.commit()
+    return wf
+
+
+def _application(db, org, wf, *, stage, status, created_at, closed_at=None):
+    app = Application(
+        organization_id=org.id,
+        workflow_id=wf.id,
+        stage=stage,
+        status=status,
+        created_at=created_at,
+        stage_entered_at=created_at,
+        closed_at=closed_at,
+    )
+    db.add(app)
+    db.commit()
+    db.refresh(app)
+    return app
+
+
+def _move(db, ctx, app, from_stage, to_stage, at, *, approved=False):
+    if approved:
+        append_audit_log(
+            db,
+            ctx,
+            entity_type="application",
+            entity_id=str(app.id),
+            action="stage_transition_approved",
+            payload={"from_stage": from_stage, "to_stage": to_stage},
+            created_at=at,
+        )
+    else:
+        append_audit_log(
+            db,
+            ctx,
+            entity_type="application",
+            entity_id=str(app.id),
+            action="stage_changed",
+            payload=f"{from_stage}->{to_stage}",
+            created_at=at,
+        )
+
+
+def test_org_report_matches_per_workflow_endpoints(db, org, ctx, monkeypatch):
+    monkeypatch.setattr(
+        "app.services.stage_duration_breakdown_service._now_utc", lambda: NOW
+    )
+
+    hiring = _workflow(db, org, "Hiring", ["applied", "screening", "interview"])
+    interns = _workflow(db, org, "Interns", ["applied", "offer"])
+    _workflow(db, org, "Empty", ["applied"])
+
+    t = NOW - timedelta(days=10)
+    closed = _application(
+        db, org, hiring, stage="interview", status="closed",
+        created_at=t, closed_at=t + timedelta(days=6),
+    )
+    _move(db, ctx, closed, "applied", "screening", t + timedelta(days=1))
+    _move(db, ctx, closed, "screening", "interview", t + timedelta(days=3), approved=True)
+
+    active = _application(
+        db, org, hiring, stage="screening", status="active", created_at=t + timedelta(days=2)
+    )
+    _move(db, ctx, active, "applied", "screening", t + timedelta(days=4))
+    _move(db, ctx, active, "screening", "interview", NOW + timedelta(days=1))
+
+    _application(db, org, interns, stage="applied", status="active", created_at=t)
+    hired = _application(
+        db, org, interns, stage="offer", status="closed",
+        created_at=t, closed_at=t + timedelta(days=5),
+    )
+    _move(db, ctx, hired, "applied", "offer", t + timedelta(days=2))
+    db.commit()
+
+    window = ReportingWindow(from_datetime=t + timedelta(days=2), to_datetime=NOW)
+    sections = list(iter_org_lifecycle_report(db, ctx, window=window, now=NOW))
+
+    assert [s["workflow_name"] for s in sections] == ["Empty", "Hiring", "Interns"]
+    for section in sections:
+        workflow_id = UUID(section["workflow_id"])
+        assert section["stage_summary"] == (
+            get_stage_summary(db, ctx, workflow_id)["stages"]
+        )
+        assert section["stage_duration"] == (
+            get_stage_duration_summary(db, ctx, workflow_id, now=NOW)["stages"]
+        )
+        assert section["stage_duration_summary"] == stage_duration_summary(
+            db, ctx, workflow_id=workflow_id
+        )
+        assert section["stage_duration_breakdown"] == list_stage_duration_breakdown(
+            db, ctx, workflow_id=workflow_id, window=window
+        )
+        assert section["time_to_close"] == time_to_close_stats(
+            db, ctx, workflow_id=workflow_id
+        )
+
+    assert sections[1]["stage_duration_breakdown"]
+    assert sections[1]["time_to_close"]["count"] == 1
+
+
+def test_org_report_is_org_scoped(db, org, ctx):
+    from app.domain.organization.models import Organization
+
+    other = Organization(name="Other Org")
+    db.add(other)
+    db.commit()
+    _workflow(db, other, "Foreign", ["applied"])
+
+    sections = list(
+        iter_org_lifecycle_report(db, ctx, window=ReportingWindow.all_time(), now=NOW)
+    )
+    assert sections == []
@@ -0,0 +1,166 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.domain.application.models import Application
+from app.domain.automation.models import Activity
+from app.domain.governance.models import PolicyConfig
+from app.domain.workflow.models import Workflow
+from app.services.sla_service import emit_new_sla_breaches, list_sla_breaches
+
+
+NOW = datetime(2026, 3, 20, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _set_now(monkeypatch, now):
+    monkeypatch.setattr("app.services.sla_service._now_utc", lambda: now)
+
+
+def _setup(db, org):
+    db.add(PolicyConfig(organization_id=org.id, stage_aging_sla_days=5))
+    wf = Workflow(organization_id=org.id, name="Hiring")
+    other = Workflow(organization_id=org.id, name="Other")
+    db.add_all([wf, other])
+    db.commit()
+
+    def add(workflow, stage, days_in_stage, status="active"):
+        app = Application(
+            organization_id=org.id,
+            workflow_id=workflow.id,
+            stage=stage,
+            status=status,
+            stage_entered_at=NOW - timedelta(days=days_in_stage),
+        )
+        db.add(app)
+        return app
+
+    breached = [
+        add(wf, "applied", 20),
+        add(wf, "screening", 9),
+        add(other, "applied", 6),
+    ]
+    add(wf, "applied", 4)
+    add(wf, "hired", 30, status="closed")
+    db.commit()
+    return wf, breached
+
+
+def test_list_sla_breaches_counts_and_pages_exact_set(db, org, ctx, monkeypatch):
+    _set_now(monkeypatch, NOW)
+    wf, breached = _setup(db, org)
+
+    page = list_sla_breaches(db, ctx, limit=2)
+    assert page["sla_days"] == 5
+    assert page["total"] == 3
+    assert [item["application_id"] for item in page["items"]] == [
+        breached[0].id,
+        breached[1].id,
+    ]
+    first = page["items"][0]
+    assert first["breach_started_at"] == NOW - timedelta(days=15)
+    assert first["overdue_seconds"] == 15 * 86400
+
+    rest = list_sla_breaches(db, ctx, limit=2, offset=2)
+    assert rest["total"] == 3
+    assert [item["application_id"] for item in rest["items"]] == [breached[2].id]
+
+    scoped = list_sla_breaches(db, ctx, workflow_id=wf.id)
+    assert scoped["total"] == 2
+
+
+def test_list_sla_breaches_uses_default_sla_without_policy(db, org, ctx, monkeypatch):
+    _set_now(monkeypatch, NOW)
+    wf = Workflow(organization_id=org.id, name="Hiring")
+    db.add(wf)
+    db.commit()
+    db.add(
+        Application(
+            organization_id=org.id,
+            workflow_id=wf.id,
+            stage="applied",
+            stage_entered_at=NOW - timedelta(days=8),
+        )
+    )
+    db.commit()
+
+    page = list_sla_breaches(db, ctx)
+    assert page["sla_days"] == 7
+    assert page["total"] == 1
+    assert db.query(PolicyConfig).count() == 0
+
+
+def test_emit_new_sla_breaches_only_alerts_new_range(db, org, ctx, monkeypatch):
+    _set_now(monkeypatch, NOW)
+    wf, breached = _setup(db, org)
+
+    assert emit_new_sla_breaches(db, ctx)["emitted"] == 3
+    assert emit_new_sla_breaches(db, ctx)["emitted"] == 0
+
+    # Breaches one day later after entering the stage 4 days ago.
+    _set_now(monkeypatch, NOW + timedelta(days=2))
+    result = emit_new_sla_breaches(db, ctx)
+    assert result["emitted"] == 1
+    assert result["as_of"] == NOW + timedelta(days=2)
+
+    alerts = db.query(Activity).filter(Activity.type == "sla_breached").all()
+    assert len(alerts) == 4
+    assert {a.entity_id for a in alerts} >= {str(app.id) for app in breached}
+
+
+def test_emit_new_sla_breaches_commits_per_batch(db, org, ctx, monkeypatch):
+    from app.domain.reporting.models import ReportingWatermark
+    import app.services.sla_service as sla_service
+
+    _set_now(monkeypatch, NOW)
+    wf, breached = _setup(db, org)
+
+    emit = sla_service._emit_breach_alert
+    calls = []
+
+    def failing_emit(*args, **kwargs):
+        calls.append(1)
+        if len(calls) == 2:
+            raise RuntimeError("automation down")
+        emit(*args, **kwargs)
+
+    monkeypatch.setattr(sla_service, "_emit_breach_alert", failing_emit)
+    with pytest.raises(RuntimeError):
+        emit_new_sla_breaches(db, ctx, batch_size=1)
+    db.rollback()
+
+    # The first batch is committed with the watermark at its breach start.
+    watermark = db.query(ReportingWatermark).one()
+    assert watermark.last_at.replace(tzinfo=timezone.utc) == NOW - timedelta(days=15)
+
+    monkeypatch.setattr(sla_service, "_emit_breach_alert", emit)
+    assert emit_new_sla_breaches(db, ctx, batch_size=1)["emitted"] == 2
+
+    alerts = db.query(Activity).filter(Activity.type == "sla_breached").all()
+    assert sorted(a.entity_id for a in alerts) == sorted(str(a.id) for a in breached)
+
+
+def test_breach_scan_uses_open_partial_index(db, org, ctx, monkeypatch):
+    from sqlalchemy import event
+
+    from app.services.sla_service import _open_applications
+
+    _set_now(monkeypatch, NOW)
+    _setup(db, org)
+
+    plans = []
+
+    def explain(conn, cursor, statement, parameters, context, executemany):
+        plan_cursor = conn.connection.cursor()
+        plan_cursor.execute("EXPLAIN QUERY PLAN " + statement, parameters)
+        plans.append(plan_cursor.fetchall())
+
+    engine = db.get_bind()
+    event.listen(engine, "after_cursor_execute", explain)
+    try:
+        _open_applications(db, ctx).filter(
+            Application.stage_entered_at <= NOW - timedelta(days=5)
+        ).all()
+    finally:
+        event.remove(engine, "after_cursor_execute", explain)
+
+    assert "ix_application_org_open_stage_entered" in str(plans[-1])
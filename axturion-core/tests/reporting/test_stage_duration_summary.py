@@ -84,3 +84,57 @@ def test_stage_duration_summary_is_workflow_scoped_and_calculates_average(db, or
 
     # Ensure no leakage from workflow B
     assert stages["applied"]["count"] != 3
+
+
+def test_stage_duration_summary_aggregates_in_sql(db, org, ctx):
+    from sqlalchemy import event
+
+    workflow = Workflow(name="Workflow", organization_id=org.id)
+    db.add(workflow)
+    db.commit()
+    for order, name in enumerate(["applied", "screening", "offer"], start=1):
+        db.add(
+            WorkflowStage(
+                organization_id=org.id, workflow_id=workflow.id, name=name, order=order
+            )
+        )
+
+    now = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+    for stage, days in [
+        ("applied", 1),
+        ("applied", 2),
+        ("applied", 6),
+        ("screening", 0.5),
+        ("archived", 10),
+    ]:
+        db.add(
+            Application(
+                organization_id=org.id,
+                workflow_id=workflow.id,
+                stage=stage,
+                stage_entered_at=now - timedelta(days=days),
+            )
+        )
+    db.commit()
+
+    workflow_id = workflow.id
+    statements = []
+
+    def _count(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _count)
+    try:
+        result = get_stage_duration_summary(db, ctx, workflow_id, now=now)
+    finally:
+        event.remove(engine, "before_cursor_execute", _count)
+
+    assert len(statements) == 2
+    assert result["workflow_name"] == "Workflow"
+    assert result["stages"] == [
+        {"stage": "applied", "average_days": 3.0, "count": 3},
+        {"stage": "screening", "average_days": 0.5, "count": 1},
+        {"stage": "offer", "average_days": 0.0, "count": 0},
+        {"stage": "archived", "average_days": 10.0, "count": 1},
+    ]
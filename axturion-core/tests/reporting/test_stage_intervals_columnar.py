@@ -0,0 +1,84 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.services.stage_duration_breakdown_service import (
+    breakdown_reference,
+    stage_duration_breakdown,
+)
+
+pytest.importorskip("numpy")
+
+
+BASE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+STAGES = ["applied", "screening", "interview", "offer", "Zeta", "ärchived"]
+
+
+def _at(rng: random.Random) -> datetime:
+    # Coarse grid so timestamps collide; microseconds exercise truncation.
+    return BASE + timedelta(
+        hours=rng.randint(0, 24 * 40), microseconds=rng.choice([0, 1, 999_999])
+    )
+
+
+def _dataset(seed: int, n_apps: int = 200):
+    rng = random.Random(seed)
+    apps = []
+    events = []
+    seq = 0
+    for i in range(n_apps):
+        app_id = f"app-{i}"
+        created = None if rng.random() < 0.03 else _at(rng)
+        closed = _at(rng) if rng.random() < 0.4 else None
+        apps.append((app_id, rng.choice(STAGES), created, closed))
+        for _ in range(rng.randint(0, 6)):
+            seq += 1
+            from_stage = rng.choice(STAGES + [None, None])
+            events.append((app_id, _at(rng), seq, from_stage, rng.choice(STAGES)))
+    # Events for unknown applications are ignored.
+    events.append(("missing", BASE, seq + 1, None, "applied"))
+    rng.shuffle(events)
+    return apps, events
+
+
+WINDOWS = [
+    (None, None),
+    (BASE + timedelta(days=10), None),
+    (None, BASE + timedelta(days=20, microseconds=1)),
+    (BASE + timedelta(days=5, hours=3), BASE + timedelta(days=25)),
+    (BASE + timedelta(days=60), BASE + timedelta(days=70)),
+]
+
+
+@pytest.mark.parametrize("seed", range(8))
+@pytest.mark.parametrize("window_from,window_to", WINDOWS)
+def test_columnar_breakdown_matches_reference(seed, window_from, window_to):
+    apps, events = _dataset(seed)
+    if window_to is not None:
+        events = [e for e in events if e[1] <= window_to]
+    now = BASE + timedelta(days=33, seconds=7)
+
+    expected = breakdown_reference(
+        apps, events, window_from=window_from, window_to=window_to, now=now
+    )
+    actual = stage_duration_breakdown(
+        apps,
+        events,
+        window_from=window_from,
+        window_to=window_to,
+        now=now,
+        vectorized=True,
+    )
+    assert actual == expected
+    assert expected
+
+
+def test_columnar_breakdown_empty_inputs():
+    now = BASE
+    kwargs = dict(window_from=None, window_to=None, now=now, vectorized=True)
+    assert stage_duration_breakdown([], [], **kwargs) == []
+    assert stage_duration_breakdown([("a", "applied", None, None)], [], **kwargs) == []
+    assert stage_duration_breakdown(
+        [("a", "applied", BASE - timedelta(seconds=90), None)], [], **kwargs
+    ) == [{"stage": "applied", "count": 1, "median_seconds": 90, "p90_seconds": 90}]
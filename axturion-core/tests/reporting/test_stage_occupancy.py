@@ -0,0 +1,141 @@
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.domain.application.models import Application
+from app.domain.reporting.models import StageOccupancySnapshot
+from app.domain.workflow.models import Workflow, WorkflowStage
+from app.reporting.window import ReportingWindow
+from app.services.audit_service import append_audit_log
+from app.services.occupancy_service import (
+    get_stage_occupancy_series,
+    snapshot_stage_occupancy,
+)
+from app.services.reporting_service import get_stage_summary
+
+
+DAY0 = datetime(2026, 3, 2, 10, 0, 0, tzinfo=timezone.utc)
+STAGES = ["applied", "screening", "interview"]
+
+
+def _setup(db, org, ctx):
+    wf = Workflow(organization_id=org.id, name="Hiring")
+    db.add(wf)
+    db.commit()
+    db.refresh(wf)
+    for order, name in enumerate(STAGES, start=1):
+        db.add(
+            WorkflowStage(
+                organization_id=org.id, workflow_id=wf.id, name=name, order=order
+            )
+        )
+
+    # Predates the audit trail: no application_created entry.
+    db.add(
+        Application(
+            organization_id=org.id,
+            workflow_id=wf.id,
+            stage="applied",
+            created_at=DAY0 - timedelta(days=30),
+        )
+    )
+
+    app = Application(
+        organization_id=org.id, workflow_id=wf.id, stage="interview", created_at=DAY0
+    )
+    db.add(app)
+    db.flush()
+    append_audit_log(
+        db,
+        ctx,
+        entity_type="application",
+        entity_id=str(app.id),
+        action="application_created",
+        payload={"workflow_id": str(wf.id), "initial_stage": "applied"},
+        created_at=DAY0,
+    )
+    for days, change in ((1, "applied->screening"), (3, "screening->interview")):
+        append_audit_log(
+            db,
+            ctx,
+            entity_type="application",
+            entity_id=str(app.id),
+            action="stage_changed",
+            payload=change,
+            created_at=DAY0 + timedelta(days=days),
+        )
+    db.commit()
+    return wf, app
+
+
+def _counts(series) -> list[tuple[int, int, int]]:
+    return [tuple(s["count"] for s in day["stages"]) for day in series["days"]]
+
+
+def test_snapshots_replay_history_and_continue_incrementally(
+    db, org, ctx, monkeypatch
+):
+    wf, app = _setup(db, org, ctx)
+    monkeypatch.setattr(
+        "app.services.occupancy_service._now_utc", lambda: DAY0 + timedelta(days=5)
+    )
+
+    run = snapshot_stage_occupancy(db, ctx)
+    assert run == {"days_written": 5, "through": date(2026, 3, 6)}
+
+    series = get_stage_occupancy_series(db, ctx, wf.id, window=ReportingWindow.all_time())
+    assert [d["day"] for d in series["days"]][0] == date(2026, 3, 2)
+    assert _counts(series) == [
+        (2, 0, 0),
+        (1, 1, 0),
+        (1, 1, 0),
+        (1, 0, 1),
+        (1, 0, 1),
+    ]
+    # The latest snapshot agrees with the current-state summary.
+    assert _counts(series)[-1] == tuple(
+        s["count"] for s in get_stage_summary(db, ctx, wf.id)["stages"]
+    )
+
+    append_audit_log(
+        db,
+        ctx,
+        entity_type="application",
+        entity_id=str(app.id),
+        action="stage_changed",
+        payload="interview->screening",
+        created_at=DAY0 + timedelta(days=6),
+    )
+    db.commit()
+    monkeypatch.setattr(
+        "app.services.occupancy_service._now_utc", lambda: DAY0 + timedelta(days=8)
+    )
+    written_before = db.query(StageOccupancySnapshot).count()
+
+    assert snapshot_stage_occupancy(db, ctx)["days_written"] == 3
+    assert snapshot_stage_occupancy(db, ctx)["days_written"] == 0
+    assert db.query(StageOccupancySnapshot).count() == written_before + 6
+
+    window = ReportingWindow(
+        from_datetime=DAY0 + timedelta(days=4), to_datetime=DAY0 + timedelta(days=30)
+    )
+    series = get_stage_occupancy_series(db, ctx, wf.id, window=window)
+    assert [d["day"] for d in series["days"]] == [
+        date(2026, 3, 6),
+        date(2026, 3, 7),
+        date(2026, 3, 8),
+        date(2026, 3, 9),
+    ]
+    assert _counts(series) == [(1, 0, 1), (1, 0, 1), (1, 1, 0), (1, 1, 0)]
+
+
+def test_snapshot_rejects_incomplete_days(db, org, ctx, monkeypatch):
+    monkeypatch.setattr("app.services.occupancy_service._now_utc", lambda: DAY0)
+    with pytest.raises(ValueError):
+        snapshot_stage_occupancy(db, ctx, through=DAY0.date())
+
+
+def test_series_is_empty_before_first_snapshot(db, org, ctx):
+    wf, _app = _setup(db, org, ctx)
+    series = get_stage_occupancy_series(db, ctx, wf.id, window=ReportingWindow.all_time())
+    assert series["days"] == []
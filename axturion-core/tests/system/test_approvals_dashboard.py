@@ -224,3 +224,32 @@ def test_reporting_summary_endpoint_returns_metrics(client: TestClient, db):
     assert data["total_pending"] == 1
     assert data["oldest_pending_age_seconds"] >= 0
     assert data["avg_pending_age_seconds"] >= 0
+
+
+def test_pending_list_supports_sort_and_keyset_cursor(client: TestClient, db):
+    org, app, make_user = _seed_pending_approval(db, org_name="org-keyset")
+    recruiter = make_user("recruiter", "recruiter@local")
+    headers = {"X-Org-Id": str(org.id), "X-User-Id": str(recruiter.id)}
+
+    _create_pending_via_move_stage(client, org, app, recruiter)
+
+    resp = client.get("/approvals/pending?sort=oldest", headers=headers)
+    assert resp.status_code == 200
+    items = resp.json()
+    assert len(items) == 1
+
+    resp = client.get(
+        f"/approvals/pending?sort=oldest&after={items[0]['pending_id']}",
+        headers=headers,
+    )
+    assert resp.status_code == 200
+    assert resp.json() == []
+
+    resp = client.get(
+        "/approvals/pending?after=00000000-0000-0000-0000-000000000000",
+        headers=headers,
+    )
+    assert resp.status_code == 404
+
+    resp = client.get("/approvals/pending?sort=priority", headers=headers)
+    assert resp.status_code == 422
@@ -0,0 +1,226 @@
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.audit.merkle import verify_inclusion
+from app.core.audit_hashing import canonical_audit_payload, compute_hash
+from app.domain.audit.models import AuditLog, AuditMerkleAnchor
+from app.services.audit_service import anchor_completed_ranges, append_audit_log
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    """System-level client wired to sqlite in-memory."""
+
+    from app.main import app
+    import app.core.db as core_db
+    from app.core.config import Settings
+
+    engine = db.get_bind()
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr("app.main.core_db.wait_for_db", lambda: None)
+    monkeypatch.setattr("app.main.core_db.init_db", lambda _settings: None)
+    monkeypatch.setattr("app.main.verify_startup", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.main.seed_identity", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_workflow", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_automation", lambda _db: None)
+
+    monkeypatch.setattr(
+        "app.main.get_settings",
+        lambda: Settings(DATABASE_URL=str(engine.url), ENV="test", LOG_LEVEL="INFO"),
+    )
+
+    monkeypatch.setattr(core_db, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr("app.main.core_db", core_db)
+
+    app.dependency_overrides[core_db.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def small_anchor_ranges(monkeypatch):
+    monkeypatch.setattr("app.services.audit_service.ANCHOR_RANGE_SIZE", 8)
+
+
+def _auditor_headers(db, org) -> dict:
+    from app.domain.identity.models import OrganizationMembership, User
+
+    user = User(email="auditor-proof@local", is_active=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    db.add(
+        OrganizationMembership(
+            organization_id=org.id, user_id=user.id, role="auditor", is_active=True
+        )
+    )
+    db.commit()
+    return {"X-Org-Id": str(org.id), "X-User-Id": str(user.id)}
+
+
+def _append(db, ctx, count: int):
+    for i in range(count):
+        append_audit_log(
+            db, ctx, entity_type="application", entity_id=str(i % 3), action="moved"
+        )
+    db.commit()
+
+
+def test_appends_do_not_anchor(db, ctx):
+    _append(db, ctx, 17)
+
+    assert db.query(AuditMerkleAnchor).count() == 0
+
+
+def test_anchoring_job_scans_forward_from_last_anchor(db, ctx):
+    _append(db, ctx, 17)
+
+    result = anchor_completed_ranges(db, ctx, max_ranges=1)
+    assert result == {
+        "anchored": 1,
+        "anchored_through_seq": 8,
+        "failed_first_seq": None,
+        "failed_last_seq": None,
+    }
+    assert anchor_completed_ranges(db, ctx)["anchored_through_seq"] == 16
+    assert anchor_completed_ranges(db, ctx)["anchored"] == 0
+
+    anchors = db.query(AuditMerkleAnchor).order_by(AuditMerkleAnchor.first_seq).all()
+    assert [(a.first_seq, a.last_seq, a.leaf_count) for a in anchors] == [
+        (1, 8, 8),
+        (9, 16, 8),
+    ]
+
+
+def test_anchoring_job_stops_at_a_broken_range(db, ctx):
+    _append(db, ctx, 16)
+    row = db.query(AuditLog).filter(AuditLog.seq == 10).one()
+    row.action = "tampered"
+    db.commit()
+
+    result = anchor_completed_ranges(db, ctx)
+
+    assert result["anchored"] == 1
+    assert (result["failed_first_seq"], result["failed_last_seq"]) == (9, 16)
+    assert db.query(AuditMerkleAnchor).count() == 1
+
+
+def test_proof_verifies_in_log_n_hashes(client: TestClient, db, org, ctx):
+    _append(db, ctx, 17)
+    anchor_completed_ranges(db, ctx)
+    headers = _auditor_headers(db, org)
+
+    res = client.get("/audit/proof/13", headers=headers)
+    assert res.status_code == 200
+    body = res.json()
+
+    assert body["anchor"]["first_seq"] == 9
+    assert len(body["proof"]) == 3
+
+    # The entry hash is recomputable from the returned canonical bytes ...
+    assert compute_hash(body["prev_hash"], body["canonical"].encode()) == body["hash"]
+    # ... and folds up to the anchored root.
+    proof = [(step["position"], bytes.fromhex(step["hash"])) for step in body["proof"]]
+    assert verify_inclusion(
+        bytes.fromhex(body["leaf_hash"]), proof, bytes.fromhex(body["anchor"]["root"])
+    )
+
+    assert client.get("/audit/proof/17", headers=headers).status_code == 409
+    assert client.get("/audit/proof/99", headers=headers).status_code == 404
+
+
+def test_proof_is_not_anchored_until_the_job_runs(client: TestClient, db, org, ctx):
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    prev = None
+    for seq in range(1, 11):
+        row = AuditLog(
+            id=uuid.uuid4(),
+            organization_id=org.id,
+            actor_id="legacy",
+            entity_type="job",
+            entity_id="1",
+            action="legacy",
+            payload="{}",
+            created_at=base + timedelta(seconds=seq),
+            seq=seq,
+            prev_hash=prev,
+            hash="",
+        )
+        row.hash = compute_hash(prev, canonical_audit_payload(row))
+        prev = row.hash
+        db.add(row)
+    db.commit()
+    assert db.query(AuditMerkleAnchor).count() == 0
+
+    headers = _auditor_headers(db, org)
+    res = client.get("/audit/proof/2", headers=headers)
+    assert res.status_code == 409
+    assert res.json()["detail"] == "not_anchored"
+    assert db.query(AuditMerkleAnchor).count() == 0
+
+    anchor_completed_ranges(db, ctx)
+    assert client.get("/audit/proof/2", headers=headers).status_code == 200
+
+
+def test_proof_requires_audit_scope(client: TestClient, db, org, ctx):
+    from app.domain.identity.models import OrganizationMembership, User
+
+    _append(db, ctx, 8)
+    user = User(email="recruiter-proof@local", is_active=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    db.add(
+        OrganizationMembership(
+            organization_id=org.id, user_id=user.id, role="recruiter", is_active=True
+        )
+    )
+    db.commit()
+
+    res = client.get(
+        "/audit/proof/1", headers={"X-Org-Id": str(org.id), "X-User-Id": str(user.id)}
+    )
+    assert res.status_code == 403
+
+
+def test_anchoring_endpoint_requires_workflow_write(client: TestClient, db, org, ctx):
+    _append(db, ctx, 8)
+
+    res = client.post("/audit/anchors", headers=_auditor_headers(db, org))
+    assert res.status_code == 403
+
+    from app.domain.identity.models import OrganizationMembership, User
+
+    admin = User(email="admin-anchor@local", is_active=True)
+    db.add(admin)
+    db.commit()
+    db.refresh(admin)
+    db.add(
+        OrganizationMembership(
+            organization_id=org.id, user_id=admin.id, role="hr_admin", is_active=True
+        )
+    )
+    db.commit()
+
+    res = client.post(
+        "/audit/anchors",
+        headers={"X-Org-Id": str(org.id), "X-User-Id": str(admin.id)},
+    )
+    assert res.status_code == 200
+    assert res.json()["anchored"] == 1
+    assert res.json()["anchored_through_seq"] == 8
@@ -0,0 +1,126 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.workflow.models import Workflow
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    """System-level client wired to sqlite in-memory."""
+
+    from app.main import app
+    import app.core.db as core_db
+    from app.core.config import Settings
+
+    engine = db.get_bind()
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr("app.main.core_db.wait_for_db", lambda: None)
+    monkeypatch.setattr("app.main.core_db.init_db", lambda _settings: None)
+    monkeypatch.setattr("app.main.verify_startup", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.main.seed_identity", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_workflow", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_automation", lambda _db: None)
+
+    monkeypatch.setattr(
+        "app.main.get_settings",
+        lambda: Settings(DATABASE_URL=str(engine.url), ENV="test", LOG_LEVEL="INFO"),
+    )
+
+    monkeypatch.setattr(core_db, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr("app.main.core_db", core_db)
+
+    app.dependency_overrides[core_db.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+def _headers(db, org, role: str = "hr_admin") -> dict:
+    from app.domain.identity.models import OrganizationMembership, User
+
+    user = User(email=f"bootstrap-{role}@local", is_active=True, language="nl")
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+    db.add(
+        OrganizationMembership(
+            organization_id=org.id, user_id=user.id, role=role, is_active=True
+        )
+    )
+    db.commit()
+    return {"X-Org-Id": str(org.id), "X-User-Id": str(user.id)}
+
+
+def test_bootstrap_bundles_identity_policy_workflows_and_ux(
+    client: TestClient, db, org
+):
+    headers = _headers(db, org)
+    db.add(Workflow(organization_id=org.id, name="Hiring", active=True))
+    db.commit()
+
+    saved = client.put(
+        "/ux/applications", headers=headers, json={"layout": "compact"}
+    )
+    assert saved.status_code == 200
+
+    resp = client.get(
+        "/bootstrap?modules=applications, jobs,applications", headers=headers
+    )
+    assert resp.status_code == 200
+    assert resp.headers.get("ETag")
+    body = resp.json()
+
+    me = client.get("/me", headers=headers).json()
+    assert body["identity"]["user_id"] == me["user_id"]
+    assert body["identity"]["scopes"] == me["scopes"]
+    assert body["identity"]["effective_language"] == "nl"
+
+    policy = client.get("/governance/policy", headers=headers).json()
+    assert body["policy"]["organization_id"] == policy["organization_id"]
+    assert body["policy"]["default_language"] == policy["default_language"]
+
+    assert [w["name"] for w in body["workflows"]] == ["Hiring"]
+    assert body["ux"] == {"applications": {"layout": "compact"}, "jobs": {}}
+
+
+def test_bootstrap_etag_returns_304_until_audited_change(client: TestClient, db, org):
+    headers = _headers(db, org)
+
+    first = client.get("/bootstrap?modules=applications", headers=headers)
+    etag = first.headers["ETag"]
+
+    cached = client.get(
+        "/bootstrap?modules=applications",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert cached.status_code == 304
+
+    client.put("/ux/applications", headers=headers, json={"theme": "dark"})
+    changed = client.get(
+        "/bootstrap?modules=applications",
+        headers={**headers, "If-None-Match": etag},
+    )
+    assert changed.status_code == 200
+    assert changed.json()["ux"] == {"applications": {"theme": "dark"}}
+
+
+def test_bootstrap_nulls_sections_without_scope(client: TestClient, db, org):
+    headers = {**_headers(db, org), "X-Scopes": "workflow:read"}
+
+    resp = client.get("/bootstrap?modules=applications", headers=headers)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["identity"]["scopes"] == ["workflow:read"]
+    assert body["policy"] is not None
+    assert body["ux"] is None
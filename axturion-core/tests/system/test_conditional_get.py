@@ -0,0 +1,186 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    from app.main import app
+    import app.core.db as core_db
+    from app.core.config import Settings
+
+    engine = db.get_bind()
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr("app.main.core_db.wait_for_db", lambda: None)
+    monkeypatch.setattr("app.main.core_db.init_db", lambda _settings: None)
+    monkeypatch.setattr("app.main.verify_startup", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.main.seed_identity", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_workflow", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_automation", lambda _db: None)
+
+    monkeypatch.setattr(
+        "app.main.get_settings",
+        lambda: Settings(DATABASE_URL=str(engine.url), ENV="test", LOG_LEVEL="INFO"),
+    )
+
+    monkeypatch.setattr(core_db, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr("app.main.core_db", core_db)
+
+    app.dependency_overrides[core_db.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+def _seed_org_and_user(db, *, org_name: str, role: str, email: str):
+    from app.domain.organization.models import Organization
+    from app.domain.identity.models import OrganizationMembership, User
+
+    org = Organization(name=org_name)
+    db.add(org)
+    db.commit()
+    db.refresh(org)
+
+    user = User(email=email, is_active=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+    db.add(
+        OrganizationMembership(
+            organization_id=org.id,
+            user_id=user.id,
+            role=role,
+            is_active=True,
+        )
+    )
+    db.commit()
+
+    return org, user
+
+
+def _seed_workflow(db, org_id):
+    from app.domain.workflow.models import Workflow
+
+    wf = Workflow(organization_id=org_id, name="wf")
+    db.add(wf)
+    db.commit()
+    db.refresh(wf)
+    return wf
+
+
+def test_ux_config_revalidates_with_etag(client: TestClient, db):
+    org, user = _seed_org_and_user(
+        db, org_name="org-etag-ux", role="hr_admin", email="admin@etag.local"
+    )
+    headers = {"X-Org-Id": str(org.id), "X-User-Id": str(user.id)}
+
+    first = client.get("/ux/applications", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+    # Weak: compressed and identity bodies share it.
+    assert etag.startswith('W/"')
+
+    not_modified = client.get(
+        "/ux/applications", headers={**headers, "If-None-Match": etag}
+    )
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["ETag"] == etag
+
+    # A strong form of the same tag still matches (weak comparison).
+    assert (
+        client.get(
+            "/ux/applications", headers={**headers, "If-None-Match": etag[2:]}
+        ).status_code
+        == 304
+    )
+
+    updated = client.put(
+        "/ux/applications", json={"layout": "compact"}, headers=headers
+    )
+    assert updated.status_code == 200
+
+    refetched = client.get(
+        "/ux/applications", headers={**headers, "If-None-Match": etag}
+    )
+    assert refetched.status_code == 200
+    assert refetched.headers["ETag"] != etag
+    assert refetched.json()["config"]["layout"] == "compact"
+
+
+def test_workflow_edits_change_workflow_etag(client: TestClient, db):
+    org, user = _seed_org_and_user(
+        db, org_name="org-etag-wf", role="hr_admin", email="wf@etag.local"
+    )
+    wf = _seed_workflow(db, org.id)
+    headers = {"X-Org-Id": str(org.id), "X-User-Id": str(user.id)}
+
+    first = client.get(f"/workflows/{wf.id}", headers=headers)
+    assert first.status_code == 200
+    etag = first.headers["ETag"]
+
+    created = client.post(
+        f"/workflow-editor/{wf.id}/stages", json={"name": "applied"}, headers=headers
+    )
+    assert created.status_code == 201
+
+    second = client.get(
+        f"/workflows/{wf.id}", headers={**headers, "If-None-Match": etag}
+    )
+    assert second.status_code == 200
+    assert [s["name"] for s in second.json()["stages"]] == ["applied"]
+
+
+def test_etag_is_scoped_to_caller_and_url(client: TestClient, db):
+    org, admin = _seed_org_and_user(
+        db, org_name="org-etag-scope", role="hr_admin", email="a@etag.local"
+    )
+    from app.domain.identity.models import OrganizationMembership, User
+
+    recruiter = User(email="r@etag.local", is_active=True)
+    db.add(recruiter)
+    db.commit()
+    db.add(
+        OrganizationMembership(
+            organization_id=org.id, user_id=recruiter.id, role="recruiter", is_active=True
+        )
+    )
+    db.commit()
+
+    admin_headers = {"X-Org-Id": str(org.id), "X-User-Id": str(admin.id)}
+    recruiter_headers = {"X-Org-Id": str(org.id), "X-User-Id": str(recruiter.id)}
+
+    admin_me = client.get("/me", headers=admin_headers)
+    recruiter_me = client.get(
+        "/me", headers={**recruiter_headers, "If-None-Match": admin_me.headers["ETag"]}
+    )
+    assert recruiter_me.status_code == 200
+    assert recruiter_me.headers["ETag"] != admin_me.headers["ETag"]
+
+    ux_a = client.get("/ux/a", headers=admin_headers)
+    ux_b = client.get(
+        "/ux/b", headers={**admin_headers, "If-None-Match": ux_a.headers["ETag"]}
+    )
+    assert ux_b.status_code == 200
+
+
+def test_time_relative_reports_are_not_conditional(client: TestClient, db):
+    org, user = _seed_org_and_user(
+        db, org_name="org-etag-aging", role="recruiter", email="aging@etag.local"
+    )
+    headers = {"X-Org-Id": str(org.id), "X-User-Id": str(user.id)}
+
+    res = client.get("/reporting/stage-aging", headers=headers)
+    assert res.status_code == 200
+    assert "ETag" not in res.headers
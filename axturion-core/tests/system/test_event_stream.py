@@ -0,0 +1,214 @@
+import asyncio
+import functools
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.core.event_bus import event_bus
+from app.services.activity_service import create_activity
+from app.services.audit_service import append_audit_log
+from app.services.event_stream_service import replay_audit_events
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    from app.main import app
+    import app.core.db as core_db
+    from app.core.config import Settings
+
+    engine = db.get_bind()
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr("app.main.core_db.wait_for_db", lambda: None)
+    monkeypatch.setattr("app.main.core_db.init_db", lambda _settings: None)
+    monkeypatch.setattr("app.main.verify_startup", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.main.seed_identity", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_workflow", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_automation", lambda _db: None)
+
+    monkeypatch.setattr(
+        "app.main.get_settings",
+        lambda: Settings(DATABASE_URL=str(engine.url), ENV="test", LOG_LEVEL="INFO"),
+    )
+
+    monkeypatch.setattr(core_db, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr("app.main.core_db", core_db)
+
+    app.dependency_overrides[core_db.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+def _seed_user(db, org, *, role: str = "recruiter"):
+    from app.domain.identity.models import OrganizationMembership, User
+
+    user = User(email=f"{role}@stream.local", is_active=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+    db.add(
+        OrganizationMembership(
+            organization_id=org.id, user_id=user.id, role=role, is_active=True
+        )
+    )
+    db.commit()
+    return user
+
+
+def _drain(sub) -> list:
+    items = []
+    while not sub.queue.empty():
+        items.append(sub.queue.get_nowait())
+    return items
+
+
+def test_events_are_published_only_after_commit(db, org, ctx):
+    async def scenario():
+        sub = event_bus.subscribe(str(org.id))
+        try:
+            append_audit_log(
+                db, ctx, entity_type="application", entity_id="app-1", action="x"
+            )
+            create_activity(
+                db,
+                organization_id=org.id,
+                entity_type="application",
+                entity_id="app-1",
+                activity_type="note",
+            )
+            await asyncio.sleep(0)
+            assert _drain(sub) == []
+
+            db.commit()
+            await asyncio.sleep(0)
+
+            events = _drain(sub)
+            assert [e.kind for e in events] == ["audit", "activity"]
+            assert events[0].seq == 1
+            assert events[1].data["type"] == "note"
+        finally:
+            event_bus.unsubscribe(sub)
+
+    asyncio.run(scenario())
+
+
+def test_rollback_and_other_orgs_are_not_delivered(db, org, ctx):
+    async def scenario():
+        sub = event_bus.subscribe(str(org.id), entity_id="app-2")
+        other = event_bus.subscribe("00000000-0000-0000-0000-000000000000")
+        try:
+            append_audit_log(
+                db, ctx, entity_type="application", entity_id="app-2", action="x"
+            )
+            db.rollback()
+
+            append_audit_log(
+                db, ctx, entity_type="application", entity_id="app-3", action="y"
+            )
+            append_audit_log(
+                db, ctx, entity_type="application", entity_id="app-2", action="z"
+            )
+            db.commit()
+            await asyncio.sleep(0)
+
+            assert [e.data["action"] for e in _drain(sub)] == ["z"]
+            assert _drain(other) == []
+        finally:
+            event_bus.unsubscribe(sub)
+            event_bus.unsubscribe(other)
+
+    asyncio.run(scenario())
+
+
+def test_slow_subscriber_is_marked_overflowed(db, org, ctx):
+    async def scenario():
+        sub = event_bus.subscribe(str(org.id), maxsize=1)
+        try:
+            for i in range(3):
+                append_audit_log(
+                    db, ctx, entity_type="job", entity_id=str(i), action="x"
+                )
+            db.commit()
+            await asyncio.sleep(0)
+
+            assert sub.overflowed is True
+            assert len(_drain(sub)) == 1
+        finally:
+            event_bus.unsubscribe(sub)
+
+    asyncio.run(scenario())
+
+
+def test_replay_returns_audit_events_after_seq(db, ctx):
+    for i in range(5):
+        append_audit_log(db, ctx, entity_type="job", entity_id=str(i % 2), action="x")
+    db.commit()
+
+    events, truncated = replay_audit_events(db, ctx, after_seq=2)
+    assert [e.seq for e in events] == [3, 4, 5]
+    assert truncated is False
+
+    events, truncated = replay_audit_events(
+        db, ctx, after_seq=0, entity_type="job", entity_id="1"
+    )
+    assert [e.seq for e in events] == [2, 4]
+
+    events, truncated = replay_audit_events(db, ctx, after_seq=0, limit=2)
+    assert [e.seq for e in events] == [1, 2]
+    assert truncated is True
+
+
+def test_stream_requires_audit_read_scope(client: TestClient, db, org):
+    user = _seed_user(db, org, role="stage_operator")
+
+    res = client.get(
+        "/events/stream",
+        headers={
+            "X-Org-Id": str(org.id),
+            "X-User-Id": str(user.id),
+            "Last-Event-ID": "0",
+        },
+    )
+
+    assert res.status_code == 403
+    assert event_bus.subscriber_count() == 0
+
+
+def test_stream_resumes_from_last_event_id(client: TestClient, db, org, ctx, monkeypatch):
+    user = _seed_user(db, org, role="auditor")
+    for i in range(3):
+        append_audit_log(db, ctx, entity_type="job", entity_id=str(i), action="x")
+    db.commit()
+
+    # Force a truncated replay so the stream terminates deterministically.
+    monkeypatch.setattr(
+        "app.api.routes.events.replay_audit_events",
+        functools.partial(replay_audit_events, limit=1),
+    )
+
+    headers = {
+        "X-Org-Id": str(org.id),
+        "X-User-Id": str(user.id),
+        "Last-Event-ID": "1",
+    }
+    with client.stream("GET", "/events/stream", headers=headers) as res:
+        assert res.status_code == 200
+        assert res.headers["content-type"].startswith("text/event-stream")
+        body = "".join(res.iter_text())
+
+    assert "id: 2\nevent: audit\n" in body
+    assert "id: 3" not in body
+    assert "event: resync" in body
+    assert event_bus.subscriber_count() == 0
@@ -0,0 +1,87 @@
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.domain.audit.models import AuditLog  # noqa: F401 (register model)
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    """System-level client wired to sqlite in-memory."""
+
+    from app.main import app
+    import app.core.db as core_db
+    from app.core.config import Settings
+
+    engine = db.get_bind()
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr("app.main.core_db.wait_for_db", lambda: None)
+    monkeypatch.setattr("app.main.core_db.init_db", lambda _settings: None)
+    monkeypatch.setattr("app.main.verify_startup", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.main.seed_identity", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_workflow", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_automation", lambda _db: None)
+
+    monkeypatch.setattr(
+        "app.main.get_settings",
+        lambda: Settings(DATABASE_URL=str(engine.url), ENV="test", LOG_LEVEL="INFO"),
+    )
+
+    monkeypatch.setattr(core_db, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr("app.main.core_db", core_db)
+
+    app.dependency_overrides[core_db.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+def _make_user(db, org, role: str, email: str):
+    from app.domain.identity.models import OrganizationMembership, User
+
+    user = User(email=email, is_active=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+    membership = OrganizationMembership(
+        organization_id=org.id,
+        user_id=user.id,
+        role=role,
+        is_active=True,
+    )
+    db.add(membership)
+    db.commit()
+
+    return user
+
+
+def test_partition_maintenance_requires_workflow_write(client: TestClient, db, org):
+    recruiter = _make_user(db, org, "recruiter", "recruiter-partitions@local")
+
+    resp = client.post(
+        "/governance/partitions/maintain",
+        headers={"X-Org-Id": str(org.id), "X-User-Id": str(recruiter.id)},
+    )
+    assert resp.status_code == 403
+
+
+def test_partition_maintenance_is_noop_outside_postgres(client: TestClient, db, org):
+    admin = _make_user(db, org, "hr_admin", "admin-partitions@local")
+
+    resp = client.post(
+        "/governance/partitions/maintain?months_ahead=2",
+        headers={"X-Org-Id": str(org.id), "X-User-Id": str(admin.id)},
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json() == {"months_ahead": 2, "partitions": []}
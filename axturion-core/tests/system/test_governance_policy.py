@@ -69,7 +69,7 @@ def _make_user(db, org, role: str, email: str):
     return user
 
 
-def test_get_policy_autocreates_defaults(client: TestClient, db, org):
+def test_get_policy_returns_defaults_without_writing(client: TestClient, db, org):
     recruiter = _make_user(db, org, "recruiter", "recruiter-policy@local")
 
     resp = client.get(
@@ -89,15 +89,13 @@ def test_get_policy_autocreates_defaults(client: TestClient, db, org):
     assert body["default_language"] == "en"
     assert body.get("candidate_retention_days") is None
     assert body.get("audit_retention_days") is None
-    assert "created_at" in body
-    assert "updated_at" in body
 
     row = (
         db.query(PolicyConfig)
         .filter(PolicyConfig.organization_id == org.id)
         .one_or_none()
     )
-    assert row is not None
+    assert row is None
 
 
 def test_put_policy_requires_workflow_write_scope(client: TestClient, db, org):
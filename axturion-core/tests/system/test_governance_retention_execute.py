@@ -0,0 +1,292 @@
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+from app.audit.archive import (
+    ArchiveConfigurationError,
+    boundary_from_seal,
+    verify_segment_file,
+)
+from app.domain.audit.models import AuditLog, AuditSegmentSeal
+from app.domain.candidate.models import Candidate
+from app.domain.governance.models import PolicyConfig
+from app.services.audit_service import append_audit_log, verify_audit_chain
+from app.services.retention_service import ANONYMIZED_NAME, execute_retention
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    """System-level client wired to sqlite in-memory."""
+
+    from app.main import app
+    import app.core.db as core_db
+    from app.core.config import Settings
+
+    engine = db.get_bind()
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr("app.main.core_db.wait_for_db", lambda: None)
+    monkeypatch.setattr("app.main.core_db.init_db", lambda _settings: None)
+    monkeypatch.setattr("app.main.verify_startup", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.main.seed_identity", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_workflow", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_automation", lambda _db: None)
+
+    monkeypatch.setattr(
+        "app.main.get_settings",
+        lambda: Settings(DATABASE_URL=str(engine.url), ENV="test", LOG_LEVEL="INFO"),
+    )
+
+    monkeypatch.setattr(core_db, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr("app.main.core_db", core_db)
+
+    app.dependency_overrides[core_db.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture(autouse=True)
+def archive_root(tmp_path, monkeypatch) -> Path:
+    monkeypatch.setenv("AUDIT_ARCHIVE_DIR", str(tmp_path))
+    monkeypatch.setenv("AUDIT_SEAL_KEY", "test-audit-seal-key")
+    return tmp_path
+
+
+def _set_policy(db, org, *, candidate_days=None, audit_days=None):
+    db.add(
+        PolicyConfig(
+            organization_id=org.id,
+            candidate_retention_days=candidate_days,
+            audit_retention_days=audit_days,
+        )
+    )
+    db.commit()
+
+
+def _seed_candidates(db, org, *, old: int, recent: int):
+    now = datetime.now(timezone.utc)
+    for i in range(old):
+        db.add(
+            Candidate(
+                organization_id=org.id,
+                name=f"Old {i}",
+                email=f"old{i}@local",
+                phone="0612345678",
+                created_at=now - timedelta(days=400),
+            )
+        )
+    for i in range(recent):
+        db.add(
+            Candidate(
+                organization_id=org.id,
+                name=f"Recent {i}",
+                email=f"recent{i}@local",
+                created_at=now - timedelta(days=1),
+            )
+        )
+    db.commit()
+
+
+def _seed_audit(db, ctx, *, old: int, recent: int):
+    now = datetime.now(timezone.utc)
+    for i in range(old + recent):
+        age = timedelta(days=400) if i < old else timedelta(days=1)
+        append_audit_log(
+            db,
+            ctx,
+            entity_type="job",
+            entity_id=str(i),
+            action="created",
+            payload={"i": i},
+            created_at=now - age,
+        )
+    db.commit()
+
+
+def test_dry_run_reports_without_changes(db, org, ctx, archive_root):
+    _set_policy(db, org, candidate_days=30, audit_days=30)
+    _seed_candidates(db, org, old=3, recent=1)
+    _seed_audit(db, ctx, old=5, recent=1)
+
+    report = execute_retention(db, ctx, dry_run=True)
+
+    assert report["candidates_eligible"] == 3
+    assert report["candidates_processed"] == 0
+    assert report["audit_entries_eligible"] == 5
+    assert report["audit_entries_archived"] == 0
+    assert db.query(AuditLog).count() == 6
+    assert db.query(Candidate).filter(Candidate.name == ANONYMIZED_NAME).count() == 0
+    assert list(archive_root.iterdir()) == []
+
+
+def test_candidates_are_anonymized_in_throttled_chunks(db, org, ctx):
+    _set_policy(db, org, candidate_days=30)
+    _seed_candidates(db, org, old=5, recent=2)
+
+    sleeps: list[float] = []
+    progress: list[dict] = []
+    report = execute_retention(
+        db,
+        ctx,
+        dry_run=False,
+        chunk_size=2,
+        max_rows_per_second=10,
+        on_progress=progress.append,
+        sleep=sleeps.append,
+        clock=lambda: 0.0,
+    )
+
+    assert report["candidates_processed"] == 5
+    assert [p["processed"] for p in progress] == [2, 4, 5]
+    # Frozen clock: each chunk sleeps up to the cumulative rows/sec budget.
+    assert sleeps == [0.2, 0.4, 0.5]
+
+    anonymized = db.query(Candidate).filter(Candidate.name == ANONYMIZED_NAME).all()
+    assert len(anonymized) == 5
+    assert all(c.email is None and c.phone is None for c in anonymized)
+
+    # Already-anonymized candidates are not eligible again.
+    again = execute_retention(db, ctx, dry_run=True)
+    assert again["candidates_eligible"] == 0
+
+
+def test_candidates_can_be_deleted(db, org, ctx):
+    _set_policy(db, org, candidate_days=30)
+    _seed_candidates(db, org, old=3, recent=1)
+
+    report = execute_retention(db, ctx, dry_run=False, candidate_mode="delete")
+
+    assert report["candidates_processed"] == 3
+    assert db.query(Candidate).count() == 1
+
+
+def test_audit_is_archived_into_sealed_segments(db, org, ctx):
+    _set_policy(db, org, audit_days=30)
+    _seed_audit(db, ctx, old=10, recent=2)
+
+    report = execute_retention(db, ctx, dry_run=False, chunk_size=4)
+
+    assert report["audit_entries_archived"] == 10
+    assert report["audit_segments_written"] == 3
+    assert report["archived_through_seq"] == 10
+
+    seqs = [r.seq for r in db.query(AuditLog).order_by(AuditLog.seq).all()]
+    # Two retained rows plus the retention_executed audit entry.
+    assert seqs == [11, 12, 13]
+
+    seals = db.query(AuditSegmentSeal).order_by(AuditSegmentSeal.first_seq).all()
+    assert [(s.first_seq, s.last_seq) for s in seals] == [(1, 4), (5, 8), (9, 10)]
+    for seal in seals:
+        assert verify_segment_file(Path(seal.archive_path), boundary_from_seal(seal))
+
+    # Verification reads the archived prefix back from the segments.
+    result = verify_audit_chain(db, ctx, limit=1000)
+    assert result["ok"] is True
+    assert result["first_seq"] == 1
+    assert result["checked"] == 13
+
+    result = verify_audit_chain(db, ctx, limit=4)
+    assert result["first_seq"] == 10
+    assert result["checked"] == 4
+
+
+def test_audit_archiving_requires_seal_key(db, org, ctx, archive_root, monkeypatch):
+    monkeypatch.delenv("AUDIT_SEAL_KEY")
+    _set_policy(db, org, candidate_days=30, audit_days=30)
+    _seed_candidates(db, org, old=2, recent=0)
+    _seed_audit(db, ctx, old=3, recent=1)
+
+    # Dry runs only count.
+    report = execute_retention(db, ctx, dry_run=True)
+    assert report["audit_entries_eligible"] == 3
+
+    with pytest.raises(ArchiveConfigurationError):
+        execute_retention(db, ctx, dry_run=False)
+
+    assert db.query(AuditSegmentSeal).count() == 0
+    assert db.query(Candidate).filter(Candidate.email.is_(None)).count() == 0
+    assert list(archive_root.iterdir()) == []
+
+
+def test_tampered_seal_breaks_verification(db, org, ctx):
+    _set_policy(db, org, audit_days=30)
+    _seed_audit(db, ctx, old=3, recent=1)
+    execute_retention(db, ctx, dry_run=False)
+
+    seal = db.query(AuditSegmentSeal).one()
+    seal.last_hash = "0" * 64
+    db.commit()
+
+    result = verify_audit_chain(db, ctx, limit=1000)
+    assert result["ok"] is False
+    assert result["error"]["reason"] == "segment_seal_invalid"
+    assert result["error"]["segment_seal_id"] == str(seal.id)
+    assert "audit_log_id" not in result["error"]
+
+
+def test_execute_endpoint_requires_write_scope(client: TestClient, db, org):
+    from app.domain.identity.models import OrganizationMembership, User
+
+    users = {}
+    for role in ("hr_admin", "recruiter"):
+        user = User(email=f"{role}-retention-exec@local", is_active=True)
+        db.add(user)
+        db.commit()
+        db.refresh(user)
+        db.add(
+            OrganizationMembership(
+                organization_id=org.id, user_id=user.id, role=role, is_active=True
+            )
+        )
+        db.commit()
+        users[role] = user
+
+    def post(role: str):
+        return client.post(
+            "/governance/retention/execute",
+            headers={"X-Org-Id": str(org.id), "X-User-Id": str(users[role].id)},
+            json={"dry_run": True},
+        )
+
+    assert post("recruiter").status_code == 403
+
+    resp = post("hr_admin")
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["dry_run"] is True
+    assert body["candidates_eligible"] == 0
+    assert body["audit_segments_written"] == 0
+
+
+def test_compliance_export_includes_archived_history(db, org, ctx):
+    import io
+    import json
+    import zipfile
+
+    from app.services.compliance_service import generate_compliance_bundle
+
+    _set_policy(db, org, audit_days=30)
+    _seed_audit(db, ctx, old=6, recent=1)
+    execute_retention(db, ctx, dry_run=False, chunk_size=4)
+
+    bundle = zipfile.ZipFile(io.BytesIO(generate_compliance_bundle(db, ctx)))
+    chain = json.loads(bundle.read("audit_chain.json"))
+    verification = json.loads(bundle.read("audit_verification.json"))
+
+    assert [r["seq"] for r in chain] == list(range(1, 9))
+    assert verification["ok"] is True
+    assert verification["archived_count"] == 6
+    assert verification["total_count"] == 8
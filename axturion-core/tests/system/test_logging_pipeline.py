@@ -0,0 +1,71 @@
+import json
+import logging
+
+from app.core.structured_logging import (
+    SamplingFilter,
+    SensitiveRedactionFilter,
+    configure_logging,
+    parse_sample_rates,
+    shutdown_logging,
+)
+
+
+def _records(output: str) -> list[dict]:
+    return [json.loads(line) for line in output.splitlines() if line.startswith("{")]
+
+
+def test_queue_mode_formats_off_thread_and_redacts(capsys, monkeypatch):
+    monkeypatch.setenv("LOG_QUEUE", "true")
+    configure_logging()
+    try:
+        logger = logging.getLogger("test.queue")
+        logger.info("login token=%s", "abc123", extra={"action": "login", "secret": "s"})
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed")
+    finally:
+        # Drains the queue before we read the captured stream.
+        shutdown_logging()
+        monkeypatch.setenv("LOG_QUEUE", "false")
+        configure_logging()
+
+    records = _records(capsys.readouterr().err)
+    login = next(r for r in records if r.get("action") == "login")
+    assert login["message"] == "login token=***REDACTED***"
+    assert login["secret"] == "***REDACTED***"
+
+    failed = next(r for r in records if r["message"] == "failed")
+    assert "ValueError: boom" in failed["exc_info"]
+
+
+def test_sampling_drops_configured_info_events_only():
+    rolls = iter([0.5, 0.001])
+    sampling = SamplingFilter({"role_resolved": 0.01}, rand=lambda: next(rolls))
+
+    def record(level, action):
+        rec = logging.LogRecord("t", level, __file__, 1, action, None, None)
+        rec.action = action
+        return rec
+
+    assert sampling.filter(record(logging.INFO, "role_resolved")) is False
+    assert sampling.filter(record(logging.INFO, "role_resolved")) is True
+    assert sampling.filter(record(logging.WARNING, "role_resolved")) is True
+    assert sampling.filter(record(logging.INFO, "stage_moved")) is True
+
+
+def test_parse_sample_rates():
+    assert parse_sample_rates("role_resolved=0.01, bad, x=abc,y=2") == {
+        "role_resolved": 0.01,
+        "y": 1.0,
+    }
+    assert parse_sample_rates(None) == {}
+
+
+def test_single_pattern_redacts_every_key():
+    redact = SensitiveRedactionFilter()._redact_message
+    message = 'Password: "a b" TOKEN=x, phone=123; email=a@b.c other=ok'
+    assert redact(message) == (
+        'Password: ***REDACTED*** TOKEN=***REDACTED***, phone=***REDACTED***; '
+        "email=***REDACTED*** other=ok"
+    )
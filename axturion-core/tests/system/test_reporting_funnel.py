@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    from app.main import app
+    import app.core.db as core_db
+    from app.core.config import Settings
+
+    engine = db.get_bind()
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr("app.main.core_db.wait_for_db", lambda: None)
+    monkeypatch.setattr("app.main.core_db.init_db", lambda _settings: None)
+    monkeypatch.setattr("app.main.verify_startup", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.main.seed_identity", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_workflow", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_automation", lambda _db: None)
+    monkeypatch.setattr(
+        "app.main.get_settings",
+        lambda: Settings(DATABASE_URL=str(engine.url), ENV="test", LOG_LEVEL="INFO"),
+    )
+
+    monkeypatch.setattr(core_db, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr("app.main.core_db", core_db)
+
+    app.dependency_overrides[core_db.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+def _make_user(db, org, role: str, email: str):
+    from app.domain.identity.models import OrganizationMembership, User
+
+    user = User(email=email, is_active=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+    membership = OrganizationMembership(
+        organization_id=org.id,
+        user_id=user.id,
+        role=role,
+        is_active=True,
+    )
+    db.add(membership)
+    db.commit()
+
+    return user
+
+
+def test_reporting_funnel_and_throughput_endpoints(client: TestClient, db, org):
+    from app.domain.workflow.models import Workflow, WorkflowStage
+
+    recruiter = _make_user(db, org, "recruiter", "reporting-funnel@local")
+    headers = {"X-Org-Id": str(org.id), "X-User-Id": str(recruiter.id)}
+
+    wf = Workflow(organization_id=org.id, name="wf")
+    db.add(wf)
+    db.commit()
+    db.refresh(wf)
+    db.add(
+        WorkflowStage(organization_id=org.id, workflow_id=wf.id, name="applied", order=1)
+    )
+    db.commit()
+
+    resp = client.post(
+        "/applications", json={"workflow_id": str(wf.id)}, headers=headers
+    )
+    assert resp.status_code in (200, 201)
+
+    resp = client.get(f"/reporting/workflows/{wf.id}/funnel", headers=headers)
+    assert resp.status_code == 200
+    assert resp.json()["stages"] == [
+        {"stage": "applied", "entered": 1, "advanced": 0, "dropped": 1, "conversion_rate": 0.0}
+    ]
+
+    resp = client.get(f"/reporting/workflows/{wf.id}/throughput", headers=headers)
+    assert resp.status_code == 200
+    weeks = resp.json()["weeks"]
+    assert len(weeks) == 1
+    assert weeks[0]["started"] == 1
+
+    resp = client.get(
+        f"/reporting/workflows/{wf.id}/funnel?from=2026-02-02T00:00:00Z&to=2026-02-01T00:00:00Z",
+        headers=headers,
+    )
+    assert resp.status_code == 400
+
+    resp = client.get(
+        "/reporting/workflows/00000000-0000-0000-0000-000000000000/throughput",
+        headers=headers,
+    )
+    assert resp.status_code == 404
+
+
+def test_funnel_is_not_cacheable_when_facts_lag(client: TestClient, db, org, monkeypatch):
+    from app.domain.workflow.models import Workflow, WorkflowStage
+
+    recruiter = _make_user(db, org, "recruiter", "reporting-funnel-lag@local")
+    headers = {"X-Org-Id": str(org.id), "X-User-Id": str(recruiter.id)}
+
+    wf = Workflow(organization_id=org.id, name="wf")
+    db.add(wf)
+    db.commit()
+    db.refresh(wf)
+    db.add(
+        WorkflowStage(organization_id=org.id, workflow_id=wf.id, name="applied", order=1)
+    )
+    db.commit()
+    client.post("/applications", json={"workflow_id": str(wf.id)}, headers=headers)
+
+    fresh = client.get(f"/reporting/workflows/{wf.id}/funnel", headers=headers)
+    assert fresh.headers["ETag"]
+
+    # Another request holds the fact watermark while a new application lands.
+    monkeypatch.setattr(
+        "app.services.funnel_reporting_service.sync_stage_transition_facts",
+        lambda *_args, **_kwargs: None,
+    )
+    client.post("/applications", json={"workflow_id": str(wf.id)}, headers=headers)
+
+    for path in ("funnel", "throughput"):
+        stale = client.get(f"/reporting/workflows/{wf.id}/{path}", headers=headers)
+        assert stale.status_code == 200
+        assert "ETag" not in stale.headers
+        assert stale.headers["Cache-Control"] == "no-store"
+        assert "facts_current" not in stale.json()
+
+
+def test_reporting_occupancy_snapshot_job_and_series(client: TestClient, db, org):
+    from app.domain.workflow.models import Workflow
+
+    recruiter = _make_user(db, org, "recruiter", "reporting-occupancy@local")
+    admin = _make_user(db, org, "hr_admin", "reporting-occupancy-admin@local")
+    recruiter_headers = {"X-Org-Id": str(org.id), "X-User-Id": str(recruiter.id)}
+    admin_headers = {"X-Org-Id": str(org.id), "X-User-Id": str(admin.id)}
+
+    wf = Workflow(organization_id=org.id, name="wf")
+    db.add(wf)
+    db.commit()
+    db.refresh(wf)
+
+    assert (
+        client.post("/reporting/occupancy/snapshots", headers=recruiter_headers).status_code
+        == 403
+    )
+
+    resp = client.post("/reporting/occupancy/snapshots", headers=admin_headers)
+    assert resp.status_code == 200
+    assert resp.json()["days_written"] == 1
+
+    today = datetime.now(timezone.utc).date().isoformat()
+    resp = client.post(
+        "/reporting/occupancy/snapshots", json={"through": today}, headers=admin_headers
+    )
+    assert resp.status_code == 400
+
+    resp = client.get(f"/reporting/workflows/{wf.id}/occupancy", headers=recruiter_headers)
+    assert resp.status_code == 200
+    assert resp.json()["days"] == []
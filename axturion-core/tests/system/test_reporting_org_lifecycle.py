@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    from app.main import app
+    import app.core.db as core_db
+    from app.core.config import Settings
+
+    engine = db.get_bind()
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr("app.main.core_db.wait_for_db", lambda: None)
+    monkeypatch.setattr("app.main.core_db.init_db", lambda _settings: None)
+    monkeypatch.setattr("app.main.verify_startup", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.main.seed_identity", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_workflow", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_automation", lambda _db: None)
+    monkeypatch.setattr(
+        "app.main.get_settings",
+        lambda: Settings(DATABASE_URL=str(engine.url), ENV="test", LOG_LEVEL="INFO"),
+    )
+
+    monkeypatch.setattr(core_db, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr("app.main.core_db", core_db)
+
+    app.dependency_overrides[core_db.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+def _make_user(db, org, role: str, email: str):
+    from app.domain.identity.models import OrganizationMembership, User
+
+    user = User(email=email, is_active=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+    membership = OrganizationMembership(
+        organization_id=org.id,
+        user_id=user.id,
+        role=role,
+        is_active=True,
+    )
+    db.add(membership)
+    db.commit()
+
+    return user
+
+
+def test_reporting_org_lifecycle_requires_reporting_read_scope(
+    client: TestClient, db, org
+):
+    stage_operator = _make_user(db, org, "stage_operator", "no-reporting-org@local")
+
+    resp = client.get(
+        "/reporting/org/lifecycle",
+        headers={"X-Org-Id": str(org.id), "X-User-Id": str(stage_operator.id)},
+    )
+    assert resp.status_code == 403
+
+
+def test_reporting_org_lifecycle_json_and_ndjson(client: TestClient, db, org):
+    import json
+
+    from app.domain.application.models import Application
+    from app.domain.workflow.models import Workflow, WorkflowStage
+
+    recruiter = _make_user(db, org, "recruiter", "reporting-org@local")
+    headers = {"X-Org-Id": str(org.id), "X-User-Id": str(recruiter.id)}
+
+    created = datetime.now(timezone.utc) - timedelta(days=3)
+    for name in ("wf-b", "wf-a"):
+        wf = Workflow(organization_id=org.id, name=name)
+        db.add(wf)
+        db.commit()
+        db.refresh(wf)
+        db.add(
+            WorkflowStage(
+                organization_id=org.id, workflow_id=wf.id, name="applied", order=1
+            )
+        )
+        db.add(
+            Application(
+                organization_id=org.id,
+                workflow_id=wf.id,
+                stage="applied",
+                status="closed",
+                created_at=created,
+                stage_entered_at=created,
+                closed_at=created + timedelta(days=1),
+            )
+        )
+    db.commit()
+
+    resp = client.get("/reporting/org/lifecycle", headers=headers)
+    assert resp.status_code == 200
+    sections = resp.json()["workflows"]
+    assert [s["workflow_name"] for s in sections] == ["wf-a", "wf-b"]
+    assert sections[0]["stage_summary"] == [{"stage": "applied", "count": 1}]
+    assert sections[0]["time_to_close"]["count"] == 1
+    assert sections[0]["time_to_close"]["min_seconds"] == 86400
+
+    resp = client.get("/reporting/org/lifecycle?stream=true", headers=headers)
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert lines == sections
+
+    resp = client.get(
+        "/reporting/org/lifecycle?from=2026-02-02T00:00:00Z&to=2026-02-01T00:00:00Z",
+        headers=headers,
+    )
+    assert resp.status_code == 400
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    from app.main import app
+    import app.core.db as core_db
+    from app.core.config import Settings
+
+    engine = db.get_bind()
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr("app.main.core_db.wait_for_db", lambda: None)
+    monkeypatch.setattr("app.main.core_db.init_db", lambda _settings: None)
+    monkeypatch.setattr("app.main.verify_startup", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.main.seed_identity", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_workflow", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_automation", lambda _db: None)
+    monkeypatch.setattr(
+        "app.main.get_settings",
+        lambda: Settings(DATABASE_URL=str(engine.url), ENV="test", LOG_LEVEL="INFO"),
+    )
+
+    monkeypatch.setattr(core_db, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr("app.main.core_db", core_db)
+
+    app.dependency_overrides[core_db.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+def _make_user(db, org, role: str, email: str):
+    from app.domain.identity.models import OrganizationMembership, User
+
+    user = User(email=email, is_active=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+    membership = OrganizationMembership(
+        organization_id=org.id,
+        user_id=user.id,
+        role=role,
+        is_active=True,
+    )
+    db.add(membership)
+    db.commit()
+
+    return user
+
+
+def test_reporting_sla_breaches_list_and_scan(client: TestClient, db, org):
+    from app.domain.application.models import Application
+    from app.domain.workflow.models import Workflow
+
+    recruiter = _make_user(db, org, "recruiter", "reporting-sla@local")
+    admin = _make_user(db, org, "hr_admin", "reporting-sla-admin@local")
+    recruiter_headers = {"X-Org-Id": str(org.id), "X-User-Id": str(recruiter.id)}
+    admin_headers = {"X-Org-Id": str(org.id), "X-User-Id": str(admin.id)}
+
+    wf = Workflow(organization_id=org.id, name="wf")
+    db.add(wf)
+    db.commit()
+    now = datetime.now(timezone.utc)
+    for days in (30, 10, 1):
+        db.add(
+            Application(
+                organization_id=org.id,
+                workflow_id=wf.id,
+                stage="applied",
+                stage_entered_at=now - timedelta(days=days),
+            )
+        )
+    db.commit()
+
+    resp = client.get("/reporting/sla-breaches?limit=1", headers=recruiter_headers)
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body["sla_days"] == 7
+    assert body["total"] == 2
+    assert len(body["items"]) == 1
+    assert body["items"][0]["overdue_seconds"] >= 23 * 86400
+
+    assert (
+        client.post("/reporting/sla-breaches/scan", headers=recruiter_headers).status_code
+        == 403
+    )
+    resp = client.post("/reporting/sla-breaches/scan", headers=admin_headers)
+    assert resp.status_code == 200
+    assert resp.json()["emitted"] == 2
+
+    resp = client.post("/reporting/sla-breaches/scan", headers=admin_headers)
+    assert resp.json()["emitted"] == 0
@@ -0,0 +1,176 @@
+import json
+
+import pytest
+from fastapi.responses import JSONResponse
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import sessionmaker
+from starlette.applications import Starlette
+from starlette.responses import PlainTextResponse, StreamingResponse
+from starlette.routing import Route
+
+from app.core.compression import CompressionMiddleware, brotli, negotiate_encoding
+from app.core.responses import ORJSONResponse
+
+
+@pytest.fixture
+def client(db, monkeypatch):
+    from app.main import app
+    import app.core.db as core_db
+    from app.core.config import Settings
+
+    engine = db.get_bind()
+    TestingSessionLocal = sessionmaker(bind=engine, autoflush=False, autocommit=False)
+
+    def override_get_db():
+        session = TestingSessionLocal()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr("app.main.core_db.wait_for_db", lambda: None)
+    monkeypatch.setattr("app.main.core_db.init_db", lambda _settings: None)
+    monkeypatch.setattr("app.main.verify_startup", lambda *_args, **_kwargs: None)
+    monkeypatch.setattr("app.main.seed_identity", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_workflow", lambda _db: None)
+    monkeypatch.setattr("app.main.seed_automation", lambda _db: None)
+
+    monkeypatch.setattr(
+        "app.main.get_settings",
+        lambda: Settings(DATABASE_URL=str(engine.url), ENV="test", LOG_LEVEL="INFO"),
+    )
+
+    monkeypatch.setattr(core_db, "SessionLocal", TestingSessionLocal)
+    monkeypatch.setattr("app.main.core_db", core_db)
+
+    app.dependency_overrides[core_db.get_db] = override_get_db
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+    app.dependency_overrides.clear()
+
+
+def _seed_user(db, org):
+    from app.domain.identity.models import OrganizationMembership, User
+
+    user = User(email="recruiter@compression.local", is_active=True)
+    db.add(user)
+    db.commit()
+    db.refresh(user)
+
+    db.add(
+        OrganizationMembership(
+            organization_id=org.id, user_id=user.id, role="recruiter", is_active=True
+        )
+    )
+    db.commit()
+    return user
+
+
+def _seed_activities(db, org, count: int):
+    from app.domain.automation.models import Activity
+
+    db.add_all(
+        [
+            Activity(
+                organization_id=org.id,
+                entity_type="application",
+                entity_id="app-1",
+                type="note",
+                message=f"note {i}",
+                payload={"i": i},
+            )
+            for i in range(count)
+        ]
+    )
+    db.commit()
+
+
+def test_large_list_is_compressed_when_accepted(client: TestClient, db, org):
+    user = _seed_user(db, org)
+    _seed_activities(db, org, 100)
+    headers = {"X-Org-Id": str(org.id), "X-User-Id": str(user.id)}
+
+    res = client.get(
+        "/activity/activities?limit=100",
+        headers={**headers, "Accept-Encoding": "gzip"},
+    )
+    assert res.status_code == 200
+    assert res.headers["content-encoding"] == "gzip"
+    assert "Accept-Encoding" in res.headers["vary"]
+    assert "x-correlation-id" in res.headers
+    assert len(res.json()) == 100
+
+    plain = client.get(
+        "/activity/activities?limit=100",
+        headers={**headers, "Accept-Encoding": "identity"},
+    )
+    assert "content-encoding" not in plain.headers
+    assert plain.json() == res.json()
+
+
+def test_small_responses_are_not_compressed(client: TestClient):
+    res = client.get("/live", headers={"Accept-Encoding": "gzip, br"})
+    assert res.status_code == 200
+    assert "content-encoding" not in res.headers
+    assert res.headers["content-type"] == "application/json"
+
+
+def _asgi_app(minimum_size: int = 16):
+    big = "x" * 4096
+
+    async def buffered(_request):
+        return PlainTextResponse(big)
+
+    async def streamed(_request):
+        async def chunks():
+            for _ in range(3):
+                yield big
+
+        return StreamingResponse(chunks(), media_type="text/plain")
+
+    async def sse(_request):
+        return PlainTextResponse(big, media_type="text/event-stream")
+
+    app = Starlette(
+        routes=[
+            Route("/buffered", buffered),
+            Route("/streamed", streamed),
+            Route("/sse", sse),
+        ]
+    )
+    return CompressionMiddleware(app, minimum_size=minimum_size)
+
+
+def test_streaming_and_excluded_media_types_pass_through():
+    with TestClient(_asgi_app()) as test_client:
+        headers = {"Accept-Encoding": "gzip"}
+
+        assert test_client.get("/buffered", headers=headers).headers[
+            "content-encoding"
+        ] == "gzip"
+
+        streamed = test_client.get("/streamed", headers=headers)
+        assert "content-encoding" not in streamed.headers
+        assert streamed.text == "x" * 4096 * 3
+
+        assert "content-encoding" not in test_client.get("/sse", headers=headers).headers
+
+
+def test_encoding_negotiation():
+    assert negotiate_encoding(None) is None
+    assert negotiate_encoding("identity") is None
+    assert negotiate_encoding("gzip;q=0") is None
+    assert negotiate_encoding("gzip, deflate") == "gzip"
+    assert negotiate_encoding("br;q=0, *") == "gzip"
+    if brotli is not None:
+        assert negotiate_encoding("gzip, br") == "br"
+        assert negotiate_encoding("br;q=0.5, gzip") == "gzip"
+
+
+def test_orjson_response_matches_stdlib_json():
+    content = {"a": [1, 2.5, None, True], "b": {"nested": "ü"}, "c": ""}
+    assert json.loads(ORJSONResponse(content).body) == json.loads(
+        JSONResponse(content).body
+    )
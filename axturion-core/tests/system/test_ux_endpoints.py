@@ -511,3 +511,46 @@ def test_versions_include_diff_vs_previous(client: TestClient, db, org):
     assert diff["flags_added"] == ["c"]
     assert diff["flags_removed"] == ["b"]
     assert diff["flags_changed"] == [{"key": "a", "from": True, "to": False}]
+
+
+def test_versions_are_read_from_version_table(client: TestClient, db, org):
+    from app.domain.ux.models import UXConfigVersion
+
+    hr_admin = _make_user(db, org, "hr_admin", "admin-ux-version-table@local")
+    headers = {"X-Org-Id": str(org.id), "X-User-Id": str(hr_admin.id)}
+
+    for layout in ("compact", "dense", "default"):
+        resp = client.put("/ux/applications", headers=headers, json={"layout": layout})
+        assert resp.status_code == 200
+
+    stored = (
+        db.query(UXConfigVersion)
+        .filter(UXConfigVersion.organization_id == org.id)
+        .order_by(UXConfigVersion.version)
+        .all()
+    )
+    assert [v.version for v in stored] == [1, 2, 3]
+    assert [v.snapshot_json for v in stored] == [
+        {"layout": "compact"},
+        {"layout": "dense"},
+        {"layout": "default"},
+    ]
+    assert stored[0].diff_json is None
+    assert stored[1].diff_json == {"layout": {"from": "compact", "to": "dense"}}
+
+    # A page starting mid-history still carries the diff against its predecessor.
+    page = client.get(
+        "/ux/applications/versions?offset=1&limit=1", headers=headers
+    ).json()
+    assert [item["version"] for item in page] == [2]
+    assert page[0]["diff"] == {"layout": {"from": "compact", "to": "dense"}}
+    assert page[0]["audit_log_id"] == str(stored[1].audit_log_id)
+
+    rollback = client.post(
+        "/ux/applications/rollback", headers=headers, json={"version": 1}
+    )
+    assert rollback.status_code == 200
+    assert rollback.json()["config"] == {"layout": "compact"}
+
+    # Rollbacks do not create versions.
+    assert db.query(UXConfigVersion).count() == 3
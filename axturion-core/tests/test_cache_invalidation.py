@@ -0,0 +1,78 @@
+import json
+
+from app.core.invalidation import (
+    ALL_CACHES,
+    Invalidation,
+    InvalidationBus,
+    InvalidationListener,
+    invalidate_on_commit,
+    invalidation_bus,
+    start_invalidation_listener,
+)
+
+
+def _record(bus, cache):
+    received = []
+    unsubscribe = bus.subscribe(cache, received.append)
+    return received, unsubscribe
+
+
+def test_invalidations_are_delivered_after_commit_only(db, org):
+    received, unsubscribe = _record(invalidation_bus, "policy")
+    try:
+        invalidate_on_commit(db, "policy", org.id)
+        invalidate_on_commit(db, "policy", org.id)
+        invalidate_on_commit(db, "ux_config", org.id, key="applications")
+        assert received == []
+
+        db.commit()
+        assert received == [Invalidation(cache="policy", organization_id=str(org.id))]
+
+        invalidate_on_commit(db, "policy", org.id)
+        db.rollback()
+        db.commit()
+        assert len(received) == 1
+    finally:
+        unsubscribe()
+
+    invalidate_on_commit(db, "policy", org.id)
+    db.commit()
+    assert len(received) == 1
+
+
+def test_full_reset_reaches_every_cache_and_handler_errors_are_isolated():
+    bus = InvalidationBus()
+    policy, _ = _record(bus, "policy")
+    ux, _ = _record(bus, "ux_config")
+
+    def broken(_invalidation):
+        raise RuntimeError("boom")
+
+    bus.subscribe("policy", broken)
+    bus.deliver(Invalidation(cache=ALL_CACHES))
+    bus.deliver(Invalidation(cache="policy", organization_id="org-1", key="k"))
+
+    assert [i.cache for i in policy] == [ALL_CACHES, "policy"]
+    assert [i.cache for i in ux] == [ALL_CACHES]
+
+
+def test_listener_delivers_foreign_notifications_and_skips_own():
+    bus = InvalidationBus()
+    received, _ = _record(bus, "policy")
+    listener = InvalidationListener(
+        "postgresql+psycopg://user:secret@db:5432/app", bus=bus
+    )
+
+    own = Invalidation(cache="policy", organization_id="org-1")
+    listener._handle(own.to_payload())
+    assert received == []
+
+    foreign = json.loads(own.to_payload())
+    foreign["origin"] = "another-worker"
+    listener._handle(json.dumps(foreign))
+    listener._handle("not json")
+    assert received == [own]
+
+
+def test_listener_is_not_started_for_sqlite():
+    assert start_invalidation_listener("sqlite:///:memory:") is None
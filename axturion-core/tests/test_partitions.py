@@ -0,0 +1,26 @@
+from datetime import date, datetime, timezone
+
+from app.core.partitions import (
+    add_months,
+    ensure_future_partitions,
+    partition_ddl,
+    partition_name,
+)
+
+
+def test_month_arithmetic_wraps_years():
+    assert add_months(date(2026, 11, 1), 1) == date(2026, 12, 1)
+    assert add_months(date(2026, 12, 1), 1) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_partition_ddl_covers_one_month():
+    assert partition_name("audit_log", date(2026, 3, 1)) == "audit_log_y2026m03"
+    assert partition_ddl("activity", date(2026, 12, 17)) == (
+        'CREATE TABLE IF NOT EXISTS "activity_y2026m12" PARTITION OF "activity" '
+        "FOR VALUES FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')"
+    )
+
+
+def test_ensure_future_partitions_is_noop_outside_postgres(db):
+    assert ensure_future_partitions(db, now=datetime(2026, 3, 1, tzinfo=timezone.utc)) == []
@@ -0,0 +1,94 @@
+from sqlalchemy import event
+
+from app.domain.governance.models import PolicyConfig
+from app.services import policy_service
+from app.services.policy_service import (
+    PolicySnapshot,
+    get_policy,
+    invalidate_policy_cache,
+    provision_policy,
+    update_policy,
+)
+
+
+def _count_statements(db):
+    statements = []
+
+    def _record(_conn, _cursor, statement, *_args):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", _record)
+    return statements, lambda: event.remove(engine, "before_cursor_execute", _record)
+
+
+def test_get_policy_reads_defaults_without_writing_and_caches(db, ctx):
+    statements, stop = _count_statements(db)
+    try:
+        first = get_policy(db, ctx)
+        second = get_policy(db, ctx)
+    finally:
+        stop()
+
+    assert first == PolicySnapshot.defaults(ctx.organization_id)
+    assert second is first
+    assert len(statements) == 1
+    assert all(s.lstrip().upper().startswith("SELECT") for s in statements)
+    assert db.query(PolicyConfig).count() == 0
+
+
+def test_update_policy_writes_through(db, ctx):
+    assert get_policy(db, ctx).stage_aging_sla_days == 7
+
+    update_policy(db, ctx, {"stage_aging_sla_days": 3})
+
+    statements, stop = _count_statements(db)
+    try:
+        policy = get_policy(db, ctx)
+    finally:
+        stop()
+    assert policy.stage_aging_sla_days == 3
+    assert policy.created_at is not None
+    assert statements == []
+
+
+def test_committed_row_writes_invalidate_the_cache(db, ctx):
+    assert get_policy(db, ctx).require_4eyes_on_hire is False
+
+    db.add(PolicyConfig(organization_id=ctx.organization_id, require_4eyes_on_hire=True))
+    db.flush()
+    # Not committed yet: still the cached value.
+    assert get_policy(db, ctx).require_4eyes_on_hire is False
+
+    db.commit()
+    assert get_policy(db, ctx).require_4eyes_on_hire is True
+
+    row = db.get(PolicyConfig, ctx.organization_id)
+    row.default_language = "nl"
+    db.commit()
+    assert get_policy(db, ctx).default_language == "nl"
+
+
+def test_fill_racing_an_invalidation_is_dropped(db, ctx, monkeypatch):
+    real_load = policy_service._load_policy_row
+
+    def _load_then_invalidate(*args, **kwargs):
+        row = real_load(*args, **kwargs)
+        invalidate_policy_cache(ctx.organization_id)
+        return row
+
+    monkeypatch.setattr(policy_service, "_load_policy_row", _load_then_invalidate)
+    get_policy(db, ctx)
+    monkeypatch.setattr(policy_service, "_load_policy_row", real_load)
+
+    cached, _ = policy_service._cache.get(ctx.organization_id)
+    assert cached is None
+
+
+def test_provision_policy_is_idempotent(db, org):
+    first = provision_policy(db, org.id)
+    db.commit()
+    second = provision_policy(db, org.id)
+
+    assert second is first
+    assert db.query(PolicyConfig).count() == 1
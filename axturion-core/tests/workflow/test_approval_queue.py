@@ -0,0 +1,106 @@
+import uuid
+
+import pytest
+
+from app.core.request_context import RequestContext
+from app.domain.application.models import Application
+from app.domain.workflow.models import (
+    ApprovalQueueCounter,
+    ApprovalQueueItem,
+    Workflow,
+    WorkflowTransition,
+)
+from app.services.approvals_service import approval_summary, list_pending_approvals
+from app.workflow.service import StageTransitionPendingError, move_application_stage
+
+
+def _pending_queue(db, org, ctx, n):
+    workflow = Workflow(name="Hiring", organization_id=org.id)
+    db.add(workflow)
+    db.commit()
+    db.add(
+        WorkflowTransition(
+            organization_id=org.id,
+            workflow_id=workflow.id,
+            from_stage="applied",
+            to_stage="offer",
+            requires_approval=True,
+        )
+    )
+    apps = [
+        Application(organization_id=org.id, workflow_id=workflow.id, stage="applied")
+        for _ in range(n)
+    ]
+    db.add_all(apps)
+    db.commit()
+
+    for app in apps:
+        with pytest.raises(StageTransitionPendingError):
+            move_application_stage(db, ctx, app.id, "offer")
+    return workflow, apps
+
+
+def test_queue_read_model_and_counters_follow_pending_lifecycle(db, org, ctx):
+    workflow, apps = _pending_queue(db, org, ctx, 3)
+
+    assert db.query(ApprovalQueueItem).count() == 3
+    counter = db.get(ApprovalQueueCounter, org.id)
+    assert counter.pending_count == 3
+
+    summary = approval_summary(db, ctx)
+    assert summary["total_pending"] == 3
+    assert summary["avg_pending_age_seconds"] >= 0
+    assert summary["oldest_pending_age_seconds"] >= 0
+
+    approver = RequestContext(
+        organization_id=org.id,
+        actor_id=str(uuid.uuid4()),
+        role=None,
+        scopes=set(),
+    )
+    move_application_stage(db, approver, apps[0].id, "offer")
+
+    assert approval_summary(db, ctx)["total_pending"] == 2
+    remaining = list_pending_approvals(db, ctx, limit=10)
+    assert {item["application_id"] for item in remaining} == {apps[1].id, apps[2].id}
+    assert {item["workflow_id"] for item in remaining} == {workflow.id}
+    assert {item["current_stage"] for item in remaining} == {"applied"}
+
+    move_application_stage(db, approver, apps[1].id, "offer")
+    move_application_stage(db, approver, apps[2].id, "offer")
+    summary = approval_summary(db, ctx)
+    assert summary == {
+        "total_pending": 0,
+        "avg_pending_age_seconds": 0.0,
+        "oldest_pending_age_seconds": 0,
+    }
+    assert db.get(ApprovalQueueCounter, org.id).initiated_epoch_sum == 0
+
+
+def test_queue_sort_orders_and_keyset_paging(db, org, ctx):
+    workflow, _apps = _pending_queue(db, org, ctx, 5)
+
+    newest = [item["pending_id"] for item in list_pending_approvals(db, ctx, limit=10)]
+    oldest = [
+        item["pending_id"]
+        for item in list_pending_approvals(db, ctx, limit=10, sort="oldest")
+    ]
+    assert len(newest) == 5
+    assert oldest == list(reversed(newest))
+
+    for sort, expected in (("newest", newest), ("oldest", oldest)):
+        pages: list = []
+        after = None
+        while True:
+            page = list_pending_approvals(db, ctx, limit=2, sort=sort, after_id=after)
+            if not page:
+                break
+            pages.extend(item["pending_id"] for item in page)
+            after = page[-1]["pending_id"]
+        assert pages == expected
+
+    assert len(list_pending_approvals(db, ctx, workflow_id=workflow.id)) == 5
+    assert list_pending_approvals(db, ctx, workflow_id=uuid.uuid4()) == []
+
+    with pytest.raises(ValueError):
+        list_pending_approvals(db, ctx, sort="priority")